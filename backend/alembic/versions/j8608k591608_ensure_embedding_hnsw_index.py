@@ -0,0 +1,82 @@
+"""ensure HNSW index on resource embeddings
+
+Revision ID: j8608k591608
+Revises: 74e602211084
+Create Date: 2026-02-02 10:00:00.000000
+
+Semantic and hybrid search order by `embedding <=> :query` and rely on the
+HNSW index to turn that into an approximate top-K scan. Databases where
+pgvector was installed after the embedding migrations ran never got the
+column or the index, so every vector query was a sequential scan. This
+migration creates both when pgvector is available and is a no-op otherwise.
+
+SAFETY NET ONLY: the column and index belong to c5f9e3g2h890 (resized by
+g6486h379496), whose downgrades drop them. This revision only fills them
+in where those migrations skipped, so its downgrade deliberately does
+nothing. Dropping them here would remove objects the earlier revisions
+created on every database where pgvector was installed in time.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy import text
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "j8608k591608"
+down_revision: str | Sequence[str] | None = "74e602211084"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# SentenceTransformers all-MiniLM-L6-v2
+EMBEDDING_DIMENSION = 384
+
+logger = logging.getLogger(__name__)
+
+
+def _pgvector_available() -> bool:
+    """Check if pgvector extension is available on this PostgreSQL instance."""
+    conn = op.get_bind()
+    result = conn.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'"))
+    return result.scalar() is not None
+
+
+def _embedding_column_exists() -> bool:
+    """Check if the embedding column exists on resources table."""
+    conn = op.get_bind()
+    result = conn.execute(
+        text("""
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'resources' AND column_name = 'embedding'
+        """)
+    )
+    return result.scalar() is not None
+
+
+def upgrade() -> None:
+    """Create the embedding column and its HNSW index if they are missing (safety net)."""
+    if not _pgvector_available():
+        logger.warning("pgvector extension not available. Skipping HNSW index.")
+        return
+
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+
+    if not _embedding_column_exists():
+        op.execute(text(f"ALTER TABLE resources ADD COLUMN embedding vector({EMBEDDING_DIMENSION})"))
+
+    # m/ef_construction match the original index; query-time recall is tuned
+    # per request with hnsw.ef_search (see SearchService._configure_ann)
+    op.execute(
+        text("""
+        CREATE INDEX IF NOT EXISTS ix_resources_embedding_hnsw
+        ON resources
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        """)
+    )
+
+
+def downgrade() -> None:
+    """Intentional no-op (safety net): c5f9e3g2h890's downgrade drops the column and index."""
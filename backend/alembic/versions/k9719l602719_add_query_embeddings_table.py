@@ -0,0 +1,39 @@
+"""add query_embeddings table for the semantic search query cache
+
+Revision ID: k9719l602719
+Revises: j8608k591608
+Create Date: 2026-02-03 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "k9719l602719"
+down_revision: str | Sequence[str] | None = "j8608k591608"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the shared query embedding cache table."""
+    op.create_table(
+        "query_embeddings",
+        sa.Column("query", sa.String(255), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("embedding", postgresql.ARRAY(sa.Float), nullable=False),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("query", "model"),
+    )
+    op.create_index("ix_query_embeddings_created_at", "query_embeddings", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop the query embedding cache table."""
+    op.drop_index("ix_query_embeddings_created_at", table_name="query_embeddings")
+    op.drop_table("query_embeddings")
@@ -0,0 +1,35 @@
+"""add embedding text hash and model columns to resources
+
+Revision ID: l0820m713820
+Revises: k9719l602719
+Create Date: 2026-02-04 10:00:00.000000
+
+The embeddings job only embedded rows with a NULL vector, so edited
+resources kept stale embeddings. It now records the hash of the embedded
+text and the model that produced the vector, and re-embeds rows where
+either no longer matches.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "l0820m713820"
+down_revision: str | Sequence[str] | None = "k9719l602719"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add embedding provenance columns to resources table."""
+    op.add_column("resources", sa.Column("embedding_text_hash", sa.String(length=64), nullable=True))
+    op.add_column("resources", sa.Column("embedding_model", sa.String(length=100), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove embedding provenance columns from resources table."""
+    op.drop_column("resources", "embedding_model")
+    op.drop_column("resources", "embedding_text_hash")
@@ -0,0 +1,32 @@
+"""add indexes for ETL loader lookups
+
+Revision ID: m1931n824931
+Revises: l0820m713820
+Create Date: 2026-02-05 10:00:00.000000
+
+The loader resolves each chunk with resources.source_url IN (...) and
+lower(organizations.name) IN (...). Neither was indexed, so both were
+sequential scans.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "m1931n824931"
+down_revision: str | Sequence[str] | None = "l0820m713820"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add source_url and lower(name) indexes."""
+    op.create_index("ix_resources_source_url", "resources", ["source_url"])
+    op.execute("CREATE INDEX ix_organizations_name_lower ON organizations (lower(name));")
+
+
+def downgrade() -> None:
+    """Remove source_url and lower(name) indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_organizations_name_lower;")
+    op.drop_index("ix_resources_source_url", table_name="resources")
@@ -0,0 +1,75 @@
+"""add trigram indexes for tag text matching
+
+Revision ID: n2042o935042
+Revises: m1931n824931
+Create Date: 2026-02-06 10:00:00.000000
+
+The nearby tag filter matches each tag with ILIKE '%tag%' against
+eligibility, title and description. B-tree and the array GIN indexes
+can't serve a leading-wildcard ILIKE, so every tagged nearby query
+scanned those columns. pg_trgm GIN indexes let Postgres answer the same
+predicates with a BitmapOr over index scans, without changing results.
+
+The indexes are built CONCURRENTLY (outside the migration transaction) so
+resource writes aren't blocked while they build. A build that failed part
+way leaves an invalid index behind, which is dropped and rebuilt.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy import text
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n2042o935042"
+down_revision: str | Sequence[str] | None = "m1931n824931"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger(__name__)
+
+TEXT_COLUMNS = ("eligibility", "title", "description")
+
+
+def _pg_trgm_available() -> bool:
+    """Check if the pg_trgm extension is available on this PostgreSQL instance."""
+    conn = op.get_bind()
+    result = conn.execute(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"))
+    return result.scalar() is not None
+
+
+def _index_invalid(name: str) -> bool:
+    """Check if an index exists but is invalid (left by an interrupted concurrent build)."""
+    conn = op.get_bind()
+    result = conn.execute(
+        text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    )
+    return bool(result.scalar())
+
+
+def upgrade() -> None:
+    """Create pg_trgm GIN indexes on the tag-matched text columns if available."""
+    if not _pg_trgm_available():
+        logger.warning(
+            "pg_trgm extension not available. Skipping trigram indexes; tag text filters will scan resources."
+        )
+        return
+
+    op.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    with op.get_context().autocommit_block():
+        for column in TEXT_COLUMNS:
+            index = f"ix_resources_{column}_trgm"
+            if _index_invalid(index):
+                op.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index}"))
+            op.execute(
+                text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON resources USING gin ({column} gin_trgm_ops)")
+            )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension is left installed)."""
+    with op.get_context().autocommit_block():
+        for column in TEXT_COLUMNS:
+            op.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS ix_resources_{column}_trgm"))
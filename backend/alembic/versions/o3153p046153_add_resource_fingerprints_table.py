@@ -0,0 +1,49 @@
+"""add resource_fingerprints table for database-aware dedupe
+
+Revision ID: o3153p046153
+Revises: n2042o935042
+Create Date: 2026-02-07 10:00:00.000000
+
+Each import path stores normalized org/title/phone/address keys for the
+resources it writes, and looks up incoming records against them with one
+indexed query per chunk. Existing resources are fingerprinted by
+scripts/backfill_dedupe_fingerprints.py.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o3153p046153"
+down_revision: str | Sequence[str] | None = "n2042o935042"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the resource fingerprint table and its lookup indexes."""
+    op.create_table(
+        "resource_fingerprints",
+        sa.Column("resource_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("org_key", sa.String(500), nullable=False),
+        sa.Column("title_key", sa.String(500), nullable=False),
+        sa.Column("phone", sa.String(10), nullable=True),
+        sa.Column("address_key", sa.String(500), nullable=True),
+        sa.Column("state", sa.String(2), nullable=True),
+        sa.Column("updated_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("resource_id"),
+        sa.ForeignKeyConstraint(["resource_id"], ["resources.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_resource_fingerprints_org_title", "resource_fingerprints", ["org_key", "title_key"])
+    op.create_index("ix_resource_fingerprints_org_phone", "resource_fingerprints", ["org_key", "phone"])
+
+
+def downgrade() -> None:
+    """Drop the resource fingerprint table."""
+    op.drop_index("ix_resource_fingerprints_org_phone", table_name="resource_fingerprints")
+    op.drop_index("ix_resource_fingerprints_org_title", table_name="resource_fingerprints")
+    op.drop_table("resource_fingerprints")
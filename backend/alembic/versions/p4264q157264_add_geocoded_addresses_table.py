@@ -0,0 +1,39 @@
+"""add geocoded_addresses table for the ETL geocoder cache
+
+Revision ID: p4264q157264
+Revises: o3153p046153
+Create Date: 2026-02-08 10:00:00.000000
+
+The ETL geocoder (etl/geocoder.py) caches Census results by a hash of the
+normalized address, so refreshes only geocode new or changed addresses.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p4264q157264"
+down_revision: str | Sequence[str] | None = "o3153p046153"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the geocoder address cache table."""
+    op.create_table(
+        "geocoded_addresses",
+        sa.Column("address_hash", sa.String(64), nullable=False),
+        sa.Column("latitude", sa.Float, nullable=True),
+        sa.Column("longitude", sa.Float, nullable=True),
+        sa.Column("match_quality", sa.String(20), nullable=True),
+        sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("address_hash"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the geocoder address cache table."""
+    op.drop_table("geocoded_addresses")
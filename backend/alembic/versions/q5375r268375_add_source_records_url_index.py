@@ -0,0 +1,29 @@
+"""add source_records (url, fetched_at) index for loader change detection
+
+Revision ID: q5375r268375
+Revises: p4264q157264
+Create Date: 2026-02-09 10:00:00.000000
+
+The loader looks up the latest source record for every URL in a chunk to
+skip records whose raw data hash hasn't changed. url was not indexed.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q5375r268375"
+down_revision: str | Sequence[str] | None = "p4264q157264"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the (url, fetched_at) index."""
+    op.create_index("ix_source_records_url_fetched_at", "source_records", ["url", "fetched_at"])
+
+
+def downgrade() -> None:
+    """Remove the (url, fetched_at) index."""
+    op.drop_index("ix_source_records_url_fetched_at", table_name="source_records")
@@ -0,0 +1,43 @@
+"""add resource_stats_snapshots table for /api/v1/stats/ai
+
+Revision ID: r6486s379486
+Revises: q5375r268375
+Create Date: 2026-02-10 10:00:00.000000
+
+The About page stats were four full scans of resources per request,
+including every categories array pulled into Python. They are now
+computed by StatsService.refresh() after ETL and freshness runs and
+read from this one-row table.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r6486s379486"
+down_revision: str | Sequence[str] | None = "q5375r268375"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the resource stats snapshot table."""
+    op.create_table(
+        "resource_stats_snapshots",
+        sa.Column("id", sa.Integer, nullable=False),
+        sa.Column("total_resources", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("resources_verified", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("total_sources", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("average_trust_score", sa.Float, nullable=False, server_default="0"),
+        sa.Column("resources_by_category", sa.Text, nullable=False, server_default="{}"),
+        sa.Column("computed_at", sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the resource stats snapshot table."""
+    op.drop_table("resource_stats_snapshots")
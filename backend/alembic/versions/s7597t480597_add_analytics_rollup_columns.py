@@ -0,0 +1,61 @@
+"""add hourly rollups and full counts to analytics_daily_aggregates
+
+Revision ID: s7597t480597
+Revises: r6486s379486
+Create Date: 2026-02-12 10:00:00.000000
+
+The analytics dashboard grouped raw analytics_events over the whole
+requested window on every load. The analytics rollup job now keeps one
+row per completed day and one per completed hour of the current day
+(period), with the counts the dashboard needs beyond the original
+columns, and the dashboard reads those plus the last hour of raw events.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s7597t480597"
+down_revision: str | Sequence[str] | None = "r6486s379486"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add rollup period and count columns."""
+    op.add_column(
+        "analytics_daily_aggregates",
+        sa.Column("period", sa.String(10), nullable=False, server_default="day"),
+    )
+    op.add_column(
+        "analytics_daily_aggregates",
+        sa.Column("total_filter_usage", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "analytics_daily_aggregates",
+        sa.Column("total_page_views", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.add_column("analytics_daily_aggregates", sa.Column("wizard_steps", sa.Text, nullable=True))
+
+    # Existing rows were computed with top-10 maps and no filter/page view counts: recompute them
+    op.execute("DELETE FROM analytics_daily_aggregates")
+
+    op.create_index(
+        "ix_analytics_daily_aggregates_period_date",
+        "analytics_daily_aggregates",
+        ["period", "date"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove rollup period and count columns."""
+    op.drop_index("ix_analytics_daily_aggregates_period_date", table_name="analytics_daily_aggregates")
+    op.execute("DELETE FROM analytics_daily_aggregates WHERE period <> 'day'")
+    op.drop_column("analytics_daily_aggregates", "wizard_steps")
+    op.drop_column("analytics_daily_aggregates", "total_page_views")
+    op.drop_column("analytics_daily_aggregates", "total_filter_usage")
+    op.drop_column("analytics_daily_aggregates", "period")
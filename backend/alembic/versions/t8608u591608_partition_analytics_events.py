@@ -0,0 +1,107 @@
+"""partition analytics_events by month on created_at
+
+Revision ID: t8608u591608
+Revises: s7597t480597
+Create Date: 2026-02-13 10:00:00.000000
+
+The existing table becomes the first partition (analytics_events_legacy,
+from MINVALUE to the start of next month) of a new partitioned parent,
+so no rows are copied. A unique index for the new (id, created_at)
+primary key is built concurrently and a CHECK constraint proving the
+partition bound is validated without blocking writes; the swap itself is
+catalog-only. Monthly partitions after that are created here and by the
+analytics partitions job, which also drops expired ones. A DEFAULT
+partition takes events past the last monthly one, so inserts keep working
+if the job stops running; the job moves them out when it creates their
+month.
+"""
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t8608u591608"
+down_revision: str | Sequence[str] | None = "s7597t480597"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Monthly partitions created after the legacy one
+MONTHS_AHEAD = 3
+
+INDEXES = {
+    "ix_analytics_events_event_type": "event_type",
+    "ix_analytics_events_created_at": "created_at",
+    "ix_analytics_events_resource_id": "resource_id",
+}
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    """Convert analytics_events to a monthly range-partitioned table."""
+    this_month = datetime.now(UTC).replace(tzinfo=None, day=1, hour=0, minute=0, second=0, microsecond=0)
+    boundary = _add_months(this_month, 1)
+
+    # Without blocking writes: the (id, created_at) key index, and a validated
+    # constraint matching the partition bound so ATTACH skips its scan
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS analytics_events_legacy_pkey "
+            "ON analytics_events (id, created_at)"
+        )
+        op.execute(
+            "ALTER TABLE analytics_events ADD CONSTRAINT analytics_events_legacy_bound "
+            f"CHECK (created_at IS NOT NULL AND created_at < '{boundary}') NOT VALID"
+        )
+        op.execute("ALTER TABLE analytics_events VALIDATE CONSTRAINT analytics_events_legacy_bound")
+
+    # Swap in the partitioned parent: catalog changes only, brief locks
+    op.execute("ALTER TABLE analytics_events DROP CONSTRAINT analytics_events_pkey")
+    op.execute(
+        "ALTER TABLE analytics_events ADD CONSTRAINT analytics_events_legacy_pkey "
+        "PRIMARY KEY USING INDEX analytics_events_legacy_pkey"
+    )
+    op.execute("ALTER TABLE analytics_events RENAME TO analytics_events_legacy")
+    for index in INDEXES:
+        legacy_index = index.replace("analytics_events", "analytics_events_legacy")
+        op.execute(f"ALTER INDEX {index} RENAME TO {legacy_index}")
+
+    op.execute(
+        "CREATE TABLE analytics_events (LIKE analytics_events_legacy INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute("ALTER TABLE analytics_events ADD CONSTRAINT analytics_events_pkey PRIMARY KEY (id, created_at)")
+    for index, column in INDEXES.items():
+        op.create_index(index, "analytics_events", [column])
+
+    # The legacy table's indexes match the parent's and are attached with it
+    op.execute(
+        "ALTER TABLE analytics_events ATTACH PARTITION analytics_events_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{boundary}')"
+    )
+    op.execute("ALTER TABLE analytics_events_legacy DROP CONSTRAINT analytics_events_legacy_bound")
+
+    for offset in range(MONTHS_AHEAD):
+        start = _add_months(boundary, offset)
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE analytics_events_y{start.year:04d}m{start.month:02d} "
+            f"PARTITION OF analytics_events FOR VALUES FROM ('{start}') TO ('{end}')"
+        )
+    op.execute("CREATE TABLE analytics_events_default PARTITION OF analytics_events DEFAULT")
+
+
+def downgrade() -> None:
+    """Copy analytics_events back into an unpartitioned table (offline)."""
+    op.execute("CREATE TABLE analytics_events_unpartitioned (LIKE analytics_events INCLUDING DEFAULTS)")
+    op.execute("INSERT INTO analytics_events_unpartitioned SELECT * FROM analytics_events")
+    op.execute("DROP TABLE analytics_events")
+    op.execute("ALTER TABLE analytics_events_unpartitioned RENAME TO analytics_events")
+    op.execute("ALTER TABLE analytics_events ADD CONSTRAINT analytics_events_pkey PRIMARY KEY (id)")
+    for index, column in INDEXES.items():
+        op.create_index(index, "analytics_events", [column])
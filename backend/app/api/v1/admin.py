@@ -1,5 +1,6 @@
 """Admin endpoints for review queue, source management, and job scheduling."""
 
+from dataclasses import asdict
 from typing import Any
 from uuid import UUID
 
@@ -17,6 +18,8 @@ from app.schemas.health import (
     SourceHealthListResponse,
 )
 from app.schemas.review import ReviewAction, ReviewQueueResponse
+from app.services.embedding_cache import get_query_embedding_cache
+from app.services.geo import refresh_geo_context
 from app.services.health import HealthService
 from app.services.review import ReviewService
 from jobs import get_available_connectors, get_scheduler
@@ -370,3 +373,20 @@ def list_connectors(_auth: AdminAuthDep) -> dict[str, Any]:
         "connectors": connectors,
         "total": len(connectors),
     }
+
+
+@router.get("/cache/query-embeddings")
+def get_query_embedding_cache_stats(_auth: AdminAuthDep) -> dict[str, Any]:
+    """Get hit/miss counters for this worker's semantic search query embedding cache."""
+    stats = get_query_embedding_cache().stats()
+    return {**asdict(stats), "hit_rate": round(stats.hit_rate, 4)}
+
+
+@router.post("/cache/geo/refresh")
+def refresh_geo_cache(_auth: AdminAuthDep, session: SessionDep) -> dict[str, Any]:
+    """Reload this worker's in-memory zip code table and PostGIS detection.
+
+    Run after etl/load_zip_codes.py; other workers pick up the new table on restart.
+    """
+    context = refresh_geo_context(session)
+    return {"zip_codes": len(context.zips), "postgis": context.postgis}
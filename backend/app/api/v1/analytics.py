@@ -4,7 +4,7 @@ Public endpoint for recording events (no auth, no PII).
 Admin endpoints for viewing aggregated statistics.
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from sqlmodel import select
 
 from app.api.deps import AdminAuthDep
@@ -23,6 +23,7 @@ from app.schemas.analytics import (
     WizardFunnelStats,
 )
 from app.services.analytics import AnalyticsService
+from app.services.analytics_buffer import get_analytics_buffer
 
 router = APIRouter()
 
@@ -32,7 +33,7 @@ router = APIRouter()
 # ============================================================================
 
 
-@router.post("/events", response_model=AnalyticsEventResponse, status_code=201)
+@router.post("/events", response_model=AnalyticsEventResponse, status_code=202)
 def record_event(
     event_data: AnalyticsEventCreate,
     session: SessionDep,
@@ -47,6 +48,9 @@ def record_event(
     - Which searches are most common
     - Which resources are most viewed
     - How users interact with the wizard
+
+    Events are buffered and written in batches, so the request does no
+    database work. Returns 503 with Retry-After when the buffer is full.
     """
     event = AnalyticsEvent(
         event_type=event_data.event_type,
@@ -59,10 +63,19 @@ def record_event(
         page_path=event_data.page_path,
     )
 
-    session.add(event)
-    session.commit()
-    session.refresh(event)
-
+    buffer = get_analytics_buffer()
+    if buffer is None:
+        # Buffering disabled: write on the request (the session only connects here)
+        AnalyticsService(session).record(event)
+        session.refresh(event)
+        return event
+
+    if not buffer.add(event):
+        raise HTTPException(
+            status_code=503,
+            detail="Analytics buffer full, retry later",
+            headers={"Retry-After": "1"},
+        )
     return event
 
 
@@ -12,7 +12,9 @@ from collections import defaultdict
 from threading import Lock
 
 from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
+from sqlmodel import Session
 
 from app.config import settings
 from app.database import SessionDep
@@ -36,6 +38,19 @@ _conversation_lock = Lock()
 MAX_CONVERSATION_HISTORY = 10  # messages per conversation
 MAX_CONVERSATIONS = 1000  # total conversations cached
 
+# Claude client shared by chat requests, so they reuse its HTTP connections
+_claude_client: ClaudeClient | None = None
+_claude_client_lock = Lock()
+
+
+def _get_claude_client() -> ClaudeClient:
+    """Get the shared Claude client, creating it on first use or when the API key changes."""
+    global _claude_client
+    with _claude_client_lock:
+        if _claude_client is None or _claude_client.api_key != settings.anthropic_api_key:
+            _claude_client = ClaudeClient()
+        return _claude_client
+
 
 def _check_rate_limit(client_id: str) -> bool:
     """Check if client has exceeded rate limit.
@@ -119,6 +134,28 @@ class ResourceReference(BaseModel):
     category: str = Field(..., description="Resource category")
 
 
+def _find_resources(session: Session, query: str) -> list[ResourceReference]:
+    """Search resources to ground the response.
+
+    Closes the session afterwards so its connection goes back to the pool
+    instead of being held while the request waits on Claude.
+    """
+    try:
+        results, _ = SearchService(session).search(query=query, limit=5)
+        return [
+            ResourceReference(
+                id=result.resource.id,
+                title=result.resource.title,
+                url=result.resource.website,
+                phone=result.resource.phone,
+                category=result.resource.categories[0] if result.resource.categories else "general",
+            )
+            for result in results
+        ]
+    finally:
+        session.close()
+
+
 class ChatResponse(BaseModel):
     """Chat response with resources."""
 
@@ -243,28 +280,12 @@ async def chat(message: ChatMessage, session: SessionDep) -> ChatResponse:
     history = _get_conversation(conversation_id)
 
     # Search for relevant resources based on the user's message
-    search_service = SearchService(session)
     resources: list[ResourceReference] = []
     search_failed = False
 
     try:
-        # Search resources to ground the response
-        results, _ = search_service.search(
-            query=message.message,
-            limit=5,
-        )
-
-        for result in results:
-            r = result.resource
-            resources.append(
-                ResourceReference(
-                    id=r.id,
-                    title=r.title,
-                    url=r.website,
-                    phone=r.phone,
-                    category=r.categories[0] if r.categories else "general",
-                )
-            )
+        # Sync DB work, kept off the event loop
+        resources = await run_in_threadpool(_find_resources, session, message.message)
     except Exception as e:
         logger.error(
             f"Chat search failed for query '{message.message[:50]}...': {e}",
@@ -299,8 +320,8 @@ async def chat(message: ChatMessage, session: SessionDep) -> ChatResponse:
     full_prompt = f"{history_context}{user_content}" if history_context else user_content
 
     try:
-        claude = ClaudeClient()
-        response = claude.complete(
+        claude = _get_claude_client()
+        response = await claude.acomplete(
             prompt=full_prompt,
             system=SYSTEM_PROMPT,
             model=ClaudeModel.HAIKU,  # Fast and cost-effective for chat
@@ -24,6 +24,8 @@ from app.schemas.resource import (
     ResourceUpdate,
     SuggestResponse,
 )
+from app.services.filters import COUNT_MODE_PATTERN, reported_total
+from app.services.geo import get_geo_context
 from app.services.resource import ResourceService
 
 router = APIRouter()
@@ -92,7 +94,7 @@ def get_resource_count(
     ),
     scope: str | None = Query(
         default=None,
-        description="Filter by resource scope: 'national', 'state', 'local', or 'all'",
+        description="Filter by resource scope: 'national', 'state' (state or local), 'local', or 'all'",
         examples=["national", "state", "local"],
     ),
 ) -> ResourceCount:
@@ -104,7 +106,7 @@ def get_resource_count(
     **Query Parameters:**
     - `categories` - Comma-separated category names (housing, legal, employment, training)
     - `states` - Comma-separated 2-letter state codes (VA, MD, DC)
-    - `scope` - Resource scope: national, state, local, or all
+    - `scope` - Resource scope: national, state (state or local), local, or all
 
     Returns count of all active resources when no filters provided.
     """
@@ -276,7 +278,7 @@ def list_resources(
     ),
     scope: str | None = Query(
         default=None,
-        description="Filter by resource scope: 'national', 'state', 'local', or 'all'",
+        description="Filter by resource scope: 'national', 'state' (state or local), 'local', or 'all'",
         examples=["national", "state", "local"],
     ),
     status: ResourceStatus | None = Query(
@@ -295,6 +297,15 @@ def list_resources(
     ),
     limit: int = Query(default=20, ge=1, le=500, description="Maximum results to return"),
     offset: int = Query(default=0, ge=0, description="Number of results to skip for pagination"),
+    count: str = Query(
+        default="exact",
+        description="Total count: 'exact', 'estimate' (capped, reported as 1000+) or 'none' (skip for infinite scroll)",
+        pattern=COUNT_MODE_PATTERN,
+    ),
+    facets: bool = Query(
+        default=False,
+        description="Include category/state/tag/scope counts for the filter sidebar",
+    ),
 ) -> ResourceList:
     """List Veteran resources with optional filtering and pagination.
 
@@ -334,8 +345,26 @@ def list_resources(
         tags=tag_list,
         limit=limit,
         offset=offset,
+        count=count,
+    )
+    total, total_is_estimate = reported_total(total, count)
+    facet_counts = None
+    if facets:
+        facet_counts = service.facet_counts(
+            categories=category_list,
+            states=state_list,
+            scope=scope,
+            status=status,
+            tags=tag_list,
+        )
+    return ResourceList(
+        resources=resources,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        limit=limit,
+        offset=offset,
+        facets=facet_counts,
     )
-    return ResourceList(resources=resources, total=total, limit=limit, offset=offset)
 
 
 @router.get(
@@ -361,12 +390,7 @@ def get_zip_info(
 
     Used by the landing page to highlight the state on the map when a ZIP is entered.
     """
-    from sqlalchemy import text
-
-    result = session.execute(
-        text("SELECT state FROM zip_codes WHERE zip_code = :zip"),
-        {"zip": zip_code},
-    ).fetchone()
+    result = get_geo_context(session).zips.get(zip_code)
 
     if not result:
         raise HTTPException(status_code=404, detail="Zip code not found")
@@ -456,6 +480,15 @@ def list_nearby_resources(
     ),
     limit: int = Query(default=20, ge=1, le=100, description="Maximum results to return"),
     offset: int = Query(default=0, ge=0, description="Number of results to skip for pagination"),
+    count: str = Query(
+        default="exact",
+        description="Total count: 'exact' or 'estimate' include it, 'none' skips it (infinite scroll)",
+        pattern=COUNT_MODE_PATTERN,
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="next_cursor from the previous response; continues after it (offset is ignored)",
+    ),
 ) -> ResourceNearbyList:
     """Find Veteran resources near a location.
 
@@ -478,6 +511,7 @@ def list_nearby_resources(
     - `categories` - Optional category filter (housing, legal, employment, training)
     - `scope` - Optional scope filter: 'national' (only nationwide programs), 'state' (only local/state)
     - `tags` - Optional eligibility tags filter (comma-separated)
+    - `cursor` - Optional `next_cursor` from the previous page (keyset pagination, preferred over offset)
 
     **Note:** When scope is omitted (default), returns local/state resources sorted by distance
     PLUS all national resources (which apply everywhere). National resources appear after
@@ -498,27 +532,34 @@ def list_nearby_resources(
     service = ResourceService(session)
 
     # Use lat/lng if provided, otherwise use zip
-    if lat is not None and lng is not None:
-        result = service.list_nearby_by_coords(
-            lat=lat,
-            lng=lng,
-            radius_miles=radius,
-            categories=category_list,
-            scope=scope,
-            tags=tag_list,
-            limit=limit,
-            offset=offset,
-        )
-    else:
-        result = service.list_nearby(
-            zip_code=zip,  # type: ignore  # We validated zip exists above
-            radius_miles=radius,
-            categories=category_list,
-            scope=scope,
-            tags=tag_list,
-            limit=limit,
-            offset=offset,
-        )
+    try:
+        if lat is not None and lng is not None:
+            result = service.list_nearby_by_coords(
+                lat=lat,
+                lng=lng,
+                radius_miles=radius,
+                categories=category_list,
+                scope=scope,
+                tags=tag_list,
+                limit=limit,
+                offset=offset,
+                count=count,
+                cursor=cursor,
+            )
+        else:
+            result = service.list_nearby(
+                zip_code=zip,  # type: ignore  # We validated zip exists above
+                radius_miles=radius,
+                categories=category_list,
+                scope=scope,
+                tags=tag_list,
+                limit=limit,
+                offset=offset,
+                count=count,
+                cursor=cursor,
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
     if result is None:
         raise HTTPException(status_code=404, detail="Zip code not found")
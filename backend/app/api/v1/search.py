@@ -11,8 +11,12 @@ import logging
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from app.config import settings
 from app.database import SessionDep
 from app.schemas.resource import ResourceSearchResult
+from app.services.embedding import embedding_model_loading
+from app.services.embedding_cache import embed_query
+from app.services.filters import COUNT_MODE_PATTERN, reported_total
 from app.services.search import EligibilityFilters, SearchService
 
 logger = logging.getLogger(__name__)
@@ -25,9 +29,18 @@ class SearchResponse(BaseModel):
 
     query: str = Field(..., description="The search query that was executed")
     results: list[ResourceSearchResult] = Field(..., description="List of matching resources with relevance scores")
-    total: int = Field(..., description="Total number of matching results")
+    total: int | None = Field(..., description="Total number of matching results (null when count=none)")
+    total_is_estimate: bool = Field(False, description="Total is a lower bound (more than 1000 matches)")
     limit: int = Field(..., description="Maximum results returned")
     offset: int = Field(..., description="Pagination offset")
+    facets: dict[str, dict[str, int]] | None = Field(
+        None,
+        description="Counts per categories/states/tags/scope value when facets=true (each OR filter ignores itself)",
+    )
+    facets_are_estimate: bool = Field(
+        False,
+        description=f"Facet counts cover only {settings.facet_search_max_matches:,} of the text matches (more matched)",
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -133,6 +146,12 @@ def search_resources(
     ),
     limit: int = Query(20, ge=1, le=500, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    count: str = Query(
+        "exact",
+        description="Total count: 'exact', 'estimate' (capped, reported as 1000+) or 'none' (skip for infinite scroll)",
+        pattern=COUNT_MODE_PATTERN,
+    ),
+    facets: bool = Query(False, description="Include category/state/tag/scope counts for the filter sidebar"),
 ) -> SearchResponse:
     """Search Veteran resources using PostgreSQL full-text search.
 
@@ -154,6 +173,7 @@ def search_resources(
     - `states` - Comma-separated 2-letter state codes (VA, MD, DC)
     - `scope` - Resource scope: national, state, local, or all
     - `tags` - Comma-separated eligibility tags
+    - `facets` - Also return counts per category, state, tag and scope (approximate for very broad queries)
     """
     # Parse comma-separated filters into lists
     category_list: list[str] | None = None
@@ -179,14 +199,31 @@ def search_resources(
         tags=tags_list,
         limit=limit,
         offset=offset,
+        count=count,
     )
+    total, total_is_estimate = reported_total(total, count)
+    facet_counts = None
+    facets_are_estimate = False
+    if facets:
+        counted = service.facet_counts(
+            query=q,
+            categories=category_list,
+            states=state_list,
+            scope=scope,
+            tags=tags_list,
+        )
+        if counted is not None:
+            facet_counts, facets_are_estimate = counted
 
     return SearchResponse(
         query=q,
         results=results,
         total=total,
+        total_is_estimate=total_is_estimate,
         limit=limit,
         offset=offset,
+        facets=facet_counts,
+        facets_are_estimate=facets_are_estimate,
     )
 
 
@@ -337,10 +374,13 @@ class SemanticSearchResponse(BaseModel):
 
     query: str = Field(..., description="The search query")
     results: list[ResourceSearchResult] = Field(..., description="Matching resources")
-    total: int = Field(..., description="Total matching results")
+    total: int | None = Field(..., description="Total matching results (null when count=none)")
+    total_is_estimate: bool = Field(False, description="Total is a lower bound (more than 1000 matches)")
     limit: int = Field(..., description="Maximum results returned")
     offset: int = Field(..., description="Pagination offset")
-    search_mode: str = Field(..., description="Search mode used: 'semantic' or 'hybrid'")
+    search_mode: str = Field(
+        ..., description="Search mode used: 'semantic', 'hybrid' or 'keyword' (while the embedding model loads)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -397,8 +437,19 @@ def semantic_search(
         pattern="^(semantic|hybrid)$",
         examples=["hybrid", "semantic"],
     ),
+    tier: str = Query(
+        "balanced",
+        description="Vector index recall/latency tier: 'fast', 'balanced' or 'accurate'",
+        pattern="^(fast|balanced|accurate)$",
+        examples=["balanced", "accurate"],
+    ),
     limit: int = Query(20, ge=1, le=500, description="Maximum results to return"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    count: str = Query(
+        "exact",
+        description="Total count for semantic mode: 'exact', 'estimate' (capped, reported as 1000+) or 'none'",
+        pattern=COUNT_MODE_PATTERN,
+    ),
 ) -> SemanticSearchResponse:
     """AI-powered semantic search using vector embeddings.
 
@@ -417,14 +468,35 @@ def semantic_search(
 
     Uses local SentenceTransformers model by default (free, fast).
     Can be configured to use OpenAI embeddings via USE_LOCAL_EMBEDDINGS=false.
+    While the model is still loading after startup, results come from
+    keyword search and `search_mode` is `keyword`.
     """
-    # Generate embedding for query
-    try:
-        from app.services.embedding import get_embedding_service
+    service = SearchService(session)
 
-        embedding_service = get_embedding_service()
-        result = embedding_service.generate_embedding(q)
-        query_embedding = result.embedding
+    # Don't block on the model load at startup - serve keyword results meanwhile
+    if embedding_model_loading():
+        results, total = service.search(
+            query=q,
+            categories=[category] if category else None,
+            states=[state] if state else None,
+            limit=limit,
+            offset=offset,
+            count=count,
+        )
+        total, total_is_estimate = reported_total(total, count)
+        return SemanticSearchResponse(
+            query=q,
+            results=results,
+            total=total,
+            total_is_estimate=total_is_estimate,
+            limit=limit,
+            offset=offset,
+            search_mode="keyword",
+        )
+
+    # Generate embedding for query (cached by normalized query text)
+    try:
+        query_embedding = embed_query(q, session)
     except Exception as e:
         # Log full error server-side, return generic message to client
         logger.exception("Failed to generate embedding for query: %s", e)
@@ -433,8 +505,6 @@ def semantic_search(
             detail="Failed to process search query",
         ) from e
 
-    service = SearchService(session)
-
     if mode == "semantic":
         results, total = service.semantic_search(
             query_embedding=query_embedding,
@@ -442,6 +512,8 @@ def semantic_search(
             state=state,
             limit=limit,
             offset=offset,
+            ann_tier=tier,
+            count=count,
         )
     else:  # hybrid
         results, total = service.hybrid_search(
@@ -451,12 +523,16 @@ def semantic_search(
             state=state,
             limit=limit,
             offset=offset,
+            ann_tier=tier,
         )
 
+    total, total_is_estimate = reported_total(total, count)
+
     return SemanticSearchResponse(
         query=q,
         results=results,
         total=total,
+        total_is_estimate=total_is_estimate,
         limit=limit,
         offset=offset,
         search_mode=mode,
@@ -4,10 +4,9 @@ from datetime import UTC, datetime
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
-from sqlmodel import func, select
 
 from app.database import SessionDep
-from app.models import Resource, ResourceStatus, Source
+from app.services.stats import StatsService
 from jobs import get_available_connectors, get_scheduler
 
 router = APIRouter()
@@ -43,6 +42,10 @@ class AIStats(BaseModel):
     scheduler_status: str = Field(description="Whether the job scheduler is running")
     jobs_completed_today: int = Field(description="Number of jobs completed in last 24 hours")
 
+    # Staleness of the resource counts (recomputed after refresh and freshness jobs)
+    stats_computed_at: datetime | None = Field(default=None, description="When the resource counts were computed")
+    stats_age_seconds: float | None = Field(default=None, description="Age of the resource counts in seconds")
+
 
 @router.get("/ai", response_model=AIStats)
 def get_ai_stats(session: SessionDep) -> AIStats:
@@ -57,27 +60,9 @@ def get_ai_stats(session: SessionDep) -> AIStats:
     These stats are displayed on the About page to show transparency
     about how the AI-powered resource aggregation works.
     """
-    # Count total resources
-    total_resources = session.exec(select(func.count()).select_from(Resource)).one() or 0
-
-    # Count verified resources (those that have been reviewed)
-    resources_verified = (
-        session.exec(
-            select(func.count()).select_from(Resource).where(Resource.last_verified != None)  # noqa: E711
-        ).one()
-        or 0
-    )
-
-    # Count resources by category
-    all_resources = session.exec(select(Resource.categories)).all()
-    resources_by_category: dict[str, int] = {}
-    for categories in all_resources:
-        if categories:
-            for cat in categories:
-                resources_by_category[cat] = resources_by_category.get(cat, 0) + 1
-
-    # Count sources
-    total_sources = session.exec(select(func.count()).select_from(Source)).one() or 0
+    # Resource counts come from the precomputed snapshot, not a scan per request
+    stats_service = StatsService(session)
+    snapshot = stats_service.get_snapshot()
 
     # Get active connectors
     connectors_raw = get_available_connectors()
@@ -114,25 +99,19 @@ def get_ai_stats(session: SessionDep) -> AIStats:
             if completed >= today_start:
                 jobs_completed_today += 1
 
-    # Calculate average trust score
-    avg_trust = session.exec(
-        select(func.avg(Resource.reliability_score * Resource.freshness_score)).where(
-            Resource.status == ResourceStatus.ACTIVE
-        )
-    ).one()
-    average_trust_score = float(avg_trust) if avg_trust else 0.0
-
     # Scheduler status
     scheduler_status = "Running" if scheduler.is_running else "Stopped"
 
     return AIStats(
-        total_resources=total_resources,
-        resources_verified=resources_verified,
-        resources_by_category=resources_by_category,
-        total_sources=total_sources,
+        total_resources=snapshot.total_resources,
+        resources_verified=snapshot.resources_verified,
+        resources_by_category=stats_service.categories(snapshot),
+        total_sources=snapshot.total_sources,
         connectors_active=connectors,
         last_refresh=last_refresh,
-        average_trust_score=round(average_trust_score, 2),
+        average_trust_score=round(snapshot.average_trust_score, 2),
         scheduler_status=scheduler_status,
         jobs_completed_today=jobs_completed_today,
+        stats_computed_at=snapshot.computed_at,
+        stats_age_seconds=round(stats_service.age_seconds(snapshot, now), 1),
     )
@@ -40,6 +40,50 @@ class Settings(BaseSettings):
     anthropic_api_key: str = ""
     openai_api_key: str = ""  # For embeddings (text-embedding-3-small)
     use_local_embeddings: bool = True  # Use SentenceTransformers (free) instead of OpenAI
+    # Unix socket of a shared embedding sidecar (app.embedding_sidecar); empty = load the model in each worker
+    embedding_sidecar_socket: str = ""
+
+    # Vector search - hnsw.ef_search per request tier (higher = better recall, slower)
+    ann_ef_search_fast: int = 40
+    ann_ef_search_balanced: int = 100
+    ann_ef_search_accurate: int = 400
+
+    # Query embedding cache for semantic search (in-process LRU, optionally shared via Postgres)
+    query_embedding_cache_size: int = 2000
+    query_embedding_cache_ttl_seconds: int = 7 * 24 * 3600
+    query_embedding_cache_persist: bool = False  # Share embeddings across workers via query_embeddings table
+    query_embedding_cache_warm_count: int = 100  # Popular searches embedded at startup (0 = disabled)
+
+    # In-process grid index of resource coordinates for nearby search without PostGIS
+    nearby_spatial_index: bool = False
+    nearby_spatial_index_ttl_seconds: int = 300  # Full rebuild interval (picks up other workers' writes)
+
+    # Analytics ingestion: events are buffered in memory and written in batches by a background thread
+    analytics_buffer_max_events: int = 10000  # Events beyond this are refused (503); 0 = write on the request
+    analytics_flush_batch_size: int = 500
+    analytics_flush_interval_ms: int = 1000
+    # analytics_events monthly partitions: created ahead of time, dropped whole after the retention period
+    analytics_partition_months_ahead: int = 3
+    analytics_retention_months: int = 13  # Raw events only; dashboard rollups are kept
+
+    # In-process facet bitmaps for filter sidebar counts (?facets=true on search and listing)
+    facet_index_ttl_seconds: int = 300  # Full rebuild interval (picks up other workers' writes)
+    # Text matches counted for search facets; past this the counts cover an arbitrary subset and are approximate
+    facet_search_max_matches: int = 10000
+
+    # ETL geocoding: Census batch geocoder with a persistent address cache (False = zip centroids after load only)
+    etl_census_geocoder: bool = True
+    etl_geocode_miss_ttl_days: int = 30  # Census "no match" results are retried after this
+
+    # ETL extract stage: connectors run concurrently, limited overall and per source host
+    etl_extract_workers: int = 8
+    etl_extract_per_host: int = 2
+    etl_connector_timeout_seconds: float = 1800  # A connector still running after this is abandoned
+    # Streaming ETL: resources per dedupe/enrich/load chunk; 0 = materialize every source and dedupe across all of them.
+    # Cross-chunk duplicates are merged by the loader, where a lower-tier copy only fills empty fields
+    etl_stream_chunk_size: int = 0
+    # ETL load: skip records whose raw data hash matches their last SourceRecord (False = full field diff every run)
+    etl_skip_unchanged: bool = True
 
     # Environment
     environment: str = "development"
@@ -55,7 +99,11 @@ class Settings(BaseSettings):
     link_checker_schedule: str = "0 3 * * *"  # Daily at 3am
     discovery_schedule: str = "0 4 * * *"  # Daily at 4am
     embeddings_schedule: str = "0 5 * * *"  # Daily at 5am
+    analytics_rollup_schedule: str = "5 * * * *"  # Hourly, just after each hour closes
+    analytics_partition_schedule: str = "30 0 * * *"  # Daily at 12:30am
     scheduler_enabled: bool = True  # Can disable in dev
+    # Max vectors from an older embedding model re-embedded per embeddings run (rolling migration)
+    embeddings_rolling_limit: int = 5000
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
@@ -71,6 +119,8 @@ class Settings(BaseSettings):
             "LINK_CHECKER_SCHEDULE": self.link_checker_schedule,
             "DISCOVERY_SCHEDULE": self.discovery_schedule,
             "EMBEDDINGS_SCHEDULE": self.embeddings_schedule,
+            "ANALYTICS_ROLLUP_SCHEDULE": self.analytics_rollup_schedule,
+            "ANALYTICS_PARTITION_SCHEDULE": self.analytics_partition_schedule,
             "SCHEDULER_ENABLED": self.scheduler_enabled,
         }
 
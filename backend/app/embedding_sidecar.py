@@ -0,0 +1,57 @@
+"""Embedding sidecar - one shared local embedding model for all API workers.
+
+Each uvicorn worker that uses LocalEmbeddingService loads its own copy of
+the SentenceTransformers model. Run this app once per host instead and set
+EMBEDDING_SIDECAR_SOCKET on the API so workers encode through it:
+
+    uvicorn app.embedding_sidecar:app --uds /tmp/vetrd-embeddings.sock
+    EMBEDDING_SIDECAR_SOCKET=/tmp/vetrd-embeddings.sock uvicorn app.main:app --workers 4
+"""
+
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
+
+from app.services.embedding import LOCAL_MODEL_NAME, LocalEmbeddingService
+
+# Upper bound on texts per request (the embeddings job sends 256 at a time)
+MAX_TEXTS = 1024
+
+
+class EmbedRequest(BaseModel):
+    """Texts to embed."""
+
+    texts: list[str] = Field(..., min_length=1, max_length=MAX_TEXTS)
+
+
+class EmbedResponse(BaseModel):
+    """Embeddings in the same order as the request texts."""
+
+    embeddings: list[list[float]]
+    model: str
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Load the model before accepting requests."""
+    LocalEmbeddingService.load_model()
+    yield
+
+
+app = FastAPI(title="VetRD Embedding Sidecar", lifespan=lifespan)
+
+
+@app.get("/health")
+async def health_check() -> dict[str, str]:
+    """Report the loaded model."""
+    return {"status": "healthy", "model": LOCAL_MODEL_NAME}
+
+
+@app.post("/embed", response_model=EmbedResponse)
+async def embed(request: EmbedRequest) -> EmbedResponse:
+    """Embed a batch of texts with the shared model."""
+    results = await run_in_threadpool(LocalEmbeddingService().generate_batch_embeddings, request.texts)
+    return EmbedResponse(embeddings=[r.embedding for r in results], model=LOCAL_MODEL_NAME)
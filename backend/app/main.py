@@ -1,6 +1,7 @@
 """VetRD API - Veteran Resource Directory."""
 
 import logging
+import threading
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
@@ -12,6 +13,11 @@ from sqlmodel import Session, select, text
 from app.api.v1 import admin, analytics, chat, email, feedback, partner, resources, search, stats, taxonomy
 from app.config import settings
 from app.database import create_db_and_tables, engine
+from app.services.analytics_buffer import start_analytics_buffer, stop_analytics_buffer
+from app.services.analytics_partitions import AnalyticsPartitionService
+from app.services.embedding import preload_embedding_model
+from app.services.embedding_cache import warm_query_embedding_cache
+from app.services.geo import get_geo_context
 from jobs import get_scheduler, setup_jobs
 
 logger = logging.getLogger(__name__)
@@ -20,6 +26,26 @@ logger = logging.getLogger(__name__)
 DB_INIT_FAILED = False
 
 
+def _warm_query_embedding_cache() -> None:
+    """Embed popular searches into the query embedding cache."""
+    try:
+        with Session(engine) as session:
+            warm_query_embedding_cache(session)
+    except Exception as e:
+        logger.warning("Failed to warm query embedding cache: %s", e)
+
+
+def _ensure_analytics_partitions() -> None:
+    """Create the current and upcoming analytics_events partitions (fresh databases)."""
+    try:
+        with Session(engine) as session:
+            partitions = AnalyticsPartitionService(session)
+            if partitions.is_partitioned():
+                partitions.ensure_partitions()
+    except Exception as e:
+        logger.warning("Failed to create analytics partitions: %s", e)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan handler."""
@@ -34,6 +60,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         DB_INIT_FAILED = True
         # Continue anyway to allow health checks to report failure
 
+    # Detect PostGIS and load zip code centroids once per process
+    if not DB_INIT_FAILED:
+        get_geo_context()
+
+    # Load the embedding model and pre-embed popular searches in the background so
+    # startup isn't delayed; semantic search falls back to keyword search until then
+    warm = not DB_INIT_FAILED and settings.query_embedding_cache_warm_count > 0
+    if preload_embedding_model(on_ready=_warm_query_embedding_cache if warm else None) is None and warm:
+        threading.Thread(target=_warm_query_embedding_cache, name="warm-query-embeddings", daemon=True).start()
+
+    # Analytics events are written in batches off the request path, into monthly partitions
+    if not DB_INIT_FAILED:
+        _ensure_analytics_partitions()
+    start_analytics_buffer(engine)
+
     # Initialize scheduler variable before try block to ensure it's defined
     scheduler = None
 
@@ -57,6 +98,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("Scheduler shutdown error: %s", e, exc_info=True)
 
+    # Write buffered analytics events before exiting
+    try:
+        stop_analytics_buffer()
+    except Exception as e:
+        logger.warning("Analytics buffer drain error: %s", e, exc_info=True)
+
 
 API_DESCRIPTION = """
 # VetRD API
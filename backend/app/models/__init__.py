@@ -8,6 +8,8 @@ from app.models.analytics import (
     AnalyticsEventType,
 )
 from app.models.feedback import Feedback, FeedbackIssueType, FeedbackStatus
+from app.models.fingerprint import ResourceFingerprint
+from app.models.geocode_cache import GeocodedAddress
 from app.models.location import Location
 from app.models.organization import Organization
 from app.models.partner import (
@@ -17,6 +19,7 @@ from app.models.partner import (
     PartnerTier,
 )
 from app.models.program import Program, ProgramStatus, ProgramType
+from app.models.query_embedding import QueryEmbedding
 from app.models.resource import Resource, ResourceScope, ResourceStatus
 from app.models.review import ChangeLog, ChangeType, ReviewState, ReviewStatus
 from app.models.source import (
@@ -27,6 +30,7 @@ from app.models.source import (
     SourceRecord,
     SourceType,
 )
+from app.models.stats import ResourceStatsSnapshot
 
 
 def utc_now() -> datetime:
@@ -46,6 +50,7 @@ __all__ = [
     "Feedback",
     "FeedbackIssueType",
     "FeedbackStatus",
+    "GeocodedAddress",
     "Organization",
     "Location",
     "Partner",
@@ -55,9 +60,12 @@ __all__ = [
     "Program",
     "ProgramStatus",
     "ProgramType",
+    "QueryEmbedding",
     "Resource",
+    "ResourceFingerprint",
     "ResourceStatus",
     "ResourceScope",
+    "ResourceStatsSnapshot",
     "Source",
     "SourceError",
     "SourceErrorType",
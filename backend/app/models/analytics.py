@@ -43,9 +43,14 @@ class AnalyticsEvent(SQLModel, table=True):
 
     Captures user interactions without any personally identifiable information.
     No IP addresses, cookies, or user identifiers are stored.
+
+    Range-partitioned by month on created_at (see
+    app.services.analytics_partitions); Postgres requires the partition
+    key in the primary key.
     """
 
     __tablename__ = "analytics_events"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
 
@@ -68,20 +73,22 @@ class AnalyticsEvent(SQLModel, table=True):
     page_path: str | None = Field(default=None, max_length=255)
 
     # Timestamp
-    created_at: datetime = Field(default_factory=_utc_now, index=True)
+    created_at: datetime = Field(default_factory=_utc_now, primary_key=True, index=True)
 
 
 class AnalyticsDailyAggregate(SQLModel, table=True):
-    """Daily aggregated analytics for dashboard display.
+    """Aggregated analytics for dashboard display.
 
-    Pre-computed daily summaries for fast dashboard queries.
-    Updated by a background job.
+    Pre-computed summaries for fast dashboard queries, maintained by the
+    analytics rollup job: one row per completed day, plus one per completed
+    hour (period "hour") of the current day until its day row is written.
     """
 
     __tablename__ = "analytics_daily_aggregates"
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    date: datetime = Field(index=True)  # Date only, no time
+    date: datetime = Field(index=True)  # Bucket start: midnight for days, the hour for hours
+    period: str = Field(default="day", max_length=10)  # "day" or "hour"
 
     # Event counts
     total_searches: int = Field(default=0)
@@ -90,6 +97,11 @@ class AnalyticsDailyAggregate(SQLModel, table=True):
     total_chat_messages: int = Field(default=0)
     wizard_starts: int = Field(default=0)
     wizard_completions: int = Field(default=0)
+    total_filter_usage: int = Field(default=0)
+    total_page_views: int = Field(default=0)
+
+    # Wizard step distribution (JSON string of step counts)
+    wizard_steps: str | None = Field(default=None)  # JSON: {"1": 40, "2": 31}
 
     # Popular categories (JSON string of category counts)
     top_categories: str | None = Field(default=None)  # JSON: {"housing": 50, "employment": 30}
@@ -0,0 +1,34 @@
+"""Normalized duplicate-detection keys for resources.
+
+One row per resource, written by the import paths (ETL loader, 211
+importer, discovery job) so later imports find duplicates with an indexed
+lookup instead of scanning resources. See etl/dedupe_index.py.
+"""
+
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import Index
+from sqlmodel import Field, SQLModel
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class ResourceFingerprint(SQLModel, table=True):
+    """Normalized title, org, phone and address of one resource."""
+
+    __tablename__ = "resource_fingerprints"
+    __table_args__ = (
+        Index("ix_resource_fingerprints_org_title", "org_key", "title_key"),
+        Index("ix_resource_fingerprints_org_phone", "org_key", "phone"),
+    )
+
+    resource_id: uuid.UUID = Field(foreign_key="resources.id", primary_key=True, ondelete="CASCADE")
+    org_key: str = Field(max_length=500)
+    title_key: str = Field(max_length=500)
+    phone: str | None = Field(default=None, max_length=10)
+    address_key: str | None = Field(default=None, max_length=500)
+    state: str | None = Field(default=None, max_length=2)
+    updated_at: datetime = Field(default_factory=_utc_now)
@@ -0,0 +1,27 @@
+"""Persistent cache of Census geocoder results.
+
+Keyed on a hash of the normalized address so ETL refreshes only send
+addresses the geocoder hasn't seen. Unmatched addresses are cached too
+(with no coordinates) so they aren't retried every run, until they expire
+after ETL_GEOCODE_MISS_TTL_DAYS. See etl/geocoder.py.
+"""
+
+from datetime import UTC, datetime
+
+from sqlmodel import Field, SQLModel
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class GeocodedAddress(SQLModel, table=True):
+    """Census geocoder result for one normalized address."""
+
+    __tablename__ = "geocoded_addresses"
+
+    address_hash: str = Field(primary_key=True, max_length=64)
+    latitude: float | None = Field(default=None)
+    longitude: float | None = Field(default=None)
+    match_quality: str | None = Field(default=None, max_length=20)  # Census "Exact" / "Non_Exact"
+    created_at: datetime = Field(default_factory=_utc_now)
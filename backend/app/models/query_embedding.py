@@ -0,0 +1,26 @@
+"""Shared cache of search-query embeddings.
+
+Lets API workers reuse each other's query embeddings instead of re-running
+the embedding model (or an OpenAI call) for common searches.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, Float
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlmodel import Field, SQLModel
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class QueryEmbedding(SQLModel, table=True):
+    """Embedding of a normalized search query for one embedding model."""
+
+    __tablename__ = "query_embeddings"
+
+    query: str = Field(primary_key=True, max_length=255)
+    model: str = Field(primary_key=True, max_length=100)
+    embedding: list[float] = Field(sa_column=Column(ARRAY(Float), nullable=False))
+    created_at: datetime = Field(default_factory=_utc_now, index=True)
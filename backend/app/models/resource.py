@@ -97,7 +97,7 @@ class Resource(SQLModel, table=True):
 
     # Trust signals
     source_id: uuid.UUID | None = Field(default=None, foreign_key="sources.id")
-    source_url: str | None = Field(default=None, max_length=1000)
+    source_url: str | None = Field(default=None, max_length=1000, index=True)
     last_scraped: datetime | None = None
     last_verified: datetime | None = None
     freshness_score: float = Field(default=1.0)  # 0-1
@@ -129,6 +129,10 @@ class Resource(SQLModel, table=True):
     #     sa_column=Column(Vector(EMBEDDING_DIMENSION), nullable=True) if _HAS_PGVECTOR else None,
     # )
 
+    # What the current embedding was generated from (written by the embeddings job)
+    embedding_text_hash: str | None = Field(default=None, max_length=64)  # sha256 of prepare_resource_text()
+    embedding_model: str | None = Field(default=None, max_length=100)
+
     # Relationships
     organization: "Organization" = Relationship(back_populates="resources")
     program: Optional["Program"] = Relationship(back_populates="resources")
@@ -0,0 +1,31 @@
+"""Snapshot of corpus-wide resource statistics.
+
+Computed in one aggregate query by StatsService.refresh() (after ETL
+refreshes and freshness updates) so the About page reads a single row
+instead of scanning resources on every request.
+"""
+
+from datetime import UTC, datetime
+
+from sqlmodel import Field, SQLModel
+
+
+def _utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class ResourceStatsSnapshot(SQLModel, table=True):
+    """Latest resource statistics (a single row, id = 1)."""
+
+    __tablename__ = "resource_stats_snapshots"
+
+    id: int = Field(default=1, primary_key=True)
+    total_resources: int = Field(default=0)
+    resources_verified: int = Field(default=0)
+    total_sources: int = Field(default=0)
+    average_trust_score: float = Field(default=0.0)  # Mean reliability * freshness of active resources
+
+    # JSON string of category counts: {"housing": 500, "employment": 300}
+    resources_by_category: str = Field(default="{}")
+
+    computed_at: datetime = Field(default_factory=_utc_now)
@@ -360,9 +360,14 @@ class ResourceList(BaseModel):
     """Paginated list of resources."""
 
     resources: list[ResourceRead] = Field(..., description="List of resources")
-    total: int = Field(..., description="Total number of matching resources")
+    total: int | None = Field(..., description="Total number of matching resources (null when count=none)")
+    total_is_estimate: bool = Field(False, description="Total is a lower bound (more than 1000 matches)")
     limit: int = Field(..., description="Maximum results per page")
     offset: int = Field(..., description="Current pagination offset")
+    facets: dict[str, dict[str, int]] | None = Field(
+        None,
+        description="Counts per categories/states/tags/scope value when facets=true (each OR filter ignores itself)",
+    )
 
 
 class ResourceCount(BaseModel):
@@ -415,7 +420,8 @@ class ResourceNearbyList(BaseModel):
     """Paginated list of nearby resources."""
 
     resources: list[ResourceNearbyResult] = Field(..., description="Resources sorted by distance")
-    total: int = Field(..., description="Total number of resources within radius")
+    total: int | None = Field(..., description="Total number of resources within radius (null when count=none)")
+    next_cursor: str | None = Field(None, description="Pass as cursor to fetch the next page (null on the last page)")
     zip_code: str | None = Field(None, description="Search zip code (null when using lat/lng)")
     state: str | None = Field(None, description="2-letter state code for the zip code")
     radius_miles: int = Field(..., description="Search radius in miles")
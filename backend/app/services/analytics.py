@@ -2,20 +2,104 @@
 
 All data is anonymous - no PII, no user identifiers, no IP addresses.
 This service provides methods to record events and query aggregated statistics.
+
+Dashboard statistics are read from rollups (analytics_daily_aggregates),
+which the analytics rollup job maintains incrementally: one row per
+completed day and one per completed hour of the current day. Only the
+events after the last rolled-up bucket (normally under an hour) are
+counted raw, so dashboard cost doesn't grow with the event history.
 """
 
 import json
 import uuid
+from collections import Counter
+from dataclasses import dataclass, field, fields
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlmodel import Session, func, select
+from sqlmodel import Session, delete, func, select
 
 from app.models.analytics import (
     AnalyticsDailyAggregate,
     AnalyticsEvent,
     AnalyticsEventType,
 )
+from app.services.analytics_buffer import get_analytics_buffer
+
+PERIOD_DAY = "day"
+PERIOD_HOUR = "hour"
+PERIOD_SPANS = {PERIOD_DAY: timedelta(days=1), PERIOD_HOUR: timedelta(hours=1)}
+
+# Values kept per JSON count map in a rollup row. Merged counts are exact for
+# values that make every bucket's cut (all categories and states do).
+ROLLUP_TOP_N = 500
+
+# Event type -> rollup count column
+TYPE_COLUMNS = {
+    AnalyticsEventType.SEARCH: "total_searches",
+    AnalyticsEventType.RESOURCE_VIEW: "total_resource_views",
+    AnalyticsEventType.CHAT_START: "total_chat_sessions",
+    AnalyticsEventType.CHAT_MESSAGE: "total_chat_messages",
+    AnalyticsEventType.WIZARD_START: "wizard_starts",
+    AnalyticsEventType.WIZARD_COMPLETE: "wizard_completions",
+    AnalyticsEventType.SEARCH_FILTER: "total_filter_usage",
+    AnalyticsEventType.PAGE_VIEW: "total_page_views",
+}
+
+# Rollup JSON column -> EventCounts field
+JSON_COLUMNS = {
+    "top_categories": "categories",
+    "top_states": "states",
+    "top_searches": "searches",
+    "top_resources": "resources",
+    "wizard_steps": "wizard_steps",
+}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Rollup dates are stored without a timezone (UTC)."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+def _day_start(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class EventCounts:
+    """Event counts for a time range: one rollup bucket, a raw tail, or a merge of them."""
+
+    by_type: Counter[str] = field(default_factory=Counter)
+    wizard_steps: Counter[str] = field(default_factory=Counter)
+    categories: Counter[str] = field(default_factory=Counter)
+    states: Counter[str] = field(default_factory=Counter)
+    searches: Counter[str] = field(default_factory=Counter)
+    resources: Counter[str] = field(default_factory=Counter)
+
+    def merge(self, other: "EventCounts") -> "EventCounts":
+        """Add another range's counts into this one."""
+        for counter in fields(self):
+            getattr(self, counter.name).update(getattr(other, counter.name))
+        return self
+
+    @classmethod
+    def from_aggregate(cls, aggregate: AnalyticsDailyAggregate) -> "EventCounts":
+        """Decode a rollup row."""
+        counts = cls(
+            by_type=Counter(
+                {str(event_type): getattr(aggregate, column) or 0 for event_type, column in TYPE_COLUMNS.items()}
+            )
+        )
+        for column, name in JSON_COLUMNS.items():
+            getattr(counts, name).update(json.loads(getattr(aggregate, column) or "{}"))
+        return counts
+
+    def apply_to(self, aggregate: AnalyticsDailyAggregate) -> None:
+        """Write these counts into a rollup row."""
+        for event_type, column in TYPE_COLUMNS.items():
+            setattr(aggregate, column, self.by_type.get(str(event_type), 0))
+        for column, name in JSON_COLUMNS.items():
+            setattr(aggregate, column, json.dumps(dict(getattr(self, name).most_common(ROLLUP_TOP_N))))
 
 
 class AnalyticsService:
@@ -23,11 +107,26 @@ class AnalyticsService:
 
     def __init__(self, session: Session):
         self.session = session
+        # Window counts by days, so the dashboard reads the rollups once
+        self._windows: dict[int, EventCounts] = {}
 
     # =========================================================================
     # Event Recording
     # =========================================================================
 
+    def record(self, event: AnalyticsEvent) -> AnalyticsEvent:
+        """Queue an event for a batched write, or write it now when buffering is off.
+
+        A buffered event that doesn't fit (buffer full) is dropped.
+        """
+        buffer = get_analytics_buffer()
+        if buffer is not None:
+            buffer.add(event)
+            return event
+        self.session.add(event)
+        self.session.commit()
+        return event
+
     def track_search(
         self,
         query: str,
@@ -44,9 +143,7 @@ class AnalyticsService:
             state=state[:2] if state else None,
             page_path=page_path,
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     def track_filter_usage(
         self,
@@ -62,9 +159,7 @@ class AnalyticsService:
             state=state[:2] if state else None,
             page_path=page_path,
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     def track_resource_view(
         self,
@@ -81,9 +176,7 @@ class AnalyticsService:
             state=state[:2] if state else None,
             page_path=f"/resources/{resource_id}",
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     def track_wizard_event(
         self,
@@ -104,9 +197,7 @@ class AnalyticsService:
             wizard_step=step,
             page_path="/search",
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     def track_chat_event(
         self,
@@ -123,9 +214,7 @@ class AnalyticsService:
             event_name=f"chat_{event_name}",
             page_path="/chat",
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     def track_page_view(
         self,
@@ -141,9 +230,7 @@ class AnalyticsService:
             category=category,
             state=state[:2] if state else None,
         )
-        self.session.add(event)
-        self.session.commit()
-        return event
+        return self.record(event)
 
     # =========================================================================
     # Statistics Queries
@@ -151,16 +238,7 @@ class AnalyticsService:
 
     def get_summary_stats(self, days: int = 30) -> dict[str, Any]:
         """Get summary statistics for the dashboard."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        # Count by event type
-        counts = self.session.exec(
-            select(AnalyticsEvent.event_type, func.count(AnalyticsEvent.id))
-            .where(AnalyticsEvent.created_at >= since)
-            .group_by(AnalyticsEvent.event_type)
-        ).all()
-
-        count_dict = {str(event_type): count for event_type, count in counts}
+        count_dict = self._window_counts(days).by_type
 
         return {
             "period_days": days,
@@ -175,106 +253,31 @@ class AnalyticsService:
 
     def get_popular_searches(self, days: int = 30, limit: int = 10) -> list[dict]:
         """Get most popular search queries."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        results = self.session.exec(
-            select(AnalyticsEvent.search_query, func.count(AnalyticsEvent.id).label("count"))
-            .where(
-                AnalyticsEvent.event_type == AnalyticsEventType.SEARCH,
-                AnalyticsEvent.created_at >= since,
-                AnalyticsEvent.search_query.isnot(None),
-            )
-            .group_by(AnalyticsEvent.search_query)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(limit)
-        ).all()
-
-        return [{"query": query, "count": count} for query, count in results]
+        searches = self._window_counts(days).searches
+        return [{"query": query, "count": count} for query, count in self._top(searches, limit)]
 
     def get_popular_categories(self, days: int = 30, limit: int = 10) -> list[dict]:
         """Get most used categories."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        results = self.session.exec(
-            select(AnalyticsEvent.category, func.count(AnalyticsEvent.id).label("count"))
-            .where(
-                AnalyticsEvent.created_at >= since,
-                AnalyticsEvent.category.isnot(None),
-            )
-            .group_by(AnalyticsEvent.category)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(limit)
-        ).all()
-
-        return [{"category": category, "count": count} for category, count in results]
+        categories = self._window_counts(days).categories
+        return [{"category": category, "count": count} for category, count in self._top(categories, limit)]
 
     def get_popular_states(self, days: int = 30, limit: int = 10) -> list[dict]:
         """Get most searched states."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        results = self.session.exec(
-            select(AnalyticsEvent.state, func.count(AnalyticsEvent.id).label("count"))
-            .where(
-                AnalyticsEvent.created_at >= since,
-                AnalyticsEvent.state.isnot(None),
-            )
-            .group_by(AnalyticsEvent.state)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(limit)
-        ).all()
-
-        return [{"state": state, "count": count} for state, count in results]
+        states = self._window_counts(days).states
+        return [{"state": state, "count": count} for state, count in self._top(states, limit)]
 
     def get_most_viewed_resources(self, days: int = 30, limit: int = 10) -> list[dict]:
         """Get most viewed resources."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        results = self.session.exec(
-            select(AnalyticsEvent.resource_id, func.count(AnalyticsEvent.id).label("count"))
-            .where(
-                AnalyticsEvent.event_type == AnalyticsEventType.RESOURCE_VIEW,
-                AnalyticsEvent.created_at >= since,
-                AnalyticsEvent.resource_id.isnot(None),
-            )
-            .group_by(AnalyticsEvent.resource_id)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(limit)
-        ).all()
-
-        return [{"resource_id": str(resource_id), "count": count} for resource_id, count in results]
+        resources = self._window_counts(days).resources
+        return [{"resource_id": resource_id, "count": count} for resource_id, count in self._top(resources, limit)]
 
     def get_wizard_funnel(self, days: int = 30) -> dict[str, int]:
         """Get wizard completion funnel."""
-        since = datetime.now(UTC) - timedelta(days=days)
-
-        # Count starts and completions
-        starts = self.session.exec(
-            select(func.count(AnalyticsEvent.id)).where(
-                AnalyticsEvent.event_type == AnalyticsEventType.WIZARD_START,
-                AnalyticsEvent.created_at >= since,
-            )
-        ).one()
-
-        completions = self.session.exec(
-            select(func.count(AnalyticsEvent.id)).where(
-                AnalyticsEvent.event_type == AnalyticsEventType.WIZARD_COMPLETE,
-                AnalyticsEvent.created_at >= since,
-            )
-        ).one()
-
-        # Get step distribution
-        step_counts = self.session.exec(
-            select(AnalyticsEvent.wizard_step, func.count(AnalyticsEvent.id))
-            .where(
-                AnalyticsEvent.event_type == AnalyticsEventType.WIZARD_STEP,
-                AnalyticsEvent.created_at >= since,
-                AnalyticsEvent.wizard_step.isnot(None),
-            )
-            .group_by(AnalyticsEvent.wizard_step)
-            .order_by(AnalyticsEvent.wizard_step)
-        ).all()
+        counts = self._window_counts(days)
+        starts = counts.by_type.get("wizard_start", 0)
+        completions = counts.by_type.get("wizard_complete", 0)
 
-        steps = {f"step_{step}": count for step, count in step_counts}
+        steps = {f"step_{step}": counts.wizard_steps[step] for step in sorted(counts.wizard_steps, key=int)}
 
         return {
             "starts": starts,
@@ -285,130 +288,158 @@ class AnalyticsService:
 
     def get_daily_trends(self, days: int = 30) -> list[dict]:
         """Get daily event counts for trend chart."""
-        since = datetime.now(UTC) - timedelta(days=days)
+        rollups, tail_since = self._rollup_window(days)
 
-        # Use a column reference for date_trunc to avoid GROUP BY issues
-        date_col = func.date_trunc("day", AnalyticsEvent.created_at)
+        by_day: dict[str, Counter[str]] = {}
+        for aggregate in rollups:
+            date_str = aggregate.date.strftime("%Y-%m-%d")
+            by_day.setdefault(date_str, Counter()).update(EventCounts.from_aggregate(aggregate).by_type)
 
+        # Raw tail, by day in case the rollup job has fallen behind
+        date_col = func.date_trunc("day", AnalyticsEvent.created_at)
         results = self.session.exec(
             select(
                 date_col.label("date"),
                 AnalyticsEvent.event_type,
                 func.count(AnalyticsEvent.id).label("count"),
             )
-            .where(AnalyticsEvent.created_at >= since)
+            .where(AnalyticsEvent.created_at >= tail_since)
             .group_by(
                 date_col,
                 AnalyticsEvent.event_type,
             )
-            .order_by(date_col)
         ).all()
-
-        # Group by date
-        trends: dict[str, dict] = {}
         for date, event_type, count in results:
-            date_str = date.strftime("%Y-%m-%d")
-            if date_str not in trends:
-                trends[date_str] = {"date": date_str}
-            trends[date_str][str(event_type)] = count
+            by_day.setdefault(date.strftime("%Y-%m-%d"), Counter())[str(event_type)] += count
+
+        return [
+            {"date": date_str, **{event_type: count for event_type, count in counts.items() if count}}
+            for date_str, counts in sorted(by_day.items())
+        ]
+
+    def _window_counts(self, days: int) -> EventCounts:
+        """Counts for the last ``days`` days: rollups plus the raw tail after them."""
+        if days not in self._windows:
+            rollups, tail_since = self._rollup_window(days)
+            counts = EventCounts()
+            for aggregate in rollups:
+                counts.merge(EventCounts.from_aggregate(aggregate))
+            self._windows[days] = counts.merge(self.count_events(tail_since))
+        return self._windows[days]
+
+    def _rollup_window(self, days: int) -> tuple[list[AnalyticsDailyAggregate], datetime]:
+        """Rollup rows covering the last ``days`` days, and where the raw tail starts.
+
+        The window is whole UTC days: the ``days`` days before today plus
+        today so far. Day rows cover completed days and hour rows the
+        completed hours after them; events after the last rolled-up
+        bucket are read raw. With no rollups yet, the whole window is raw.
+        """
+        today = _day_start(datetime.now(UTC))
+        covered = today - timedelta(days=days)
+
+        day_rows = self.session.exec(
+            select(AnalyticsDailyAggregate)
+            .where(
+                AnalyticsDailyAggregate.period == PERIOD_DAY,
+                AnalyticsDailyAggregate.date >= covered,
+                AnalyticsDailyAggregate.date < today,
+            )
+            .order_by(AnalyticsDailyAggregate.date)
+        ).all()
+        if day_rows:
+            covered = _as_utc(day_rows[-1].date) + PERIOD_SPANS[PERIOD_DAY]
+
+        hour_rows = self.session.exec(
+            select(AnalyticsDailyAggregate)
+            .where(
+                AnalyticsDailyAggregate.period == PERIOD_HOUR,
+                AnalyticsDailyAggregate.date >= covered,
+            )
+            .order_by(AnalyticsDailyAggregate.date)
+        ).all()
+        if hour_rows:
+            covered = _as_utc(hour_rows[-1].date) + PERIOD_SPANS[PERIOD_HOUR]
+
+        return [*day_rows, *hour_rows], covered
 
-        return list(trends.values())
+    @staticmethod
+    def _top(counts: Counter[str], limit: int) -> list[tuple[str, int]]:
+        """Largest counts first; ties by value so results are stable."""
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
 
     # =========================================================================
     # Aggregation (for background job)
     # =========================================================================
 
-    def compute_daily_aggregate(self, date: datetime) -> AnalyticsDailyAggregate:
-        """Compute and store daily aggregate for a specific date."""
-        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end = start + timedelta(days=1)
+    def count_events(self, start: datetime, end: datetime | None = None) -> EventCounts:
+        """Count raw events created in [start, end) (up to now when ``end`` is None)."""
+        window = [AnalyticsEvent.created_at >= start]
+        if end is not None:
+            window.append(AnalyticsEvent.created_at < end)
 
-        # Count by event type for this day
-        counts = self.session.exec(
+        # Count by event type
+        by_type = self.session.exec(
             select(AnalyticsEvent.event_type, func.count(AnalyticsEvent.id))
-            .where(
-                AnalyticsEvent.created_at >= start,
-                AnalyticsEvent.created_at < end,
-            )
+            .where(*window)
             .group_by(AnalyticsEvent.event_type)
         ).all()
 
-        count_dict = {str(event_type): count for event_type, count in counts}
-
-        # Top categories
-        top_cats = self.session.exec(
-            select(AnalyticsEvent.category, func.count(AnalyticsEvent.id))
+        # Wizard step distribution
+        steps = self.session.exec(
+            select(AnalyticsEvent.wizard_step, func.count(AnalyticsEvent.id))
             .where(
-                AnalyticsEvent.created_at >= start,
-                AnalyticsEvent.created_at < end,
-                AnalyticsEvent.category.isnot(None),
+                *window,
+                AnalyticsEvent.event_type == AnalyticsEventType.WIZARD_STEP,
+                AnalyticsEvent.wizard_step.isnot(None),
             )
-            .group_by(AnalyticsEvent.category)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(10)
+            .group_by(AnalyticsEvent.wizard_step)
         ).all()
 
-        # Top states
-        top_states = self.session.exec(
-            select(AnalyticsEvent.state, func.count(AnalyticsEvent.id))
-            .where(
-                AnalyticsEvent.created_at >= start,
-                AnalyticsEvent.created_at < end,
-                AnalyticsEvent.state.isnot(None),
-            )
-            .group_by(AnalyticsEvent.state)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(10)
-        ).all()
+        return EventCounts(
+            by_type=Counter({str(event_type): count for event_type, count in by_type}),
+            wizard_steps=Counter({str(step): count for step, count in steps}),
+            categories=self._count_values(AnalyticsEvent.category, window),
+            states=self._count_values(AnalyticsEvent.state, window),
+            searches=self._count_values(
+                AnalyticsEvent.search_query,
+                [*window, AnalyticsEvent.event_type == AnalyticsEventType.SEARCH],
+            ),
+            resources=self._count_values(
+                AnalyticsEvent.resource_id,
+                [*window, AnalyticsEvent.event_type == AnalyticsEventType.RESOURCE_VIEW],
+            ),
+        )
 
-        # Top searches
-        top_searches = self.session.exec(
-            select(AnalyticsEvent.search_query, func.count(AnalyticsEvent.id))
-            .where(
-                AnalyticsEvent.event_type == AnalyticsEventType.SEARCH,
-                AnalyticsEvent.created_at >= start,
-                AnalyticsEvent.created_at < end,
-                AnalyticsEvent.search_query.isnot(None),
-            )
-            .group_by(AnalyticsEvent.search_query)
+    def _count_values(self, column: Any, conditions: list[Any]) -> Counter[str]:
+        """Top ROLLUP_TOP_N values of a column among matching events."""
+        results = self.session.exec(
+            select(column, func.count(AnalyticsEvent.id))
+            .where(*conditions, column.isnot(None))
+            .group_by(column)
             .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(10)
+            .limit(ROLLUP_TOP_N)
         ).all()
+        return Counter({str(value): count for value, count in results})
 
-        # Top resources
-        top_resources = self.session.exec(
-            select(AnalyticsEvent.resource_id, func.count(AnalyticsEvent.id))
-            .where(
-                AnalyticsEvent.event_type == AnalyticsEventType.RESOURCE_VIEW,
-                AnalyticsEvent.created_at >= start,
-                AnalyticsEvent.created_at < end,
-                AnalyticsEvent.resource_id.isnot(None),
-            )
-            .group_by(AnalyticsEvent.resource_id)
-            .order_by(func.count(AnalyticsEvent.id).desc())
-            .limit(10)
-        ).all()
+    def rollup(self, start: datetime, period: str = PERIOD_DAY) -> AnalyticsDailyAggregate:
+        """Compute and store the rollup of the day or hour starting at ``start``."""
+        counts = self.count_events(start, start + PERIOD_SPANS[period])
 
         # Check if aggregate exists
         existing = self.session.exec(
-            select(AnalyticsDailyAggregate).where(AnalyticsDailyAggregate.date == start)
+            select(AnalyticsDailyAggregate).where(
+                AnalyticsDailyAggregate.period == period,
+                AnalyticsDailyAggregate.date == start,
+            )
         ).first()
 
         if existing:
             aggregate = existing
         else:
-            aggregate = AnalyticsDailyAggregate(date=start)
-
-        aggregate.total_searches = count_dict.get("search", 0)
-        aggregate.total_resource_views = count_dict.get("resource_view", 0)
-        aggregate.total_chat_sessions = count_dict.get("chat_start", 0)
-        aggregate.total_chat_messages = count_dict.get("chat_message", 0)
-        aggregate.wizard_starts = count_dict.get("wizard_start", 0)
-        aggregate.wizard_completions = count_dict.get("wizard_complete", 0)
-        aggregate.top_categories = json.dumps({cat: cnt for cat, cnt in top_cats})
-        aggregate.top_states = json.dumps({st: cnt for st, cnt in top_states})
-        aggregate.top_searches = json.dumps({q: cnt for q, cnt in top_searches})
-        aggregate.top_resources = json.dumps({str(rid): cnt for rid, cnt in top_resources})
+            aggregate = AnalyticsDailyAggregate(date=start, period=period)
+
+        counts.apply_to(aggregate)
         aggregate.updated_at = datetime.now(UTC)
 
         self.session.add(aggregate)
@@ -416,3 +447,32 @@ class AnalyticsService:
         self.session.refresh(aggregate)
 
         return aggregate
+
+    def compute_daily_aggregate(self, date: datetime) -> AnalyticsDailyAggregate:
+        """Compute and store daily aggregate for a specific date."""
+        return self.rollup(_day_start(date), PERIOD_DAY)
+
+    def rollup_dates(self, period: str, since: datetime) -> set[datetime]:
+        """Start times (UTC) of the rollups of one period stored since ``since``."""
+        dates = self.session.exec(
+            select(AnalyticsDailyAggregate.date).where(
+                AnalyticsDailyAggregate.period == period,
+                AnalyticsDailyAggregate.date >= since,
+            )
+        ).all()
+        return {_as_utc(date) for date in dates}
+
+    def first_event_at(self) -> datetime | None:
+        """When the oldest stored event was created."""
+        first = self.session.exec(select(func.min(AnalyticsEvent.created_at))).one()
+        return _as_utc(first) if first is not None else None
+
+    def delete_hour_rollups(self, before: datetime) -> int:
+        """Delete hour rollups before ``before`` (their day has been rolled up)."""
+        stmt = delete(AnalyticsDailyAggregate).where(
+            AnalyticsDailyAggregate.period == PERIOD_HOUR,
+            AnalyticsDailyAggregate.date < before,
+        )
+        result = self.session.exec(stmt)  # type: ignore[call-overload]
+        self.session.commit()
+        return result.rowcount  # type: ignore[attr-defined]
@@ -0,0 +1,217 @@
+"""Buffered ingestion of analytics events.
+
+Recording an event used to be a database transaction on the request path,
+so page views and searches competed with real queries for the connection
+pool. Events are now appended to an in-process buffer (no database work)
+and a background thread writes them with batched multi-row INSERTs every
+ANALYTICS_FLUSH_BATCH_SIZE events or ANALYTICS_FLUSH_INTERVAL_MS,
+whichever comes first, holding one pooled connection only while it writes.
+
+The buffer is bounded by ANALYTICS_BUFFER_MAX_EVENTS. When it is full,
+add() refuses the event so the endpoint can tell clients to back off.
+A failed write is put back into the buffer (while there is room) and
+retried up to MAX_BATCH_ATTEMPTS times; after that its rows are written
+one at a time and the ones that still fail are dropped, so a row that
+can never be written doesn't hold up everything behind it. The
+application lifespan starts the buffer and drains it on shutdown.
+"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+
+from app.config import settings
+from app.models import AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+# Attempts at writing a batch before falling back to one row at a time
+MAX_BATCH_ATTEMPTS = 3
+
+
+@dataclass
+class AnalyticsBufferStats:
+    """Counters for monitoring ingestion."""
+
+    accepted: int = 0
+    written: int = 0
+    dropped: int = 0  # Refused because the buffer was full, or lost after failed writes
+    flushes: int = 0
+    failed_flushes: int = 0
+    pending: int = 0
+    max_events: int = 0
+
+
+class AnalyticsBuffer:
+    """Thread-safe bounded buffer of analytics events with a background writer."""
+
+    def __init__(self, engine: Engine, max_events: int, batch_size: int, flush_interval_ms: int) -> None:
+        self.engine = engine
+        self.max_events = max_events
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._pending: deque[dict] = deque()
+        self._lock = threading.Lock()
+        # Serializes writes between the writer thread and drains
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = AnalyticsBufferStats(max_events=max_events)
+        # First row of the batch that last failed, and its failed attempts
+        self._failed_row: dict | None = None
+        self._failed_attempts = 0
+
+    def add(self, event: AnalyticsEvent) -> bool:
+        """Queue an event for writing. Returns False if the buffer is full."""
+        row = event.model_dump()
+        with self._lock:
+            if len(self._pending) >= self.max_events:
+                self._stats.dropped += 1
+                return False
+            self._pending.append(row)
+            self._stats.accepted += 1
+            full_batch = len(self._pending) >= self.batch_size
+        if full_batch:
+            self._wake.set()
+        return True
+
+    def start(self) -> None:
+        """Start the background writer."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="analytics-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the writer and write everything still buffered."""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered events now. Returns the number written."""
+        written = 0
+        with self._write_lock:
+            while True:
+                with self._lock:
+                    batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+                if not batch:
+                    return written
+                count = self._write(batch)
+                if count is None:
+                    return written
+                written += count
+
+    def stats(self) -> AnalyticsBufferStats:
+        """Return a snapshot of the counters."""
+        with self._lock:
+            self._stats.pending = len(self._pending)
+            return AnalyticsBufferStats(**asdict(self._stats))
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:  # Keep the writer alive whatever happens
+                logger.warning("Analytics flush failed: %s", e)
+
+    def _write(self, batch: list[dict]) -> int | None:
+        """Insert one batch and return the rows written; on failure put it back (as far as there is room).
+
+        A batch that has failed MAX_BATCH_ATTEMPTS times is written one row
+        at a time instead, dropping the rows that fail.
+        """
+        try:
+            self._insert(batch)
+        except Exception as e:
+            with self._lock:
+                self._stats.failed_flushes += 1
+                attempts = self._failed_attempts + 1 if self._failed_row is batch[0] else 1
+                retry = attempts < MAX_BATCH_ATTEMPTS
+                self._failed_row, self._failed_attempts = (batch[0], attempts) if retry else (None, 0)
+                if retry:
+                    room = max(0, self.max_events - len(self._pending))
+                    self._pending.extendleft(reversed(batch[:room]))
+                    self._stats.dropped += len(batch) - min(room, len(batch))
+            if retry:
+                logger.warning("Failed to write %d analytics events: %s", len(batch), e)
+                return None
+            logger.warning(
+                "Failed to write %d analytics events %d times, writing them one at a time: %s", len(batch), attempts, e
+            )
+            return self._write_rows(batch)
+        with self._lock:
+            self._stats.written += len(batch)
+            self._stats.flushes += 1
+            if self._failed_row is batch[0]:
+                self._failed_row, self._failed_attempts = None, 0
+        return len(batch)
+
+    def _write_rows(self, batch: list[dict]) -> int:
+        """Insert a batch row by row, dropping the rows that fail."""
+        written = 0
+        for row in batch:
+            try:
+                self._insert([row])
+                written += 1
+            except Exception as e:
+                logger.warning("Dropped analytics event %s: %s", row.get("event_name"), e)
+        with self._lock:
+            self._stats.written += written
+            self._stats.dropped += len(batch) - written
+            self._stats.flushes += 1
+        return written
+
+    def _insert(self, rows: list[dict]) -> None:
+        with Session(self.engine) as session:
+            session.execute(insert(AnalyticsEvent), rows)
+            session.commit()
+
+
+_buffer: AnalyticsBuffer | None = None
+_buffer_lock = threading.Lock()
+
+
+def start_analytics_buffer(engine: Engine) -> AnalyticsBuffer | None:
+    """Create and start the process-wide buffer (None when ANALYTICS_BUFFER_MAX_EVENTS is 0)."""
+    global _buffer
+    if settings.analytics_buffer_max_events <= 0:
+        return None
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = AnalyticsBuffer(
+                engine,
+                max_events=settings.analytics_buffer_max_events,
+                batch_size=settings.analytics_flush_batch_size,
+                flush_interval_ms=settings.analytics_flush_interval_ms,
+            )
+            _buffer.start()
+    return _buffer
+
+
+def get_analytics_buffer() -> AnalyticsBuffer | None:
+    """Return the running buffer, or None to write events directly."""
+    return _buffer
+
+
+def stop_analytics_buffer() -> None:
+    """Drain and stop the process-wide buffer."""
+    global _buffer
+    with _buffer_lock:
+        buffer, _buffer = _buffer, None
+    if buffer is not None:
+        buffer.stop()
+        stats = buffer.stats()
+        logger.info("Analytics buffer drained: %d written, %d dropped", stats.written, stats.dropped)
@@ -0,0 +1,181 @@
+"""Monthly range partitions of analytics_events.
+
+analytics_events is partitioned by month on created_at, so retention drops
+whole partitions (no DELETE, no table or index bloat) and queries bounded
+by created_at (rollups, the dashboard's raw tail) only scan the months in
+range. The analytics partitions job keeps ANALYTICS_PARTITION_MONTHS_AHEAD
+months created ahead of time and drops months older than
+ANALYTICS_RETENTION_MONTHS; dashboard rollups are not affected.
+
+Events from before the table was partitioned live in one partition
+(analytics_events_legacy, from MINVALUE) that is dropped the same way
+once its upper bound passes the retention cutoff.
+
+Events with no monthly partition (the job hasn't run for months) land in
+the DEFAULT partition (analytics_events_default) instead of failing.
+Creating their month moves them out of it, so the DEFAULT partition only
+holds rows while the job is behind.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlmodel import Session, text
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "analytics_events"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+PARTITIONS_SQL = """
+    SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = to_regclass(:parent)
+"""
+
+# e.g. FOR VALUES FROM ('2026-03-01 00:00:00') TO ('2026-04-01 00:00:00')
+_BOUND_RE = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the month, as a naive UTC timestamp (the column type)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month start by whole months."""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    """Name of the partition for the month starting at ``start``."""
+    return f"{PARENT_TABLE}_y{start.year:04d}m{start.month:02d}"
+
+
+def _parse_bound(value: str) -> datetime | None:
+    """A partition bound value; None for MINVALUE/MAXVALUE."""
+    if value in ("MINVALUE", "MAXVALUE"):
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+@dataclass
+class EventPartition:
+    """One partition of analytics_events and its [start, end) range."""
+
+    name: str
+    start: datetime | None  # None = MINVALUE
+    end: datetime | None  # None = MAXVALUE
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        return (self.start is None or self.start < end) and (self.end is None or start < self.end)
+
+
+class AnalyticsPartitionService:
+    """Creates and drops the monthly partitions of analytics_events."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def is_partitioned(self) -> bool:
+        """Whether analytics_events is a partitioned table (migrated)."""
+        relkind = self.session.execute(
+            text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:parent)"),
+            {"parent": PARENT_TABLE},
+        ).scalar()
+        return relkind == "p"
+
+    def _partition_bounds(self) -> list[tuple[str, str]]:
+        return self.session.execute(text(PARTITIONS_SQL), {"parent": PARENT_TABLE}).fetchall()
+
+    def has_default_partition(self) -> bool:
+        """Whether the DEFAULT partition exists (created by the partitioning migration)."""
+        return any(bound == "DEFAULT" for _, bound in self._partition_bounds())
+
+    def partitions(self) -> list[EventPartition]:
+        """Current range partitions, oldest first."""
+        partitions = []
+        for name, bound in self._partition_bounds():
+            match = _BOUND_RE.search(bound or "")
+            if match is None:  # DEFAULT partition
+                continue
+            partitions.append(EventPartition(name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+        return sorted(partitions, key=lambda p: p.start or datetime.min)
+
+    def ensure_partitions(self, months_ahead: int | None = None, now: datetime | None = None) -> list[str]:
+        """Create this month's and the next ``months_ahead`` months' partitions if missing.
+
+        Returns the names of the partitions created.
+        """
+        if months_ahead is None:
+            months_ahead = settings.analytics_partition_months_ahead
+        current = month_start(now or datetime.now(UTC))
+        existing = self.partitions()
+        has_default = self.has_default_partition()
+
+        created = []
+        for offset in range(months_ahead + 1):
+            start = add_months(current, offset)
+            end = add_months(start, 1)
+            if any(partition.overlaps(start, end) for partition in existing):
+                continue
+            name = partition_name(start)
+            if has_default:
+                self._split_default(name, start, end)
+            else:
+                self._create(name, start, end)
+            created.append(name)
+        self.session.commit()
+
+        if created:
+            logger.info("Created analytics_events partitions: %s", ", ".join(created))
+        return created
+
+    def _create(self, name: str, start: datetime, end: datetime) -> None:
+        # DDL takes no bind parameters; the name and bounds are generated here
+        self.session.execute(
+            text(f"CREATE TABLE {name} PARTITION OF {PARENT_TABLE} FOR VALUES FROM ('{start}') TO ('{end}')")
+        )
+
+    def _split_default(self, name: str, start: datetime, end: datetime) -> None:
+        """Create a month's partition, moving its rows out of the DEFAULT partition first.
+
+        Postgres refuses to create a partition for rows the DEFAULT partition
+        already holds, so the DEFAULT partition is detached while they are
+        moved. Inserts wait on the parent's lock until the commit.
+        """
+        in_range = f"created_at >= '{start}' AND created_at < '{end}'"
+        moved = self.session.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION} WHERE {in_range}")).scalar()
+        if not moved:
+            self._create(name, start, end)
+            return
+
+        self.session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+        self._create(name, start, end)
+        self.session.execute(text(f"INSERT INTO {name} SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        self.session.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+        self.session.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+        logger.warning("Moved %d analytics events from %s into %s", moved, DEFAULT_PARTITION, name)
+
+    def expired_partitions(self, retention_months: int | None = None, now: datetime | None = None) -> list[str]:
+        """Partitions whose whole range is older than the retention period."""
+        if retention_months is None:
+            retention_months = settings.analytics_retention_months
+        cutoff = add_months(month_start(now or datetime.now(UTC)), -retention_months)
+        return [p.name for p in self.partitions() if p.end is not None and p.end <= cutoff]
+
+    def drop_partitions(self, names: list[str]) -> None:
+        """Drop partitions (instant, unlike deleting their rows)."""
+        for name in names:
+            self.session.execute(text(f'DROP TABLE "{name}"'))
+        self.session.commit()
+        if names:
+            logger.info("Dropped analytics_events partitions: %s", ", ".join(names))
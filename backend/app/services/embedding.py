@@ -4,16 +4,23 @@ Supports:
 - Local: SentenceTransformers (free, 384 dimensions)
 - OpenAI: text-embedding-3-small (paid, 1536 dimensions)
 
-Set USE_LOCAL_EMBEDDINGS=true in .env to use local model.
+Set USE_LOCAL_EMBEDDINGS=true in .env to use local model. Set
+EMBEDDING_SIDECAR_SOCKET to have all workers share one local model served
+by app.embedding_sidecar over a unix socket.
 """
 
+import hashlib
 import logging
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from app.config import settings
 
 if TYPE_CHECKING:
+    from sqlalchemy import Row
+
     from app.models import Resource
 
 logger = logging.getLogger(__name__)
@@ -36,14 +43,55 @@ class EmbeddingResult:
     tokens_used: int
 
 
+def prepare_resource_text(resource: "Resource | Row") -> str:
+    """Build the text embedded for a resource.
+
+    Accepts a Resource or any row with title, description, summary,
+    eligibility, categories and tags attributes.
+    """
+    parts = [
+        resource.title,
+        resource.description,
+    ]
+
+    if resource.summary:
+        parts.append(resource.summary)
+
+    if resource.eligibility:
+        parts.append(f"Eligibility: {resource.eligibility}")
+
+    if resource.categories:
+        parts.append(f"Categories: {', '.join(resource.categories)}")
+
+    if resource.tags:
+        parts.append(f"Tags: {', '.join(resource.tags)}")
+
+    return "\n".join(parts)
+
+
+def embedding_text_hash(text: str) -> str:
+    """Hash the exact text that was embedded, to detect when a vector goes stale."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
 class LocalEmbeddingService:
     """Service for generating embeddings using local SentenceTransformers model."""
 
     _model = None  # Class-level cache for the model
+    _load_lock = threading.Lock()
 
     def __init__(self) -> None:
         """Initialize the local embedding service."""
-        if LocalEmbeddingService._model is None:
+        self.load_model()
+
+    @classmethod
+    def load_model(cls) -> None:
+        """Load the model once per process; concurrent callers wait for the same load."""
+        if cls._model is not None:
+            return
+        with cls._load_lock:
+            if cls._model is not None:
+                return
             logger.info(f"Loading local embedding model: {LOCAL_MODEL_NAME}")
             try:
                 from sentence_transformers import SentenceTransformer
@@ -53,29 +101,17 @@ class LocalEmbeddingService:
                     "Install with: pip install 'vetrd-backend[ml]' or pip install sentence-transformers"
                 ) from None
 
-            LocalEmbeddingService._model = SentenceTransformer(LOCAL_MODEL_NAME)
+            cls._model = SentenceTransformer(LOCAL_MODEL_NAME)
             logger.info("Local embedding model loaded")
 
+    @classmethod
+    def is_loaded(cls) -> bool:
+        """Check whether the model is already in memory."""
+        return cls._model is not None
+
     def _prepare_text(self, resource: "Resource") -> str:
         """Prepare resource text for embedding."""
-        parts = [
-            resource.title,
-            resource.description,
-        ]
-
-        if resource.summary:
-            parts.append(resource.summary)
-
-        if resource.eligibility:
-            parts.append(f"Eligibility: {resource.eligibility}")
-
-        if resource.categories:
-            parts.append(f"Categories: {', '.join(resource.categories)}")
-
-        if resource.tags:
-            parts.append(f"Tags: {', '.join(resource.tags)}")
-
-        return "\n".join(parts)
+        return prepare_resource_text(resource)
 
     def generate_embedding(self, text: str) -> EmbeddingResult:
         """Generate an embedding for the given text."""
@@ -117,24 +153,7 @@ class OpenAIEmbeddingService:
 
     def _prepare_text(self, resource: "Resource") -> str:
         """Prepare resource text for embedding."""
-        parts = [
-            resource.title,
-            resource.description,
-        ]
-
-        if resource.summary:
-            parts.append(resource.summary)
-
-        if resource.eligibility:
-            parts.append(f"Eligibility: {resource.eligibility}")
-
-        if resource.categories:
-            parts.append(f"Categories: {', '.join(resource.categories)}")
-
-        if resource.tags:
-            parts.append(f"Tags: {', '.join(resource.tags)}")
-
-        return "\n".join(parts)
+        return prepare_resource_text(resource)
 
     def generate_embedding(self, text: str) -> EmbeddingResult:
         """Generate an embedding for the given text."""
@@ -225,21 +244,117 @@ class OpenAIEmbeddingService:
         return results
 
 
-# Type alias for either service
-EmbeddingService = LocalEmbeddingService | OpenAIEmbeddingService
+class SidecarEmbeddingService:
+    """Service for generating embeddings with the local model hosted by a sidecar process.
+
+    Talks to app.embedding_sidecar over a unix socket, so API workers don't
+    each load their own copy of the model.
+    """
+
+    def __init__(self, socket_path: str | None = None) -> None:
+        """Initialize the sidecar embedding client."""
+        self.socket_path = socket_path or settings.embedding_sidecar_socket
+        if not self.socket_path:
+            raise ValueError("EMBEDDING_SIDECAR_SOCKET not configured.")
+
+    def _prepare_text(self, resource: "Resource") -> str:
+        """Prepare resource text for embedding."""
+        return prepare_resource_text(resource)
+
+    def _embed(self, texts: list[str], timeout: float) -> list[list[float]]:
+        """Request embeddings for ``texts`` from the sidecar."""
+        import httpx
+
+        transport = httpx.HTTPTransport(uds=self.socket_path)
+        with httpx.Client(transport=transport, timeout=timeout) as client:
+            response = client.post("http://embedding-sidecar/embed", json={"texts": texts})
+
+            if response.status_code != 200:
+                logger.error(f"Embedding sidecar error: {response.status_code} - {response.text}")
+                raise ValueError(f"Embedding sidecar error: {response.status_code}")
 
+            return response.json()["embeddings"]
 
-def get_embedding_service() -> LocalEmbeddingService | OpenAIEmbeddingService:
+    def generate_embedding(self, text: str) -> EmbeddingResult:
+        """Generate an embedding for the given text."""
+        return EmbeddingResult(
+            embedding=self._embed([text], timeout=30.0)[0],
+            model=LOCAL_MODEL_NAME,
+            tokens_used=0,
+        )
+
+    def generate_resource_embedding(self, resource: "Resource") -> EmbeddingResult:
+        """Generate an embedding for a resource."""
+        text = self._prepare_text(resource)
+        return self.generate_embedding(text)
+
+    def generate_batch_embeddings(self, texts: list[str], batch_size: int = 256) -> list[EmbeddingResult]:
+        """Generate embeddings for multiple texts."""
+        results = []
+        for i in range(0, len(texts), batch_size):
+            for embedding in self._embed(texts[i : i + batch_size], timeout=120.0):
+                results.append(EmbeddingResult(embedding=embedding, model=LOCAL_MODEL_NAME, tokens_used=0))
+        return results
+
+
+# Type alias for any service
+EmbeddingService = LocalEmbeddingService | OpenAIEmbeddingService | SidecarEmbeddingService
+
+# Set while preload_embedding_model() is loading the local model in the background
+_model_loading = threading.Event()
+
+
+def preload_embedding_model(on_ready: Callable[[], None] | None = None) -> threading.Thread | None:
+    """Load the local embedding model in a background thread.
+
+    While it loads, embedding_model_loading() is True so request handlers can
+    serve a fallback instead of blocking on the load. ``on_ready`` runs in the
+    same thread once loading has finished (or failed).
+
+    Returns:
+        The loading thread, or None when this process doesn't need to load a
+        model (OpenAI, sidecar, or already loaded).
+    """
+    use_local = getattr(settings, "use_local_embeddings", False)
+    if not use_local or settings.embedding_sidecar_socket or LocalEmbeddingService.is_loaded():
+        return None
+
+    def load() -> None:
+        try:
+            LocalEmbeddingService.load_model()
+        except Exception as e:
+            logger.warning("Failed to preload embedding model: %s", e)
+        finally:
+            _model_loading.clear()
+        if on_ready is not None:
+            on_ready()
+
+    _model_loading.set()
+    thread = threading.Thread(target=load, name="load-embedding-model", daemon=True)
+    thread.start()
+    return thread
+
+
+def embedding_model_loading() -> bool:
+    """Check whether the local model is still being preloaded."""
+    return _model_loading.is_set()
+
+
+def get_embedding_service() -> EmbeddingService:
     """Factory function to create an embedding service.
 
-    Uses local SentenceTransformers if USE_LOCAL_EMBEDDINGS=true,
-    otherwise falls back to OpenAI API.
+    Uses local SentenceTransformers if USE_LOCAL_EMBEDDINGS=true (through
+    the sidecar when EMBEDDING_SIDECAR_SOCKET is set), otherwise falls back
+    to OpenAI API.
 
     Returns:
         Configured embedding service instance.
     """
     use_local = getattr(settings, "use_local_embeddings", False)
 
+    if use_local and settings.embedding_sidecar_socket:
+        return SidecarEmbeddingService()
+
     if use_local:
         logger.info("Using local embedding service (SentenceTransformers)")
         return LocalEmbeddingService()
@@ -248,6 +363,12 @@ def get_embedding_service() -> LocalEmbeddingService | OpenAIEmbeddingService:
     return OpenAIEmbeddingService()
 
 
+def get_embedding_model_name() -> str:
+    """Get the model name for the configured service (matches EmbeddingResult.model)."""
+    use_local = getattr(settings, "use_local_embeddings", False)
+    return LOCAL_MODEL_NAME if use_local else OPENAI_EMBEDDING_MODEL
+
+
 def get_embedding_dimension() -> int:
     """Get the embedding dimension for the configured service."""
     use_local = getattr(settings, "use_local_embeddings", False)
@@ -0,0 +1,266 @@
+"""Cache of search-query embeddings for semantic search.
+
+Every semantic search embeds the query text, which is a model forward pass
+(or an OpenAI request). Popular queries repeat constantly, so embeddings are
+kept in a bounded in-process LRU with a TTL, keyed by embedding model and
+normalized query. When QUERY_EMBEDDING_CACHE_PERSIST is enabled, misses fall
+through to the query_embeddings table so all workers share one cache.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, select
+
+from app.config import settings
+from app.models import QueryEmbedding
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Matches the length of AnalyticsEvent.search_query and query_embeddings.query
+MAX_QUERY_LENGTH = 255
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text for cache keys: trimmed, lowercased, single-spaced."""
+    return _WHITESPACE.sub(" ", query.strip().lower())[:MAX_QUERY_LENGTH]
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters for monitoring cache effectiveness."""
+
+    hits: int = 0  # Served from the in-process LRU
+    shared_hits: int = 0  # Served from the query_embeddings table
+    misses: int = 0  # Embedding had to be generated
+    evictions: int = 0
+    warmed: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.shared_hits + self.misses
+        return (self.hits + self.shared_hits) / lookups if lookups else 0.0
+
+
+class QueryEmbeddingCache:
+    """Thread-safe LRU cache with TTL for query embeddings."""
+
+    def __init__(self, max_size: int, ttl_seconds: int, persist: bool = False) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = EmbeddingCacheStats(max_size=max_size)
+
+    def get(self, model: str, query: str) -> list[float] | None:
+        """Return a cached embedding from this process, or None."""
+        key = (model, normalize_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, embedding = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, model: str, query: str, embedding: list[float]) -> None:
+        """Store an embedding, evicting the least recently used entries past max_size."""
+        key = (model, normalize_query(query))
+        with self._lock:
+            self._entries[key] = (time.monotonic(), embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_create(
+        self,
+        model: str,
+        query: str,
+        generate: Callable[[str], list[float]],
+        session: Session | None = None,
+    ) -> list[float]:
+        """Return the embedding for ``query``, generating it on a miss.
+
+        Args:
+            model: Embedding model name (part of the cache key).
+            query: Raw query text; ``generate`` receives the normalized form.
+            generate: Function that embeds a text.
+            session: Database session for the shared table (used when persist is enabled).
+        """
+        normalized = normalize_query(query)
+        embedding = self.get(model, normalized)
+        if embedding is not None:
+            self._count("hits")
+            return embedding
+
+        if self.persist and session is not None:
+            embedding = self._load_shared(session, model, [normalized]).get(normalized)
+            if embedding is not None:
+                self._count("shared_hits")
+                self.put(model, normalized, embedding)
+                return embedding
+
+        self._count("misses")
+        embedding = generate(normalized)
+        self.put(model, normalized, embedding)
+        if self.persist and session is not None:
+            self._store_shared(session, model, {normalized: embedding})
+        return embedding
+
+    def warm(
+        self,
+        model: str,
+        queries: list[str],
+        generate_batch: Callable[[list[str]], list[list[float]]],
+        session: Session | None = None,
+    ) -> int:
+        """Pre-populate the cache for ``queries``, embedding all misses in one batch.
+
+        Returns:
+            Number of queries added to the in-process cache.
+        """
+        pending = list(dict.fromkeys(normalize_query(q) for q in queries if q and q.strip()))
+        pending = [q for q in pending if self.get(model, q) is None]
+        if not pending:
+            return 0
+
+        found: dict[str, list[float]] = {}
+        if self.persist and session is not None:
+            found = self._load_shared(session, model, pending)
+
+        missing = [q for q in pending if q not in found]
+        generated = dict(zip(missing, generate_batch(missing), strict=True)) if missing else {}
+        if generated and self.persist and session is not None:
+            self._store_shared(session, model, generated)
+
+        for query, embedding in {**found, **generated}.items():
+            self.put(model, query, embedding)
+        self._count("warmed", len(pending))
+        return len(pending)
+
+    def stats(self) -> EmbeddingCacheStats:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return EmbeddingCacheStats(**{**asdict(self._stats), "size": len(self._entries)})
+
+    def clear(self) -> None:
+        """Drop all in-process entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._stats = EmbeddingCacheStats(max_size=self.max_size)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + amount)
+
+    def _load_shared(self, session: Session, model: str, queries: list[str]) -> dict[str, list[float]]:
+        """Read unexpired embeddings for ``queries`` from the query_embeddings table."""
+        cutoff = datetime.now(UTC) - timedelta(seconds=self.ttl_seconds)
+        try:
+            rows = session.exec(
+                select(QueryEmbedding.query, QueryEmbedding.embedding).where(
+                    QueryEmbedding.model == model,
+                    col(QueryEmbedding.query).in_(queries),
+                    QueryEmbedding.created_at >= cutoff,
+                )
+            ).all()
+        except Exception as e:
+            logger.warning("Failed to read shared query embeddings: %s", e)
+            session.rollback()
+            return {}
+        return {query: list(embedding) for query, embedding in rows}
+
+    def _store_shared(self, session: Session, model: str, embeddings: dict[str, list[float]]) -> None:
+        """Upsert embeddings into the query_embeddings table (best effort).
+
+        Written through a short-lived session on the same bind, so the commit
+        (or a rollback on failure) never touches the caller's request session.
+        """
+        now = datetime.now(UTC)
+        stmt = insert(QueryEmbedding).values(
+            [{"query": q, "model": model, "embedding": e, "created_at": now} for q, e in embeddings.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["query", "model"],
+            set_={"embedding": stmt.excluded.embedding, "created_at": stmt.excluded.created_at},
+        )
+        try:
+            with Session(session.get_bind()) as own_session:
+                own_session.execute(stmt)
+                own_session.commit()
+        except Exception as e:
+            logger.warning("Failed to store shared query embeddings: %s", e)
+
+
+_cache: QueryEmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Return the process-wide query embedding cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QueryEmbeddingCache(
+                    max_size=settings.query_embedding_cache_size,
+                    ttl_seconds=settings.query_embedding_cache_ttl_seconds,
+                    persist=settings.query_embedding_cache_persist,
+                )
+    return _cache
+
+
+def embed_query(query: str, session: Session | None = None) -> list[float]:
+    """Embed search query text through the process-wide cache."""
+    from app.services.embedding import get_embedding_model_name, get_embedding_service
+
+    return get_query_embedding_cache().get_or_create(
+        get_embedding_model_name(),
+        query,
+        lambda text: get_embedding_service().generate_embedding(text).embedding,
+        session,
+    )
+
+
+def warm_query_embedding_cache(session: Session, limit: int | None = None) -> int:
+    """Embed the most popular recent searches so their first request is a cache hit.
+
+    Returns:
+        Number of queries warmed.
+    """
+    from app.services.analytics import AnalyticsService
+    from app.services.embedding import get_embedding_model_name, get_embedding_service
+
+    limit = settings.query_embedding_cache_warm_count if limit is None else limit
+    if limit <= 0:
+        return 0
+
+    popular = AnalyticsService(session).get_popular_searches(days=30, limit=limit)
+    queries = [row["query"] for row in popular]
+    if not queries:
+        return 0
+
+    warmed = get_query_embedding_cache().warm(
+        get_embedding_model_name(),
+        queries,
+        lambda texts: [r.embedding for r in get_embedding_service().generate_batch_embeddings(texts)],
+        session,
+    )
+    logger.info("Warmed query embedding cache with %d popular searches", warmed)
+    return warmed
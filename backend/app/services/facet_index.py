@@ -0,0 +1,301 @@
+"""In-process facet bitmaps for filter sidebar counts.
+
+Each process gives every resource a dense position and keeps one bitmap
+per facet value (category, state, tag, scope) and per status. Bitmaps are
+Python ints used as bitsets: a filter is a few ANDs/ORs, and a facet
+count is ``(value_bitmap & result_bitmap).bit_count()``, so counting a
+few hundred facet values over 100k resources takes a couple of
+milliseconds with no database work; repeated result sets (common
+browse filters) are answered from a small cache.
+
+Counts are disjunctive for the OR filters: the categories facet is
+counted with the categories filter removed (the same for states and
+scope), so the sidebar shows what each alternative would return. Tags
+are ANDed, so tag counts use the full result set.
+
+The index is rebuilt from the database every FACET_INDEX_TTL_SECONDS and
+updated for the resources the ETL loader commits in between.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import replace
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.config import settings
+from app.models.resource import ResourceScope, ResourceStatus
+from app.services.filters import ResourceFilters
+
+logger = logging.getLogger(__name__)
+
+FACETS = ("categories", "states", "tags", "scope")
+
+# Most values returned per facet (by count)
+MAX_FACET_VALUES = 100
+
+# Facet counts kept per index for repeated result sets (common browse filters)
+COUNT_CACHE_SIZE = 128
+
+INDEX_SQL = """
+    SELECT r.id, r.status, r.scope, r.categories, r.states, r.tags, r.subcategories
+    FROM resources r
+"""
+
+# Rows for resources the loader just committed
+ROWS_SQL = INDEX_SQL + " WHERE r.id = ANY(:ids)"
+
+
+def _status_name(value: Any) -> str:
+    """Status/scope as stored in the database (enum name, e.g. 'ACTIVE')."""
+    return value.name if hasattr(value, "name") else str(value).upper()
+
+
+def _bitmap(positions: Iterable[int], size: int) -> int:
+    """Build a bitmap from bit positions without an O(size) copy per bit."""
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class FacetIndex:
+    """Thread-safe bitmaps of facet values over a dense resource numbering."""
+
+    def __init__(self, rows: Iterable[Sequence[Any]] = ()) -> None:
+        self._position: dict[UUID, int] = {}
+        # Each resource's indexed row by position, to clear its bits on update
+        self._rows: dict[int, tuple] = {}
+        self._status: dict[str, int] = {}
+        self._facets: dict[str, dict[str, int]] = {facet: {} for facet in FACETS}
+        self._subcategories: dict[str, int] = {}
+        self._nationwide = 0  # National scope with no states: matches every state filter
+        self._all = 0
+        self._lock = threading.Lock()
+        self._count_cache: dict[tuple[str, int], dict[str, int]] = {}
+        self.built_at = time.monotonic()
+
+        # Collect positions per value first; setting bits one at a time copies the whole int
+        positions: dict[tuple[str, str], list[int]] = {}
+        for row in rows:
+            position = self._position.setdefault(row[0], len(self._position))
+            self._rows[position] = tuple(row)
+            for key in self._keys(tuple(row)):
+                positions.setdefault(key, []).append(position)
+        size = len(self._position)
+        self._nationwide = _bitmap(positions.pop(("nationwide", ""), ()), size)
+        for (kind, value), members in positions.items():
+            self._bitmaps(kind)[value] = _bitmap(members, size)
+        self._all = _bitmap(self._rows, size)
+
+    def __len__(self) -> int:
+        return self._all.bit_count()
+
+    def upsert(self, rows: Iterable[Sequence[Any]], removed: Iterable[UUID] = ()) -> None:
+        """Replace the facet values of these resources; drop removed ones."""
+        with self._lock:
+            self._count_cache.clear()
+            for resource_id in removed:
+                self._remove(resource_id)
+            for row in rows:
+                self._remove(row[0])
+                self._put(*row)
+
+    def match(self, filters: ResourceFilters, base: int | None = None) -> int | None:
+        """Return the bitmap of resources matching ``filters`` (within ``base`` if given).
+
+        Returns None for tag_match='text' with tags, which needs the text
+        columns and can't be answered from bitmaps.
+        """
+        if filters.tags and filters.tag_match == "text":
+            return None
+        with self._lock:
+            bits = self._all if base is None else base & self._all
+            if filters.active_only:
+                bits &= self._status.get(ResourceStatus.ACTIVE.name, 0)
+            else:
+                bits &= ~self._status.get(ResourceStatus.INACTIVE.name, 0)
+            if filters.status:
+                bits &= self._status.get(filters.status.name, 0)
+
+            if filters.categories:
+                bits &= self._any("categories", filters.categories)
+            if filters.states:
+                bits &= self._nationwide | self._any("states", filters.states)
+
+            scopes = self._facets["scope"]
+            if filters.scope == "non_national":
+                bits &= ~scopes.get(ResourceScope.NATIONAL.name, 0)
+            elif filters.scope in ("national", "state", "local"):
+                bits &= scopes.get(ResourceScope(filters.scope).name, 0)
+
+            for tag in filters.tags or []:
+                tagged = self._facets["tags"].get(tag, 0)
+                if filters.tag_match == "array":
+                    tagged |= self._subcategories.get(tag, 0)
+                bits &= tagged
+            return bits
+
+    def bitmap(self, resource_ids: Iterable[UUID]) -> int:
+        """Return the bitmap of the given resources (unknown ids are ignored)."""
+        with self._lock:
+            positions = [self._position[i] for i in resource_ids if i in self._position]
+            return _bitmap(positions, len(self._position))
+
+    def members(self, bits: int, resource_ids: Iterable[UUID]) -> set[UUID]:
+        """Return the given resources whose bit is set in ``bits``."""
+        with self._lock:
+            data = bits.to_bytes((len(self._position) + 7) // 8, "little")
+            positions = self._position
+            return {i for i in resource_ids if (p := positions.get(i)) is not None and data[p >> 3] >> (p & 7) & 1}
+
+    def counts(self, facet: str, bits: int) -> dict[str, int]:
+        """Count resources in ``bits`` per value of one facet, largest first."""
+        with self._lock:
+            cached = self._count_cache.get((facet, bits))
+            if cached is not None:
+                return cached
+            values = self._facets[facet]
+            nationwide = self._nationwide & bits if facet == "states" else 0
+            counted = [(value, ((bitmap & bits) | nationwide).bit_count()) for value, bitmap in values.items()]
+            counted = [(value, n) for value, n in counted if n]
+            counted.sort(key=lambda item: (-item[1], item[0]))
+            if facet == "scope":
+                result = {ResourceScope[value].value: n for value, n in counted}
+            else:
+                result = dict(counted[:MAX_FACET_VALUES])
+            if len(self._count_cache) >= COUNT_CACHE_SIZE:
+                del self._count_cache[next(iter(self._count_cache))]
+            self._count_cache[(facet, bits)] = result
+            return result
+
+    def _any(self, facet: str, values: Iterable[str]) -> int:
+        bits = 0
+        for value in values:
+            bits |= self._facets[facet].get(value, 0)
+        return bits
+
+    def _bitmaps(self, kind: str) -> dict[str, int]:
+        if kind == "status":
+            return self._status
+        if kind == "subcategories":
+            return self._subcategories
+        return self._facets[kind]
+
+    @staticmethod
+    def _keys(row: tuple) -> list[tuple[str, str]]:
+        """(bitmap kind, value) pairs a resource row sets bits in."""
+        _, status, scope, categories, states, tags, subcategories = row
+        keys = [("status", _status_name(status)), ("scope", _status_name(scope))]
+        for kind, values in (
+            ("categories", categories),
+            ("states", states),
+            ("tags", tags),
+            ("subcategories", subcategories),
+        ):
+            keys += [(kind, value) for value in set(values or ())]
+        if _status_name(scope) == ResourceScope.NATIONAL.name and not states:
+            keys.append(("nationwide", ""))
+        return keys
+
+    def _put(self, *row: Any) -> None:
+        position = self._position.setdefault(row[0], len(self._position))
+        self._rows[position] = tuple(row)
+        bit = 1 << position
+        for kind, value in self._keys(self._rows[position]):
+            if kind == "nationwide":
+                self._nationwide |= bit
+            else:
+                bitmaps = self._bitmaps(kind)
+                bitmaps[value] = bitmaps.get(value, 0) | bit
+        self._all |= bit
+
+    def _remove(self, resource_id: UUID) -> None:
+        # The position is kept, so a re-added resource reuses its bit
+        position = self._position.get(resource_id)
+        row = self._rows.pop(position, None) if position is not None else None
+        if row is None:
+            return
+        bit = 1 << position
+        for kind, value in self._keys(row):
+            if kind == "nationwide":
+                continue
+            bitmaps = self._bitmaps(kind)
+            bitmaps[value] &= ~bit
+            if not bitmaps[value]:
+                del bitmaps[value]
+        self._nationwide &= ~bit
+        self._all &= ~bit
+
+
+def facet_counts(index: FacetIndex, filters: ResourceFilters, matches: int | None = None) -> dict[str, dict[str, int]]:
+    """Count each facet's values for resources matching ``filters`` (and ``matches``, e.g. a search).
+
+    Categories, states and scope are counted without their own filter;
+    tags are counted over the full result set. Returns {} when the
+    filters can't be evaluated from bitmaps.
+    """
+    result: dict[str, dict[str, int]] = {}
+    for facet in FACETS:
+        # Disjunctive facets ignore their own filter
+        own_filter = {facet: None} if facet in ("categories", "states", "scope") else {}
+        bits = index.match(replace(filters, **own_filter), base=matches)
+        if bits is None:
+            return {}
+        result[facet] = index.counts(facet, bits)
+    return result
+
+
+_index: FacetIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_facet_index(session: Session) -> FacetIndex | None:
+    """Return the process-wide facet index, (re)building it when missing or stale.
+
+    Returns None when the build fails, so callers respond without facets.
+    """
+    global _index
+    index = _index
+    if index is not None and time.monotonic() - index.built_at < settings.facet_index_ttl_seconds:
+        return index
+
+    with _index_lock:
+        if _index is index:
+            try:
+                started = time.perf_counter()
+                rows = session.execute(text(INDEX_SQL)).fetchall()
+                _index = FacetIndex(rows)
+                logger.info(
+                    "Built facet index of %d resources in %.0f ms",
+                    len(_index),
+                    (time.perf_counter() - started) * 1000,
+                )
+            except Exception as e:
+                logger.warning("Failed to build facet index: %s", e)
+                session.rollback()
+                return index
+    return _index
+
+
+def update_facet_index(session: Session, resource_ids: Sequence[UUID]) -> None:
+    """Re-read committed resources into this process's index, if it has been built.
+
+    Resources that no longer exist are removed.
+    """
+    index = _index
+    if index is None or not resource_ids:
+        return
+    try:
+        rows = session.execute(text(ROWS_SQL), {"ids": list(resource_ids)}).fetchall()
+    except Exception as e:
+        logger.warning("Failed to update facet index: %s", e)
+        session.rollback()
+        return
+    found = {row[0] for row in rows}
+    index.upsert(rows, removed=[resource_id for resource_id in resource_ids if resource_id not in found])
@@ -0,0 +1,210 @@
+"""Resource filter predicates and paginated counting shared by search and listing.
+
+ResourceFilters is the one definition of what each filter means. It renders
+to SQLAlchemy clauses for ORM statements and to parameterized SQL fragments
+(against the ``r`` alias for resources) for the raw-SQL vector and nearby
+queries, so the page query and its count can never disagree.
+"""
+
+from dataclasses import dataclass
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import Session, select
+
+from app.models import Resource
+from app.models.resource import ResourceScope, ResourceStatus
+
+# How a listing reports its total:
+# - exact: count(*) OVER () on the page query, so the predicate runs once
+# - estimate: count at most TOTAL_ESTIMATE_CAP + 1 matches (shown as "1000+")
+# - none: skip counting (infinite-scroll clients)
+COUNT_MODES = ("exact", "estimate", "none")
+COUNT_MODE_PATTERN = "^(exact|estimate|none)$"
+
+# Upper bound for estimated totals
+TOTAL_ESTIMATE_CAP = 1000
+
+# Text columns searched by tag_match='text'; each has a pg_trgm GIN index
+# (ix_resources_<column>_trgm) so the ILIKE predicates are index-backed
+TAG_TEXT_COLUMNS = ("eligibility", "title", "description")
+
+
+def tag_text_patterns(tag: str) -> list[str]:
+    """Return the ILIKE patterns a tag matches in resource text.
+
+    The tag as written, plus a spaced variant ("hud-vash" -> "hud vash")
+    only when it differs, so tags without dashes don't scan twice.
+    """
+    patterns = [f"%{tag}%"]
+    spaced = f"%{tag.replace('-', ' ')}%"
+    if spaced != patterns[0]:
+        patterns.append(spaced)
+    return patterns
+
+
+@dataclass
+class ResourceFilters:
+    """Filters applied to resource queries.
+
+    Attributes:
+        categories: Match ANY of these categories.
+        states: Match ANY of these states, or be truly nationwide (national scope, no states listed).
+        scope: 'national', 'state' or 'local' (only that scope), 'non_national' (state or
+            local) or 'all'/None.
+        tags: Match ALL of these tags.
+        status: Only this status.
+        active_only: Only ACTIVE resources (search); otherwise anything but INACTIVE (listing).
+        tag_match: Where tags are looked up - 'tags' (tags array), 'array' (tags or
+            subcategories arrays) or 'text' (arrays plus eligibility/title/description text).
+    """
+
+    categories: list[str] | None = None
+    states: list[str] | None = None
+    scope: str | None = None
+    tags: list[str] | None = None
+    status: ResourceStatus | None = None
+    active_only: bool = False
+    tag_match: str = "array"
+
+    def clauses(self) -> list[ColumnElement[bool]]:
+        """Return the filters as SQLAlchemy WHERE clauses on Resource."""
+        clauses: list[ColumnElement[bool]] = []
+
+        if self.active_only:
+            clauses.append(Resource.status == ResourceStatus.ACTIVE)
+        else:
+            clauses.append(Resource.status != ResourceStatus.INACTIVE)
+        if self.status:
+            clauses.append(Resource.status == self.status)
+
+        if self.categories:
+            clauses.append(or_(*[Resource.categories.contains([cat]) for cat in self.categories]))
+
+        if self.states:
+            clauses.append(
+                or_(
+                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
+                    *[Resource.states.contains([s]) for s in self.states],
+                )
+            )
+
+        if self.scope == "non_national":
+            clauses.append(Resource.scope != ResourceScope.NATIONAL)
+        elif self.scope in ("national", "state", "local"):
+            clauses.append(Resource.scope == ResourceScope(self.scope))
+
+        for tag in self.tags or []:
+            conditions = [Resource.tags.contains([tag])]
+            if self.tag_match in ("array", "text"):
+                conditions.append(Resource.subcategories.contains([tag]))
+            if self.tag_match == "text":
+                for pattern in tag_text_patterns(tag):
+                    conditions += [getattr(Resource, column).ilike(pattern) for column in TAG_TEXT_COLUMNS]
+            clauses.append(or_(*conditions))
+
+        return clauses
+
+    def sql(self, params: dict) -> str:
+        """Return the filters as parameterized ``AND ...`` clauses on alias ``r``.
+
+        Bind values are added to ``params``; no user input is interpolated.
+        """
+        clauses: list[str] = []
+
+        if self.active_only:
+            clauses.append("r.status = :f_active")
+            params["f_active"] = ResourceStatus.ACTIVE.name
+        else:
+            clauses.append("r.status != :f_inactive")
+            params["f_inactive"] = ResourceStatus.INACTIVE.name
+        if self.status:
+            clauses.append("r.status = :f_status")
+            params["f_status"] = self.status.name
+
+        if self.categories:
+            cat_conditions = []
+            for i, cat in enumerate(self.categories):
+                params[f"f_cat_{i}"] = cat
+                cat_conditions.append(f"r.categories @> ARRAY[:f_cat_{i}]::text[]")
+            clauses.append(f"({' OR '.join(cat_conditions)})")
+
+        if self.states:
+            state_conditions = ["(r.scope = :f_national AND r.states = '{}'::text[])"]
+            params["f_national"] = ResourceScope.NATIONAL.name
+            for i, state in enumerate(self.states):
+                params[f"f_state_{i}"] = state
+                state_conditions.append(f"r.states @> ARRAY[:f_state_{i}]::text[]")
+            clauses.append(f"({' OR '.join(state_conditions)})")
+
+        if self.scope == "non_national":
+            clauses.append("r.scope != :f_scope")
+            params["f_scope"] = ResourceScope.NATIONAL.name
+        elif self.scope in ("national", "state", "local"):
+            clauses.append("r.scope = :f_scope")
+            params["f_scope"] = ResourceScope(self.scope).name
+
+        for i, tag in enumerate(self.tags or []):
+            params[f"f_tag_{i}"] = tag
+            conditions = [f"r.tags @> ARRAY[:f_tag_{i}]::text[]"]
+            if self.tag_match in ("array", "text"):
+                conditions.append(f"r.subcategories @> ARRAY[:f_tag_{i}]::text[]")
+            if self.tag_match == "text":
+                patterns = tag_text_patterns(tag)
+                names = [f"f_tag_like_{i}", f"f_tag_like_spaced_{i}"][: len(patterns)]
+                params.update(zip(names, patterns, strict=True))
+                for column in TAG_TEXT_COLUMNS:
+                    conditions += [f"r.{column} ILIKE :{name}" for name in names]
+            clauses.append(f"({' OR '.join(conditions)})")
+
+        return "".join(f" AND {clause}" for clause in clauses)
+
+
+def fetch_page(
+    session: Session,
+    stmt: Select,
+    order_by: list,
+    limit: int,
+    offset: int,
+    count: str = "exact",
+) -> tuple[list[tuple], int | None]:
+    """Fetch one page of ``stmt`` and its total in as few scans as possible.
+
+    Args:
+        session: Database session.
+        stmt: Filtered, unordered SELECT.
+        order_by: ORDER BY clauses for the page.
+        limit: Maximum rows to return.
+        offset: Rows to skip.
+        count: 'exact', 'estimate' (capped at TOTAL_ESTIMATE_CAP + 1) or 'none'.
+
+    Returns:
+        Tuple of (rows as tuples of the selected columns, total or None when skipped)
+    """
+    if count == "exact":
+        windowed = stmt.add_columns(func.count().over().label("total"))
+        rows = session.execute(windowed.order_by(*order_by).offset(offset).limit(limit)).all()
+        if rows:
+            return [tuple(row[:-1]) for row in rows], rows[0][-1]
+        if offset == 0:
+            return [], 0
+        # Paged past the end, so the window saw no rows: count directly
+        matches = stmt.with_only_columns(Resource.id).subquery()
+        return [], session.execute(select(func.count()).select_from(matches)).scalar_one()
+
+    rows = session.execute(stmt.order_by(*order_by).offset(offset).limit(limit)).all()
+    if count == "none":
+        return [tuple(row) for row in rows], None
+    capped = stmt.with_only_columns(Resource.id).limit(TOTAL_ESTIMATE_CAP + 1).subquery()
+    return [tuple(row) for row in rows], session.execute(select(func.count()).select_from(capped)).scalar_one()
+
+
+def reported_total(total: int | None, count: str) -> tuple[int | None, bool]:
+    """Return (total, is_estimate) for a response built from ``fetch_page``.
+
+    Estimated totals past the cap are reported as TOTAL_ESTIMATE_CAP with
+    is_estimate set, for display as "1000+".
+    """
+    if count == "estimate" and total is not None and total > TOTAL_ESTIMATE_CAP:
+        return TOTAL_ESTIMATE_CAP, True
+    return total, False
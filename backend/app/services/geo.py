@@ -0,0 +1,132 @@
+"""Process-level geo context: PostGIS capability and zip code centroids.
+
+The zip_codes table (~33k rows) only changes when etl/load_zip_codes.py
+runs, so each process loads it once into packed arrays and resolves zips
+without a database round trip. PostGIS availability is detected at the
+same time. Call refresh_geo_context() (or POST /api/v1/admin/cache/geo/refresh
+on a running worker) after reloading zip codes.
+"""
+
+import logging
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ZipCentroid:
+    """Center point and state of a zip code."""
+
+    latitude: float
+    longitude: float
+    state: str | None
+
+
+class ZipTable:
+    """Zip code centroids in parallel arrays, looked up by binary search.
+
+    About 22 bytes per zip instead of a dict entry plus a tuple of boxed
+    floats per zip.
+    """
+
+    def __init__(self, rows: Iterable[tuple[str, float, float, str | None]] = ()) -> None:
+        self._zips = array("I")
+        self._latitudes = array("d")
+        self._longitudes = array("d")
+        states = bytearray()
+        for zip_code, latitude, longitude, state in sorted(
+            (int(row[0]), row[1], row[2], row[3]) for row in rows if _is_zip(row[0])
+        ):
+            self._zips.append(zip_code)
+            self._latitudes.append(latitude)
+            self._longitudes.append(longitude)
+            states += (state or "").encode("ascii", "ignore")[:2].ljust(2)
+        self._states = bytes(states)
+
+    def __len__(self) -> int:
+        return len(self._zips)
+
+    def get(self, zip_code: str) -> ZipCentroid | None:
+        """Return the centroid for a 5-digit zip code, or None if unknown."""
+        if not _is_zip(zip_code):
+            return None
+        key = int(zip_code)
+        i = bisect_left(self._zips, key)
+        if i == len(self._zips) or self._zips[i] != key:
+            return None
+        state = self._states[2 * i : 2 * i + 2].decode().strip() or None
+        return ZipCentroid(latitude=self._latitudes[i], longitude=self._longitudes[i], state=state)
+
+
+def _is_zip(value: str) -> bool:
+    return len(value) == 5 and value.isdigit()
+
+
+@dataclass(frozen=True)
+class GeoContext:
+    """What the spatial queries need to know about this database."""
+
+    postgis: bool
+    zips: ZipTable
+
+    @classmethod
+    def load(cls, session: Session) -> "GeoContext":
+        """Detect PostGIS and read every zip code centroid."""
+        postgis = session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).fetchone() is not None
+        rows = session.execute(text("SELECT zip_code, latitude, longitude, state FROM zip_codes")).fetchall()
+        return cls(postgis=postgis, zips=ZipTable(tuple(row) for row in rows))
+
+
+_context: GeoContext | None = None
+_context_lock = threading.Lock()
+
+
+def get_geo_context(session: Session | None = None) -> GeoContext:
+    """Return the process-wide geo context, loading it on first use.
+
+    Args:
+        session: Session to load with (a new one is opened if omitted).
+
+    If loading fails, an empty context (no PostGIS, no zips) is returned
+    and not cached, so the next call tries again.
+    """
+    global _context
+    if _context is None:
+        with _context_lock:
+            if _context is None:
+                try:
+                    _context = _load(session)
+                except Exception as e:
+                    logger.warning("Failed to load geo context: %s", e)
+                    if session is not None:
+                        session.rollback()
+                    return GeoContext(postgis=False, zips=ZipTable())
+    return _context
+
+
+def refresh_geo_context(session: Session | None = None) -> GeoContext:
+    """Reload PostGIS detection and zip centroids, e.g. after load_zip_codes runs."""
+    global _context
+    context = _load(session)
+    with _context_lock:
+        _context = context
+    return context
+
+
+def _load(session: Session | None) -> GeoContext:
+    if session is not None:
+        context = GeoContext.load(session)
+    else:
+        from app.database import engine
+
+        with Session(engine) as own_session:
+            context = GeoContext.load(own_session)
+    logger.info("Geo context loaded: %d zip codes, PostGIS %s", len(context.zips), context.postgis)
+    return context
@@ -1,12 +1,14 @@
 """Resource service for CRUD operations."""
 
+import base64
+import json
 import logging
-import math
+from dataclasses import replace
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import String, and_, case, func, or_, text
-from sqlalchemy.orm import selectinload
+from sqlalchemy import String, case, func, text
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Session, col, select
 
 from app.models import Location, Organization, Program, Resource, Source
@@ -26,30 +28,16 @@ from app.schemas.resource import (
     TrustSignals,
     VerificationInfo,
 )
+from app.services.facet_index import FacetIndex, facet_counts, get_facet_index
+from app.services.filters import ResourceFilters, fetch_page
+from app.services.geo import get_geo_context
+from app.services.spatial_index import SpatialIndex, bounding_box, get_spatial_index
 
 # Meters per mile for distance calculations
 METERS_PER_MILE = 1609.34
 
 logger = logging.getLogger(__name__)
 
-# Cache for PostGIS availability check (per-process)
-_postgis_available: bool | None = None
-
-
-def _check_postgis(session: Session) -> bool:
-    """Check if PostGIS is available on this database."""
-    global _postgis_available
-    if _postgis_available is not None:
-        return _postgis_available
-    try:
-        result = session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).fetchone()
-        _postgis_available = result is not None
-    except Exception as e:
-        logger.warning("Failed to check PostGIS availability: %s", e)
-        _postgis_available = False
-    return _postgis_available
-
-
 # Haversine distance formula in SQL (returns miles)
 # Uses Earth radius of 3959 miles
 HAVERSINE_DISTANCE_SQL = """
@@ -63,6 +51,108 @@ HAVERSINE_DISTANCE_SQL = """
 """
 
 
+def _haversine_distance_sql(center_lat: float, center_lng: float, radius_miles: int) -> tuple[str, dict]:
+    """Build the non-PostGIS nearby SELECT of (resource_id, distance_miles) and its params.
+
+    A bounding box narrows the rows (lat/lng BETWEEN), and the Haversine
+    distance both applies the radius and is the displayed distance.
+    """
+    lat_min, lat_max, lng_min, lng_max = bounding_box(center_lat, center_lng, radius_miles)
+
+    distance_sql = f"""
+        SELECT r.id as resource_id,
+               {HAVERSINE_DISTANCE_SQL} as distance_miles
+        FROM resources r
+        JOIN locations l ON r.location_id = l.id
+        WHERE l.latitude IS NOT NULL AND l.longitude IS NOT NULL
+        AND l.latitude BETWEEN :lat_min AND :lat_max
+        AND l.longitude BETWEEN :lng_min AND :lng_max
+        AND {HAVERSINE_DISTANCE_SQL} <= :radius_miles
+    """
+    params = {
+        "center_lat": center_lat,
+        "center_lng": center_lng,
+        "lat_min": lat_min,
+        "lat_max": lat_max,
+        "lng_min": lng_min,
+        "lng_max": lng_max,
+        "radius_miles": radius_miles,
+    }
+    return distance_sql, params
+
+
+def _local_filters_sql(filters: ResourceFilters, params: dict) -> str:
+    """``AND ...`` clauses on alias ``r`` for the nearby branch: ``filters`` and not national.
+
+    National resources are listed once, in the national bucket, even with a
+    location in the radius.
+    """
+    params["national_scope"] = ResourceScope.NATIONAL.name
+    return f"AND r.scope != :national_scope {filters.sql(params)}"
+
+
+def _indexed_distance_sql(
+    index: SpatialIndex,
+    facets: FacetIndex | None,
+    center_lat: float,
+    center_lng: float,
+    radius_miles: int,
+    filters: ResourceFilters,
+    params: dict,
+) -> str:
+    """Build the nearby SELECT of non-national resources matching ``filters`` from the in-process indexes.
+
+    The spatial index finds the resources within the radius (the same rows
+    and distances as _haversine_distance_sql). When the facet index can
+    answer the filters, its bitmaps drop the rest and Postgres only
+    unnests the final ids; otherwise (tags matched against text, or the
+    facet index failed to build) the matches are joined to resources and
+    filtered in SQL. Bind values are added to ``params``.
+    """
+    matches = index.within_radius(center_lat, center_lng, radius_miles)
+    bits = facets.match(replace(filters, scope="non_national")) if facets is not None else None
+    if facets is not None and bits is not None:
+        selected = facets.members(bits, (resource_id for resource_id, _ in matches))
+        matches = [(resource_id, distance) for resource_id, distance in matches if resource_id in selected]
+
+    params["near_ids"] = [resource_id for resource_id, _ in matches]
+    params["near_distances"] = [distance for _, distance in matches]
+    near_sql = (
+        "unnest(CAST(:near_ids AS uuid[]), CAST(:near_distances AS float8[])) AS near(resource_id, distance_miles)"
+    )
+    if bits is not None:
+        return f"SELECT near.resource_id, near.distance_miles FROM {near_sql}"
+    return f"""
+        SELECT r.id as resource_id, near.distance_miles
+        FROM {near_sql}, resources r
+        WHERE r.id = near.resource_id {_local_filters_sql(filters, params)}
+    """
+
+
+def _listing_scope(scope: str | None) -> str | None:
+    """Scope filter for listings, where 'state' has always meant state or local (anything but national)."""
+    return "non_national" if scope == "state" else scope
+
+
+def _encode_nearby_cursor(row) -> str:
+    """Encode a nearby row's sort key (bucket, distance, title, id) as an opaque cursor."""
+    key = [row.bucket, float(row.distance_miles), row.title, str(row.resource_id)]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_nearby_cursor(cursor: str) -> tuple[int, float, str, str]:
+    """Decode a cursor from _encode_nearby_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        bucket, distance, title, resource_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return int(bucket), float(distance), str(title), str(UUID(resource_id))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 class ResourceService:
     """Service for resource CRUD operations."""
 
@@ -85,37 +175,8 @@ class ResourceService:
         Returns:
             Count of matching resources
         """
-        query = select(func.count(Resource.id)).where(Resource.status != ResourceStatus.INACTIVE)
-
-        # Apply category filter (OR logic: match any of the categories)
-        if categories:
-            category_conditions = [Resource.categories.contains([cat]) for cat in categories]
-            query = query.where(or_(*category_conditions))
-
-        # Apply state filter:
-        # - Truly nationwide resources (national scope with empty states array) show for all states
-        # - Resources with specific states in their array show only for matching states
-        if states:
-            state_conditions = [Resource.states.contains([s]) for s in states]
-            query = query.where(
-                or_(
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    *state_conditions,
-                )
-            )
-
-        # Apply scope filter
-        # 'national' = only national resources
-        # 'state' = exclude national (show state + local)
-        # 'local' = only local resources
-        if scope and scope != "all":
-            if scope == "state":
-                # Exclude national resources (keep state and local)
-                query = query.where(Resource.scope != ResourceScope.NATIONAL)
-            else:
-                scope_enum = ResourceScope(scope)
-                query = query.where(Resource.scope == scope_enum)
-
+        filters = ResourceFilters(categories=categories, states=states, scope=_listing_scope(scope))
+        query = select(func.count(Resource.id)).where(*filters.clauses())
         result = self.session.exec(query).one()
         return result
 
@@ -129,7 +190,8 @@ class ResourceService:
         tags: list[str] | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[ResourceRead], int]:
+        count: str = "exact",
+    ) -> tuple[list[ResourceRead], int | None]:
         """List resources with optional filtering.
 
         Args:
@@ -141,128 +203,35 @@ class ResourceService:
             tags: Filter by eligibility tags (resources must match ALL of the provided tags - AND logic)
             limit: Maximum results to return
             offset: Number of results to skip for pagination
+            count: How to compute the total: 'exact', 'estimate' or 'none' (see services.filters)
 
         Returns:
-            Tuple of (list of resources, total count matching filters)
+            Tuple of (list of resources, total count matching filters or None when count='none')
         """
-        # Build base query
-        query = select(Resource).where(Resource.status != ResourceStatus.INACTIVE)
-
-        # Apply category filter (OR logic: match any of the categories)
-        if categories:
-            category_conditions = [Resource.categories.contains([cat]) for cat in categories]
-            query = query.where(or_(*category_conditions))
-
-        # Apply state filter:
-        # - Truly nationwide resources (national scope with empty states array) show for all states
-        # - Resources with specific states in their array show only for matching states
-        # This prevents e.g. "Feeding America MN" from showing for Texas searches
-        if states:
-            state_conditions = [Resource.states.contains([s]) for s in states]
-            query = query.where(
-                or_(
-                    # Truly nationwide: national scope AND no specific states listed
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    # OR has matching state in their states array
-                    *state_conditions,
-                )
-            )
-
-        # Apply scope filter
-        # 'national' = only national resources
-        # 'state' = exclude national (show state + local)
-        # 'local' = only local resources
-        if scope and scope != "all":
-            if scope == "state":
-                # Exclude national resources (keep state and local)
-                query = query.where(Resource.scope != ResourceScope.NATIONAL)
-            else:
-                scope_enum = ResourceScope(scope)
-                query = query.where(Resource.scope == scope_enum)
-
-        # Apply tags filter - check tags and subcategories arrays only
-        # Tags like "hud-vash", "ssvf", "food-pantry" filter by exact array membership
-        # Uses AND logic: resources must match ALL provided tags (selecting more tags narrows results)
-        if tags:
-            for tag in tags:
-                # Each tag must be in either tags or subcategories array
-                query = query.where(
-                    or_(
-                        Resource.tags.contains([tag]),
-                        Resource.subcategories.contains([tag]),
-                    )
-                )
-
-        if status:
-            query = query.where(Resource.status == status)
-
-        # Get total count with same filters (using COUNT(*) for efficiency)
-        count_query = select(func.count()).select_from(Resource).where(Resource.status != ResourceStatus.INACTIVE)
-        if categories:
-            category_conditions = [Resource.categories.contains([cat]) for cat in categories]
-            count_query = count_query.where(or_(*category_conditions))
-        if states:
-            state_conditions = [Resource.states.contains([s]) for s in states]
-            count_query = count_query.where(
-                or_(
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    *state_conditions,
-                )
-            )
-        if scope and scope != "all":
-            if scope == "state":
-                count_query = count_query.where(Resource.scope != ResourceScope.NATIONAL)
-            else:
-                scope_enum = ResourceScope(scope)
-                count_query = count_query.where(Resource.scope == scope_enum)
-        if tags:
-            # AND logic: each tag must match (apply as separate WHERE clauses)
-            for tag in tags:
-                count_query = count_query.where(
-                    or_(
-                        Resource.tags.contains([tag]),
-                        Resource.subcategories.contains([tag]),
-                    )
-                )
-        if status:
-            count_query = count_query.where(Resource.status == status)
-
-        total = self.session.exec(count_query).one()
+        # Tags like "hud-vash", "ssvf", "food-pantry" filter by exact tags/subcategories membership
+        filters = ResourceFilters(
+            categories=categories, states=states, scope=_listing_scope(scope), tags=tags, status=status
+        )
+        query = select(Resource).where(*filters.clauses())
 
         # Apply ordering based on sort option (secondary sort by id for stable pagination)
         # When no location filter is applied, boost national resources to the top
         # since they're relevant to all users
-        no_location_filter = not states
-        national_boost = case((Resource.scope == ResourceScope.NATIONAL, 0), else_=1) if no_location_filter else None
+        order_by: list = []
+        if not states and sort != "shuffle":
+            order_by.append(case((Resource.scope == ResourceScope.NATIONAL, 0), else_=1))
 
         if sort == "newest":
-            if national_boost is not None:
-                query = query.order_by(national_boost, col(Resource.created_at).desc(), col(Resource.id))
-            else:
-                query = query.order_by(col(Resource.created_at).desc(), col(Resource.id))
+            order_by += [col(Resource.created_at).desc(), col(Resource.id)]
         elif sort == "alpha":
-            if national_boost is not None:
-                query = query.order_by(national_boost, col(Resource.title).asc(), col(Resource.id))
-            else:
-                query = query.order_by(col(Resource.title).asc(), col(Resource.id))
+            order_by += [col(Resource.title).asc(), col(Resource.id)]
         elif sort == "shuffle":
             # Day-seeded random: consistent order within a day, varies day-to-day
             # Uses md5(id::text || current_date::text) for deterministic shuffling
-            query = query.order_by(func.md5(func.concat(Resource.id.cast(String), func.current_date().cast(String))))
-        elif sort == "official":
-            # Official First: sort by source tier (reliability_score), Tier 1 first
-            if national_boost is not None:
-                query = query.order_by(national_boost, col(Resource.reliability_score).desc(), col(Resource.id))
-            else:
-                query = query.order_by(col(Resource.reliability_score).desc(), col(Resource.id))
+            order_by.append(func.md5(func.concat(Resource.id.cast(String), func.current_date().cast(String))))
         else:
-            # Default: relevance (by reliability score)
-            if national_boost is not None:
-                query = query.order_by(national_boost, col(Resource.reliability_score).desc(), col(Resource.id))
-            else:
-                query = query.order_by(col(Resource.reliability_score).desc(), col(Resource.id))
-
-        query = query.offset(offset).limit(limit)
+            # Default/"official": relevance by source tier (reliability_score), Tier 1 first
+            order_by += [col(Resource.reliability_score).desc(), col(Resource.id)]
 
         # Eager load relationships to avoid N+1 queries
         query = query.options(
@@ -272,8 +241,29 @@ class ResourceService:
             selectinload(Resource.program),  # type: ignore[attr-defined]
         )
 
-        resources = self.session.exec(query).all()
-        return [self._to_read_schema(r) for r in resources], total
+        rows, total = fetch_page(self.session, query, order_by, limit, offset, count)
+        return [self._to_read_schema(resource) for (resource,) in rows], total
+
+    def facet_counts(
+        self,
+        categories: list[str] | None = None,
+        states: list[str] | None = None,
+        scope: str | None = None,
+        status: ResourceStatus | None = None,
+        tags: list[str] | None = None,
+    ) -> dict[str, dict[str, int]] | None:
+        """Count category, state, tag and scope values for a listing's filters.
+
+        Same filters as list_resources(), answered from the in-process facet
+        index. Returns None if the index is unavailable.
+        """
+        index = get_facet_index(self.session)
+        if index is None:
+            return None
+        filters = ResourceFilters(
+            categories=categories, states=states, scope=_listing_scope(scope), tags=tags, status=status
+        )
+        return facet_counts(index, filters)
 
     def list_nearby(
         self,
@@ -284,6 +274,8 @@ class ResourceService:
         tags: list[str] | None = None,
         limit: int = 20,
         offset: int = 0,
+        count: str = "exact",
+        cursor: str | None = None,
     ) -> ResourceNearbyList | None:
         """List resources near a zip code, sorted by distance.
 
@@ -295,277 +287,33 @@ class ResourceService:
                    or None (local/state + national)
             tags: Filter by eligibility tags (optional)
             limit: Maximum results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (ignored with cursor)
+            count: 'exact'/'estimate' to include the total, 'none' to skip it
+            cursor: next_cursor from the previous page (keyset pagination)
 
         Returns:
             ResourceNearbyList with resources sorted by distance, or None if zip not found
+
+        Raises:
+            ValueError: If cursor is malformed.
         """
-        # Look up zip code center point and state (no geog column needed - we use Haversine)
-        zip_result = self.session.execute(
-            text("SELECT latitude, longitude, state FROM zip_codes WHERE zip_code = :zip"),
-            {"zip": zip_code},
-        ).fetchone()
+        # Zip center point and state come from the in-process zip table
+        zip_result = get_geo_context(self.session).zips.get(zip_code)
 
         if not zip_result:
             return None
 
         center_lat, center_lng = zip_result.latitude, zip_result.longitude
-        zip_state = zip_result.state  # 2-letter state code
-        radius_meters = radius_miles * METERS_PER_MILE
-
-        nearby_resources = []
-        total = 0
-
-        # Helper to build tags SQL condition with parameterized queries
-        def build_tags_sql(tags: list[str], params: dict) -> str:
-            """Build SQL condition for tags filtering (matches eligibility, title, description, tags, subcategories).
-
-            Uses AND logic: resources must match ALL provided tags (selecting more tags narrows results).
-            All values are parameterized to prevent SQL injection.
-            """
-            tag_conditions = []
-            for i, tag in enumerate(tags):
-                # Create unique parameter names for each tag
-                param_like = f"tag_like_{i}"
-                param_like_spaced = f"tag_like_spaced_{i}"
-                param_array = f"tag_array_{i}"
-                # Add parameters to the dict
-                params[param_like] = f"%{tag}%"
-                params[param_like_spaced] = f"%{tag.replace('-', ' ')}%"
-                params[param_array] = tag
-                # Use parameterized placeholders
-                tag_conditions.append(
-                    f"(r.eligibility ILIKE :{param_like} OR r.eligibility ILIKE :{param_like_spaced} "
-                    f"OR r.title ILIKE :{param_like} OR r.title ILIKE :{param_like_spaced} "
-                    f"OR r.description ILIKE :{param_like} OR r.description ILIKE :{param_like_spaced} "
-                    f"OR r.tags @> ARRAY[:{param_array}]::text[] "
-                    f"OR r.subcategories @> ARRAY[:{param_array}]::text[])"
-                )
-            # AND logic: each tag condition must be satisfied
-            return " AND ".join(tag_conditions)
-
-        # Helper to build categories SQL condition with parameterized queries
-        def build_categories_sql(categories: list[str], params: dict, prefix: str = "cat") -> str:
-            """Build SQL condition for category filtering with parameterization."""
-            cat_conditions = []
-            for i, cat in enumerate(categories):
-                param_name = f"{prefix}_{i}"
-                params[param_name] = cat
-                cat_conditions.append(f"r.categories @> ARRAY[:{param_name}]::text[]")
-            return " OR ".join(cat_conditions)
-
-        # If scope is 'national', only return national resources (no spatial query)
-        if scope == "national":
-            national_sql = """
-                SELECT r.id as resource_id
-                FROM resources r
-                WHERE r.scope::text = 'national'
-                AND r.status::text != 'inactive'
-            """
-            params: dict = {}
-
-            if categories:
-                category_conditions = build_categories_sql(categories, params, "nat_cat")
-                national_sql += f" AND ({category_conditions})"
-
-            if tags:
-                tags_condition = build_tags_sql(tags, params)
-                national_sql += f" AND ({tags_condition})"
-
-            count_sql = f"SELECT COUNT(*) FROM ({national_sql}) as subquery"
-            total = self.session.execute(text(count_sql), params).scalar() or 0
-
-            results_sql = f"{national_sql} ORDER BY r.title ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            results = self.session.execute(text(results_sql), params).fetchall()
-            for row in results:
-                resource = self.session.get(Resource, row.resource_id)
-                if resource:
-                    nearby_resources.append(
-                        ResourceNearbyResult(
-                            resource=self._to_read_schema(resource),
-                            distance_miles=0,  # National = available everywhere
-                        )
-                    )
-        else:
-            # Check if PostGIS is available
-            has_postgis = _check_postgis(self.session)
-
-            if has_postgis:
-                # Use PostGIS spatial query (more accurate)
-                base_sql = """
-                    SELECT r.id as resource_id,
-                           ST_Distance(l.geog, z.geog) / :meters_per_mile as distance_miles
-                    FROM resources r
-                    JOIN locations l ON r.location_id = l.id
-                    CROSS JOIN zip_codes z
-                    WHERE z.zip_code = :zip
-                    AND l.geog IS NOT NULL
-                    AND ST_DWithin(l.geog, z.geog, :radius_meters)
-                    AND r.status::text != 'inactive'
-                """
-                params = {
-                    "zip": zip_code,
-                    "radius_meters": radius_meters,
-                    "meters_per_mile": METERS_PER_MILE,
-                }
-            else:
-                # Fallback: Use Haversine formula (pure SQL, no PostGIS required)
-                # Use bounding box for filtering (close enough), calculate exact distance for display
-                lat_range = radius_miles / 69.0  # ~69 miles per degree latitude
-                lng_range = radius_miles / (69.0 * max(0.1, abs(math.cos(math.radians(center_lat)))))
-
-                base_sql = """
-                    SELECT r.id as resource_id,
-                           3959 * ACOS(
-                               LEAST(1.0, GREATEST(-1.0,
-                                   COS(RADIANS(:center_lat)) * COS(RADIANS(l.latitude)) *
-                                   COS(RADIANS(l.longitude) - RADIANS(:center_lng)) +
-                                   SIN(RADIANS(:center_lat)) * SIN(RADIANS(l.latitude))
-                               ))
-                           ) as distance_miles
-                    FROM resources r
-                    JOIN locations l ON r.location_id = l.id
-                    WHERE l.latitude IS NOT NULL AND l.longitude IS NOT NULL
-                    AND l.latitude BETWEEN :lat_min AND :lat_max
-                    AND l.longitude BETWEEN :lng_min AND :lng_max
-                    AND r.status::text != 'inactive'
-                """
-                params = {
-                    "center_lat": center_lat,
-                    "center_lng": center_lng,
-                    "lat_min": center_lat - lat_range,
-                    "lat_max": center_lat + lat_range,
-                    "lng_min": center_lng - lng_range,
-                    "lng_max": center_lng + lng_range,
-                }
-
-            if categories:
-                category_conditions = build_categories_sql(categories, params, "base_cat")
-                base_sql += f" AND ({category_conditions})"
-
-            if tags:
-                tags_condition = build_tags_sql(tags, params)
-                base_sql += f" AND ({tags_condition})"
-
-            # Get nearby resources count
-            count_sql = f"SELECT COUNT(*) FROM ({base_sql}) as subquery"
-            nearby_count = self.session.execute(text(count_sql), params).scalar() or 0
-
-            # Get national resources count (if not filtering to state-only)
-            national_count = 0
-            if scope != "state":
-                # Use separate params dict for national count query to avoid collisions
-                nat_count_params: dict = {}
-                national_count_sql = """
-                    SELECT COUNT(*) FROM resources r
-                    WHERE r.scope::text = 'national'
-                    AND r.status::text != 'inactive'
-                """
-                if categories:
-                    category_conditions = build_categories_sql(categories, nat_count_params, "natc_cat")
-                    national_count_sql += f" AND ({category_conditions})"
-                if tags:
-                    tags_condition = build_tags_sql(tags, nat_count_params)
-                    national_count_sql += f" AND ({tags_condition})"
-                national_count = self.session.execute(text(national_count_sql), nat_count_params).scalar() or 0
-
-            total = nearby_count + national_count
-
-            # Pagination logic: fetch nearby first, then national
-            remaining_limit = limit
-            current_offset = offset
-
-            # Collect resource IDs and distances first, then batch load
-            nearby_ids_distances: list[tuple[UUID, float]] = []
-            national_ids: list[UUID] = []
-
-            # Fetch nearby resources if we're within that range
-            if current_offset < nearby_count:
-                results_sql = f"""
-                    {base_sql}
-                    ORDER BY distance_miles ASC
-                    LIMIT :limit OFFSET :offset
-                """
-                params["limit"] = remaining_limit
-                params["offset"] = current_offset
-
-                results = self.session.execute(text(results_sql), params).fetchall()
-                for row in results:
-                    nearby_ids_distances.append((row.resource_id, round(row.distance_miles, 1)))
-                remaining_limit -= len(nearby_ids_distances)
-                current_offset = 0  # Reset for national query
-            else:
-                current_offset -= nearby_count
-
-            # Fetch national resources if we have room and not filtering to state-only
-            if remaining_limit > 0 and scope != "state":
-                # Use separate params dict for national fetch query
-                nat_fetch_params: dict = {"limit": remaining_limit, "offset": current_offset}
-                national_sql = """
-                    SELECT r.id as resource_id
-                    FROM resources r
-                    WHERE r.scope::text = 'national'
-                    AND r.status::text != 'inactive'
-                """
-                if categories:
-                    category_conditions = build_categories_sql(categories, nat_fetch_params, "natf_cat")
-                    national_sql += f" AND ({category_conditions})"
-                if tags:
-                    tags_condition = build_tags_sql(tags, nat_fetch_params)
-                    national_sql += f" AND ({tags_condition})"
-
-                national_sql += " ORDER BY r.title ASC LIMIT :limit OFFSET :offset"
-
-                national_results = self.session.execute(text(national_sql), nat_fetch_params).fetchall()
-
-                for row in national_results:
-                    national_ids.append(row.resource_id)
-
-            # Batch load all resources with eager loading to avoid N+1 queries
-            all_ids = [rid for rid, _ in nearby_ids_distances] + national_ids
-            if all_ids:
-                resources_query = (
-                    select(Resource)
-                    .where(Resource.id.in_(all_ids))
-                    .options(
-                        selectinload(Resource.organization),  # type: ignore[attr-defined]
-                        selectinload(Resource.location),  # type: ignore[attr-defined]
-                        selectinload(Resource.source),  # type: ignore[attr-defined]
-                        selectinload(Resource.program),  # type: ignore[attr-defined]
-                    )
-                )
-                resources_by_id = {r.id: r for r in self.session.exec(resources_query).all()}
-
-                # Build nearby results in order
-                for rid, distance in nearby_ids_distances:
-                    resource = resources_by_id.get(rid)
-                    if resource:
-                        nearby_resources.append(
-                            ResourceNearbyResult(
-                                resource=self._to_read_schema(resource),
-                                distance_miles=distance,
-                            )
-                        )
-
-                # Build national results in order
-                for rid in national_ids:
-                    resource = resources_by_id.get(rid)
-                    if resource:
-                        nearby_resources.append(
-                            ResourceNearbyResult(
-                                resource=self._to_read_schema(resource),
-                                distance_miles=0,  # National = available everywhere
-                            )
-                        )
+        resources, total, next_cursor = self._nearby_page(
+            center_lat, center_lng, radius_miles, categories, scope, tags, limit, offset, count, cursor
+        )
 
         return ResourceNearbyList(
-            resources=nearby_resources,
+            resources=resources,
             total=total,
+            next_cursor=next_cursor,
             zip_code=zip_code,
-            state=zip_state,
+            state=zip_result.state,  # 2-letter state code
             radius_miles=radius_miles,
             center_lat=center_lat,
             center_lng=center_lng,
@@ -581,6 +329,8 @@ class ResourceService:
         tags: list[str] | None = None,
         limit: int = 20,
         offset: int = 0,
+        count: str = "exact",
+        cursor: str | None = None,
     ) -> ResourceNearbyList:
         """List resources near GPS coordinates, sorted by distance.
 
@@ -593,264 +343,24 @@ class ResourceService:
                    or None (local/state + national)
             tags: Filter by eligibility tags (optional)
             limit: Maximum results to return
-            offset: Number of results to skip for pagination
+            offset: Number of results to skip for pagination (ignored with cursor)
+            count: 'exact'/'estimate' to include the total, 'none' to skip it
+            cursor: next_cursor from the previous page (keyset pagination)
 
         Returns:
             ResourceNearbyList with resources sorted by distance
-        """
-        radius_meters = radius_miles * METERS_PER_MILE
 
-        nearby_resources = []
-        total = 0
-
-        # Helper to build tags SQL condition with parameterized queries
-        def build_tags_sql(tags: list[str], params: dict) -> str:
-            """Build SQL condition for tags filtering (matches eligibility, title, description, tags, subcategories).
-
-            Uses AND logic: resources must match ALL provided tags (selecting more tags narrows results).
-            All values are parameterized to prevent SQL injection.
-            """
-            tag_conditions = []
-            for i, tag in enumerate(tags):
-                # Create unique parameter names for each tag (use coord_ prefix to avoid collisions)
-                param_like = f"coord_tag_like_{i}"
-                param_like_spaced = f"coord_tag_like_spaced_{i}"
-                param_array = f"coord_tag_array_{i}"
-                # Add parameters to the dict
-                params[param_like] = f"%{tag}%"
-                params[param_like_spaced] = f"%{tag.replace('-', ' ')}%"
-                params[param_array] = tag
-                # Use parameterized placeholders
-                tag_conditions.append(
-                    f"(r.eligibility ILIKE :{param_like} OR r.eligibility ILIKE :{param_like_spaced} "
-                    f"OR r.title ILIKE :{param_like} OR r.title ILIKE :{param_like_spaced} "
-                    f"OR r.description ILIKE :{param_like} OR r.description ILIKE :{param_like_spaced} "
-                    f"OR r.tags @> ARRAY[:{param_array}]::text[] "
-                    f"OR r.subcategories @> ARRAY[:{param_array}]::text[])"
-                )
-            # AND logic: each tag condition must be satisfied
-            return " AND ".join(tag_conditions)
-
-        # Helper to build categories SQL condition with parameterized queries
-        def build_categories_sql(categories: list[str], params: dict, prefix: str = "coord_cat") -> str:
-            """Build SQL condition for category filtering with parameterization."""
-            cat_conditions = []
-            for i, cat in enumerate(categories):
-                param_name = f"{prefix}_{i}"
-                params[param_name] = cat
-                cat_conditions.append(f"r.categories @> ARRAY[:{param_name}]::text[]")
-            return " OR ".join(cat_conditions)
-
-        # If scope is 'national', only return national resources (no spatial query)
-        if scope == "national":
-            national_sql = """
-                SELECT r.id as resource_id
-                FROM resources r
-                WHERE r.scope::text = 'national'
-                AND r.status::text != 'inactive'
-            """
-            params: dict = {}
-
-            if categories:
-                category_conditions = build_categories_sql(categories, params, "coord_nat_cat")
-                national_sql += f" AND ({category_conditions})"
-
-            if tags:
-                tags_condition = build_tags_sql(tags, params)
-                national_sql += f" AND ({tags_condition})"
-
-            count_sql = f"SELECT COUNT(*) FROM ({national_sql}) as subquery"
-            total = self.session.execute(text(count_sql), params).scalar() or 0
-
-            results_sql = f"{national_sql} ORDER BY r.title ASC LIMIT :limit OFFSET :offset"
-            params["limit"] = limit
-            params["offset"] = offset
-
-            results = self.session.execute(text(results_sql), params).fetchall()
-            for row in results:
-                resource = self.session.get(Resource, row.resource_id)
-                if resource:
-                    nearby_resources.append(
-                        ResourceNearbyResult(
-                            resource=self._to_read_schema(resource),
-                            distance_miles=0,
-                        )
-                    )
-        else:
-            # Check if PostGIS is available
-            has_postgis = _check_postgis(self.session)
-
-            if has_postgis:
-                # Use PostGIS spatial query (more accurate)
-                point_expr = "ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography"
-                base_sql = f"""
-                    SELECT r.id as resource_id,
-                           ST_Distance(l.geog, {point_expr}) / :meters_per_mile as distance_miles
-                    FROM resources r
-                    JOIN locations l ON r.location_id = l.id
-                    WHERE l.geog IS NOT NULL
-                    AND ST_DWithin(l.geog, {point_expr}, :radius_meters)
-                    AND r.status::text != 'inactive'
-                """
-                params = {
-                    "lat": lat,
-                    "lng": lng,
-                    "radius_meters": radius_meters,
-                    "meters_per_mile": METERS_PER_MILE,
-                }
-            else:
-                # Fallback: Use Haversine formula (pure SQL, no PostGIS required)
-                # Use bounding box for filtering (close enough), calculate exact distance for display
-                lat_range = radius_miles / 69.0  # ~69 miles per degree latitude
-                lng_range = radius_miles / (69.0 * max(0.1, abs(math.cos(math.radians(lat)))))
-
-                base_sql = """
-                    SELECT r.id as resource_id,
-                           3959 * ACOS(
-                               LEAST(1.0, GREATEST(-1.0,
-                                   COS(RADIANS(:center_lat)) * COS(RADIANS(l.latitude)) *
-                                   COS(RADIANS(l.longitude) - RADIANS(:center_lng)) +
-                                   SIN(RADIANS(:center_lat)) * SIN(RADIANS(l.latitude))
-                               ))
-                           ) as distance_miles
-                    FROM resources r
-                    JOIN locations l ON r.location_id = l.id
-                    WHERE l.latitude IS NOT NULL AND l.longitude IS NOT NULL
-                    AND l.latitude BETWEEN :lat_min AND :lat_max
-                    AND l.longitude BETWEEN :lng_min AND :lng_max
-                    AND r.status::text != 'inactive'
-                """
-                params = {
-                    "center_lat": lat,
-                    "center_lng": lng,
-                    "lat_min": lat - lat_range,
-                    "lat_max": lat + lat_range,
-                    "lng_min": lng - lng_range,
-                    "lng_max": lng + lng_range,
-                }
-
-            if categories:
-                category_conditions = build_categories_sql(categories, params, "coord_base_cat")
-                base_sql += f" AND ({category_conditions})"
-
-            if tags:
-                tags_condition = build_tags_sql(tags, params)
-                base_sql += f" AND ({tags_condition})"
-
-            # Get nearby resources count
-            count_sql = f"SELECT COUNT(*) FROM ({base_sql}) as subquery"
-            nearby_count = self.session.execute(text(count_sql), params).scalar() or 0
-
-            # Get national resources count (if not filtering to state-only)
-            national_count = 0
-            if scope != "state":
-                # Use separate params dict for national count query to avoid collisions
-                coord_nat_count_params: dict = {}
-                national_count_sql = """
-                    SELECT COUNT(*) FROM resources r
-                    WHERE r.scope::text = 'national'
-                    AND r.status::text != 'inactive'
-                """
-                if categories:
-                    category_conditions = build_categories_sql(categories, coord_nat_count_params, "coord_natc_cat")
-                    national_count_sql += f" AND ({category_conditions})"
-                if tags:
-                    tags_condition = build_tags_sql(tags, coord_nat_count_params)
-                    national_count_sql += f" AND ({tags_condition})"
-                national_count = self.session.execute(text(national_count_sql), coord_nat_count_params).scalar() or 0
-
-            total = nearby_count + national_count
-
-            # Pagination logic: fetch nearby first, then national
-            remaining_limit = limit
-            current_offset = offset
-
-            # Collect resource IDs and distances first, then batch load
-            nearby_ids_distances: list[tuple[UUID, float]] = []
-            national_ids: list[UUID] = []
-
-            # Fetch nearby resources if we're within that range
-            if current_offset < nearby_count:
-                results_sql = f"""
-                    {base_sql}
-                    ORDER BY distance_miles ASC
-                    LIMIT :limit OFFSET :offset
-                """
-                params["limit"] = remaining_limit
-                params["offset"] = current_offset
-
-                results = self.session.execute(text(results_sql), params).fetchall()
-                for row in results:
-                    nearby_ids_distances.append((row.resource_id, round(row.distance_miles, 1)))
-                remaining_limit -= len(nearby_ids_distances)
-                current_offset = 0
-            else:
-                current_offset -= nearby_count
-
-            # Fetch national resources if we have room and not filtering to state-only
-            if remaining_limit > 0 and scope != "state":
-                # Use separate params dict for national fetch query
-                coord_nat_fetch_params: dict = {"limit": remaining_limit, "offset": current_offset}
-                national_sql = """
-                    SELECT r.id as resource_id
-                    FROM resources r
-                    WHERE r.scope::text = 'national'
-                    AND r.status::text != 'inactive'
-                """
-                if categories:
-                    category_conditions = build_categories_sql(categories, coord_nat_fetch_params, "coord_natf_cat")
-                    national_sql += f" AND ({category_conditions})"
-                if tags:
-                    tags_condition = build_tags_sql(tags, coord_nat_fetch_params)
-                    national_sql += f" AND ({tags_condition})"
-
-                national_sql += " ORDER BY r.title ASC LIMIT :limit OFFSET :offset"
-
-                national_results = self.session.execute(text(national_sql), coord_nat_fetch_params).fetchall()
-
-                for row in national_results:
-                    national_ids.append(row.resource_id)
-
-            # Batch load all resources with eager loading to avoid N+1 queries
-            all_ids = [rid for rid, _ in nearby_ids_distances] + national_ids
-            if all_ids:
-                resources_query = (
-                    select(Resource)
-                    .where(Resource.id.in_(all_ids))
-                    .options(
-                        selectinload(Resource.organization),  # type: ignore[attr-defined]
-                        selectinload(Resource.location),  # type: ignore[attr-defined]
-                        selectinload(Resource.source),  # type: ignore[attr-defined]
-                        selectinload(Resource.program),  # type: ignore[attr-defined]
-                    )
-                )
-                resources_by_id = {r.id: r for r in self.session.exec(resources_query).all()}
-
-                # Build nearby results in order
-                for rid, distance in nearby_ids_distances:
-                    resource = resources_by_id.get(rid)
-                    if resource:
-                        nearby_resources.append(
-                            ResourceNearbyResult(
-                                resource=self._to_read_schema(resource),
-                                distance_miles=distance,
-                            )
-                        )
-
-                # Build national results in order
-                for rid in national_ids:
-                    resource = resources_by_id.get(rid)
-                    if resource:
-                        nearby_resources.append(
-                            ResourceNearbyResult(
-                                resource=self._to_read_schema(resource),
-                                distance_miles=0,
-                            )
-                        )
+        Raises:
+            ValueError: If cursor is malformed.
+        """
+        resources, total, next_cursor = self._nearby_page(
+            lat, lng, radius_miles, categories, scope, tags, limit, offset, count, cursor
+        )
 
         return ResourceNearbyList(
-            resources=nearby_resources,
+            resources=resources,
             total=total,
+            next_cursor=next_cursor,
             zip_code=None,  # No zip code when using coordinates
             state=None,  # Could potentially reverse geocode to get state
             radius_miles=radius_miles,
@@ -858,6 +368,160 @@ class ResourceService:
             center_lng=lng,
         )
 
+    def _nearby_distance_sql(
+        self, lat: float, lng: float, radius_miles: int, filters: ResourceFilters, params: dict
+    ) -> str:
+        """Build the SELECT of (resource_id, distance_miles) of non-national resources within the radius.
+
+        Uses PostGIS when available (more accurate), otherwise Haversine
+        distance within a bounding box, answered by the in-process spatial
+        index (and facet index) when enabled. Bind values are added to ``params``.
+        """
+        if not get_geo_context(self.session).postgis:
+            index = get_spatial_index(self.session)
+            if index is not None:
+                facets = get_facet_index(self.session)
+                return _indexed_distance_sql(index, facets, lat, lng, radius_miles, filters, params)
+            distance_sql, distance_params = _haversine_distance_sql(lat, lng, radius_miles)
+        else:
+            point_expr = "ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography"
+            distance_sql = f"""
+                SELECT r.id as resource_id,
+                       ST_Distance(l.geog, {point_expr}) / :meters_per_mile as distance_miles
+                FROM resources r
+                JOIN locations l ON r.location_id = l.id
+                WHERE l.geog IS NOT NULL
+                AND ST_DWithin(l.geog, {point_expr}, :radius_meters)
+            """
+            distance_params = {
+                "lat": lat,
+                "lng": lng,
+                "radius_meters": radius_miles * METERS_PER_MILE,
+                "meters_per_mile": METERS_PER_MILE,
+            }
+
+        params.update(distance_params)
+        return f"{distance_sql} {_local_filters_sql(filters, params)}"
+
+    def _nearby_page(
+        self,
+        lat: float,
+        lng: float,
+        radius_miles: int,
+        categories: list[str] | None,
+        scope: str | None,
+        tags: list[str] | None,
+        limit: int,
+        offset: int,
+        count: str,
+        cursor: str | None,
+    ) -> tuple[list[ResourceNearbyResult], int | None, str | None]:
+        """Fetch a page of nearby results followed by national resources, with the total.
+
+        Nearby rows (sorted by distance) and national rows (sorted by title,
+        distance 0) come from one statement, and COUNT(*) OVER () gives the
+        total of both without separate count queries. Pages continue from a
+        keyset cursor on the sort key, so deep pages don't re-sort and skip
+        OFFSET rows. Resources are then hydrated with one joined query.
+
+        Args:
+            lat: Latitude of search center
+            lng: Longitude of search center
+            radius_miles: Search radius in miles
+            categories: Filter by categories (optional)
+            scope: 'national', 'state' or None (see list_nearby)
+            tags: Filter by eligibility tags (optional)
+            limit: Maximum results to return
+            offset: Number of results to skip for pagination (ignored with cursor)
+            count: 'none' skips the total
+            cursor: next_cursor from the previous page (optional)
+
+        Returns:
+            Tuple of (results in display order, total or None when count='none',
+            cursor for the next page or None on the last page)
+        """
+        # Tags match eligibility text as well as the tags/subcategories arrays
+        filters = ResourceFilters(categories=categories, tags=tags, tag_match="text")
+
+        params: dict = {}
+        branches = []
+        if scope != "national":
+            distance_sql = self._nearby_distance_sql(lat, lng, radius_miles, filters, params)
+            branches.append(
+                "SELECT nearby.resource_id, nearby.distance_miles, 0 AS bucket, '' AS title"
+                f" FROM ({distance_sql}) AS nearby"
+            )
+        if scope != "state":
+            params["national_scope"] = ResourceScope.NATIONAL.name
+            branches.append(
+                "SELECT r.id AS resource_id, 0.0 AS distance_miles, 1 AS bucket, r.title FROM resources r"
+                f" WHERE r.scope = :national_scope {filters.sql(params)}"
+            )
+        combined_sql = " UNION ALL ".join(branches)
+
+        keyset_sql = ""
+        if cursor:
+            bucket, distance, title, resource_id = _decode_nearby_cursor(cursor)
+            keyset_sql = (
+                "WHERE (bucket, distance_miles, title, resource_id)"
+                " > (:c_bucket, :c_distance, :c_title, CAST(:c_id AS uuid))"
+            )
+            params.update(c_bucket=bucket, c_distance=distance, c_title=title, c_id=resource_id)
+            offset = 0
+
+        # The window runs before the keyset filter so the total covers every page
+        total_sql = ", COUNT(*) OVER () AS total" if count != "none" else ""
+        page_sql = f"""
+            WITH combined AS (
+                SELECT resource_id, distance_miles, bucket, title{total_sql}
+                FROM ({combined_sql}) AS merged
+            )
+            SELECT * FROM combined
+            {keyset_sql}
+            ORDER BY bucket, distance_miles, title, resource_id
+            LIMIT :limit OFFSET :offset
+        """
+        rows = self.session.execute(text(page_sql), {**params, "limit": limit, "offset": offset}).fetchall()
+
+        total = None
+        if count != "none":
+            if rows:
+                total = rows[0].total
+            elif offset == 0 and not cursor:
+                total = 0
+            else:
+                # Paged past the end, so the window saw no rows: count directly
+                count_sql = f"SELECT COUNT(*) FROM ({combined_sql}) AS combined"
+                total = self.session.execute(text(count_sql), params).scalar() or 0
+
+        next_cursor = _encode_nearby_cursor(rows[-1]) if len(rows) == limit else None
+
+        # Batch load all resources; the relationships are all many-to-one, so one joined query
+        resources_by_id = {}
+        if rows:
+            resources_query = (
+                select(Resource)
+                .where(col(Resource.id).in_([row.resource_id for row in rows]))
+                .options(
+                    joinedload(Resource.organization),  # type: ignore[attr-defined]
+                    joinedload(Resource.location),  # type: ignore[attr-defined]
+                    joinedload(Resource.source),  # type: ignore[attr-defined]
+                    joinedload(Resource.program),  # type: ignore[attr-defined]
+                )
+            )
+            resources_by_id = {r.id: r for r in self.session.exec(resources_query).all()}
+
+        # National = available everywhere (distance 0)
+        results = [
+            ResourceNearbyResult(
+                resource=self._to_read_schema(resources_by_id[row.resource_id]),
+                distance_miles=round(row.distance_miles, 1),
+            )
+            for row in rows
+            if row.resource_id in resources_by_id
+        ]
+        return results, total, next_cursor
+
     def get_resource(self, resource_id: UUID) -> ResourceRead | None:
         """Get a single resource by ID."""
         resource = self.session.get(Resource, resource_id)
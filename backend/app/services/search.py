@@ -1,15 +1,18 @@
 """Search service for full-text, semantic, and hybrid search."""
 
 import logging
-from dataclasses import dataclass
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, and_, case, cast, func, or_, text
+from sqlalchemy import case, func, or_, text
 from sqlmodel import Session, col, select
 
-from app.models import Location, Organization, Resource, Source
-from app.models.resource import ResourceScope, ResourceStatus
+from app.config import settings
+from app.models import Location, Organization, Program, Resource, Source
+from app.models.resource import ResourceScope
 
 if TYPE_CHECKING:
     pass
@@ -23,11 +26,130 @@ from app.schemas.resource import (
     MatchExplanation,
     MatchReason,
     OrganizationNested,
+    ProgramNested,
     ResourceRead,
     ResourceSearchResult,
     TrustSignals,
     VerificationInfo,
 )
+from app.services.facet_index import facet_counts, get_facet_index
+from app.services.filters import TOTAL_ESTIMATE_CAP, ResourceFilters, fetch_page
+
+# Reciprocal Rank Fusion constant (commonly 60)
+RRF_K = 60
+
+# Number of candidates each ranker contributes to hybrid search before fusion
+HYBRID_CANDIDATES_PER_RANKER = 100
+
+# Top-K from FTS and from vector distance, fused by rank: score = sum(weight / (k + rank)).
+# Ranks are numbered outside the LIMITed subqueries so the vector side stays an index scan.
+# {filters} is replaced with ResourceFilters.sql() clauses shared by both rankers
+HYBRID_RRF_SQL = """
+    WITH fts AS (
+        SELECT id, fts_score, row_number() OVER (ORDER BY fts_score DESC, id) AS fts_rank
+        FROM (
+            SELECT r.id, ts_rank(r.search_vector, q.query) AS fts_score
+            FROM resources r, to_tsquery('english', :tsquery) AS q(query)
+            WHERE r.search_vector @@ q.query
+            {filters}
+            ORDER BY fts_score DESC, r.id
+            LIMIT :candidates
+        ) AS fts_top
+    ),
+    semantic AS (
+        SELECT id, distance, row_number() OVER (ORDER BY distance, id) AS semantic_rank
+        FROM (
+            SELECT r.id, (r.embedding <=> CAST(:embedding AS vector))::float AS distance
+            FROM resources r
+            WHERE r.embedding IS NOT NULL
+            {filters}
+            ORDER BY r.embedding <=> CAST(:embedding AS vector)
+            LIMIT :candidates
+        ) AS semantic_top
+    ),
+    fused AS (
+        SELECT COALESCE(f.id, s.id) AS resource_id,
+               f.fts_score,
+               s.distance,
+               COALESCE(CAST(:fts_weight AS float) / (:rrf_k + f.fts_rank), 0)
+                 + COALESCE(CAST(:semantic_weight AS float) / (:rrf_k + s.semantic_rank), 0) AS rrf_score
+        FROM fts f
+        FULL OUTER JOIN semantic s ON s.id = f.id
+    )
+    SELECT resource_id, fts_score, distance, rrf_score, COUNT(*) OVER () AS total
+    FROM fused
+    ORDER BY rrf_score DESC, resource_id
+    LIMIT :limit OFFSET :offset
+"""
+
+
+# Nearest neighbours by cosine distance; the inner ORDER BY/LIMIT is the HNSW index scan and
+# the outer ORDER BY restores exact order when iterative scans return relaxed ordering
+SEMANTIC_SQL = """
+    SELECT resource_id, distance
+    FROM (
+        SELECT r.id AS resource_id, (r.embedding <=> CAST(:embedding AS vector))::float AS distance
+        FROM resources r
+        WHERE r.embedding IS NOT NULL
+        {filters}
+        ORDER BY r.embedding <=> CAST(:embedding AS vector)
+        LIMIT :limit OFFSET :offset
+    ) AS nearest
+    ORDER BY distance, resource_id
+"""
+
+# Matching embedded resources; {cap} is "LIMIT :count_cap" for estimated totals
+SEMANTIC_COUNT_SQL = """
+    SELECT COUNT(*)
+    FROM (
+        SELECT 1
+        FROM resources r
+        WHERE r.embedding IS NOT NULL
+        {filters}
+        {cap}
+    ) AS matches
+"""
+
+# pgvector caps hnsw.ef_search at 1000
+HNSW_MAX_EF_SEARCH = 1000
+
+# Candidate-list multiplier for filtered vector queries when iterative index scans are unavailable
+FILTERED_EF_SEARCH_MULTIPLIER = 4
+
+# Cache for pgvector iterative index scan support (pgvector >= 0.8, per-process)
+_iterative_scan_available: bool | None = None
+
+
+def _check_iterative_scan(session: Session) -> bool:
+    """Check if the installed pgvector supports hnsw.iterative_scan (0.8.0+)."""
+    global _iterative_scan_available
+    if _iterative_scan_available is not None:
+        return _iterative_scan_available
+    try:
+        version = session.execute(text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+        parts = tuple(int(p) for p in str(version).split(".")[:2]) if version else (0, 0)
+        _iterative_scan_available = parts >= (0, 8)
+    except Exception as e:
+        logger.warning("Failed to check pgvector version: %s", e)
+        _iterative_scan_available = False
+    return _iterative_scan_available
+
+
+def ann_ef_search_for_tier(tier: str) -> int:
+    """Return the configured hnsw.ef_search for a request tier ('fast', 'balanced', 'accurate')."""
+    tiers = {
+        "fast": settings.ann_ef_search_fast,
+        "balanced": settings.ann_ef_search_balanced,
+        "accurate": settings.ann_ef_search_accurate,
+    }
+    if tier not in tiers:
+        raise ValueError(f"Unknown ANN tier: {tier}")
+    return tiers[tier]
+
+
+def _vector_literal(embedding: list[float]) -> str:
+    """Format an embedding as a pgvector text literal for use as a bind parameter."""
+    return "[" + ",".join(repr(float(x)) for x in embedding) + "]"
 
 
 @dataclass
@@ -45,6 +167,26 @@ class EligibilityFilters:
     has_disability: bool | None = None
 
 
+@dataclass
+class ResultRelations:
+    """Related rows for a page of search results, keyed by primary key.
+
+    Built once per page by SearchService._hydrate so that result building
+    never goes back to the database per row.
+    """
+
+    organizations: dict[uuid.UUID, Organization] = field(default_factory=dict)
+    locations: dict[uuid.UUID, Location] = field(default_factory=dict)
+    sources: dict[uuid.UUID, Source] = field(default_factory=dict)
+    programs: dict[uuid.UUID, Program] = field(default_factory=dict)
+
+    def location_for(self, resource: Resource) -> Location | None:
+        """Return the hydrated location for a resource, if any."""
+        if not resource.location_id:
+            return None
+        return self.locations.get(resource.location_id)
+
+
 class SearchService:
     """Service for searching resources."""
 
@@ -148,7 +290,8 @@ class SearchService:
         tags: list[str] | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[ResourceSearchResult], int]:
+        count: str = "exact",
+    ) -> tuple[list[ResourceSearchResult], int | None]:
         """Search resources using PostgreSQL full-text search.
 
         Args:
@@ -159,91 +302,41 @@ class SearchService:
             tags: Optional list of eligibility tags to filter by (AND logic - must match ALL tags).
             limit: Maximum results to return.
             offset: Pagination offset.
+            count: How to compute the total: 'exact', 'estimate' or 'none' (see services.filters).
+
+        Returns:
+            Tuple of (results, total_count); total_count is None when count='none'.
         """
         # Build the search query with prefix matching for partial words
         prefix_query = self._build_prefix_tsquery(query)
         search_query = func.to_tsquery("english", prefix_query)
 
-        # Base query with FTS
+        # Tags are matched against the tags array only for text search
+        filters = ResourceFilters(
+            categories=categories,
+            states=states,
+            scope=scope,
+            tags=tags,
+            active_only=True,
+            tag_match="tags",
+        )
         stmt = (
             select(
                 Resource,
                 func.ts_rank(Resource.search_vector, search_query).label("rank"),
             )
-            .where(Resource.status == ResourceStatus.ACTIVE)
-            .where(Resource.search_vector.op("@@")(search_query))
-        )
-
-        # Apply category filter (OR logic - match ANY category)
-        if categories:
-            category_conditions = [Resource.categories.contains([cat]) for cat in categories]
-            stmt = stmt.where(or_(*category_conditions))
-
-        # Apply state filter:
-        # - Truly nationwide resources (national scope with empty states array) show for all states
-        # - Resources with specific states in their array show only for matching states
-        if states:
-            state_conditions = [and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == [])]
-            for state in states:
-                state_conditions.append(Resource.states.contains([state]))
-            stmt = stmt.where(or_(*state_conditions))
-
-        # Apply scope filter
-        if scope and scope != "all":
-            if scope == "national":
-                stmt = stmt.where(Resource.scope == ResourceScope.NATIONAL)
-            elif scope == "state":
-                stmt = stmt.where(Resource.scope == ResourceScope.STATE)
-            elif scope == "local":
-                stmt = stmt.where(Resource.scope == ResourceScope.LOCAL)
-
-        # Tag filter: resource must have ALL of the requested tags (AND logic)
-        # Uses @> (contains) operator for each tag to ensure all tags are present
-        if tags:
-            for tag in tags:
-                stmt = stmt.where(Resource.tags.contains([tag]))
-
-        # Get total count with same filters
-        count_stmt = (
-            select(func.count(Resource.id))
-            .where(Resource.status == ResourceStatus.ACTIVE)
             .where(Resource.search_vector.op("@@")(search_query))
+            .where(*filters.clauses())
         )
-        if categories:
-            category_conditions = [Resource.categories.contains([cat]) for cat in categories]
-            count_stmt = count_stmt.where(or_(*category_conditions))
-        if states:
-            state_conditions = [and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == [])]
-            for state in states:
-                state_conditions.append(Resource.states.contains([state]))
-            count_stmt = count_stmt.where(or_(*state_conditions))
-        if scope and scope != "all":
-            if scope == "national":
-                count_stmt = count_stmt.where(Resource.scope == ResourceScope.NATIONAL)
-            elif scope == "state":
-                count_stmt = count_stmt.where(Resource.scope == ResourceScope.STATE)
-            elif scope == "local":
-                count_stmt = count_stmt.where(Resource.scope == ResourceScope.LOCAL)
-        if tags:
-            # AND logic: each tag must be present
-            for tag in tags:
-                count_stmt = count_stmt.where(Resource.tags.contains([tag]))
-
-        total = self.session.exec(count_stmt).one()
 
         # Order by rank, then reliability
         # When no location filter, boost national resources to the top (they're relevant to everyone)
+        order_by = [text("rank DESC"), col(Resource.reliability_score).desc()]
         if not states:
-            national_boost = case((Resource.scope == ResourceScope.NATIONAL, 0), else_=1)
-            stmt = (
-                stmt.order_by(national_boost, text("rank DESC"), col(Resource.reliability_score).desc())
-                .offset(offset)
-                .limit(limit)
-            )
-        else:
-            stmt = stmt.order_by(text("rank DESC"), col(Resource.reliability_score).desc()).offset(offset).limit(limit)
+            order_by.insert(0, case((Resource.scope == ResourceScope.NATIONAL, 0), else_=1))
 
-        results = self.session.exec(stmt).all()
+        results, total = fetch_page(self.session, stmt, order_by, limit, offset, count)
+        relations = self._hydrate([resource for resource, _ in results])
 
         # Build search results with explanations
         search_results = []
@@ -251,8 +344,8 @@ class SearchService:
         category = categories[0] if categories else None
         state = states[0] if states else None
         for resource, rank in results:
-            explanations = self._build_explanations(resource, query, category, state, tags)
-            resource_read = self._to_read_schema(resource)
+            explanations = self._build_explanations(resource, query, category, state, tags, relations)
+            resource_read = self._to_read_schema(resource, relations)
             search_results.append(
                 ResourceSearchResult(
                     resource=resource_read,
@@ -263,6 +356,95 @@ class SearchService:
 
         return search_results, total
 
+    def facet_counts(
+        self,
+        query: str,
+        categories: list[str] | None = None,
+        states: list[str] | None = None,
+        scope: str | None = None,
+        tags: list[str] | None = None,
+    ) -> tuple[dict[str, dict[str, int]], bool] | None:
+        """Count category, state, tag and scope values for a search's results.
+
+        The ids matching the text query are fetched once (no filters, no
+        ranking); the filters and counts are then applied in the facet index.
+        At most FACET_SEARCH_MAX_MATCHES ids are fetched, so a very broad
+        query can't pull the whole table: past that the counts cover an
+        arbitrary subset of the matches and are approximate.
+
+        Returns:
+            (counts, approximate), or None if the index is unavailable.
+        """
+        index = get_facet_index(self.session)
+        if index is None:
+            return None
+        max_matches = settings.facet_search_max_matches
+        search_query = func.to_tsquery("english", self._build_prefix_tsquery(query))
+        matching_ids = list(
+            self.session.exec(
+                select(Resource.id).where(Resource.search_vector.op("@@")(search_query)).limit(max_matches + 1)
+            )
+        )
+        approximate = len(matching_ids) > max_matches
+        filters = ResourceFilters(
+            categories=categories,
+            states=states,
+            scope=scope,
+            tags=tags,
+            active_only=True,
+            tag_match="tags",
+        )
+        return facet_counts(index, filters, matches=index.bitmap(matching_ids[:max_matches])), approximate
+
+    def _configure_ann(self, tier: str, min_candidates: int, filtered: bool) -> None:
+        """Set HNSW search parameters for the vector query in this transaction.
+
+        ef_search comes from the request tier but never drops below the number
+        of rows the query needs. Filtered queries would otherwise lose recall
+        because the index returns ef_search rows before the WHERE clause runs:
+        with pgvector >= 0.8 the scan is made iterative, older versions get a
+        larger candidate list instead.
+        """
+        ef_search = max(ann_ef_search_for_tier(tier), min_candidates)
+        if filtered:
+            if _check_iterative_scan(self.session):
+                self.session.execute(text("SET LOCAL hnsw.iterative_scan = relaxed_order"))
+            else:
+                ef_search *= FILTERED_EF_SEARCH_MULTIPLIER
+        ef_search = min(ef_search, HNSW_MAX_EF_SEARCH)
+        # SET does not accept bind parameters; ef_search is always an int here
+        self.session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+
+    def _hydrate(self, resources: Sequence[Resource]) -> ResultRelations:
+        """Bulk-load organizations, locations, sources and programs for a page.
+
+        Issues at most one ``IN (...)`` query per related table, regardless of
+        how many resources are on the page.
+        """
+        relations = ResultRelations()
+        if not resources:
+            return relations
+
+        org_ids = {r.organization_id for r in resources if r.organization_id}
+        location_ids = {r.location_id for r in resources if r.location_id}
+        source_ids = {r.source_id for r in resources if r.source_id}
+        program_ids = {r.program_id for r in resources if r.program_id}
+
+        if org_ids:
+            orgs = self.session.exec(select(Organization).where(col(Organization.id).in_(org_ids))).all()
+            relations.organizations = {o.id: o for o in orgs}
+        if location_ids:
+            locations = self.session.exec(select(Location).where(col(Location.id).in_(location_ids))).all()
+            relations.locations = {loc.id: loc for loc in locations}
+        if source_ids:
+            sources = self.session.exec(select(Source).where(col(Source.id).in_(source_ids))).all()
+            relations.sources = {src.id: src for src in sources}
+        if program_ids:
+            programs = self.session.exec(select(Program).where(col(Program.id).in_(program_ids))).all()
+            relations.programs = {p.id: p for p in programs}
+
+        return relations
+
     def _build_explanations(
         self,
         resource: Resource,
@@ -270,6 +452,7 @@ class SearchService:
         category: str | None,
         state: str | None,
         tags: list[str] | None = None,
+        relations: ResultRelations | None = None,
     ) -> list[MatchExplanation]:
         """Build 'Why this matched' explanations."""
         from app.core.taxonomy import get_tag_display_name
@@ -330,9 +513,7 @@ class SearchService:
 
         # State filter explanation
         if state and state in resource.states:
-            location = None
-            if resource.location_id:
-                location = self.session.get(Location, resource.location_id)
+            location = relations.location_for(resource) if relations else None
             if location:
                 explanations.append(
                     MatchExplanation(
@@ -371,9 +552,9 @@ class SearchService:
 
         return explanations
 
-    def _to_read_schema(self, resource: Resource) -> ResourceRead:
-        """Convert Resource model to read schema."""
-        organization = self.session.get(Organization, resource.organization_id)
+    def _to_read_schema(self, resource: Resource, relations: ResultRelations) -> ResourceRead:
+        """Convert Resource model to read schema using pre-hydrated relations."""
+        organization = relations.organizations.get(resource.organization_id)
         if not organization:
             # Orphaned resource - organization was deleted
             logger.warning(
@@ -394,18 +575,16 @@ class SearchService:
             )
 
         location_nested = None
-        if resource.location_id:
-            location = self.session.get(Location, resource.location_id)
-            if location:
-                location_nested = self._build_location_nested(location)
+        location = relations.location_for(resource)
+        if location:
+            location_nested = self._build_location_nested(location)
 
         source_tier = None
         source_name = None
-        if resource.source_id:
-            source = self.session.get(Source, resource.source_id)
-            if source:
-                source_tier = source.tier
-                source_name = source.name
+        source = relations.sources.get(resource.source_id) if resource.source_id else None
+        if source:
+            source_tier = source.tier
+            source_name = source.name
 
         trust = TrustSignals(
             freshness_score=resource.freshness_score,
@@ -415,6 +594,17 @@ class SearchService:
             source_name=source_name,
         )
 
+        program_nested = None
+        program = relations.programs.get(resource.program_id) if resource.program_id else None
+        if program:
+            program_nested = ProgramNested(
+                id=program.id,
+                name=program.name,
+                program_type=program.program_type.value,
+                description=program.description,
+                services_offered=program.services_offered or [],
+            )
+
         return ResourceRead(
             id=resource.id,
             title=resource.title,
@@ -422,6 +612,8 @@ class SearchService:
             summary=resource.summary,
             eligibility=resource.eligibility,
             how_to_apply=resource.how_to_apply,
+            program_id=resource.program_id,
+            program=program_nested,
             categories=resource.categories,
             subcategories=resource.subcategories,
             tags=resource.tags,
@@ -573,40 +765,35 @@ class SearchService:
         if query:
             prefix_query = self._build_prefix_tsquery(query)
             search_query = func.to_tsquery("english", prefix_query)
-            stmt = (
-                select(
-                    Resource,
-                    func.ts_rank(Resource.search_vector, search_query).label("rank"),
-                )
-                .where(Resource.status == ResourceStatus.ACTIVE)
-                .where(Resource.search_vector.op("@@")(search_query))
-            )
+            stmt = select(
+                Resource,
+                func.ts_rank(Resource.search_vector, search_query).label("rank"),
+            ).where(Resource.search_vector.op("@@")(search_query))
         else:
             # Browse mode - no text query
             stmt = select(
                 Resource,
                 func.literal(1.0).label("rank"),
-            ).where(Resource.status == ResourceStatus.ACTIVE)
+            )
 
-        # Apply category filter
+        # Category, tag (AND logic) and state (truly nationwide or matching) filters
+        states = eligibility_filters.states if eligibility_filters else None
+        filters = ResourceFilters(
+            categories=[category] if category else None,
+            states=states,
+            tags=tags,
+            active_only=True,
+            tag_match="tags",
+        )
+        stmt = stmt.where(*filters.clauses())
         if category:
-            stmt = stmt.where(Resource.categories.contains([category]))
             filters_applied.append("category")
-
-        # Apply tag filter (AND logic - must match ALL of the requested tags)
         if tags:
-            for tag in tags:
-                stmt = stmt.where(Resource.tags.contains([tag]))
             filters_applied.append("tags")
 
         # Apply eligibility filters if provided
         if eligibility_filters:
-            # State filter - truly nationwide (empty states) or matching states
             if eligibility_filters.states:
-                state_conditions = [and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == [])]
-                for state in eligibility_filters.states:
-                    state_conditions.append(Resource.states.contains([state]))
-                stmt = stmt.where(or_(*state_conditions))
                 filters_applied.append("state")
 
             # Join with locations for eligibility filtering
@@ -674,26 +861,22 @@ class SearchService:
                     )
                     filters_applied.append("housing_status")
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total = self.session.exec(count_stmt).one()
-
         # Order and paginate
         if query:
-            stmt = stmt.order_by(text("rank DESC"), col(Resource.reliability_score).desc())
+            order_by = [text("rank DESC"), col(Resource.reliability_score).desc()]
         else:
-            stmt = stmt.order_by(col(Resource.reliability_score).desc(), col(Resource.created_at).desc())
+            order_by = [col(Resource.reliability_score).desc(), col(Resource.created_at).desc()]
 
-        stmt = stmt.offset(offset).limit(limit)
-        results = self.session.exec(stmt).all()
+        results, total = fetch_page(self.session, stmt, order_by, limit, offset)
+        relations = self._hydrate([resource for resource, _ in results])
 
         # Build search results with match reasons
         search_results = []
         for resource, rank in results:
             state_filter = eligibility_filters.states[0] if eligibility_filters and eligibility_filters.states else None
-            explanations = self._build_explanations(resource, query or "", category, state_filter)
-            match_reasons = self._build_match_reasons(resource, eligibility_filters)
-            resource_read = self._to_read_schema(resource)
+            explanations = self._build_explanations(resource, query or "", category, state_filter, relations=relations)
+            match_reasons = self._build_match_reasons(resource, eligibility_filters, relations)
+            resource_read = self._to_read_schema(resource, relations)
             search_results.append(
                 ResourceSearchResult(
                     resource=resource_read,
@@ -719,6 +902,7 @@ class SearchService:
         self,
         resource: Resource,
         eligibility_filters: EligibilityFilters | None,
+        relations: ResultRelations,
     ) -> list[MatchReason]:
         """Build structured match reasons for eligibility filtering."""
         reasons = []
@@ -737,9 +921,7 @@ class SearchService:
                 reasons.append(MatchReason(type="category", label=cat_labels[cat]))
 
         # Location-based reasons
-        location = None
-        if resource.location_id:
-            location = self.session.get(Location, resource.location_id)
+        location = relations.location_for(resource)
 
         if location:
             # Service area
@@ -856,7 +1038,9 @@ class SearchService:
         state: str | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> tuple[list[ResourceSearchResult], int]:
+        ann_tier: str = "balanced",
+        count: str = "exact",
+    ) -> tuple[list[ResourceSearchResult], int | None]:
         """Search resources using vector similarity with pgvector.
 
         Args:
@@ -865,53 +1049,46 @@ class SearchService:
             state: Optional state filter.
             limit: Maximum results to return.
             offset: Offset for pagination.
+            ann_tier: Recall/latency tier for the HNSW index ('fast', 'balanced', 'accurate').
+            count: How to compute the total: 'exact', 'estimate' or 'none' (see services.filters).
 
         Returns:
-            Tuple of (results, total_count)
+            Tuple of (results, total_count); total_count is None when count='none'.
         """
-        # Use cosine distance for similarity (1 - cosine_distance = cosine_similarity)
-        # pgvector uses <=> for cosine distance
-        # Cast to Float to prevent pgvector from trying to parse as vector
-        distance_col = cast(Resource.embedding.op("<=>")(query_embedding), Float).label("distance")
-
-        # Base query with vector similarity
-        stmt = (
-            select(Resource, distance_col)
-            .where(Resource.status == ResourceStatus.ACTIVE)
-            .where(Resource.embedding.isnot(None))
-        )
-
-        # Apply filters
-        if category:
-            stmt = stmt.where(Resource.categories.contains([category]))
-        if state:
-            stmt = stmt.where(
-                or_(
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    Resource.states.contains([state]),
-                )
-            )
-
-        # Get total count
-        count_stmt = (
-            select(func.count(Resource.id))
-            .where(Resource.status == ResourceStatus.ACTIVE)
-            .where(Resource.embedding.isnot(None))
-        )
-        if category:
-            count_stmt = count_stmt.where(Resource.categories.contains([category]))
-        if state:
-            count_stmt = count_stmt.where(
-                or_(
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    Resource.states.contains([state]),
-                )
-            )
-        total = self.session.exec(count_stmt).one()
-
-        # Order by distance (ascending = most similar first)
-        stmt = stmt.order_by(text("distance ASC")).offset(offset).limit(limit)
-        results = self.session.exec(stmt).all()
+        params: dict = {
+            "embedding": _vector_literal(query_embedding),
+            "limit": limit,
+            "offset": offset,
+        }
+        filters = ResourceFilters(
+            categories=[category] if category else None,
+            states=[state] if state else None,
+            active_only=True,
+        ).sql(params)
+
+        # The count is a separate statement: a window over the page query would
+        # force every embedding to be scored instead of an index scan
+        total = None
+        if count != "none":
+            cap = ""
+            if count == "estimate":
+                cap = "LIMIT :count_cap"
+                params["count_cap"] = TOTAL_ESTIMATE_CAP + 1
+            total = self.session.execute(text(SEMANTIC_COUNT_SQL.format(filters=filters, cap=cap)), params).scalar()
+
+        # Order by cosine distance (ascending = most similar first) via the HNSW index
+        self._configure_ann(ann_tier, offset + limit, filtered=bool(category or state))
+        rows = self.session.execute(text(SEMANTIC_SQL.format(filters=filters)), params).fetchall()
+        if not rows:
+            return [], total
+
+        page_ids = [row.resource_id for row in rows]
+        page_resources = self.session.exec(select(Resource).where(col(Resource.id).in_(page_ids))).all()
+        resources_by_id = {r.id: r for r in page_resources}
+        results = [
+            (resources_by_id[row.resource_id], row.distance) for row in rows if row.resource_id in resources_by_id
+        ]
+        relations = self._hydrate([resource for resource, _ in results])
 
         # Build search results
         search_results = []
@@ -939,7 +1116,7 @@ class SearchService:
                     )
                 )
 
-            resource_read = self._to_read_schema(resource)
+            resource_read = self._to_read_schema(resource, relations)
             search_results.append(
                 ResourceSearchResult(
                     resource=resource_read,
@@ -960,10 +1137,15 @@ class SearchService:
         offset: int = 0,
         fts_weight: float = 0.5,
         semantic_weight: float = 0.5,
+        ann_tier: str = "balanced",
     ) -> tuple[list[ResourceSearchResult], int]:
         """Hybrid search combining full-text search and semantic similarity.
 
         Uses Reciprocal Rank Fusion (RRF) to combine FTS and vector rankings.
+        Each ranker contributes only its top candidates (ordered and limited in
+        SQL, so the vector side can use the HNSW index), the two lists are fused
+        by rank in a single CTE, and only the requested page is hydrated. The
+        total is the size of the fused candidate set, not the whole corpus.
 
         Args:
             query: The search query text.
@@ -974,77 +1156,45 @@ class SearchService:
             offset: Offset for pagination.
             fts_weight: Weight for FTS ranking (default 0.5).
             semantic_weight: Weight for semantic ranking (default 0.5).
+            ann_tier: Recall/latency tier for the HNSW index ('fast', 'balanced', 'accurate').
 
         Returns:
             Tuple of (results, total_count)
         """
-        # RRF constant (commonly 60)
-        k = 60
-
-        # Build FTS query
-        prefix_query = self._build_prefix_tsquery(query)
-        search_query = func.to_tsquery("english", prefix_query)
-
-        # Vector distance for semantic ranking
-        # Cast to Float to prevent pgvector from trying to parse as vector
-        distance_col = cast(Resource.embedding.op("<=>")(query_embedding), Float).label("distance")
-
-        # FTS rank
-        fts_rank = func.ts_rank(Resource.search_vector, search_query).label("fts_rank")
-
-        # Combined query with both rankings
-        stmt = (
-            select(Resource, fts_rank, distance_col)
-            .where(Resource.status == ResourceStatus.ACTIVE)
-            .where(
-                or_(
-                    Resource.search_vector.op("@@")(search_query),
-                    Resource.embedding.isnot(None),
-                )
-            )
-        )
-
-        # Apply filters
-        if category:
-            stmt = stmt.where(Resource.categories.contains([category]))
-        if state:
-            stmt = stmt.where(
-                or_(
-                    and_(Resource.scope == ResourceScope.NATIONAL, Resource.states == []),
-                    Resource.states.contains([state]),
-                )
-            )
-
-        # Execute to get all matching results for RRF
-        results = self.session.exec(stmt).all()
-
-        if not results:
+        params: dict = {
+            "tsquery": self._build_prefix_tsquery(query),
+            "embedding": _vector_literal(query_embedding),
+            "candidates": max(HYBRID_CANDIDATES_PER_RANKER, offset + limit),
+            "rrf_k": RRF_K,
+            "fts_weight": fts_weight,
+            "semantic_weight": semantic_weight,
+            "limit": limit,
+            "offset": offset,
+        }
+        filters = ResourceFilters(
+            categories=[category] if category else None,
+            states=[state] if state else None,
+            active_only=True,
+        ).sql(params)
+
+        self._configure_ann(ann_tier, params["candidates"], filtered=bool(category or state))
+        rows = self.session.execute(text(HYBRID_RRF_SQL.format(filters=filters)), params).fetchall()
+        if not rows:
             return [], 0
 
-        # Apply RRF scoring
-        scored_results = []
-        for resource, fts_r, distance in results:
-            # FTS score (already a rank, higher is better)
-            fts_score = float(fts_r) if fts_r else 0.0
-
-            # Semantic score (convert distance to similarity)
-            semantic_score = 1.0 - float(distance) if distance else 0.0
-
-            # RRF: combine rankings
-            # For FTS, use rank directly (higher = better)
-            # For semantic, use similarity (higher = better)
-            rrf_score = fts_weight * (1.0 / (k + (1.0 / (fts_score + 0.001)))) + semantic_weight * (
-                1.0 / (k + (1.0 / (semantic_score + 0.001)))
-            )
-
-            scored_results.append((resource, rrf_score, fts_score, semantic_score))
-
-        # Sort by RRF score
-        scored_results.sort(key=lambda x: x[1], reverse=True)
-        total = len(scored_results)
-
-        # Apply pagination
-        paginated = scored_results[offset : offset + limit]
+        total = rows[0].total
+        page_ids = [row.resource_id for row in rows]
+        page_resources = self.session.exec(select(Resource).where(col(Resource.id).in_(page_ids))).all()
+        resources_by_id = {r.id: r for r in page_resources}
+        paginated = []
+        for row in rows:
+            resource = resources_by_id.get(row.resource_id)
+            if resource is None:
+                continue
+            fts_score = float(row.fts_score) if row.fts_score is not None else 0.0
+            semantic_score = 1.0 - float(row.distance) if row.distance is not None else 0.0
+            paginated.append((resource, float(row.rrf_score), fts_score, semantic_score))
+        relations = self._hydrate([resource for resource, *_ in paginated])
 
         # Build search results
         search_results = []
@@ -1093,7 +1243,7 @@ class SearchService:
                     )
                 )
 
-            resource_read = self._to_read_schema(resource)
+            resource_read = self._to_read_schema(resource, relations)
             search_results.append(
                 ResourceSearchResult(
                     resource=resource_read,
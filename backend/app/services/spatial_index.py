@@ -0,0 +1,174 @@
+"""In-process spatial index of resource coordinates for nearby search.
+
+Without PostGIS, nearby search narrows locations with a lat/lng bounding
+box and applies the radius with a Haversine distance per row in SQL,
+which scans every location in the box. When NEARBY_SPATIAL_INDEX is
+enabled, each process keeps resource coordinates in a grid of
+CELL_DEGREES cells instead and finds the same resources within the
+radius in memory; the facet index's bitmaps apply the
+status/category/scope filters to them, so Postgres only receives the
+final ids and distances. Searches with tags (which also match
+eligibility text), or without a facet index, filter the matches in SQL.
+
+Disabled by default: it trades memory and staleness (other workers'
+writes appear after a rebuild) for skipping the box scan, which only pays
+off on large tables without PostGIS.
+
+The index is rebuilt from the database every
+NEARBY_SPATIAL_INDEX_TTL_SECONDS and updated incrementally by the ETL
+loader in between.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_MILES = 3959
+MILES_PER_DEGREE_LAT = 69.0
+
+# Grid cell size; a 25 mile search touches about 3x3 cells
+CELL_DEGREES = 0.5
+
+INDEX_SQL = """
+    SELECT r.id, l.latitude, l.longitude
+    FROM resources r
+    JOIN locations l ON r.location_id = l.id
+    WHERE l.latitude IS NOT NULL AND l.longitude IS NOT NULL
+"""
+
+
+def bounding_box(center_lat: float, center_lng: float, radius_miles: float) -> tuple[float, float, float, float]:
+    """Return (lat_min, lat_max, lng_min, lng_max) of the box around a search radius."""
+    lat_range = radius_miles / MILES_PER_DEGREE_LAT
+    lng_range = radius_miles / (MILES_PER_DEGREE_LAT * max(0.1, abs(math.cos(math.radians(center_lat)))))
+    return center_lat - lat_range, center_lat + lat_range, center_lng - lng_range, center_lng + lng_range
+
+
+def haversine_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance in miles, the same formula as HAVERSINE_DISTANCE_SQL."""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    cos_angle = math.cos(lat1) * math.cos(lat2) * math.cos(lng2 - lng1) + math.sin(lat1) * math.sin(lat2)
+    return EARTH_RADIUS_MILES * math.acos(min(1.0, max(-1.0, cos_angle)))
+
+
+def _cell(lat: float, lng: float) -> tuple[int, int]:
+    return math.floor(lat / CELL_DEGREES), math.floor(lng / CELL_DEGREES)
+
+
+class SpatialIndex:
+    """Thread-safe grid of resource coordinates."""
+
+    def __init__(self, rows: Iterable[tuple[UUID, float, float]] = ()) -> None:
+        self._cells: dict[tuple[int, int], dict[UUID, tuple[float, float]]] = {}
+        self._cell_of: dict[UUID, tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self.built_at = time.monotonic()
+        for resource_id, lat, lng in rows:
+            self._put(resource_id, lat, lng)
+
+    def __len__(self) -> int:
+        return len(self._cell_of)
+
+    def upsert(self, resource_id: UUID, lat: float | None, lng: float | None) -> None:
+        """Move a resource to new coordinates, or drop it when it has none."""
+        with self._lock:
+            self._remove(resource_id)
+            if lat is not None and lng is not None:
+                self._put(resource_id, lat, lng)
+
+    def within_box(self, center_lat: float, center_lng: float, radius_miles: float) -> list[tuple[UUID, float]]:
+        """Return (resource_id, distance_miles) for resources in the radius's bounding box.
+
+        The candidates within_radius() filters; includes the box corners beyond the radius.
+        """
+        lat_min, lat_max, lng_min, lng_max = bounding_box(center_lat, center_lng, radius_miles)
+        row_min, col_min = _cell(lat_min, lng_min)
+        row_max, col_max = _cell(lat_max, lng_max)
+
+        matches = []
+        with self._lock:
+            for row in range(row_min, row_max + 1):
+                for col in range(col_min, col_max + 1):
+                    for resource_id, (lat, lng) in self._cells.get((row, col), {}).items():
+                        if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
+                            matches.append((resource_id, haversine_miles(center_lat, center_lng, lat, lng)))
+        return matches
+
+    def within_radius(self, center_lat: float, center_lng: float, radius_miles: float) -> list[tuple[UUID, float]]:
+        """Return (resource_id, distance_miles) for resources within the radius.
+
+        Matches the SQL fallback: the same box, then Haversine distance up to the radius.
+        """
+        return [match for match in self.within_box(center_lat, center_lng, radius_miles) if match[1] <= radius_miles]
+
+    def _put(self, resource_id: UUID, lat: float, lng: float) -> None:
+        cell = _cell(lat, lng)
+        self._cells.setdefault(cell, {})[resource_id] = (lat, lng)
+        self._cell_of[resource_id] = cell
+
+    def _remove(self, resource_id: UUID) -> None:
+        cell = self._cell_of.pop(resource_id, None)
+        if cell is not None:
+            members = self._cells[cell]
+            del members[resource_id]
+            if not members:
+                del self._cells[cell]
+
+
+_index: SpatialIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_spatial_index(session: Session) -> SpatialIndex | None:
+    """Return the process-wide spatial index, (re)building it when missing or stale.
+
+    Returns None when NEARBY_SPATIAL_INDEX is disabled or the build fails,
+    so callers fall back to the SQL bounding box.
+    """
+    global _index
+    if not settings.nearby_spatial_index:
+        return None
+
+    index = _index
+    if index is not None and time.monotonic() - index.built_at < settings.nearby_spatial_index_ttl_seconds:
+        return index
+
+    with _index_lock:
+        if _index is index:
+            try:
+                started = time.perf_counter()
+                rows = session.execute(text(INDEX_SQL)).fetchall()
+                _index = SpatialIndex((row.id, row.latitude, row.longitude) for row in rows)
+                logger.info(
+                    "Built spatial index of %d resources in %.0f ms",
+                    len(_index),
+                    (time.perf_counter() - started) * 1000,
+                )
+            except Exception as e:
+                logger.warning("Failed to build spatial index: %s", e)
+                session.rollback()
+                return index
+    return _index
+
+
+def update_spatial_index(positions: Iterable[tuple[UUID, float | None, float | None]]) -> None:
+    """Apply resource coordinate changes to this process's index, if it has been built.
+
+    Args:
+        positions: (resource_id, latitude, longitude); None coordinates remove the resource.
+    """
+    index = _index
+    if index is None:
+        return
+    for resource_id, lat, lng in positions:
+        index.upsert(resource_id, lat, lng)
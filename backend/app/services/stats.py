@@ -0,0 +1,98 @@
+"""Resource statistics for the About page (/api/v1/stats/ai).
+
+Corpus-wide counts are computed by one INSERT ... SELECT that aggregates
+in SQL (categories via unnest ... GROUP BY) and upserts a one-row
+snapshot. The refresh and freshness jobs call refresh() after they change
+resources; requests only read the snapshot, so their cost doesn't grow
+with the number of resources.
+"""
+
+import json
+import logging
+from datetime import UTC, datetime
+
+from sqlmodel import Session, text
+
+from app.models import ResourceStatsSnapshot, ResourceStatus
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ID = 1
+
+# Aggregate and upsert the snapshot in one statement
+REFRESH_SQL = """
+    INSERT INTO resource_stats_snapshots (
+        id, total_resources, resources_verified, total_sources,
+        average_trust_score, resources_by_category, computed_at
+    )
+    SELECT :snapshot_id,
+           totals.total,
+           totals.verified,
+           (SELECT count(*) FROM sources),
+           COALESCE(totals.average_trust, 0),
+           COALESCE(
+               (SELECT jsonb_object_agg(c.category, c.n)::text
+                FROM (
+                    SELECT category, count(*) AS n
+                    FROM resources r, unnest(r.categories) AS category
+                    GROUP BY category
+                ) c),
+               '{}'
+           ),
+           :computed_at
+    FROM (
+        SELECT count(*) AS total,
+               count(r.last_verified) AS verified,
+               avg(r.reliability_score * r.freshness_score) FILTER (WHERE r.status = :active_status) AS average_trust
+        FROM resources r
+    ) totals
+    ON CONFLICT (id) DO UPDATE SET
+        total_resources = EXCLUDED.total_resources,
+        resources_verified = EXCLUDED.resources_verified,
+        total_sources = EXCLUDED.total_sources,
+        average_trust_score = EXCLUDED.average_trust_score,
+        resources_by_category = EXCLUDED.resources_by_category,
+        computed_at = EXCLUDED.computed_at
+"""
+
+
+class StatsService:
+    """Computes and serves the resource statistics snapshot."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def refresh(self) -> ResourceStatsSnapshot:
+        """Recompute the snapshot from resources and sources, and commit it."""
+        self.session.execute(
+            text(REFRESH_SQL),
+            {
+                "snapshot_id": SNAPSHOT_ID,
+                "computed_at": datetime.now(UTC),
+                "active_status": ResourceStatus.ACTIVE.name,
+            },
+        )
+        self.session.commit()
+        snapshot = self.session.get(ResourceStatsSnapshot, SNAPSHOT_ID, populate_existing=True)
+        logger.info("Refreshed resource stats snapshot: %d resources", snapshot.total_resources if snapshot else 0)
+        return snapshot  # type: ignore[return-value]
+
+    def get_snapshot(self) -> ResourceStatsSnapshot:
+        """Return the current snapshot, computing it if none exists yet."""
+        snapshot = self.session.get(ResourceStatsSnapshot, SNAPSHOT_ID)
+        if snapshot is None:
+            return self.refresh()
+        return snapshot
+
+    @staticmethod
+    def categories(snapshot: ResourceStatsSnapshot) -> dict[str, int]:
+        """Decode a snapshot's category counts."""
+        return json.loads(snapshot.resources_by_category or "{}")
+
+    @staticmethod
+    def age_seconds(snapshot: ResourceStatsSnapshot, now: datetime | None = None) -> float:
+        """Seconds since the snapshot was computed."""
+        computed_at = snapshot.computed_at
+        if computed_at.tzinfo is None:
+            computed_at = computed_at.replace(tzinfo=UTC)
+        return max(0.0, ((now or datetime.now(UTC)) - computed_at).total_seconds())
@@ -1,6 +1,7 @@
 """Base connector interface for data sources."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Protocol, Self
@@ -89,6 +90,15 @@ class Connector(Protocol):
         ...
 
 
+def iter_candidates(connector: Connector) -> Iterator[ResourceCandidate]:
+    """Stream a connector's candidates.
+
+    Uses the connector's iter_candidates() if it has one, otherwise run().
+    """
+    stream = getattr(connector, "iter_candidates", None)
+    return stream() if stream is not None else iter(connector.run())
+
+
 class BaseConnector(ABC):
     """Base class for connectors with common functionality."""
 
@@ -97,6 +107,15 @@ class BaseConnector(ABC):
         """Fetch and return normalized resources."""
         pass
 
+    def iter_candidates(self) -> Iterator[ResourceCandidate]:
+        """Yield resources one at a time.
+
+        Defaults to run(). Connectors over large files override this to
+        yield as they parse, so the streaming pipeline never holds the
+        whole source in memory.
+        """
+        yield from self.run()
+
     @property
     @abstractmethod
     def metadata(self) -> SourceMetadata:
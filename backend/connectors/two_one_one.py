@@ -13,6 +13,7 @@ from backend/data/211/{STATE}.json files.
 import json
 import logging
 import os
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -408,6 +409,23 @@ class TwoOneOneConnector(BaseConnector):
 
         return self._resources
 
+    def iter_candidates(self) -> Iterator[ResourceCandidate]:
+        """Yield Veteran resources, one state file at a time in file mode.
+
+        API results are bounded by max_results_per_keyword and are fetched
+        as in run(). In file mode only one state file is held in memory, and
+        nothing is kept on the connector afterwards.
+        """
+        if self.api_key:
+            yield from self.run()
+            return
+
+        logger.info("211 connector: No API key configured, streaming state files")
+        for state in self.states:
+            state_file = self.data_dir / f"{state}.json"
+            if state_file.exists():
+                yield from self._iter_state_file(state_file, state)
+
     def _fetch_from_api(self) -> None:
         """Fetch Veteran resources from 211 NDP Search API."""
         client = self._get_client()
@@ -776,6 +794,10 @@ class TwoOneOneConnector(BaseConnector):
 
     def _load_state_file(self, file_path: Path, state: str) -> None:
         """Load resources from a single state JSON file."""
+        self._resources.extend(self._iter_state_file(file_path, state))
+
+    def _iter_state_file(self, file_path: Path, state: str) -> Iterator[ResourceCandidate]:
+        """Yield resources from a single state JSON file."""
         try:
             with open(file_path) as f:
                 data = json.load(f)
@@ -788,7 +810,7 @@ class TwoOneOneConnector(BaseConnector):
         for resource in data.get("resources", []):
             candidate = self._convert_file_resource(resource, state, fetched_at)
             if candidate:
-                self._resources.append(candidate)
+                yield candidate
 
     def _convert_file_resource(
         self,
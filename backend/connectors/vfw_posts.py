@@ -16,10 +16,12 @@ Source: https://www.vfw.org/find-a-post
 Note: No public API available - data sourced via web scraping or partnership.
 """
 
-import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
+import ijson
+
 from connectors.base import BaseConnector, ResourceCandidate, SourceMetadata
 
 # State code to full name mapping
@@ -164,28 +166,24 @@ class VFWPostsConnector(BaseConnector):
         Returns:
             List of normalized ResourceCandidate objects.
         """
-        now = datetime.now(UTC)
-
-        data = self._load_data()
-        if not data:
-            return []
+        return list(self.iter_candidates())
 
-        resources: list[ResourceCandidate] = []
+    def iter_candidates(self) -> Iterator[ResourceCandidate]:
+        """Yield VFW posts as they are parsed, without building a list."""
+        now = datetime.now(UTC)
 
-        for post in data.get("posts", []):
+        for post in self._iter_posts():
             candidate = self._parse_post(post, fetched_at=now)
             if candidate:
-                resources.append(candidate)
-
-        return resources
+                yield candidate
 
-    def _load_data(self) -> dict:
-        """Load VFW post data from JSON file."""
+    def _iter_posts(self) -> Iterator[dict]:
+        """Stream VFW post entries from the JSON file without loading it whole."""
         if not self.data_path.exists():
-            return {}
+            return
 
-        with open(self.data_path) as f:
-            return json.load(f)
+        with open(self.data_path, "rb") as f:
+            yield from ijson.items(f, "posts.item", use_float=True)
 
     def _parse_post(
         self,
@@ -2,37 +2,106 @@
 
 Detects and merges duplicate resources across different sources,
 preferring higher-tier sources when conflicts occur.
+
+Candidate pairs come from blocking keys instead of comparing every
+resource in an org with every other: titles are reduced to normalized
+token sets and each resource is indexed under combinations of the rarest
+tokens of its title (prefix filtering). Two titles whose token sets reach
+the similarity threshold always share one of those keys, so no pair that
+could match is skipped, while large orgs with thousands of distinct
+titles (every "VFW Post", every Feeding America food bank) only compare
+resources with nearly the same words, location and numbers.
 """
 
-from difflib import SequenceMatcher
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from itertools import combinations
 
 from etl.models import NormalizedResource
 
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+ORG_SUFFIXES = {"inc", "llc", "corp", "corporation"}
+
+
+def normalize_tokens(text: str) -> frozenset[str]:
+    """Lowercase word tokens with apostrophes dropped and simple plurals folded."""
+    tokens = set()
+    for token in TOKEN_PATTERN.findall(text.lower().replace("'", "")):
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+def normalize_org_tokens(org_name: str) -> frozenset[str]:
+    """Org name tokens without trailing legal suffixes (Inc., LLC, ...)."""
+    words = TOKEN_PATTERN.findall(org_name.lower())
+    while len(words) > 1 and words[-1] in ORG_SUFFIXES:
+        words.pop()
+    return normalize_tokens(" ".join(words))
+
+
+def token_set_similarity(tokens1: frozenset[str], tokens2: frozenset[str]) -> float:
+    """Dice coefficient of two token sets (0-1)."""
+    if not tokens1 or not tokens2:
+        return 1.0 if tokens1 == tokens2 else 0.0
+    return 2 * len(tokens1 & tokens2) / (len(tokens1) + len(tokens2))
+
+
+@dataclass(frozen=True, slots=True)
+class _Fingerprint:
+    """The normalized fields duplicate detection compares."""
+
+    title: frozenset[str]
+    org: frozenset[str]
+    numbers: frozenset[str]
+    location: str
+
+    @classmethod
+    def of(cls, resource: NormalizedResource) -> "_Fingerprint":
+        title = normalize_tokens(resource.title)
+        org = normalize_org_tokens(resource.org_name)
+        return cls(
+            title=title,
+            org=org,
+            numbers=frozenset(t for t in title | org if t.isdigit()),
+            location=resource.location_key() or "no-location",
+        )
+
 
 class Deduplicator:
     """Detects and merges duplicate resources."""
 
-    # Threshold for fuzzy title matching (0-1)
+    # Threshold for title token-set similarity (0-1)
     TITLE_SIMILARITY_THRESHOLD = 0.85
+    # Threshold for org name token-set similarity (0-1)
+    ORG_SIMILARITY_THRESHOLD = 0.8
 
     def __init__(
         self,
         title_threshold: float = TITLE_SIMILARITY_THRESHOLD,
+        org_threshold: float = ORG_SIMILARITY_THRESHOLD,
     ):
         """Initialize deduplicator.
 
         Args:
-            title_threshold: Minimum similarity ratio for title matching (0-1).
+            title_threshold: Minimum title token-set similarity (0-1).
+            org_threshold: Minimum org name token-set similarity (0-1).
         """
         self.title_threshold = title_threshold
+        self.org_threshold = org_threshold
+        self._key_plans: dict[int, list[tuple[int, int, int]]] = {}
 
     def deduplicate(self, resources: list[NormalizedResource]) -> tuple[list[NormalizedResource], int]:
         """Remove duplicates from a list of normalized resources.
 
         Uses the following matching criteria:
-        1. Same organization (case-insensitive)
+        1. Similar organization (token-set match, legal suffixes ignored)
         2. Same address (if present) OR both have no address
-        3. Similar title (fuzzy match above threshold)
+        3. Similar title (token-set match above threshold)
+        4. Same numbers in title and org ("Post 12" is not "Post 13")
 
         When duplicates are found, prefers:
         1. Higher-tier source (lower tier number)
@@ -43,118 +112,107 @@ class Deduplicator:
             resources: List of normalized resources to deduplicate.
 
         Returns:
-            Tuple of (deduplicated list, number removed as duplicates).
+            Tuple of (deduplicated list in input order, number removed as duplicates).
         """
         if not resources:
             return [], 0
 
-        # Group by organization + location key
-        groups: dict[str, list[NormalizedResource]] = {}
-
-        for resource in resources:
-            # Create grouping key from org and location
-            group_key = self._create_group_key(resource)
-
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(resource)
-
-        # Process each group for title-based duplicates
-        deduplicated: list[NormalizedResource] = []
-        duplicates_removed = 0
-
-        for group in groups.values():
-            if len(group) == 1:
-                deduplicated.append(group[0])
-            else:
-                # Find duplicates within group based on title similarity
-                unique, removed = self._dedupe_group(group)
-                deduplicated.extend(unique)
-                duplicates_removed += removed
-
-        return deduplicated, duplicates_removed
-
-    def _create_group_key(self, resource: NormalizedResource) -> str:
-        """Create a grouping key for initial clustering.
-
-        Groups resources by organization and location to narrow
-        down candidates for title comparison.
-        """
-        org_key = resource.org_name.lower().strip()
-
-        # Normalize org name by removing common suffixes
-        for suffix in [" inc", " inc.", " llc", " corp", " corporation"]:
-            if org_key.endswith(suffix):
-                org_key = org_key[: -len(suffix)]
-
-        location_key = resource.location_key() or "no-location"
-
-        return f"{org_key}|{location_key}"
-
-    def _dedupe_group(self, group: list[NormalizedResource]) -> tuple[list[NormalizedResource], int]:
-        """Deduplicate resources within a group using title similarity.
-
-        Args:
-            group: Resources with same org and location.
+        fingerprints = [_Fingerprint.of(r) for r in resources]
+        token_counts = Counter(token for fp in fingerprints for token in fp.title)
 
-        Returns:
-            Tuple of (unique resources, count of duplicates removed).
-        """
-        if len(group) <= 1:
-            return group, 0
-
-        # Sort by tier (lower is better) then by completeness
-        sorted_group = sorted(
-            group,
-            key=lambda r: (r.source_tier, -self._completeness_score(r)),
+        # Best resources first, so each duplicate merges into the one that is kept
+        order = sorted(
+            range(len(resources)),
+            key=lambda i: (resources[i].source_tier, -self._completeness_score(resources[i])),
         )
 
-        # Track which resources to keep
-        keep: list[NormalizedResource] = []
+        # (location, numbers, *tokens) -> positions in `kept` of resources indexed under it
+        blocks: dict[tuple, list[int]] = {}
+        kept: list[int] = []
         duplicates_removed = 0
 
-        for resource in sorted_group:
-            is_duplicate = False
-
-            for kept in keep:
-                if self._are_duplicates(resource, kept):
-                    # Merge any additional data from lower-priority resource
-                    self._merge_data(kept, resource)
-                    is_duplicate = True
-                    duplicates_removed += 1
-                    break
-
-            if not is_duplicate:
-                keep.append(resource)
-
-        return keep, duplicates_removed
+        for i in order:
+            fp = fingerprints[i]
+            ranked = sorted(fp.title, key=lambda token: (token_counts[token], token))
+            prefix = (fp.location, fp.numbers)
+
+            probes = {prefix + key for key in self._probe_keys(ranked)}
+            candidates = sorted({k for key in probes for k in blocks.get(key, ())})
+            match = next((k for k in candidates if self._match(fp, fingerprints[kept[k]])), None)
+            if match is not None:
+                # Merge any additional data from lower-priority resource
+                self._merge_data(resources[kept[match]], resources[i])
+                duplicates_removed += 1
+                continue
+
+            for key in self._index_keys(ranked):
+                blocks.setdefault(prefix + key, []).append(len(kept))
+            kept.append(i)
+
+        return [resources[i] for i in sorted(kept)], duplicates_removed
+
+    # Blocking keys are combinations of a title's rarest tokens.
+    #
+    # Titles of n and m tokens with Dice similarity >= t share at least
+    # o = ceil(t * (n + m) / 2) tokens, so at most n - o tokens of the first
+    # are missing from the second. Ordered rarest first, the n - o + s
+    # rarest tokens of the first and the m - o + s rarest of the second both
+    # hold the s rarest tokens they share, and any combination of s of them
+    # is a key both produce. Keys are tagged with (indexed length, probing
+    # length) so each only meets titles of a length it can match, and s is
+    # as large as the key count allows, which keeps blocks small.
+
+    MAX_KEYS = 64
+
+    def _key_plan(self, n: int) -> list[tuple[int, int, int]]:
+        """Return (other length, prefix length, key size) for each title length n can match."""
+        plan = self._key_plans.get(n)
+        if plan is None:
+            plan = []
+            t = self.title_threshold
+            for m in range(1, math.floor(n * (2 - t) / t + 1e-9) + 1):
+                overlap = max(1, math.ceil(t * (n + m) / 2 - 1e-9))
+                if overlap > min(n, m):
+                    continue
+                size = overlap
+                while size > 1 and math.comb(max(n, m) - overlap + size, size) > self.MAX_KEYS:
+                    size -= 1
+                plan.append((m, n - overlap + size, size))
+            self._key_plans[n] = plan
+        return plan
+
+    def _index_keys(self, ranked: list[str]) -> list[tuple]:
+        """Return the keys a kept title is indexed under."""
+        if not ranked:
+            return [(0, 0)]
+        n = len(ranked)
+        return [(n, m, *key) for m, prefix, size in self._key_plan(n) for key in combinations(ranked[:prefix], size)]
+
+    def _probe_keys(self, ranked: list[str]) -> list[tuple]:
+        """Return the keys to look up for a title."""
+        if not ranked:
+            return [(0, 0)]
+        n = len(ranked)
+        return [(m, n, *key) for m, prefix, size in self._key_plan(n) for key in combinations(ranked[:prefix], size)]
+
+    def _match(self, fp1: _Fingerprint, fp2: _Fingerprint) -> bool:
+        return (
+            fp1.location == fp2.location
+            and fp1.numbers == fp2.numbers
+            and (fp1.org == fp2.org or token_set_similarity(fp1.org, fp2.org) >= self.org_threshold)
+            and token_set_similarity(fp1.title, fp2.title) >= self.title_threshold
+        )
 
     def _are_duplicates(self, resource1: NormalizedResource, resource2: NormalizedResource) -> bool:
         """Check if two resources are duplicates.
 
         Two resources are considered duplicates if they have:
-        1. Same organization (already guaranteed by grouping)
-        2. Same location (already guaranteed by grouping)
-        3. Similar titles (fuzzy match)
+        1. Similar organizations
+        2. Same location
+        3. Similar titles
+        4. The same numbers in title and org
         """
-        title_similarity = self._title_similarity(resource1.title, resource2.title)
-        return title_similarity >= self.title_threshold
-
-    def _title_similarity(self, title1: str, title2: str) -> float:
-        """Calculate similarity between two titles.
-
-        Uses SequenceMatcher for fuzzy string matching.
-        """
-        # Normalize titles
-        t1 = title1.lower().strip()
-        t2 = title2.lower().strip()
-
-        # Exact match
-        if t1 == t2:
-            return 1.0
-
-        # Fuzzy match
-        return SequenceMatcher(None, t1, t2).ratio()
+        return self._match(_Fingerprint.of(resource1), _Fingerprint.of(resource2))
 
     def _completeness_score(self, resource: NormalizedResource) -> int:
         """Calculate how complete a resource's data is.
@@ -243,15 +301,4 @@ def find_potential_duplicates(
         List of potential duplicate resources.
     """
     deduplicator = Deduplicator(title_threshold=title_threshold)
-    duplicates = []
-
-    new_group_key = deduplicator._create_group_key(new_resource)
-
-    for existing in existing_resources:
-        existing_group_key = deduplicator._create_group_key(existing)
-
-        # Same group (org + location) and similar title?
-        if new_group_key == existing_group_key and deduplicator._are_duplicates(new_resource, existing):
-            duplicates.append(existing)
-
-    return duplicates
+    return [existing for existing in existing_resources if deduplicator._are_duplicates(new_resource, existing)]
@@ -0,0 +1,299 @@
+"""Database-backed duplicate detection shared by the import paths.
+
+The in-run Deduplicator (etl/dedupe.py) only sees one batch. To catch
+duplicates of resources already in the database, every import path
+records a ResourceFingerprint (normalized title, org, phone, address and
+state) for the resources it writes, and looks up a whole chunk of
+incoming records with one indexed query on (org_key, title_key) and
+(org_key, phone). Each import run first fingerprints the resources
+written elsewhere (admin and partner APIs) since the last run.
+
+Used by the ETL Loader, the 211 importer and the discovery job.
+"""
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import or_, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, col, select
+
+from app.models import Location, Organization, Resource, ResourceFingerprint
+from etl.dedupe import TOKEN_PATTERN, Deduplicator, normalize_org_tokens, normalize_tokens, token_set_similarity
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    """Return a US phone number as 10 digits, or None if it isn't one."""
+    if not phone:
+        return None
+    digits = "".join(c for c in phone if c.isdigit())
+    # Handle 1- prefix
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits if len(digits) == 10 else None
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Normalized keys a resource is matched on."""
+
+    org_key: str
+    title_key: str
+    phone: str | None = None
+    address_key: str | None = None
+    state: str | None = None
+
+    @classmethod
+    def of(
+        cls,
+        title: str,
+        org_name: str,
+        phone: str | None = None,
+        address: str | None = None,
+        city: str | None = None,
+        state: str | None = None,
+        zip_code: str | None = None,
+    ) -> "Fingerprint":
+        """Build a fingerprint from raw resource fields.
+
+        Title and org are sorted token sets (same normalization as the
+        Deduplicator); the address key is only set for a full address.
+        """
+        address_key = None
+        if address and city and state:
+            address_key = " ".join(TOKEN_PATTERN.findall(f"{address} {city} {state} {zip_code or ''}".lower()))
+        return cls(
+            org_key=" ".join(sorted(normalize_org_tokens(org_name or ""))),
+            title_key=" ".join(sorted(normalize_tokens(title or ""))),
+            phone=normalize_phone(phone),
+            address_key=address_key,
+            state=(state or "").strip().upper()[:2] or None,
+        )
+
+    @classmethod
+    def of_resource(
+        cls, resource: Resource, organization: Organization, location: Location | None = None
+    ) -> "Fingerprint":
+        """Build a fingerprint from a stored resource."""
+        state = location.state if location else (resource.states[0] if len(resource.states) == 1 else None)
+        return cls.of(
+            title=resource.title,
+            org_name=organization.name,
+            phone=resource.phone,
+            address=location.address if location else None,
+            city=location.city if location else None,
+            state=state,
+            zip_code=location.zip_code if location else None,
+        )
+
+    def matches(self, other: "Fingerprint") -> bool:
+        """Check if two fingerprints describe the same resource.
+
+        Same org, same address (or both without one), compatible state
+        (equal or one missing), no conflicting phones, and the same title.
+        With the same phone, a near-identical title (token-set similarity
+        above the Deduplicator threshold, same numbers) also matches. A
+        shared phone alone does not: orgs list one main number for all
+        their programs.
+        """
+        if not self.org_key or self.org_key != other.org_key or self.address_key != other.address_key:
+            return False
+        if self.state and other.state and self.state != other.state:
+            return False
+        if self.phone and other.phone and self.phone != other.phone:
+            return False
+        if not self.title_key or not other.title_key:
+            return False
+        if self.title_key == other.title_key:
+            return True
+        if not self.phone or self.phone != other.phone:
+            return False
+        title, other_title = frozenset(self.title_key.split()), frozenset(other.title_key.split())
+        return {t for t in title if t.isdigit()} == {t for t in other_title if t.isdigit()} and (
+            token_set_similarity(title, other_title) >= Deduplicator.TITLE_SIMILARITY_THRESHOLD
+        )
+
+
+def _lookup_keys(fingerprint: Fingerprint) -> list[tuple[str, str, str]]:
+    """Return the keys a match shares with this fingerprint: org + title or org + phone (near-identical titles)."""
+    keys = []
+    if fingerprint.org_key and fingerprint.title_key:
+        keys.append(("title", fingerprint.org_key, fingerprint.title_key))
+    if fingerprint.org_key and fingerprint.phone:
+        keys.append(("phone", fingerprint.org_key, fingerprint.phone))
+    return keys
+
+
+class DedupeIndex:
+    """Finds existing resources for a batch of fingerprints and records new ones.
+
+    Fingerprints added with add() are visible to find() right away, so
+    records later in the same run match resources created earlier in it.
+    They are written to the database by flush().
+    """
+
+    # Rows per INSERT ... ON CONFLICT statement (7 parameters each)
+    WRITE_BATCH_SIZE = 1000
+
+    def __init__(self, session: Session):
+        """Initialize the index.
+
+        Args:
+            session: Database session.
+        """
+        self.session = session
+        # Added but not yet written, by resource id and by the keys find() queries on
+        self._pending: dict[UUID, tuple[Fingerprint, Resource]] = {}
+        self._pending_keys: dict[tuple[str, str, str], dict[UUID, Resource]] = {}
+
+    def find(self, fingerprints: Sequence[Fingerprint]) -> list[Resource | None]:
+        """Return the existing resource each fingerprint matches, or None.
+
+        Resources added in this run are checked first, then the database
+        with one query for the whole batch.
+        """
+        title_pairs = {(fp.org_key, fp.title_key) for fp in fingerprints if fp.org_key and fp.title_key}
+        phone_pairs = {(fp.org_key, fp.phone) for fp in fingerprints if fp.org_key and fp.phone}
+        stored: dict[str, list[tuple[Fingerprint, Resource]]] = {}
+        if title_pairs or phone_pairs:
+            conditions = []
+            if title_pairs:
+                conditions.append(tuple_(ResourceFingerprint.org_key, ResourceFingerprint.title_key).in_(title_pairs))
+            if phone_pairs:
+                conditions.append(tuple_(ResourceFingerprint.org_key, ResourceFingerprint.phone).in_(phone_pairs))
+            stmt = (
+                select(ResourceFingerprint, Resource)
+                .join(Resource, col(Resource.id) == ResourceFingerprint.resource_id)
+                .where(or_(*conditions))
+                .order_by(col(ResourceFingerprint.resource_id))
+                .options(selectinload(Resource.source))  # type: ignore[attr-defined]
+            )
+            for row, resource in self.session.exec(stmt):
+                fingerprint = Fingerprint(
+                    org_key=row.org_key,
+                    title_key=row.title_key,
+                    phone=row.phone,
+                    address_key=row.address_key,
+                    state=row.state,
+                )
+                stored.setdefault(row.org_key, []).append((fingerprint, resource))
+
+        return [
+            self.find_added(fp)
+            or next((resource for existing, resource in stored.get(fp.org_key, ()) if fp.matches(existing)), None)
+            for fp in fingerprints
+        ]
+
+    def find_added(self, fingerprint: Fingerprint) -> Resource | None:
+        """Return a resource added in this run that the fingerprint matches, without a query."""
+        for key in _lookup_keys(fingerprint):
+            for resource_id in self._pending_keys.get(key, {}):
+                existing, resource = self._pending[resource_id]
+                if fingerprint.matches(existing):
+                    return resource
+        return None
+
+    def add(self, resource: Resource, fingerprint: Fingerprint) -> None:
+        """Record a created or updated resource's fingerprint (written by flush())."""
+        previous = self._pending.get(resource.id)
+        if previous is not None:
+            for key in _lookup_keys(previous[0]):
+                del self._pending_keys[key][resource.id]
+        self._pending[resource.id] = (fingerprint, resource)
+        for key in _lookup_keys(fingerprint):
+            self._pending_keys.setdefault(key, {})[resource.id] = resource
+
+    def flush(self) -> None:
+        """Flush the session and upsert pending fingerprints (the caller commits)."""
+        rows = {
+            resource.id: {
+                "resource_id": resource.id,
+                "org_key": fp.org_key,
+                "title_key": fp.title_key,
+                "phone": fp.phone,
+                "address_key": fp.address_key,
+                "state": fp.state,
+                "updated_at": datetime.now(UTC),
+            }
+            for fp, resource in self._pending.values()
+        }
+        self.clear()
+        if not rows:
+            return
+        # Resources must exist before their fingerprints (foreign key)
+        self.session.flush()
+        values = list(rows.values())
+        for start in range(0, len(values), self.WRITE_BATCH_SIZE):
+            stmt = insert(ResourceFingerprint).values(values[start : start + self.WRITE_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["resource_id"],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in ("org_key", "title_key", "phone", "address_key", "state", "updated_at")
+                },
+            )
+            self.session.execute(stmt)
+
+    def clear(self) -> None:
+        """Forget pending fingerprints, e.g. after a rollback."""
+        self._pending.clear()
+        self._pending_keys.clear()
+
+    def backfill(self, batch_size: int = 1000) -> int:
+        """Fingerprint every resource without a fingerprint or changed since it was written.
+
+        Resources created or edited outside the import paths (admin and
+        partner APIs) get theirs here. Commits after each batch. Returns
+        the number of resources fingerprinted.
+        """
+        total = 0
+        after: UUID | None = None
+        while True:
+            stmt = (
+                select(Resource)
+                .outerjoin(ResourceFingerprint, col(ResourceFingerprint.resource_id) == Resource.id)
+                .where(
+                    or_(
+                        col(ResourceFingerprint.resource_id).is_(None),
+                        col(Resource.updated_at) > ResourceFingerprint.updated_at,
+                    )
+                )
+                .options(
+                    selectinload(Resource.organization),  # type: ignore[attr-defined]
+                    selectinload(Resource.location),  # type: ignore[attr-defined]
+                )
+                .order_by(col(Resource.id))
+                .limit(batch_size)
+            )
+            if after is not None:
+                stmt = stmt.where(col(Resource.id) > after)
+            resources = self.session.exec(stmt).all()
+            if not resources:
+                return total
+            for resource in resources:
+                self.add(resource, Fingerprint.of_resource(resource, resource.organization, resource.location))
+            self.flush()
+            self.session.commit()
+            total += len(resources)
+            after = resources[-1].id
+            logger.info("Fingerprinted %d resources", total)
+
+    def refresh(self) -> int:
+        """Backfill fingerprints at the start of an import run.
+
+        Failures are logged rather than raised: the run still dedupes
+        against the fingerprints that exist.
+        """
+        try:
+            return self.backfill()
+        except Exception as e:
+            logger.warning("Failed to refresh resource fingerprints: %s", e)
+            self.session.rollback()
+            self.clear()
+            return 0
@@ -4,7 +4,8 @@ Adds geocoding, trust scores, tags, and scope information
 to normalized resources.
 """
 
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Protocol, runtime_checkable
 
 from app.core.taxonomy import CATEGORIES, get_reliability_score
 from etl.models import NormalizedResource
@@ -28,6 +29,19 @@ class GeocoderProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchGeocoderProtocol(GeocoderProtocol, Protocol):
+    """Protocol for geocoding services that resolve many addresses at once."""
+
+    def geocode_batch(self, addresses: Sequence[tuple[str, str, str, str]]) -> list[tuple[float | None, float | None]]:
+        """Geocode (address, city, state, zip_code) tuples.
+
+        Returns:
+            (latitude, longitude) per address, (None, None) if not found.
+        """
+        ...
+
+
 class StubGeocoder:
     """Stub geocoder that returns None for all addresses.
 
@@ -129,7 +143,7 @@ class Enricher:
         """
         self.geocoder = geocoder or StubGeocoder()
 
-    def enrich(self, resource: NormalizedResource) -> NormalizedResource:
+    def enrich(self, resource: NormalizedResource, geocode: bool = True) -> NormalizedResource:
         """Enrich a single resource.
 
         Adds:
@@ -141,12 +155,14 @@ class Enricher:
 
         Args:
             resource: Normalized resource to enrich.
+            geocode: If False, skip geocoding (already done by enrich_batch).
 
         Returns:
             Enriched resource (modifies in place and returns).
         """
         # Geocode if address present
-        self._geocode(resource)
+        if geocode:
+            self._geocode(resource)
 
         # Set reliability score from tier
         self._set_reliability(resource)
@@ -165,13 +181,25 @@ class Enricher:
     def enrich_batch(self, resources: list[NormalizedResource]) -> list[NormalizedResource]:
         """Enrich a batch of resources.
 
+        Geocoders that support it get all addresses in one geocode_batch call.
+
         Args:
             resources: List of normalized resources.
 
         Returns:
             List of enriched resources.
         """
-        return [self.enrich(r) for r in resources]
+        if not isinstance(self.geocoder, BatchGeocoderProtocol):
+            return [self.enrich(r) for r in resources]
+
+        located = [r for r in resources if r.has_location()]
+        coordinates = self.geocoder.geocode_batch(
+            [(r.address or "", r.city or "", r.state or "", r.zip_code or "") for r in located]
+        )
+        for resource, (lat, lng) in zip(located, coordinates, strict=True):
+            resource.latitude = lat
+            resource.longitude = lng
+        return [self.enrich(r, geocode=False) for r in resources]
 
     def _geocode(self, resource: NormalizedResource) -> None:
         """Add geocoding to resource if address is present."""
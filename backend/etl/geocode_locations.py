@@ -32,7 +32,6 @@ from sqlmodel import Session
 
 from app.database import engine
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
 # Census Geocoder API endpoint
@@ -206,29 +205,35 @@ def parse_census_response(response_text: str) -> dict[str, GeocodedResult]:
     return results
 
 
+def request_census_batch(locations: list[LocationRecord], url: str = CENSUS_BATCH_URL) -> dict[str, GeocodedResult]:
+    """Send one batch to the Census Geocoder API, raising httpx.HTTPError on failure.
+
+    Max batch size is 10,000 addresses.
+    """
+    csv_data = prepare_census_batch(locations)
+    response = httpx.post(
+        url,
+        data={
+            "benchmark": CENSUS_BENCHMARK,
+            "vintage": CENSUS_VINTAGE,
+        },
+        files={"addressFile": ("addresses.csv", csv_data, "text/csv")},
+        timeout=120.0,
+    )
+    response.raise_for_status()
+    return parse_census_response(response.text)
+
+
 def geocode_batch_census(locations: list[LocationRecord]) -> dict[str, GeocodedResult]:
     """Geocode a batch of locations using Census Geocoder API.
 
-    Max batch size is 10,000 addresses.
+    Max batch size is 10,000 addresses. Returns no results on API errors.
     """
     if not locations:
         return {}
 
-    csv_data = prepare_census_batch(locations)
-
     try:
-        response = httpx.post(
-            CENSUS_BATCH_URL,
-            data={
-                "benchmark": CENSUS_BENCHMARK,
-                "vintage": CENSUS_VINTAGE,
-            },
-            files={"addressFile": ("addresses.csv", csv_data, "text/csv")},
-            timeout=120.0,
-        )
-        response.raise_for_status()
-        return parse_census_response(response.text)
-
+        return request_census_batch(locations)
     except httpx.HTTPError as e:
         logger.error(f"Census API error: {e}")
         return {}
@@ -582,6 +587,7 @@ def verify_spatial_index() -> None:
 
 def main() -> None:
     """Main entry point."""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     parser = argparse.ArgumentParser(description="Geocode locations using Census API")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done")
     parser.add_argument("--limit", type=int, help="Process only first N locations")
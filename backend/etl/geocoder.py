@@ -0,0 +1,195 @@
+"""Census batch geocoder for the ETL pipeline.
+
+Implements GeocoderProtocol (and its batch form) for the Enricher:
+
+1. Addresses are looked up in the geocoded_addresses cache by a hash of
+   the normalized address, so unchanged addresses are never re-sent.
+2. Cache misses with a street address go to the Census batch endpoint
+   (etl/geocode_locations.py), up to batch_size addresses per request,
+   and the results are cached. "No match" results expire after
+   ETL_GEOCODE_MISS_TTL_DAYS, so addresses the Census geocoder learns
+   later are retried.
+3. Anything still without coordinates falls back to the zip code centroid
+   (from the in-process geo context), then the city and state centroids.
+
+The cache is read and written through a session of its own, so its
+commits and rollbacks never touch the pipeline's open transaction.
+"""
+
+import hashlib
+import logging
+import time
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import httpx
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import Session, col, or_, select
+
+from app.config import settings
+from app.models import GeocodedAddress
+from app.services.geo import get_geo_context
+from etl.dedupe import TOKEN_PATTERN
+from etl.geocode_locations import (
+    CENSUS_BATCH_URL,
+    LocationRecord,
+    get_city_centroid,
+    get_state_centroid,
+    is_geocodable_address,
+    request_census_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+Coordinates = tuple[float | None, float | None]
+
+
+def address_hash(address: str, city: str, state: str, zip_code: str) -> str:
+    """Return the cache key of an address: sha256 of its lowercased tokens."""
+    normalized = " ".join(TOKEN_PATTERN.findall(f"{address} {city} {state} {zip_code[:5]}".lower()))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class CensusGeocoder:
+    """Cached, batched Census geocoder with centroid fallbacks."""
+
+    def __init__(
+        self,
+        session: Session,
+        url: str = CENSUS_BATCH_URL,
+        batch_size: int = 1000,
+        request_interval: float = 1.0,
+        miss_ttl_days: int | None = None,
+    ):
+        """Initialize the geocoder.
+
+        Args:
+            session: Pipeline database session (the address cache opens its own on the same bind).
+            url: Census batch endpoint.
+            batch_size: Addresses per Census request (max 10,000).
+            request_interval: Seconds between Census requests (they ask for 1/second).
+            miss_ttl_days: Days a "no match" result is cached (default ETL_GEOCODE_MISS_TTL_DAYS).
+        """
+        self.session = session
+        self.url = url
+        self.batch_size = batch_size
+        self.request_interval = request_interval
+        self.miss_ttl = timedelta(
+            days=miss_ttl_days if miss_ttl_days is not None else settings.etl_geocode_miss_ttl_days
+        )
+        # Number of Census requests made by this geocoder
+        self.requests = 0
+
+    def geocode(self, address: str, city: str, state: str, zip_code: str) -> Coordinates:
+        """Geocode one address (see geocode_batch)."""
+        return self.geocode_batch([(address, city, state, zip_code)])[0]
+
+    def geocode_batch(self, addresses: Sequence[tuple[str, str, str, str]]) -> list[Coordinates]:
+        """Geocode (address, city, state, zip_code) tuples.
+
+        Returns (latitude, longitude) per address, or (None, None) when
+        neither the Census geocoder nor a centroid covers it.
+        """
+        hashes = [address_hash(*a) for a in addresses]
+        records = {}
+        for key, (address, city, state, zip_code) in zip(hashes, addresses, strict=True):
+            record = LocationRecord(id=UUID(key[:32]), address=address, city=city, state=state, zip_code=zip_code)
+            if is_geocodable_address(record):
+                records[key] = record
+
+        geocoded = self._cached(list(records))
+        misses = {key: record for key, record in records.items() if key not in geocoded}
+        if misses:
+            geocoded.update(self._request(misses))
+
+        zips = get_geo_context(self.session).zips
+        coordinates = []
+        for key, (_, city, state, zip_code) in zip(hashes, addresses, strict=True):
+            lat, lng = geocoded.get(key, (None, None))
+            if lat is None:
+                centroid = zips.get(zip_code[:5])
+                if centroid is not None:
+                    lat, lng = centroid.latitude, centroid.longitude
+                else:
+                    lat, lng = get_city_centroid(city, state) or get_state_centroid(state) or (None, None)
+            coordinates.append((lat, lng))
+        return coordinates
+
+    def _cache_session(self) -> Session:
+        """A session for the address cache, separate from the pipeline's."""
+        return Session(self.session.get_bind())
+
+    def _cached(self, hashes: list[str]) -> dict[str, Coordinates]:
+        """Read cached results for address hashes, leaving out expired misses."""
+        cached: dict[str, Coordinates] = {}
+        miss_cutoff = datetime.now(UTC) - self.miss_ttl
+        try:
+            with self._cache_session() as cache:
+                for start in range(0, len(hashes), self.batch_size):
+                    rows = cache.exec(
+                        select(GeocodedAddress).where(
+                            col(GeocodedAddress.address_hash).in_(hashes[start : start + self.batch_size]),
+                            or_(
+                                col(GeocodedAddress.latitude).is_not(None),
+                                col(GeocodedAddress.created_at) >= miss_cutoff,
+                            ),
+                        )
+                    ).all()
+                    cached.update((row.address_hash, (row.latitude, row.longitude)) for row in rows)
+        except Exception as e:
+            logger.warning("Failed to read geocode cache: %s", e)
+        return cached
+
+    def _request(self, records: dict[str, LocationRecord]) -> dict[str, Coordinates]:
+        """Geocode cache misses (by address hash) with the Census batch API and cache the results."""
+        geocoded: dict[str, Coordinates] = {}
+        items = list(records.items())
+        for start in range(0, len(items), self.batch_size):
+            batch = dict(items[start : start + self.batch_size])
+            if self.requests and self.request_interval:
+                time.sleep(self.request_interval)
+            self.requests += 1
+            try:
+                results = request_census_batch(list(batch.values()), url=self.url)
+            except httpx.HTTPError as e:
+                # Not cached, so the next run retries these addresses
+                logger.warning("Census geocoder error for %d addresses: %s", len(batch), e)
+                continue
+
+            rows = []
+            for key, record in batch.items():
+                result = results.get(str(record.id))
+                latitude, longitude = (result.latitude, result.longitude) if result else (None, None)
+                geocoded[key] = (latitude, longitude)
+                rows.append(
+                    {
+                        "address_hash": key,
+                        "latitude": latitude,
+                        "longitude": longitude,
+                        "match_quality": result.match_quality[:20] if result and result.match_quality else None,
+                        "created_at": datetime.now(UTC),
+                    }
+                )
+            self._store(rows)
+        logger.info("Census geocoded %d new addresses in %d requests", len(geocoded), self.requests)
+        return geocoded
+
+    def _store(self, rows: list[dict]) -> None:
+        """Upsert results into the geocode cache (best effort); a retried miss replaces the expired row."""
+        stmt = insert(GeocodedAddress).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["address_hash"],
+            set_={
+                "latitude": stmt.excluded.latitude,
+                "longitude": stmt.excluded.longitude,
+                "match_quality": stmt.excluded.match_quality,
+                "created_at": stmt.excluded.created_at,
+            },
+        )
+        try:
+            with self._cache_session() as cache:
+                cache.execute(stmt)
+                cache.commit()
+        except Exception as e:
+            logger.warning("Failed to store geocode cache: %s", e)
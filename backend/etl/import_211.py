@@ -21,6 +21,7 @@ from app.database import engine
 from app.models import Location, Organization, Resource
 from connectors.base import ResourceCandidate
 from connectors.two_one_one import TwoOneOneConnector
+from etl.dedupe_index import DedupeIndex, Fingerprint
 
 
 @dataclass
@@ -65,6 +66,9 @@ class ImportStats:
 class TwoOneOneImporter:
     """Import pipeline for 211 veteran resources."""
 
+    # Candidates checked for duplicates with one lookup
+    CHUNK_SIZE = 500
+
     def __init__(
         self,
         session: Session,
@@ -85,6 +89,7 @@ class TwoOneOneImporter:
 
         # Cache for organizations to avoid repeated lookups
         self._org_cache: dict[str, Organization] = {}
+        self.dedupe_index = DedupeIndex(session)
 
     def run(self) -> ImportStats:
         """Run the import pipeline.
@@ -113,10 +118,41 @@ class TwoOneOneImporter:
                 self.stats.new += 1
             return self.stats
 
-        # Process each candidate
-        for candidate in candidates:
+        # Fingerprint resources written outside the import paths since the last run
+        if not self.dry_run:
+            self.dedupe_index.refresh()
+
+        # Process candidates in chunks, one duplicate lookup per chunk
+        for start in range(0, len(candidates), self.CHUNK_SIZE):
+            self._process_chunk(candidates[start : start + self.CHUNK_SIZE])
+
+        # Commit if not dry run
+        if not self.dry_run:
+            try:
+                self.dedupe_index.flush()
+                self.session.commit()
+                print("Changes committed to database")
+            except Exception as e:
+                self.session.rollback()
+                print(f"Error committing: {e}")
+                self.stats.errors += 1
+                self.stats.error_messages.append(f"Commit failed: {str(e)}")
+
+        return self.stats
+
+    def _process_chunk(self, chunk: list[ResourceCandidate]) -> None:
+        """Find existing duplicates for a chunk, then process each candidate."""
+        fingerprints = [self._fingerprint(candidate) for candidate in chunk]
+        try:
+            duplicates = self.dedupe_index.find(fingerprints)
+        except Exception as e:
+            self.stats.errors += len(chunk)
+            self.stats.error_messages.append(f"Duplicate lookup failed for {len(chunk)} resources: {str(e)}")
+            return
+
+        for candidate, fingerprint, existing in zip(chunk, fingerprints, duplicates, strict=True):
             try:
-                action = self._process_candidate(candidate)
+                action = self._process_candidate(candidate, fingerprint, existing)
                 state = candidate.state or "UNKNOWN"
 
                 # Track by state
@@ -135,19 +171,6 @@ class TwoOneOneImporter:
                 self.stats.errors += 1
                 self.stats.error_messages.append(f"{candidate.title}: {str(e)}")
 
-        # Commit if not dry run
-        if not self.dry_run:
-            try:
-                self.session.commit()
-                print("Changes committed to database")
-            except Exception as e:
-                self.session.rollback()
-                print(f"Error committing: {e}")
-                self.stats.errors += 1
-                self.stats.error_messages.append(f"Commit failed: {str(e)}")
-
-        return self.stats
-
     def _db_available(self) -> bool:
         """Check if database connection is available."""
         try:
@@ -157,80 +180,49 @@ class TwoOneOneImporter:
         except Exception:
             return False
 
-    def _process_candidate(self, candidate: ResourceCandidate) -> str:
+    def _process_candidate(
+        self, candidate: ResourceCandidate, fingerprint: Fingerprint, existing: Resource | None
+    ) -> str:
         """Process a single resource candidate.
 
         Args:
             candidate: The resource candidate to process.
+            fingerprint: The candidate's dedupe fingerprint.
+            existing: Stored duplicate found for the chunk, if any.
 
         Returns:
             Action taken: "new", "updated", or "skipped"
         """
-        # Check for duplicates by name + state + phone
-        existing = self._find_duplicate(candidate)
+        # Also match resources created earlier in this run
+        existing = existing or self.dedupe_index.find_added(fingerprint)
 
         if existing:
             # Check if update is needed
             if self._needs_update(existing, candidate):
                 if not self.dry_run:
                     self._update_resource(existing, candidate)
+                    self.dedupe_index.add(existing, fingerprint)
                 return "updated"
             return "skipped"
 
         # Create new resource
         if not self.dry_run:
-            self._create_resource(candidate)
+            resource = self._create_resource(candidate)
+            self.dedupe_index.add(resource, fingerprint)
         return "new"
 
-    def _find_duplicate(self, candidate: ResourceCandidate) -> Resource | None:
-        """Find existing resource by name + state + phone.
-
-        This is the deduplication key for 211 resources.
-        """
-        # Normalize for comparison
-        name = (candidate.org_name or candidate.title or "").strip().lower()
-        state = (candidate.state or "").strip().upper()
-        phone = self._normalize_phone_for_compare(candidate.phone)
-
-        if not name:
-            return None
-
-        # Query for potential duplicates
-        # First try exact match on all three
-        stmt = (
-            select(Resource)
-            .join(Organization)
-            .where(
-                Organization.name.ilike(name),
-                Resource.states.contains([state]) if state else True,
-            )
+    def _fingerprint(self, candidate: ResourceCandidate) -> Fingerprint:
+        """Fingerprint a candidate by org (or title), title, phone, address and state."""
+        return Fingerprint.of(
+            title=candidate.title,
+            org_name=candidate.org_name or candidate.title,
+            phone=candidate.phone,
+            address=candidate.address,
+            city=candidate.city,
+            state=candidate.state,
+            zip_code=candidate.zip_code,
         )
 
-        results = self.session.exec(stmt).all()
-
-        # Filter by phone if present
-        for resource in results:
-            resource_phone = self._normalize_phone_for_compare(resource.phone)
-            # Match if phones match OR if one is missing
-            if phone and resource_phone:
-                if phone == resource_phone:
-                    return resource
-            elif not phone or not resource_phone:
-                # If phone is missing from one, match on name + state only
-                return resource
-
-        return None
-
-    def _normalize_phone_for_compare(self, phone: str | None) -> str | None:
-        """Normalize phone for comparison (digits only)."""
-        if not phone:
-            return None
-        digits = "".join(c for c in phone if c.isdigit())
-        # Handle 1- prefix
-        if len(digits) == 11 and digits.startswith("1"):
-            digits = digits[1:]
-        return digits if len(digits) == 10 else None
-
     def _needs_update(self, existing: Resource, candidate: ResourceCandidate) -> bool:
         """Check if existing resource needs updating."""
         # Compare key fields
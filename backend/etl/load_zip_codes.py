@@ -20,6 +20,7 @@ from sqlalchemy import text
 from sqlmodel import Session
 
 from app.database import engine
+from app.services.geo import refresh_geo_context
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -172,6 +173,9 @@ def load_zip_codes(df: pd.DataFrame) -> int:
 
         session.commit()
 
+    # Nearby lookups in this process read zips from memory
+    refresh_geo_context()
+
     return inserted
 
 
@@ -261,6 +265,8 @@ def main() -> None:
     # Verify
     verify_data()
 
+    logger.info("Running API workers pick up the new table via POST /api/v1/admin/cache/geo/refresh or a restart")
+
 
 if __name__ == "__main__":
     main()
@@ -2,15 +2,26 @@
 
 Handles creation and updates of Organization, Location, Resource,
 and SourceRecord entities with conflict resolution.
+
+load_batch() works a chunk at a time: organizations, locations and
+existing resources for the whole chunk are resolved with one query each,
+all writes go out in a single flush (batched multi-row INSERTs), and the
+chunk is committed once. Records whose raw data hash matches the last
+SourceRecord for their URL (from the same source) are unchanged: they
+skip all of that and only get last_scraped bumped in one UPDATE.
 """
 
 import hashlib
 import json
 import logging
 from datetime import UTC, datetime
+from uuid import UUID
 
+from sqlalchemy import and_, func, tuple_, update
 from sqlalchemy.exc import IntegrityError, OperationalError
-from sqlmodel import Session, select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, col, select
 
 from app.models import (
     ChangeLog,
@@ -27,7 +38,10 @@ from app.models import (
     SourceRecord,
     SourceType,
 )
+from app.services.facet_index import update_facet_index
+from app.services.spatial_index import update_spatial_index
 from app.services.trust import TrustService
+from etl.dedupe_index import DedupeIndex, Fingerprint
 from etl.models import ETLError, LoadResult, NormalizedResource
 
 logger = logging.getLogger(__name__)
@@ -45,18 +59,33 @@ class Loader:
     # Tier 3+: State/community sources - require review for risky changes
     AUTO_APPROVE_TIER_THRESHOLD = 2
 
-    def __init__(self, session: Session):
+    # Resources resolved, written and committed together by load_batch()
+    BULK_CHUNK_SIZE = 500
+
+    def __init__(self, session: Session, skip_unchanged: bool = True):
         """Initialize loader.
 
         Args:
             session: SQLModel database session.
+            skip_unchanged: Skip records whose raw data hash is unchanged since
+                the last load (False = diff every record field by field).
         """
         self.session = session
+        self.skip_unchanged = skip_unchanged
         self.trust_service = TrustService(session)
 
         # Cache for organizations and sources to avoid repeated lookups
         self._org_cache: dict[str, Organization] = {}
         self._source_cache: dict[str, Source] = {}
+        # (resource_id, lat, lng) written in the open transaction, for the nearby spatial index
+        self._positions: list[tuple[UUID, float | None, float | None]] = []
+        # Resources written in the open transaction, for the facet index
+        self._loaded_ids: list[UUID] = []
+        # Cross-run duplicate detection (same resource under a different source_url)
+        self.dedupe_index = DedupeIndex(session)
+        # Set by streaming runs, where a lower-tier copy of a resource from a
+        # later chunk only fills its empty fields instead of overwriting them
+        self.lower_tier_fills_empty_only = False
 
     def load(self, resource: NormalizedResource) -> LoadResult:
         """Load a single resource into the database.
@@ -83,17 +112,20 @@ class Loader:
             if resource.source_name:
                 source = self._get_or_create_source(resource)
 
-            # 4. Find existing resource by source_url
-            existing = self._find_existing_resource(resource.source_url)
+            # 4. Find existing resource by source_url, then by fingerprint
+            fingerprint = self._fingerprint(resource)
+            existing = self._find_existing_resource(resource.source_url) or self.dedupe_index.find([fingerprint])[0]
 
             if existing:
                 # Update existing resource
                 result = self._update_resource(existing, resource, org, location, source)
+                self.dedupe_index.add(existing, fingerprint)
             else:
                 # Create new resource
-                result = self._create_resource(resource, org, location, source)
+                result = self._create_resource(resource, org, location, source, fingerprint)
 
-            self.session.commit()
+            self._track_position(result, location)
+            self._commit()
             return result
 
         except IntegrityError as e:
@@ -134,36 +166,278 @@ class Loader:
                 error=f"Unexpected error: {e}",
             )
 
-    def load_batch(self, resources: list[NormalizedResource]) -> tuple[list[LoadResult], list[ETLError]]:
-        """Load a batch of resources.
+    def load_batch(
+        self, resources: list[NormalizedResource], chunk_size: int | None = None
+    ) -> tuple[list[LoadResult], list[ETLError]]:
+        """Load a batch of resources in chunks.
 
-        Commits after each successful load to avoid losing all
-        progress on failure.
+        Each chunk is resolved with a few set-based queries and committed
+        once. If a chunk fails it is rolled back and retried one resource at
+        a time with load(), so a bad row only fails itself.
 
         Args:
             resources: List of normalized resources.
+            chunk_size: Resources per chunk (default BULK_CHUNK_SIZE).
 
         Returns:
             Tuple of (load results, errors).
         """
         results: list[LoadResult] = []
         errors: list[ETLError] = []
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+
+        for start in range(0, len(resources), chunk_size):
+            chunk = resources[start : start + chunk_size]
+            try:
+                chunk_results = self._load_chunk(chunk)
+                self._commit()
+            except Exception as e:
+                self.session.rollback()
+                self._positions.clear()
+                self._loaded_ids.clear()
+                self.dedupe_index.clear()
+                # Objects created in the rolled back transaction are gone
+                self._org_cache.clear()
+                self._source_cache.clear()
+                logger.warning("Bulk load of %d resources failed, loading one at a time: %s", len(chunk), e)
+                chunk_results = [self.load(resource) for resource in chunk]
+
+            for resource, result in zip(chunk, chunk_results, strict=True):
+                results.append(result)
+
+                if result.action == "failed":
+                    errors.append(
+                        ETLError(
+                            stage="load",
+                            message=result.error or "Unknown error",
+                            resource_title=resource.title,
+                            source_url=resource.source_url,
+                        )
+                    )
+
+        return results, errors
+
+    def _load_chunk(self, chunk: list[NormalizedResource]) -> list[LoadResult]:
+        """Create or update a chunk of resources without committing.
 
-        for resource in resources:
-            result = self.load(resource)
-            results.append(result)
-
-            if result.action == "failed":
-                errors.append(
-                    ETLError(
-                        stage="load",
-                        message=result.error or "Unknown error",
-                        resource_title=resource.title,
-                        source_url=resource.source_url,
+        Same decisions as load() for each resource, but lookups are batched
+        and new rows are written in one flush when the caller commits.
+        """
+        sources = {r.source_name: self._get_or_create_source(r) for r in chunk if r.source_name}
+        raw_hashes = [self._raw_hash(r) for r in chunk]
+        last_records = self._find_last_records([r.source_url for r in chunk]) if self.skip_unchanged else {}
+        results: list[LoadResult | None] = [None] * len(chunk)
+
+        # Unchanged since the last load from this source: nothing to diff or write
+        unchanged: dict[datetime, list[UUID]] = {}
+        for i, normalized in enumerate(chunk):
+            source = sources.get(normalized.source_name) if normalized.source_name else None
+            record = last_records.get(normalized.source_url)
+            # Without raw data the hash says nothing about the fields
+            if normalized.raw_data and source and record and record[1:] == (source.id, raw_hashes[i]):
+                results[i] = LoadResult(resource_id=record[0], action="skipped")
+                unchanged.setdefault(normalized.fetched_at or datetime.now(UTC), []).append(record[0])
+        for last_scraped, resource_ids in unchanged.items():
+            self.session.execute(
+                update(Resource).where(col(Resource.id).in_(resource_ids)).values(last_scraped=last_scraped)
+            )
+
+        changed = [i for i, result in enumerate(results) if result is None]
+        if not changed:
+            return results  # type: ignore[return-value]
+        changed_chunk = [chunk[i] for i in changed]
+        orgs = self._resolve_organizations(changed_chunk)
+        locations = self._resolve_locations(changed_chunk, orgs)
+        existing = self._find_existing_resources([r.source_url for r in changed_chunk])
+        fingerprints = {i: self._fingerprint(chunk[i]) for i in changed}
+        # Resources not found by URL: one fingerprint lookup for the rest of the chunk
+        unmatched = [i for i in changed if chunk[i].source_url not in existing]
+        matched = dict(zip(unmatched, self.dedupe_index.find([fingerprints[i] for i in unmatched]), strict=True))
+
+        with self.session.no_autoflush:
+            for i in changed:
+                normalized = chunk[i]
+                org = orgs[normalized.org_key()]
+                location = locations.get(self._location_key(normalized, org)) if normalized.has_location() else None
+                source = sources.get(normalized.source_name) if normalized.source_name else None
+
+                resource = (
+                    existing.get(normalized.source_url)
+                    or matched.get(i)
+                    or self.dedupe_index.find_added(fingerprints[i])
+                )
+                if resource:
+                    result = self._update_resource(resource, normalized, org, location, source)
+                    record = last_records.get(normalized.source_url)
+                    if (
+                        result.action == "skipped"
+                        and normalized.raw_data
+                        and source
+                        and record
+                        and record[1:] != (source.id, raw_hashes[i])
+                    ):
+                        # Raw data changed without changing any field: record the new
+                        # hash so the next run takes the unchanged path
+                        self._create_source_record(resource, source, normalized)
+                else:
+                    resource = self._new_resource(normalized, org, location, source)
+                    # Nothing is flushed yet, so set .source for _update_resource's tier check
+                    set_committed_value(resource, "source", source)
+                    # A later row with the same URL updates this one, as in load()
+                    existing[normalized.source_url] = resource
+                    result = LoadResult(
+                        resource_id=resource.id,
+                        organization_id=org.id,
+                        location_id=location.id if location else None,
+                        action="created",
                     )
+                self.dedupe_index.add(resource, fingerprints[i])
+                self._track_position(result, location)
+                results[i] = result
+
+        return results  # type: ignore[return-value]
+
+    def _track_position(self, result: LoadResult, location: Location | None) -> None:
+        """Remember a loaded resource's coordinates (read before commit expires them)."""
+        if result.resource_id:
+            self._loaded_ids.append(result.resource_id)
+        if result.resource_id and location is not None:
+            self._positions.append((result.resource_id, location.latitude, location.longitude))
+
+    @staticmethod
+    def _fingerprint(resource: NormalizedResource) -> Fingerprint:
+        """Fingerprint a normalized resource for the dedupe index."""
+        return Fingerprint.of(
+            title=resource.title,
+            org_name=resource.org_name,
+            phone=resource.phone,
+            address=resource.address,
+            city=resource.city,
+            state=resource.state or (resource.states[0] if len(resource.states) == 1 else None),
+            zip_code=resource.zip_code,
+        )
+
+    def _commit(self) -> None:
+        """Write fingerprints and commit, then update the in-process spatial and facet indexes."""
+        try:
+            self.dedupe_index.flush()
+            self.session.commit()
+        except Exception:
+            self._positions.clear()
+            self._loaded_ids.clear()
+            self.dedupe_index.clear()
+            raise
+        update_spatial_index(self._positions)
+        self._positions.clear()
+        update_facet_index(self.session, self._loaded_ids)
+        self._loaded_ids.clear()
+
+    def _resolve_organizations(self, chunk: list[NormalizedResource]) -> dict[str, Organization]:
+        """Find or create the organizations for a chunk, keyed by org_key()."""
+        uncached = {r.org_key() for r in chunk} - self._org_cache.keys()
+        fetched: dict[str, Organization] = {}
+        if uncached:
+            stmt = select(Organization).where(func.lower(Organization.name).in_(uncached))
+            for org in self.session.exec(stmt):
+                fetched.setdefault(org.name.lower().strip(), org)
+
+        for resource in chunk:
+            org_key = resource.org_key()
+            if org_key in self._org_cache:
+                continue
+
+            org = fetched.get(org_key)
+            if org:
+                # Update website if we have a better one
+                if resource.org_website and not org.website:
+                    org.website = resource.org_website
+                    org.updated_at = datetime.now(UTC)
+                    self.session.add(org)
+            else:
+                org = Organization(
+                    name=resource.org_name,
+                    website=resource.org_website,
                 )
+                self.session.add(org)
+            self._org_cache[org_key] = org
 
-        return results, errors
+        return {r.org_key(): self._org_cache[r.org_key()] for r in chunk}
+
+    def _resolve_locations(
+        self, chunk: list[NormalizedResource], orgs: dict[str, Organization]
+    ) -> dict[tuple, Location]:
+        """Find or create the locations for a chunk, keyed by _location_key()."""
+        keys = [self._location_key(r, orgs[r.org_key()]) for r in chunk if r.has_location()]
+        locations: dict[tuple, Location] = {}
+        if keys:
+            stmt = select(Location).where(
+                tuple_(Location.organization_id, Location.address, Location.city, Location.state).in_(set(keys))
+            )
+            for location in self.session.exec(stmt):
+                key = (location.organization_id, location.address, location.city, location.state)
+                locations.setdefault(key, location)
+
+        for resource in chunk:
+            if not resource.has_location():
+                continue
+            org = orgs[resource.org_key()]
+            key = self._location_key(resource, org)
+            location = locations.get(key)
+
+            if location:
+                # Update geocoding if we have it now
+                if resource.latitude and not location.latitude:
+                    location.latitude = resource.latitude
+                    location.longitude = resource.longitude
+                    self.session.add(location)
+                continue
+
+            location = Location(
+                organization_id=org.id,
+                address=resource.address or "",
+                city=resource.city or "",
+                state=resource.state or "",
+                zip_code=resource.zip_code or "",
+                latitude=resource.latitude,
+                longitude=resource.longitude,
+            )
+            self.session.add(location)
+            locations[key] = location
+
+        return locations
+
+    @staticmethod
+    def _location_key(resource: NormalizedResource, org: Organization) -> tuple:
+        """Key a location is matched on (same as _get_or_create_location)."""
+        return (org.id, resource.address, resource.city, resource.state)
+
+    def _find_existing_resources(self, source_urls: list[str]) -> dict[str, Resource]:
+        """Find existing resources for a chunk, keyed by source URL."""
+        stmt = (
+            select(Resource)
+            .where(col(Resource.source_url).in_(set(source_urls)))
+            .options(selectinload(Resource.source))  # type: ignore[attr-defined]
+        )
+        existing: dict[str, Resource] = {}
+        for resource in self.session.exec(stmt):
+            existing.setdefault(resource.source_url, resource)
+        return existing
+
+    def _find_last_records(self, source_urls: list[str]) -> dict[str, tuple[UUID, UUID, str]]:
+        """Find the latest source record for each URL as (resource_id, source_id, raw_hash)."""
+        latest = (
+            select(SourceRecord.url, func.max(SourceRecord.fetched_at).label("fetched_at"))
+            .where(col(SourceRecord.url).in_(set(source_urls)))
+            .group_by(SourceRecord.url)
+            .subquery()
+        )
+        stmt = select(SourceRecord.url, SourceRecord.resource_id, SourceRecord.source_id, SourceRecord.raw_hash).join(
+            latest, and_(SourceRecord.url == latest.c.url, SourceRecord.fetched_at == latest.c.fetched_at)
+        )
+        records: dict[str, tuple[UUID, UUID, str]] = {}
+        for url, resource_id, source_id, raw_hash in self.session.exec(stmt):
+            records.setdefault(url, (resource_id, source_id, raw_hash))
+        return records
 
     def _get_or_create_organization(self, resource: NormalizedResource) -> Organization:
         """Find existing organization or create new one."""
@@ -271,8 +545,27 @@ class Loader:
         org: Organization,
         location: Location | None,
         source: Source | None,
+        fingerprint: Fingerprint,
     ) -> LoadResult:
         """Create a new resource."""
+        resource = self._new_resource(normalized, org, location, source)
+        self.dedupe_index.add(resource, fingerprint)
+
+        return LoadResult(
+            resource_id=resource.id,
+            organization_id=org.id,
+            location_id=location.id if location else None,
+            action="created",
+        )
+
+    def _new_resource(
+        self,
+        normalized: NormalizedResource,
+        org: Organization,
+        location: Location | None,
+        source: Source | None,
+    ) -> Resource:
+        """Add a new resource and its source record to the session."""
         now = datetime.now(UTC)
 
         resource = Resource(
@@ -301,18 +594,12 @@ class Loader:
         )
 
         self.session.add(resource)
-        self.session.flush()
 
         # Create source record for audit trail
         if source:
             self._create_source_record(resource, source, normalized)
 
-        return LoadResult(
-            resource_id=resource.id,
-            organization_id=org.id,
-            location_id=location.id if location else None,
-            action="created",
-        )
+        return resource
 
     def _update_resource(
         self,
@@ -341,8 +628,18 @@ class Loader:
         source_tier = source.tier if source else 4
         is_trusted_source = source_tier <= self.AUTO_APPROVE_TIER_THRESHOLD
 
+        # In streaming runs, a copy from a lower-tier source than the resource's own only fills empty fields
+        existing_tier = existing.source.tier if existing.source else 5
+        is_lower_tier = bool(
+            self.lower_tier_fills_empty_only
+            and source
+            and existing.source_id
+            and source.id != existing.source_id
+            and source.tier > existing_tier
+        )
+
         for field_name, old_val, new_val in field_updates:
-            if old_val != new_val and new_val:
+            if old_val != new_val and new_val and not (old_val and is_lower_tier):
                 changes.append((field_name, old_val, new_val))
                 # Only flag for review if risky field AND source is not trusted
                 if field_name in self.RISKY_FIELDS and not is_trusted_source:
@@ -371,7 +668,6 @@ class Loader:
             existing.location_id = location.id
 
         # Update source if better tier
-        existing_tier = existing.source.tier if existing.source else 5
         if source and (not existing.source_id or source.tier < existing_tier):
             existing.source_id = source.id
             existing.reliability_score = normalized.reliability_score
@@ -431,9 +727,7 @@ class Loader:
         normalized: NormalizedResource,
     ) -> None:
         """Create a source record for audit trail."""
-        # Generate hash of raw data
-        raw_content = json.dumps(normalized.raw_data or {}, sort_keys=True)
-        raw_hash = hashlib.sha256(raw_content.encode()).hexdigest()
+        raw_hash = self._raw_hash(normalized)
 
         record = SourceRecord(
             resource_id=resource.id,
@@ -450,3 +744,9 @@ class Loader:
         source.health_status = HealthStatus.HEALTHY
         source.error_count = 0
         self.session.add(source)
+
+    @staticmethod
+    def _raw_hash(normalized: NormalizedResource) -> str:
+        """SHA-256 of a resource's raw data, for change detection."""
+        raw_content = json.dumps(normalized.raw_data or {}, sort_keys=True)
+        return hashlib.sha256(raw_content.encode()).hexdigest()
@@ -97,6 +97,9 @@ class ETLStats:
     updated: int = 0
     skipped: int = 0
     failed: int = 0
+    # Wall-clock time of the extract stage and of each connector in it
+    extract_seconds: float = 0.0
+    connector_seconds: dict[str, float] = field(default_factory=dict)
 
     @property
     def total_processed(self) -> int:
@@ -5,18 +5,30 @@ into a complete pipeline with error handling and statistics.
 """
 
 import json
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import UTC, datetime
+from urllib.parse import urlparse
 
 import httpx
 from sqlmodel import Session
 
-from connectors.base import Connector
+from app.config import settings
+from connectors.base import Connector, ResourceCandidate, iter_candidates
 from etl.dedupe import Deduplicator
+from etl.dedupe_index import DedupeIndex
 from etl.enrich import Enricher, GeocoderProtocol
 from etl.loader import Loader
 from etl.models import ETLError, ETLResult, ETLStats, NormalizedResource
 from etl.normalize import Normalizer
 
+logger = logging.getLogger(__name__)
+
 
 def _categorize_exception(e: Exception, source_name: str) -> ETLError:
     """Categorize an exception into an ETLError with appropriate category.
@@ -85,7 +97,7 @@ class ETLPipeline:
     """Main ETL pipeline orchestrator.
 
     Runs the full ETL process:
-    1. Extract - Run connectors to get ResourceCandidates
+    1. Extract - Run connectors (concurrently) to get ResourceCandidates
     2. Normalize - Validate and normalize data
     3. Deduplicate - Remove duplicates across sources
     4. Enrich - Add geocoding, tags, trust scores
@@ -97,6 +109,9 @@ class ETLPipeline:
         session: Session,
         geocoder: GeocoderProtocol | None = None,
         title_similarity_threshold: float = 0.85,
+        max_workers: int | None = None,
+        per_host: int | None = None,
+        connector_timeout: float | None = None,
     ):
         """Initialize the pipeline.
 
@@ -104,12 +119,19 @@ class ETLPipeline:
             session: Database session for loading.
             geocoder: Optional geocoding service.
             title_similarity_threshold: Threshold for deduplication.
+            max_workers: Connectors run at once (default ETL_EXTRACT_WORKERS).
+            per_host: Connectors run at once against one source host (default ETL_EXTRACT_PER_HOST).
+            connector_timeout: Seconds before a running connector is abandoned
+                (default ETL_CONNECTOR_TIMEOUT_SECONDS).
         """
         self.session = session
+        self.max_workers = max_workers or settings.etl_extract_workers
+        self.per_host = per_host or settings.etl_extract_per_host
+        self.connector_timeout = connector_timeout or settings.etl_connector_timeout_seconds
         self.normalizer = Normalizer()
         self.deduplicator = Deduplicator(title_threshold=title_similarity_threshold)
         self.enricher = Enricher(geocoder=geocoder)
-        self.loader = Loader(session)
+        self.loader = Loader(session, skip_unchanged=settings.etl_skip_unchanged)
 
     def run(self, connectors: list[Connector]) -> ETLResult:
         """Run the full ETL pipeline for multiple connectors.
@@ -124,33 +146,8 @@ class ETLPipeline:
         stats = ETLStats()
         errors: list[ETLError] = []
 
-        # Collect all normalized resources from all connectors
-        all_normalized: list[NormalizedResource] = []
-
         # Step 1: Extract and Normalize from each connector
-        for connector in connectors:
-            source_name = connector.metadata.name
-            source_tier = connector.metadata.tier
-
-            try:
-                # Extract using context manager to ensure HTTP client cleanup
-                with connector:
-                    candidates = connector.run()
-                stats.extracted += len(candidates)
-
-                # Normalize
-                normalized, norm_errors = self.normalizer.normalize_batch(
-                    candidates, source_name=source_name, source_tier=source_tier
-                )
-
-                stats.normalized += len(normalized)
-                stats.normalized_failed += len(norm_errors)
-                errors.extend(norm_errors)
-
-                all_normalized.extend(normalized)
-
-            except Exception as e:
-                errors.append(_categorize_exception(e, source_name))
+        all_normalized = self._extract(connectors, stats, errors)
 
         if not all_normalized:
             return ETLResult(
@@ -161,15 +158,84 @@ class ETLPipeline:
                 completed_at=datetime.now(UTC),
             )
 
-        # Step 2: Deduplicate across all sources
-        deduplicated, num_removed = self.deduplicator.deduplicate(all_normalized)
-        stats.deduplicated = num_removed
+        # Steps 2-4: Deduplicate across all sources, enrich, load (fingerprinting
+        # resources written outside the import paths since the last run first)
+        DedupeIndex(self.session).refresh()
+        self._dedupe_enrich_load(all_normalized, stats, errors)
+
+        return ETLResult(
+            success=stats.failed == 0 and len([e for e in errors if e.stage == "extract"]) == 0,
+            stats=stats,
+            errors=errors,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+
+    def run_streaming(self, connectors: list[Connector], chunk_size: int = 2000) -> ETLResult:
+        """Run the pipeline in fixed-size chunks with bounded memory.
+
+        Connectors stream candidates (iter_candidates) into a bounded queue;
+        every chunk_size normalized resources are deduplicated, enriched
+        and loaded before more are read, so memory doesn't grow with the
+        size of a source.
+
+        Dedupe only compares resources within a chunk. Duplicates across
+        chunks are caught by the loader (same source_url or fingerprint),
+        which merges them into the existing resource, as on a repeat run:
+        a copy from a lower-tier source only fills fields that are empty,
+        and the resource moves to the best tier that has loaded it.
+
+        Args:
+            connectors: List of data source connectors.
+            chunk_size: Resources per dedupe/enrich/load chunk.
+
+        Returns:
+            ETLResult with statistics and errors.
+        """
+        started_at = datetime.now(UTC)
+        stats = ETLStats()
+        errors: list[ETLError] = []
+        buffer: list[NormalizedResource] = []
+
+        # Fingerprint resources written outside the import paths since the last run
+        DedupeIndex(self.session).refresh()
+        self.loader.lower_tier_fills_empty_only = True
+        try:
+            for source_index, candidates in self._stream(connectors, chunk_size, stats, errors):
+                connector = connectors[source_index]
+                normalized, norm_errors = self.normalizer.normalize_batch(
+                    candidates, source_name=connector.metadata.name, source_tier=connector.metadata.tier
+                )
+                stats.normalized += len(normalized)
+                stats.normalized_failed += len(norm_errors)
+                errors.extend(norm_errors)
+                buffer.extend(normalized)
+                while len(buffer) >= chunk_size:
+                    self._dedupe_enrich_load(buffer[:chunk_size], stats, errors)
+                    del buffer[:chunk_size]
+            if buffer:
+                self._dedupe_enrich_load(buffer, stats, errors)
+        finally:
+            self.loader.lower_tier_fills_empty_only = False
+
+        return ETLResult(
+            success=stats.failed == 0 and len([e for e in errors if e.stage == "extract"]) == 0,
+            stats=stats,
+            errors=errors,
+            started_at=started_at,
+            completed_at=datetime.now(UTC),
+        )
+
+    def _dedupe_enrich_load(
+        self, normalized: list[NormalizedResource], stats: ETLStats, errors: list[ETLError]
+    ) -> None:
+        """Deduplicate, enrich and load normalized resources, updating stats."""
+        deduplicated, num_removed = self.deduplicator.deduplicate(normalized)
+        stats.deduplicated += num_removed
 
-        # Step 3: Enrich
         enriched = self.enricher.enrich_batch(deduplicated)
-        stats.enriched = len(enriched)
+        stats.enriched += len(enriched)
 
-        # Step 4: Load
         load_results, load_errors = self.loader.load_batch(enriched)
         errors.extend(load_errors)
 
@@ -183,13 +249,179 @@ class ETLPipeline:
             elif result.action == "failed":
                 stats.failed += 1
 
-        return ETLResult(
-            success=stats.failed == 0 and len([e for e in errors if e.stage == "extract"]) == 0,
-            stats=stats,
-            errors=errors,
-            started_at=started_at,
-            completed_at=datetime.now(UTC),
+    def _stream(
+        self, connectors: list[Connector], chunk_size: int, stats: ETLStats, errors: list[ETLError]
+    ) -> Iterator[tuple[int, list[ResourceCandidate]]]:
+        """Yield (connector index, candidates) chunks as connectors produce them.
+
+        Same concurrency limits and scheduling as _extract(). Workers block when the queue
+        is full, so at most about 2 * max_workers chunks are buffered. Here
+        the timeout is on progress: a connector that hasn't produced a chunk
+        for connector_timeout is stopped (between candidates) and reported.
+        Time the caller spends processing a chunk doesn't count, since
+        workers are blocked on the full queue meanwhile.
+        """
+        extract_started = time.monotonic()
+        slots = _HostSlots(connectors, self.per_host)
+        chunks: queue.Queue[tuple[int, list[ResourceCandidate] | None, Exception | None]] = queue.Queue(
+            maxsize=2 * self.max_workers
+        )
+        # Set by workers: start and last progress times; set here: connectors to stop
+        started: dict[int, float] = {}
+        progress: dict[int, float] = {}
+        stop = [threading.Event() for _ in connectors]
+        # Seconds this loop has waited since each connector's last progress
+        last_progress: dict[int, float] = {}
+        waited: dict[int, float] = {}
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="etl-stream")
+        try:
+            active = set(range(len(connectors)))
+            while active:
+                for j in slots.ready():
+                    pool.submit(_stream_connector, connectors[j], j, chunk_size, chunks, started, progress, stop[j])
+                waiting_since = time.monotonic()
+                try:
+                    i, candidates, error = chunks.get(timeout=min(1.0, self.connector_timeout))
+                except queue.Empty:
+                    i, candidates, error = -1, None, None
+
+                now = time.monotonic()
+                for j in list(active):
+                    if j not in progress:
+                        continue  # Waiting for a worker or host slot
+                    if last_progress.get(j) != progress[j]:
+                        last_progress[j] = progress[j]
+                        waited[j] = 0.0
+                    waited[j] += now - waiting_since
+                    if waited[j] > self.connector_timeout and j != i:
+                        active.discard(j)
+                        stop[j].set()
+                        slots.release(j)
+                        source_name = connectors[j].metadata.name
+                        stats.connector_seconds[source_name] = round(now - started[j], 3)
+                        errors.append(
+                            ETLError(
+                                stage="extract",
+                                message=f"Connector {source_name} timeout: no progress for "
+                                f"{self.connector_timeout:.0f}s",
+                                exception="TimeoutError",
+                                category="transient",
+                            )
+                        )
+
+                if i in active and candidates is not None:
+                    stats.extracted += len(candidates)
+                    yield i, candidates
+                elif i in active:
+                    # Connector finished (or failed)
+                    active.discard(i)
+                    slots.release(i)
+                    source_name = connectors[i].metadata.name
+                    stats.connector_seconds[source_name] = round(time.monotonic() - started[i], 3)
+                    if error is not None:
+                        errors.append(_categorize_exception(error, source_name))
+        finally:
+            for event in stop:
+                event.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        stats.extract_seconds = round(time.monotonic() - extract_started, 3)
+        logger.info(
+            "Streamed %d candidates from %d connectors in %.1fs",
+            stats.extracted,
+            len(connectors),
+            stats.extract_seconds,
+        )
+
+    def _extract(
+        self, connectors: list[Connector], stats: ETLStats, errors: list[ETLError]
+    ) -> list[NormalizedResource]:
+        """Run connectors concurrently and normalize each one's results as it finishes.
+
+        At most max_workers connectors run at once, and at most per_host
+        against the same source host. A connector is only submitted once its
+        host has a free slot, so a backlog for one busy host waits here
+        instead of holding pool workers that other hosts could use. A
+        connector still running after connector_timeout is reported as a
+        transient error and its results are discarded (the thread can't be
+        interrupted; it is left to finish, and its host slot is freed).
+
+        Normalized resources are returned in connector order, so dedupe sees
+        the same input however the connectors finished.
+
+        Args:
+            connectors: Data source connectors.
+            stats: Stats to update (extracted, normalized, timings).
+            errors: Error list to extend.
+
+        Returns:
+            Normalized resources from all connectors.
+        """
+        extract_started = time.monotonic()
+        slots = _HostSlots(connectors, self.per_host)
+        # Monotonic start time of each running connector, set by its worker
+        started: dict[int, float] = {}
+        normalized_by_connector: dict[int, list[NormalizedResource]] = {}
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="etl-extract")
+        try:
+            pending: dict[Future[list[ResourceCandidate]], int] = {}
+            while True:
+                for i in slots.ready():
+                    pending[pool.submit(_run_connector, connectors[i], started, i)] = i
+                if not pending:
+                    break
+                done, _ = wait(pending, timeout=min(1.0, self.connector_timeout), return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    slots.release(i)
+                    connector = connectors[i]
+                    source_name = connector.metadata.name
+                    stats.connector_seconds[source_name] = round(time.monotonic() - started[i], 3)
+                    try:
+                        candidates = future.result()
+                    except Exception as e:
+                        errors.append(_categorize_exception(e, source_name))
+                        continue
+                    stats.extracted += len(candidates)
+
+                    # Normalize while the remaining connectors are still extracting
+                    normalized, norm_errors = self.normalizer.normalize_batch(
+                        candidates, source_name=source_name, source_tier=connector.metadata.tier
+                    )
+                    stats.normalized += len(normalized)
+                    stats.normalized_failed += len(norm_errors)
+                    errors.extend(norm_errors)
+                    normalized_by_connector[i] = normalized
+
+                now = time.monotonic()
+                for future, i in list(pending.items()):
+                    if i in started and now - started[i] > self.connector_timeout:
+                        del pending[future]
+                        slots.release(i)
+                        source_name = connectors[i].metadata.name
+                        stats.connector_seconds[source_name] = round(now - started[i], 3)
+                        errors.append(
+                            ETLError(
+                                stage="extract",
+                                message=f"Connector {source_name} timeout: still running after "
+                                f"{self.connector_timeout:.0f}s",
+                                exception="TimeoutError",
+                                category="transient",
+                            )
+                        )
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        stats.extract_seconds = round(time.monotonic() - extract_started, 3)
+        logger.info(
+            "Extracted %d candidates from %d connectors in %.1fs",
+            stats.extracted,
+            len(connectors),
+            stats.extract_seconds,
         )
+        return [resource for i in sorted(normalized_by_connector) for resource in normalized_by_connector[i]]
 
     def run_single(self, connector: Connector) -> ETLResult:
         """Run the pipeline for a single connector.
@@ -238,30 +470,8 @@ class ETLPipeline:
         stats = ETLStats()
         errors: list[ETLError] = []
 
-        all_normalized: list[NormalizedResource] = []
-
         # Extract and normalize
-        for connector in connectors:
-            source_name = connector.metadata.name
-            source_tier = connector.metadata.tier
-
-            try:
-                # Extract using context manager to ensure HTTP client cleanup
-                with connector:
-                    candidates = connector.run()
-                stats.extracted += len(candidates)
-
-                normalized, norm_errors = self.normalizer.normalize_batch(
-                    candidates, source_name=source_name, source_tier=source_tier
-                )
-
-                stats.normalized += len(normalized)
-                stats.normalized_failed += len(norm_errors)
-                errors.extend(norm_errors)
-                all_normalized.extend(normalized)
-
-            except Exception as e:
-                errors.append(_categorize_exception(e, source_name))
+        all_normalized = self._extract(connectors, stats, errors)
 
         if all_normalized:
             # Deduplicate
@@ -284,6 +494,89 @@ class ETLPipeline:
         )
 
 
+def _source_host(connector: Connector) -> str:
+    """Return the host a connector fetches from, for per-host concurrency limits."""
+    return urlparse(connector.metadata.url).hostname or connector.metadata.name
+
+
+class _HostSlots:
+    """Per-host connector slots, taken and released by the thread that submits to the pool."""
+
+    def __init__(self, connectors: list[Connector], per_host: int):
+        self.per_host = per_host
+        self._hosts = [_source_host(connector) for connector in connectors]
+        self._running: Counter[str] = Counter()
+        # Connectors not yet submitted, in order
+        self._waiting = list(range(len(connectors)))
+
+    def ready(self) -> list[int]:
+        """Take a slot for each waiting connector whose host has room, in connector order."""
+        ready = []
+        for i in self._waiting:
+            if self._running[self._hosts[i]] < self.per_host:
+                self._running[self._hosts[i]] += 1
+                ready.append(i)
+        self._waiting = [i for i in self._waiting if i not in ready]
+        return ready
+
+    def release(self, index: int) -> None:
+        """Free the slot of a connector that finished or was given up on."""
+        self._running[self._hosts[index]] -= 1
+
+
+def _run_connector(connector: Connector, started: dict[int, float], index: int) -> list[ResourceCandidate]:
+    """Run one connector in an extract worker."""
+    started[index] = time.monotonic()
+    # Extract using context manager to ensure HTTP client cleanup
+    with connector:
+        return connector.run()
+
+
+def _stream_connector(
+    connector: Connector,
+    index: int,
+    chunk_size: int,
+    chunks: queue.Queue,
+    started: dict[int, float],
+    progress: dict[int, float],
+    stop: threading.Event,
+) -> None:
+    """Stream one connector's candidates into the queue in chunks, then a (index, None, error) marker."""
+
+    def put(item: tuple[int, list[ResourceCandidate] | None, Exception | None]) -> bool:
+        # Wait for room, giving up if the pipeline stopped this connector
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    if stop.is_set():
+        return
+    started[index] = progress[index] = time.monotonic()
+    error: Exception | None = None
+    try:
+        with connector:
+            chunk: list[ResourceCandidate] = []
+            for candidate in iter_candidates(connector):
+                if stop.is_set():
+                    return
+                chunk.append(candidate)
+                if len(chunk) >= chunk_size:
+                    progress[index] = time.monotonic()
+                    if not put((index, chunk, None)):
+                        return
+                    progress[index] = time.monotonic()
+                    chunk = []
+            if chunk and not put((index, chunk, None)):
+                return
+    except Exception as e:
+        error = e
+    put((index, None, error))
+
+
 def create_pipeline(
     session: Session,
     geocoder: GeocoderProtocol | None = None,
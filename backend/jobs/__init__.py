@@ -8,9 +8,13 @@ This module provides:
 - Discovery job for AI-powered resource discovery
 - Embeddings job for vector embedding generation
 - Cleanup job for database maintenance
+- Analytics rollup job for dashboard aggregates
+- Analytics partitions job for event partition rotation and retention
 - Job registry and configuration
 """
 
+from jobs.analytics_partitions import AnalyticsPartitionJob
+from jobs.analytics_rollup import AnalyticsRollupJob
 from jobs.base import BaseJob, JobResult, JobStatus
 from jobs.cleanup import CleanupJob, TruncateChangeLogsJob
 from jobs.discovery import DiscoveryJob
@@ -91,6 +95,22 @@ def setup_jobs(scheduler: JobScheduler, config: dict[str, str | bool]) -> None:
         enabled=bool(enabled) and bool(cleanup_schedule),
     )
 
+    # Register analytics rollup job
+    analytics_rollup_schedule = config.get("ANALYTICS_ROLLUP_SCHEDULE")
+    scheduler.register_job(
+        AnalyticsRollupJob(),
+        schedule=analytics_rollup_schedule if isinstance(analytics_rollup_schedule, str) else None,
+        enabled=bool(enabled) and bool(analytics_rollup_schedule),
+    )
+
+    # Register analytics partitions job
+    analytics_partition_schedule = config.get("ANALYTICS_PARTITION_SCHEDULE")
+    scheduler.register_job(
+        AnalyticsPartitionJob(),
+        schedule=analytics_partition_schedule if isinstance(analytics_partition_schedule, str) else None,
+        enabled=bool(enabled) and bool(analytics_partition_schedule),
+    )
+
     # Register truncate job (manual only, no schedule)
     scheduler.register_job(
         TruncateChangeLogsJob(),
@@ -105,6 +125,8 @@ __all__ = [
     "JobResult",
     "JobStatus",
     # Jobs
+    "AnalyticsPartitionJob",
+    "AnalyticsRollupJob",
     "CleanupJob",
     "DiscoveryJob",
     "EmbeddingsJob",
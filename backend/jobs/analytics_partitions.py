@@ -0,0 +1,81 @@
+"""Analytics partitions job.
+
+Rotates the monthly partitions of analytics_events:
+- Creates this month's partition and ANALYTICS_PARTITION_MONTHS_AHEAD more
+  (moving any of their events out of the DEFAULT partition, where inserts
+  land while the job is behind)
+- Drops partitions older than ANALYTICS_RETENTION_MONTHS
+
+Dropping a partition replaces row-by-row DELETEs for retention. Runs
+daily; the dashboard keeps older history in its rollups.
+"""
+
+from typing import Any
+
+from sqlmodel import Session
+
+from app.services.analytics_partitions import AnalyticsPartitionService
+from jobs.base import BaseJob
+
+
+class AnalyticsPartitionJob(BaseJob):
+    """Job to create upcoming and drop expired analytics_events partitions."""
+
+    @property
+    def name(self) -> str:
+        return "analytics_partitions"
+
+    @property
+    def description(self) -> str:
+        return "Create upcoming analytics event partitions and drop expired ones"
+
+    def execute(
+        self,
+        session: Session,
+        retention_months: int | None = None,
+        dry_run: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run the partition job.
+
+        Args:
+            session: Database session.
+            retention_months: Months of raw events to keep (default: ANALYTICS_RETENTION_MONTHS).
+            dry_run: If True, list expired partitions but don't drop them.
+            **kwargs: Additional arguments (ignored).
+
+        Returns:
+            Statistics dictionary with created and dropped partitions.
+        """
+        partitions = AnalyticsPartitionService(session)
+
+        if not partitions.is_partitioned():
+            self._log("analytics_events is not partitioned; run the database migrations", level="warning")
+            return {"partitioned": False, "created": [], "dropped": [], "dry_run": dry_run}
+
+        created = partitions.ensure_partitions()
+        if created:
+            self._log(f"Created partitions: {', '.join(created)}")
+
+        expired = partitions.expired_partitions(retention_months)
+        if expired and not dry_run:
+            partitions.drop_partitions(expired)
+            self._log(f"Dropped partitions: {', '.join(expired)}")
+
+        stats: dict[str, Any] = {
+            "partitioned": True,
+            "created": created,
+            "dropped": [] if dry_run else expired,
+            "expired": expired,
+            "dry_run": dry_run,
+        }
+
+        return stats
+
+    def _format_message(self, stats: dict[str, Any]) -> str:
+        """Format partition statistics into a message."""
+        if not stats.get("partitioned"):
+            return "analytics_events is not partitioned"
+        if stats.get("dry_run"):
+            return f"Dry run: created {len(stats['created'])} partitions, would drop {len(stats['expired'])}"
+        return f"Created {len(stats['created'])} partitions, dropped {len(stats['dropped'])}"
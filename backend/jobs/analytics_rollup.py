@@ -0,0 +1,120 @@
+"""Analytics rollup job.
+
+Maintains the rollups the analytics dashboard reads
+(analytics_daily_aggregates) incrementally:
+- A day row for every completed day that doesn't have one yet
+- An hour row for every completed hour of the current day
+- Hour rows of earlier days are dropped once their day row exists
+
+Each bucket is computed from the events in its range once it has closed,
+and recomputed by every run while it ended less than ROLLUP_REFRESH ago:
+events are stamped when the request arrives but can reach the table later
+(held in a worker's analytics buffer through failed flushes), and the
+dashboard's raw tail only reads after the last bucket. A run therefore
+reads the events since the previous run plus the last ROLLUP_REFRESH.
+Runs hourly by default.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlmodel import Session
+
+from app.services.analytics import PERIOD_DAY, PERIOD_HOUR, PERIOD_SPANS, AnalyticsService
+from jobs.base import BaseJob
+
+# A bucket is rolled up once it ended at least this long ago (buffered events are normally flushed by then)
+ROLLUP_LAG = timedelta(minutes=2)
+
+# Buckets that ended less than this long ago are recomputed to pick up late-written events
+ROLLUP_REFRESH = timedelta(hours=3)
+
+
+class AnalyticsRollupJob(BaseJob):
+    """Job to roll up analytics events into day and hour aggregates."""
+
+    # Oldest day rolled up when backfilling
+    BACKFILL_DAYS = 365
+
+    @property
+    def name(self) -> str:
+        return "analytics_rollup"
+
+    @property
+    def description(self) -> str:
+        return "Roll up analytics events into daily and hourly aggregates"
+
+    def execute(
+        self,
+        session: Session,
+        backfill_days: int | None = None,
+        now: datetime | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Run the rollup job.
+
+        Args:
+            session: Database session.
+            backfill_days: Days back to fill in missing day rollups (default: 365).
+            now: Current time (for tests).
+            **kwargs: Additional arguments (ignored).
+
+        Returns:
+            Statistics dictionary with rollup counts.
+        """
+        backfill_days = backfill_days or self.BACKFILL_DAYS
+        closed_until = (now or datetime.now(UTC)) - ROLLUP_LAG
+        refresh_after = closed_until - ROLLUP_REFRESH
+        today = closed_until.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        analytics = AnalyticsService(session)
+
+        # Completed days without a day row (or recently closed), from the first event (or the backfill limit)
+        days: list[datetime] = []
+        first_event = analytics.first_event_at()
+        if first_event is not None:
+            start = max(
+                today - timedelta(days=backfill_days),
+                first_event.replace(hour=0, minute=0, second=0, microsecond=0),
+            )
+            days_done = analytics.rollup_dates(PERIOD_DAY, start)
+            day_span = PERIOD_SPANS[PERIOD_DAY]
+            days = [
+                day
+                for day in (start + day_span * n for n in range((today - start).days))
+                if day not in days_done or day + day_span > refresh_after
+            ]
+
+        for day in days:
+            analytics.rollup(day, PERIOD_DAY)
+        if days:
+            self._log(f"Rolled up {len(days)} days ({days[0].date()} to {days[-1].date()})")
+
+        # Completed hours of today without an hour row (or recently closed)
+        hours_done = analytics.rollup_dates(PERIOD_HOUR, today)
+        hour_span = PERIOD_SPANS[PERIOD_HOUR]
+        hours = [
+            hour
+            for hour in (today + hour_span * n for n in range(24))
+            if hour + hour_span <= closed_until and (hour not in hours_done or hour + hour_span > refresh_after)
+        ]
+        for hour in hours:
+            analytics.rollup(hour, PERIOD_HOUR)
+
+        # Earlier days are covered by their day rows now
+        hours_deleted = analytics.delete_hour_rollups(before=today)
+
+        stats: dict[str, Any] = {
+            "days_rolled_up": len(days),
+            "hours_rolled_up": len(hours),
+            "hour_rollups_deleted": hours_deleted,
+        }
+
+        return stats
+
+    def _format_message(self, stats: dict[str, Any]) -> str:
+        """Format rollup statistics into a message."""
+        return (
+            f"Rolled up {stats['days_rolled_up']} days and {stats['hours_rolled_up']} hours, "
+            f"dropped {stats['hour_rollups_deleted']} superseded hour rollups"
+        )
@@ -13,12 +13,13 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.models import Organization, Resource, Source
 from app.models.resource import ResourceScope, ResourceStatus
 from app.models.review import ReviewState, ReviewStatus
 from app.models.source import HealthStatus, SourceType
+from etl.dedupe_index import DedupeIndex, Fingerprint
 from jobs.base import BaseJob
 from llm import ClaudeClient, ClaudeModel
 
@@ -157,6 +158,10 @@ class DiscoveryJob(BaseJob):
         if not all_candidates:
             return self._format_stats(stats)
 
+        dedupe_index = DedupeIndex(session)
+        if not dry_run:
+            dedupe_index.refresh()
+
         # Stage 2: Validation with Sonnet
         validated: list[ValidatedCandidate] = []
         if skip_validation:
@@ -171,9 +176,10 @@ class DiscoveryJob(BaseJob):
                     )
                 )
         else:
-            for candidate in all_candidates:
+            duplicates = self._find_duplicates(session, dedupe_index, all_candidates)
+            for candidate, is_duplicate in zip(all_candidates, duplicates, strict=True):
                 try:
-                    result = self._validate_candidate(claude, candidate, session, stats)
+                    result = self._validate_candidate(claude, candidate, is_duplicate, stats)
                     validated.append(result)
                     stats.validated += 1
                 except Exception as e:
@@ -193,12 +199,13 @@ class DiscoveryJob(BaseJob):
         # Stage 3: Routing and import
         for candidate in validated:
             try:
-                self._route_candidate(session, source, candidate, stats, dry_run)
+                self._route_candidate(session, source, candidate, stats, dry_run, dedupe_index)
             except Exception as e:
                 stats.errors.append(f"Import error: {str(e)}")
                 self._log(f"Import failed: {e}", level="error")
 
         if not dry_run:
+            dedupe_index.flush()
             session.commit()
 
         self._log(
@@ -278,7 +285,7 @@ class DiscoveryJob(BaseJob):
         self,
         claude: ClaudeClient,
         candidate: dict[str, Any],
-        session: Session,
+        is_duplicate: bool,
         stats: DiscoveryStats,
     ) -> ValidatedCandidate:
         """Validate a discovered candidate.
@@ -286,14 +293,13 @@ class DiscoveryJob(BaseJob):
         Args:
             claude: Claude client.
             candidate: The candidate data to validate.
-            session: Database session for duplicate checking.
+            is_duplicate: Whether the candidate duplicates an existing resource.
             stats: Stats object to update token counts.
 
         Returns:
             ValidatedCandidate with validation results.
         """
-        # Check for duplicates first
-        is_duplicate = self._check_duplicate(session, candidate)
+        # Skip duplicates before spending a validation call
         if is_duplicate:
             stats.duplicates_skipped += 1
             return ValidatedCandidate(
@@ -347,34 +353,53 @@ class DiscoveryJob(BaseJob):
                 validation_notes="Failed to parse validation response",
             )
 
-    def _check_duplicate(self, session: Session, candidate: dict[str, Any]) -> bool:
-        """Check if a candidate is a duplicate of existing resources.
+    def _find_duplicates(
+        self, session: Session, dedupe_index: DedupeIndex, candidates: list[dict[str, Any]]
+    ) -> list[bool]:
+        """Check which candidates duplicate existing resources.
+
+        One query for source URLs and one dedupe index lookup for the
+        fingerprints of candidates that have a name and organization.
 
         Args:
             session: Database session.
-            candidate: The candidate to check.
+            dedupe_index: Dedupe index for this run.
+            candidates: The candidates to check.
 
         Returns:
-            True if this is a duplicate.
+            True for each candidate that is a duplicate.
         """
         # Check by source URL
-        source_url = candidate.get("source_url") or candidate.get("website")
-        if source_url:
-            stmt = select(Resource).where(Resource.source_url == source_url)
-            if session.exec(stmt).first():
-                return True
-
-        # Check by name + organization
-        name = candidate.get("name") or candidate.get("title")
-        org = candidate.get("organization") or candidate.get("org_name")
-        if name and org:
-            # Simple name matching - could be enhanced with fuzzy matching
-            stmt = select(Resource).where(Resource.title == name)
-            for resource in session.exec(stmt):
-                if resource.organization and resource.organization.name == org:
-                    return True
-
-        return False
+        urls = [candidate.get("source_url") or candidate.get("website") for candidate in candidates]
+        known_urls = set()
+        if any(urls):
+            stmt = select(Resource.source_url).where(col(Resource.source_url).in_({url for url in urls if url}))
+            known_urls = set(session.exec(stmt).all())
+
+        # Check by fingerprint (name + organization, phone, address)
+        fingerprints = {i: fp for i, candidate in enumerate(candidates) if (fp := self._fingerprint(candidate))}
+        matches = dict(zip(fingerprints, dedupe_index.find(list(fingerprints.values())), strict=True))
+
+        return [bool(url and url in known_urls) or matches.get(i) is not None for i, url in enumerate(urls)]
+
+    def _fingerprint(self, data: dict[str, Any]) -> Fingerprint | None:
+        """Fingerprint candidate data, or None without a name and organization."""
+        name = data.get("name") or data.get("title")
+        org = data.get("organization") or data.get("org_name")
+        if not (name and org):
+            return None
+        states = data.get("states") or []
+        if isinstance(states, str):
+            states = [states]
+        return Fingerprint.of(
+            title=name,
+            org_name=org,
+            phone=data.get("phone"),
+            address=data.get("address"),
+            city=data.get("city"),
+            state=data.get("state") or (states[0] if len(states) == 1 else None),
+            zip_code=data.get("zip_code"),
+        )
 
     def _route_candidate(
         self,
@@ -383,6 +408,7 @@ class DiscoveryJob(BaseJob):
         candidate: ValidatedCandidate,
         stats: DiscoveryStats,
         dry_run: bool,
+        dedupe_index: DedupeIndex | None = None,
     ) -> None:
         """Route a validated candidate based on confidence.
 
@@ -392,6 +418,7 @@ class DiscoveryJob(BaseJob):
             candidate: The validated candidate.
             stats: Stats object to update.
             dry_run: If True, don't persist changes.
+            dedupe_index: Records the new resource's fingerprint, if given.
         """
         data = candidate.data
 
@@ -412,6 +439,9 @@ class DiscoveryJob(BaseJob):
 
         # Create resource
         resource = self._create_resource(session, source, org, data, candidate)
+        fingerprint = self._fingerprint(data)
+        if dedupe_index and fingerprint:
+            dedupe_index.add(resource, fingerprint)
 
         if candidate.should_auto_approve:
             # Auto-approve: set status to active
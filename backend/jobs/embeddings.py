@@ -1,23 +1,76 @@
 """Embedding generation job for semantic search.
 
-Generates vector embeddings for resources that don't have them yet.
-Uses local SentenceTransformers (free) or OpenAI API based on config.
+Generates vector embeddings for resources that don't have them yet, and
+re-embeds resources whose text or embedding model changed since their
+vector was generated. Uses local SentenceTransformers (free) or OpenAI API
+based on config.
+
+Resources are streamed in keyset-paginated chunks (by id). Each row's
+embedding text is hashed and compared with the stored embedding_text_hash
+and embedding_model; rows that need a new vector are encoded with one batch
+call per chunk and written back with a single bulk UPDATE, so memory stays
+bounded by the chunk size.
 """
 
+import time
 from typing import Any
+from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import Row
+from sqlmodel import Session, text
 
-from app.models import Resource
 from app.models.resource import ResourceStatus
 from jobs.base import BaseJob
 
+# Next chunk of resources to check, after the last id of the previous chunk
+CHUNK_SQL = """
+    SELECT r.id, r.title, r.description, r.summary, r.eligibility, r.categories, r.tags,
+           r.embedding IS NULL AS missing_embedding, r.embedding_text_hash, r.embedding_model
+    FROM resources r
+    WHERE r.status = :active_status
+      AND r.id > :after_id
+    ORDER BY r.id
+    LIMIT :limit
+"""
+
+# One UPDATE per chunk; embeddings are bound as float8[] and cast to vector
+BULK_UPDATE_SQL = """
+    UPDATE resources AS r
+    SET embedding = CAST(v.embedding AS vector),
+        embedding_text_hash = v.text_hash,
+        embedding_model = v.model
+    FROM (VALUES {values}) AS v(id, embedding, text_hash, model)
+    WHERE r.id = v.id
+"""
+
+# Lower bound for keyset pagination over UUID primary keys
+MIN_UUID = UUID(int=0)
+
+# Why a resource is (re-)embedded
+REASON_MISSING = "missing"  # No vector yet
+REASON_TEXT_CHANGED = "text_changed"  # Embedded text was edited
+REASON_MODEL_CHANGED = "model_changed"  # Vector from another model, or from before hashes were tracked
+REASON_REEMBED = "reembed"  # Forced full re-embed
+
+
+def embedding_reason(row: Row, text_hash: str, model: str) -> str | None:
+    """Return why ``row`` needs a new embedding, or None if its vector is current."""
+    if row.missing_embedding:
+        return REASON_MISSING
+    if row.embedding_model != model or row.embedding_text_hash is None:
+        return REASON_MODEL_CHANGED
+    if row.embedding_text_hash != text_hash:
+        return REASON_TEXT_CHANGED
+    return None
+
 
 class EmbeddingsJob(BaseJob):
     """Job to generate embeddings for resources.
 
-    Processes resources without embeddings in batches to avoid API rate limits.
-    Can be run manually or scheduled for incremental updates.
+    Processes resources in chunks, one model call per chunk. Missing and
+    edited resources are always embedded; vectors from a previous model are
+    replaced at most ``rolling_limit`` per run so a model switch rolls out
+    over several runs instead of all at once.
     """
 
     @property
@@ -29,92 +82,176 @@ class EmbeddingsJob(BaseJob):
         return "Generate vector embeddings for resources"
 
     def execute(self, session: Session, **kwargs: Any) -> dict[str, Any]:
-        """Generate embeddings for resources without them.
+        """Generate embeddings for resources that are missing or out of date.
 
         Args:
             session: Database session.
             **kwargs: Optional arguments:
-                - batch_size: Number of resources per batch (default 50)
-                - max_resources: Maximum resources to process (default None = all)
+                - batch_size: Number of resources per chunk (default 256)
+                - max_resources: Maximum resources to embed (default None = all)
+                - reembed: Re-embed every active resource (default False)
+                - rolling_limit: Maximum model-changed resources to re-embed
+                  (default settings.embeddings_rolling_limit)
 
         Returns:
-            Statistics dictionary with processed, failed, skipped counts.
+            Statistics dictionary with processed, failed, skipped counts,
+            counts per reason and throughput.
         """
-        from app.services.embedding import get_embedding_service
-
-        batch_size = kwargs.get("batch_size", 50)
-        max_resources = kwargs.get("max_resources")
-
-        # Get resources without embeddings
-        stmt = (
-            select(Resource)
-            .where(Resource.status == ResourceStatus.ACTIVE)
-            .where(Resource.embedding.is_(None))
-            .order_by(Resource.updated_at.desc())
+        from app.config import settings
+        from app.services.embedding import (
+            embedding_text_hash,
+            get_embedding_model_name,
+            get_embedding_service,
+            prepare_resource_text,
         )
 
-        if max_resources:
-            stmt = stmt.limit(max_resources)
-
-        resources = session.exec(stmt).all()
-        total = len(resources)
-
-        if total == 0:
-            self._log("No resources need embeddings")
-            return {"processed": 0, "failed": 0, "skipped": 0, "total": 0}
-
-        self._log(f"Found {total} resources without embeddings")
+        batch_size = kwargs.get("batch_size", 256)
+        max_resources = kwargs.get("max_resources")
+        reembed = kwargs.get("reembed", False)
+        rolling_limit = kwargs.get("rolling_limit", settings.embeddings_rolling_limit)
 
-        # Initialize embedding service (uses local or OpenAI based on config)
-        embedding_service = get_embedding_service()
+        model = get_embedding_model_name()
+        sql = text(CHUNK_SQL)
+        embedding_service = None
 
         processed = 0
         failed = 0
+        skipped = 0
         tokens_used = 0
+        chunks = 0
+        reasons = {REASON_MISSING: 0, REASON_TEXT_CHANGED: 0, REASON_MODEL_CHANGED: 0, REASON_REEMBED: 0}
+        after_id = MIN_UUID
+        started = time.perf_counter()
 
-        # Process in batches
-        for i in range(0, total, batch_size):
-            batch = resources[i : i + batch_size]
-            self._log(f"Processing batch {i // batch_size + 1} ({len(batch)} resources)")
+        while not max_resources or processed + failed < max_resources:
+            rows = session.execute(
+                sql,
+                {"active_status": ResourceStatus.ACTIVE.name, "after_id": after_id, "limit": batch_size},
+            ).all()
+            if not rows:
+                break
+            after_id = rows[-1].id
 
-            for resource in batch:
-                try:
-                    # Generate embedding
-                    result = embedding_service.generate_resource_embedding(resource)
+            # Pick the rows that need a new vector
+            pending: list[tuple[Row, str, str]] = []
+            for row in rows:
+                if max_resources and processed + failed + len(pending) >= max_resources:
+                    break
+                resource_text = prepare_resource_text(row)
+                text_hash = embedding_text_hash(resource_text)
+                reason = REASON_REEMBED if reembed else embedding_reason(row, text_hash, model)
+                if reason is None or (
+                    reason == REASON_MODEL_CHANGED and reasons[REASON_MODEL_CHANGED] >= rolling_limit
+                ):
+                    skipped += 1
+                    continue
+                reasons[reason] += 1
+                pending.append((row, resource_text, text_hash))
 
-                    # Update resource with embedding
-                    resource.embedding = result.embedding
-                    session.add(resource)
+            if not pending:
+                continue
+            chunks += 1
 
-                    processed += 1
-                    tokens_used += result.tokens_used
+            # Initialize embedding service (uses local or OpenAI based on config)
+            if embedding_service is None:
+                embedding_service = get_embedding_service()
 
-                except Exception as e:
-                    self._log(f"Failed to generate embedding for {resource.id}: {e}", "error")
-                    failed += 1
-
-            # Commit batch
+            embeddings, chunk_tokens = self._encode_chunk(embedding_service, pending)
+            if embeddings:
+                self._write_embeddings(session, embeddings, model)
             session.commit()
-            self._log(f"Committed batch, processed {processed}/{total}")
 
+            processed += len(embeddings)
+            failed += len(pending) - len(embeddings)
+            tokens_used += chunk_tokens
+
+            elapsed = time.perf_counter() - started
+            self._log(
+                f"Chunk {chunks}: {len(embeddings)}/{len(pending)} embedded, "
+                f"{processed} total ({processed / elapsed:.1f} resources/sec)"
+            )
+
+        total = processed + failed
+        if total == 0:
+            self._log("No resources need embeddings")
+            return {"processed": 0, "failed": 0, "skipped": skipped, "total": 0}
+
+        elapsed = time.perf_counter() - started
         return {
             "processed": processed,
             "failed": failed,
+            "skipped": skipped,
             "total": total,
+            **{reason: count for reason, count in reasons.items() if count},
             "tokens_used": tokens_used,
+            "chunks": chunks,
+            "elapsed_seconds": round(elapsed, 2),
+            "resources_per_second": round(processed / elapsed, 1) if elapsed else None,
         }
 
+    def _encode_chunk(
+        self, embedding_service: Any, pending: list[tuple[Row, str, str]]
+    ) -> tuple[dict[UUID, tuple[list[float], str]], int]:
+        """Encode a chunk of (row, text, text hash) in one batch call.
+
+        If the batch call fails, resources are retried one at a time so a
+        single bad input does not fail the whole chunk.
+
+        Returns:
+            Tuple of ((embedding, text hash) by resource id, tokens used)
+        """
+        texts = [resource_text for _, resource_text, _ in pending]
+        try:
+            results = embedding_service.generate_batch_embeddings(texts)
+            return (
+                {
+                    row.id: (result.embedding, text_hash)
+                    for (row, _, text_hash), result in zip(pending, results, strict=True)
+                },
+                sum(result.tokens_used for result in results),
+            )
+        except Exception as e:
+            self._log(f"Batch encoding failed, retrying chunk one at a time: {e}", "warning")
+
+        embeddings: dict[UUID, tuple[list[float], str]] = {}
+        tokens_used = 0
+        for row, resource_text, text_hash in pending:
+            try:
+                result = embedding_service.generate_embedding(resource_text)
+                embeddings[row.id] = (result.embedding, text_hash)
+                tokens_used += result.tokens_used
+            except Exception as e:
+                self._log(f"Failed to generate embedding for {row.id}: {e}", "error")
+        return embeddings, tokens_used
+
+    def _write_embeddings(self, session: Session, embeddings: dict[UUID, tuple[list[float], str]], model: str) -> None:
+        """Write a chunk of embeddings and their provenance with a single UPDATE ... FROM (VALUES ...)."""
+        params: dict[str, Any] = {"model": model}
+        values = []
+        for i, (resource_id, (embedding, text_hash)) in enumerate(embeddings.items()):
+            params[f"id_{i}"] = resource_id
+            params[f"embedding_{i}"] = [float(x) for x in embedding]
+            params[f"hash_{i}"] = text_hash
+            values.append(
+                f"(CAST(:id_{i} AS uuid), CAST(:embedding_{i} AS float8[]), CAST(:hash_{i} AS varchar), "
+                "CAST(:model AS varchar))"
+            )
+        session.execute(text(BULK_UPDATE_SQL.format(values=", ".join(values))), params)
+
 
-def run_embeddings_job(batch_size: int = 50, max_resources: int | None = None) -> dict[str, Any]:
+def run_embeddings_job(
+    batch_size: int = 256, max_resources: int | None = None, reembed: bool = False
+) -> dict[str, Any]:
     """Convenience function to run the embeddings job.
 
     Args:
-        batch_size: Number of resources per batch.
-        max_resources: Maximum resources to process (None = all).
+        batch_size: Number of resources per chunk.
+        max_resources: Maximum resources to embed (None = all).
+        reembed: Re-embed every active resource, not just missing or stale ones.
 
     Returns:
         Job result dictionary.
     """
     job = EmbeddingsJob()
-    result = job.run(batch_size=batch_size, max_resources=max_resources)
+    result = job.run(batch_size=batch_size, max_resources=max_resources, reembed=reembed)
     return result.to_dict()
@@ -2,7 +2,8 @@
 
 Updates freshness scores for all active resources based on
 time since last verification. Runs more frequently than the
-full refresh job (e.g., hourly) to keep trust scores accurate.
+full refresh job (e.g., hourly) to keep trust scores accurate,
+then refreshes the resource stats snapshot.
 """
 
 from typing import Any
@@ -11,6 +12,7 @@ from sqlmodel import Session, func, select
 
 from app.models import Resource
 from app.models.resource import ResourceStatus
+from app.services.stats import StatsService
 from app.services.trust import TrustService
 from jobs.base import BaseJob
 
@@ -60,6 +62,13 @@ class FreshnessJob(BaseJob):
         # Get count of stale resources (< 30 days)
         stale_count = len(trust_service.get_stale_resources(days=30))
 
+        # Recompute the About page stats (average trust score depends on freshness)
+        try:
+            StatsService(session).refresh()
+        except Exception as e:
+            session.rollback()
+            self._log(f"Failed to refresh resource stats: {e}", level="warning")
+
         stats: dict[str, Any] = {
             "total_active": total_active,
             "updated": updated_count,
@@ -11,6 +11,8 @@ from typing import Any
 
 from sqlmodel import Session
 
+from app.config import settings
+from app.services.stats import StatsService
 from connectors import (
     AmericanLegionPostsConnector,
     ApprenticeshipConnector,
@@ -61,6 +63,7 @@ from connectors import (
 )
 from connectors.base import BaseConnector
 from etl import ETLPipeline
+from etl.geocoder import CensusGeocoder
 from jobs.base import BaseJob
 
 # Registry of available connectors
@@ -169,13 +172,17 @@ class RefreshJob(BaseJob):
 
         self._log(f"Running {len(connectors)} connector(s)")
 
-        # Create ETL pipeline
-        pipeline = ETLPipeline(session=session)
+        # Create ETL pipeline (cached Census geocoding; unchanged addresses make no API calls)
+        geocoder = CensusGeocoder(session) if settings.etl_census_geocoder else None
+        pipeline = ETLPipeline(session=session, geocoder=geocoder)
 
         # Run pipeline
         if dry_run:
             self._log("Running in dry-run mode (no database changes)")
             result = pipeline.dry_run(connectors)
+        elif settings.etl_stream_chunk_size:
+            # Bounded memory: dedupe/enrich/load in chunks as connectors stream
+            result = pipeline.run_streaming(connectors, chunk_size=settings.etl_stream_chunk_size)
         else:
             result = pipeline.run(connectors)
 
@@ -196,6 +203,8 @@ class RefreshJob(BaseJob):
             "skipped": result.stats.skipped,
             "failed": result.stats.failed,
             "errors": len(result.errors),
+            "extract_seconds": result.stats.extract_seconds,
+            "connector_seconds": result.stats.connector_seconds,
             "duration_seconds": (
                 (result.completed_at - result.started_at).total_seconds() if result.completed_at else None
             ),
@@ -205,6 +214,14 @@ class RefreshJob(BaseJob):
         for error in result.errors:
             self._log(f"ETL error in {error.stage}: {error.message}", level="warning")
 
+        # Recompute the About page stats for the refreshed corpus
+        if not dry_run:
+            try:
+                StatsService(session).refresh()
+            except Exception as e:
+                session.rollback()
+                self._log(f"Failed to refresh resource stats: {e}", level="warning")
+
         return stats
 
     def _get_connectors(self, connector_name: str | None = None) -> list[BaseConnector]:
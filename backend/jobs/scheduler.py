@@ -140,7 +140,7 @@ class JobScheduler:
         job = self.jobs[job_name]
 
         # Run in executor to avoid blocking the event loop
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(None, lambda: job.run(**kwargs))
 
         self.history.append(result)
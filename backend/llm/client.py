@@ -80,7 +80,10 @@ class ClaudeClient:
         key = api_key or settings.anthropic_api_key
         if not key:
             raise ValueError("ANTHROPIC_API_KEY not configured. Set it in .env or pass api_key parameter.")
+        self.api_key = key
         self.client = anthropic.Anthropic(api_key=key)
+        # Created once so acomplete() calls share one connection pool
+        self.async_client = anthropic.AsyncAnthropic(api_key=key)
 
     def complete(
         self,
@@ -102,6 +105,35 @@ class ClaudeClient:
         Returns:
             ClaudeResponse with the model's response.
         """
+        response = self.client.messages.create(**self._request(prompt, model, max_tokens, temperature, system))
+        return self._to_response(response)
+
+    async def acomplete(
+        self,
+        prompt: str,
+        model: ClaudeModel = ClaudeModel.HAIKU,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system: str | None = None,
+    ) -> ClaudeResponse:
+        """Async version of complete() for use in async endpoints.
+
+        Awaits the API round trip instead of blocking the event loop.
+        """
+        response = await self.async_client.messages.create(
+            **self._request(prompt, model, max_tokens, temperature, system)
+        )
+        return self._to_response(response)
+
+    def _request(
+        self,
+        prompt: str,
+        model: ClaudeModel,
+        max_tokens: int,
+        temperature: float,
+        system: str | None,
+    ) -> dict[str, Any]:
+        """Build messages.create() arguments."""
         messages = [{"role": "user", "content": prompt}]
 
         kwargs: dict[str, Any] = {
@@ -114,8 +146,10 @@ class ClaudeClient:
         if system:
             kwargs["system"] = system
 
-        response = self.client.messages.create(**kwargs)
+        return kwargs
 
+    def _to_response(self, response: Any) -> ClaudeResponse:
+        """Convert an API message into a ClaudeResponse."""
         # Extract text content
         content = ""
         for block in response.content:
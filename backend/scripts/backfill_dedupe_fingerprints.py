@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Fingerprint existing resources for database-aware dedupe.
+
+The ETL loader, 211 importer and discovery job match incoming records
+against resource_fingerprints. Resources written before that table
+existed have no fingerprint; this script adds them, and refreshes those
+changed since their fingerprint was written (import runs do the same
+when they start). Runs idempotently - only resources without a current
+fingerprint are processed.
+
+Usage:
+    python scripts/backfill_dedupe_fingerprints.py [--batch-size 1000]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, create_engine
+
+from app.config import settings
+from etl.dedupe_index import DedupeIndex
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fingerprint existing resources for dedupe")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Resources per commit")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    engine = create_engine(settings.database_url, echo=False)
+    with Session(engine) as session:
+        total = DedupeIndex(session).backfill(batch_size=args.batch_size)
+    print(f"Fingerprinted {total} resources")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark HNSW recall vs. latency for hnsw.ef_search settings.
+
+For a set of random query vectors, computes the exact top-K neighbours with
+a sequential scan (index scans disabled) and compares them with the
+approximate top-K returned by the HNSW index at each ef_search value.
+Reports recall@K and median/p95 latency so the ann_ef_search_* tiers in
+app/config.py can be chosen from data.
+
+Queries run against existing embeddings. With --synthetic N, N random
+embedded resources are inserted first; everything runs in one transaction
+that is rolled back at the end, so the database is left untouched.
+
+Usage:
+    python scripts/benchmark_ann_recall.py [--k 20] [--queries 50] [--synthetic 100000]
+        [--ef 10,20,40,100,200,400] [--category housing]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, create_engine, text
+
+from app.config import settings
+from app.models import Organization
+from app.models.resource import EMBEDDING_DIMENSION
+
+INSERT_SQL = """
+    INSERT INTO resources (
+        id, organization_id, title, description, categories, subcategories, tags,
+        scope, states, languages, freshness_score, reliability_score, status,
+        created_at, updated_at, embedding
+    )
+    SELECT gen_random_uuid(), :org_id, 'Synthetic resource ' || g.i, 'Synthetic benchmark resource',
+           ARRAY[(ARRAY['housing','employment','legal','food','benefits'])[1 + g.i % 5]]::text[],
+           ARRAY[]::text[], ARRAY[]::text[], 'NATIONAL', ARRAY[]::text[], ARRAY['en']::text[],
+           1.0, 0.5, 'ACTIVE', now(), now(),
+           ARRAY(SELECT random() FROM generate_series(1, {dim}) WHERE g.i IS NOT NULL)::vector
+    FROM generate_series(:start, :stop - 1) AS g(i)
+"""
+
+TOP_K_SQL = """
+    SELECT r.id
+    FROM resources r
+    WHERE r.status = 'ACTIVE' AND r.embedding IS NOT NULL {filters}
+    ORDER BY r.embedding <=> CAST(:embedding AS vector)
+    LIMIT :k
+"""
+
+
+def _insert_synthetic(session: Session, count: int) -> None:
+    """Insert ``count`` random embedded resources inside the current transaction."""
+    org = Organization(name="ANN Benchmark Organization")
+    session.add(org)
+    session.flush()
+    sql = text(INSERT_SQL.format(dim=EMBEDDING_DIMENSION))
+    step = 50_000
+    for start in range(0, count, step):
+        session.execute(sql, {"org_id": str(org.id), "start": start, "stop": min(start + step, count)})
+    session.execute(text("ANALYZE resources"))
+
+
+def _top_k(session: Session, sql: str, embedding: str, k: int, category: str | None) -> set:
+    params = {"embedding": embedding, "k": k}
+    if category:
+        params["category"] = category
+    return {row.id for row in session.execute(text(sql), params)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HNSW recall vs. ef_search")
+    parser.add_argument("--k", type=int, default=20, help="Neighbours per query")
+    parser.add_argument("--queries", type=int, default=50, help="Random query vectors")
+    parser.add_argument("--ef", default="10,20,40,100,200,400", help="Comma-separated ef_search values")
+    parser.add_argument("--synthetic", type=int, default=0, help="Insert N synthetic resources first")
+    parser.add_argument("--category", default=None, help="Benchmark a filtered query on this category")
+    args = parser.parse_args()
+
+    ef_values = [int(v) for v in args.ef.split(",")]
+    filters = " AND r.categories @> ARRAY[:category]::text[]" if args.category else ""
+    sql = TOP_K_SQL.format(filters=filters)
+    engine = create_engine(settings.database_url, echo=False)
+
+    with Session(engine) as session:
+        try:
+            if args.synthetic:
+                _insert_synthetic(session, args.synthetic)
+
+            queries = [
+                "[" + ",".join(str(random.random()) for _ in range(EMBEDDING_DIMENSION)) + "]"
+                for _ in range(args.queries)
+            ]
+
+            # Ground truth: exact distances via sequential scan
+            session.execute(text("SET LOCAL enable_indexscan = off"))
+            exact = [_top_k(session, sql, q, args.k, args.category) for q in queries]
+            session.execute(text("SET LOCAL enable_indexscan = on"))
+
+            print(f"{'ef_search':>10}  {'recall@' + str(args.k):>10}  {'median ms':>10}  {'p95 ms':>10}")
+            for ef in ef_values:
+                session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef)}"))
+                recalls = []
+                latencies = []
+                for query, truth in zip(queries, exact, strict=True):
+                    started = time.perf_counter()
+                    found = _top_k(session, sql, query, args.k, args.category)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    if truth:
+                        recalls.append(len(found & truth) / len(truth))
+                latencies.sort()
+                p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+                recall = statistics.mean(recalls) if recalls else 0.0
+                print(f"{ef:>10}  {recall:>10.3f}  {statistics.median(latencies):>10.1f}  {p95:>10.1f}")
+        finally:
+            session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Benchmark ETL deduplication on synthetic records with known duplicates.
+
+Generates N records shaped like the large connectors: a few national orgs
+with thousands of locationless entries (food banks, VFW posts), many
+small local orgs, and duplicate copies from other sources with reordered
+or pluralized titles, different case and org name variants ("Inc.",
+"(DAV)"). Every record carries the id of the real-world resource it
+describes, so the output can be scored:
+
+- false merges: distinct resources that vanished into another one
+- missed duplicates: extra copies left in the output
+
+The current Deduplicator runs on all N records. The previous engine
+(exact org|location groups, pairwise SequenceMatcher) is quadratic in
+group size, so it only runs on the first --legacy-sample records, where
+both engines are scored on the same input.
+
+No database is needed.
+
+Usage:
+    python scripts/benchmark_dedupe.py [--records 200000] [--legacy-sample 20000]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from etl.dedupe import Deduplicator
+from etl.models import NormalizedResource
+
+NATIONAL_ORGS = ["Feeding America", "VFW", "American Legion", "Disabled American Veterans"]
+ORG_VARIANTS = {
+    "Feeding America": "Feeding America, Inc.",
+    "Disabled American Veterans": "Disabled American Veterans (DAV)",
+}
+SERVICES = [
+    "Food Pantry",
+    "Food Bank",
+    "Emergency Financial Assistance",
+    "Legal Aid Clinic",
+    "Housing Assistance Program",
+    "Employment Services",
+    "Mobile Food Distribution",
+    "Benefits Counseling",
+]
+SYLLABLES = [
+    "ad",
+    "am",
+    "bar",
+    "ber",
+    "cal",
+    "clin",
+    "dane",
+    "es",
+    "flo",
+    "grant",
+    "ha",
+    "le",
+    "mon",
+    "ro",
+    "ton",
+    "wood",
+]
+PLACES = [f"{a}{b}{c}".title() for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+WORDS = ["veterans", "family", "community", "regional", "support", "outreach", "resource", "center"]
+
+
+def _vary_title(title: str, rng: random.Random) -> str:
+    words = title.split()
+    change = rng.randrange(3)
+    if change == 0:
+        return title.upper()
+    if change == 1 and len(words) > 2:
+        return " ".join(words[1:] + words[:1])
+    return " ".join(w + "s" if rng.random() < 0.3 and len(w) > 3 and not w.endswith("s") else w for w in words)
+
+
+def generate(n: int, seed: int = 42) -> list[NormalizedResource]:
+    """Return n records, ~20% of them extra copies of another record."""
+    rng = random.Random(seed)
+    records: list[NormalizedResource] = []
+    originals: list[NormalizedResource] = []
+    national_titles: set[tuple[str, str]] = set()
+    entity = 0
+    while len(records) < n:
+        if originals and rng.random() < 0.2:
+            source = rng.choice(originals)
+            org = ORG_VARIANTS.get(source.org_name, source.org_name) if rng.random() < 0.5 else source.org_name
+            record = copy.copy(source)
+            record.title = _vary_title(source.title, rng)
+            record.org_name = org
+            record.source_url = f"https://dup.example.com/{len(records)}"
+            record.source_tier = rng.randint(1, 4)
+            record.raw_data = dict(source.raw_data or {})
+            records.append(record)
+            continue
+
+        entity += 1
+        if rng.random() < 0.5:
+            org = rng.choice(NATIONAL_ORGS)
+            post = f"Post {rng.randint(1, 999)} " if org in ("VFW", "American Legion") else ""
+            title = f"{post}{rng.choice(SERVICES)} of {rng.choice(PLACES)} {rng.choice(['County', 'City', 'Parish'])}"
+            if (org, title) in national_titles:
+                # Same org and title is the same resource, not a new one
+                entity -= 1
+                continue
+            national_titles.add((org, title))
+            location: dict = {}
+        else:
+            org = f"{rng.choice(WORDS).title()} {rng.choice(PLACES)} Org {entity}"
+            title = f"{rng.choice(WORDS).title()} {rng.choice(SERVICES)}"
+            location = {"address": f"{entity} Main St", "city": "Springfield", "state": "IL", "zip_code": "62701"}
+        record = NormalizedResource(
+            title=title,
+            description="Synthetic dedupe benchmark record",
+            source_url=f"https://example.com/{entity}",
+            org_name=org,
+            source_tier=rng.randint(1, 4),
+            raw_data={"entity": entity},
+            **location,
+        )
+        originals.append(record)
+        records.append(record)
+    return records
+
+
+def legacy_deduplicate(resources: list[NormalizedResource], threshold: float = 0.85) -> list[NormalizedResource]:
+    """The previous engine: exact org|location groups, pairwise SequenceMatcher titles."""
+    completeness = Deduplicator()._completeness_score
+    groups: dict[str, list[NormalizedResource]] = {}
+    for resource in resources:
+        org_key = resource.org_name.lower().strip()
+        for suffix in [" inc", " inc.", " llc", " corp", " corporation"]:
+            if org_key.endswith(suffix):
+                org_key = org_key[: -len(suffix)]
+        groups.setdefault(f"{org_key}|{resource.location_key() or 'no-location'}", []).append(resource)
+
+    result = []
+    for group in groups.values():
+        keep: list[NormalizedResource] = []
+        for resource in sorted(group, key=lambda r: (r.source_tier, -completeness(r))):
+            title = resource.title.lower().strip()
+            if not any(
+                title == kept.title.lower().strip()
+                or SequenceMatcher(None, title, kept.title.lower().strip()).ratio() >= threshold
+                for kept in keep
+            ):
+                keep.append(resource)
+        result.extend(keep)
+    return result
+
+
+def score(records: list[NormalizedResource], output: list[NormalizedResource]) -> tuple[int, int]:
+    """Return (false merges, missed duplicates)."""
+    entities = {r.raw_data["entity"] for r in records}
+    kept = [r.raw_data["entity"] for r in output]
+    return len(entities) - len(set(kept)), len(kept) - len(set(kept))
+
+
+def run(label: str, records: list[NormalizedResource], dedupe) -> None:
+    records = copy.deepcopy(records)
+    started = time.perf_counter()
+    output = dedupe(records)
+    elapsed = time.perf_counter() - started
+    false_merges, missed = score(records, output)
+    removed = len(records) - len(output)
+    print(f"{label:>28}  {len(records):>8}  {elapsed:>9.2f}  {removed:>8}  {false_merges:>7}  {missed:>7}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ETL deduplication")
+    parser.add_argument("--records", type=int, default=200_000, help="Synthetic records")
+    parser.add_argument("--legacy-sample", type=int, default=20_000, help="Records to run the old engine on")
+    args = parser.parse_args()
+
+    records = generate(args.records)
+    sample = records[: args.legacy_sample]
+
+    def blocking(resources):
+        return Deduplicator().deduplicate(resources)[0]
+
+    print(f"{'engine':>28}  {'records':>8}  {'seconds':>9}  {'removed':>8}  {'false':>7}  {'missed':>7}")
+    run("blocking keys", records, blocking)
+    if sample:
+        run("blocking keys (sample)", sample, blocking)
+        run("pairwise SequenceMatcher", sample, legacy_deduplicate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark ETL peak memory: materialized run() vs. chunked run_streaming().
+
+Writes synthetic American Legion post files of increasing size, then runs
+the full pipeline (extract, normalize, dedupe, enrich, load) over each in
+a fresh subprocess per mode and reports the growth of peak RSS over the
+process's baseline after imports. run() holds every candidate and
+normalized resource (with raw_data) at once; run_streaming() only holds
+a few chunks, so its peak should stay flat as the source grows. The
+posts file itself is parsed with json.load in both modes.
+
+Loads go to a scratch database (<database>_etl_bench) that is created
+and emptied by the script; the configured database is not touched.
+
+Usage:
+    python scripts/benchmark_etl_memory.py [--sizes 5000 20000 40000] [--chunk-size 2000]
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.config import settings
+
+STATES = ["CA", "TX", "FL", "NY", "PA", "OH", "IL", "GA", "NC", "MI"]
+PROGRAMS = ["Baseball", "Boys State", "Legion Riders", "Oratorical", "Blood Drives", "Honor Guard", "Scholarships"]
+
+
+def _scratch_url() -> str:
+    url = make_url(settings.database_url)
+    return url.set(database=f"{url.database}_etl_bench").render_as_string(hide_password=False)
+
+
+def _prepare_database() -> None:
+    """Create the scratch database (if needed) with empty tables."""
+    url = make_url(settings.database_url)
+    admin = create_engine(url, isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        name = f"{url.database}_etl_bench"
+        if conn.execute(text("SELECT 1 FROM pg_database WHERE datname = :n"), {"n": name}).first() is None:
+            conn.execute(text(f"CREATE DATABASE \"{name}\" ENCODING 'UTF8' TEMPLATE template0"))
+    admin.dispose()
+
+    import app.models  # noqa: F401 - register tables
+
+    engine = create_engine(_scratch_url())
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+
+def _write_posts(path: str, count: int) -> None:
+    rng = random.Random(count)
+    posts = []
+    for n in range(1, count + 1):
+        state = STATES[n % len(STATES)]
+        posts.append(
+            {
+                "post_number": str(n),
+                "name": f"Memorial Post {n}",
+                "state": state,
+                "city": f"City {n % 700}",
+                "address": f"{rng.randint(1, 9999)} Legion Way",
+                "zip": f"{rng.randint(10000, 99999)}",
+                "phone": f"(555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+                "email": f"post{n}@example.org",
+                "website": f"https://post{n}.example.org",
+                "department": state,
+                "attributes": ["Hall Rental", "Canteen"][: n % 3],
+                "programs": rng.sample(PROGRAMS, 4),
+                "meeting_schedule": "Second Tuesday of each month at 7pm " * 4,
+                "lat": 25 + rng.random() * 20,
+                "lng": -120 + rng.random() * 45,
+            }
+        )
+    with open(path, "w") as f:
+        json.dump({"posts": posts}, f)
+
+
+def _child(mode: str, path: str, chunk_size: int) -> None:
+    """Run one pipeline in this process and print 'baseline_kb peak_kb seconds created'."""
+    from connectors.american_legion_posts import AmericanLegionPostsConnector
+    from etl.pipeline import ETLPipeline
+
+    engine = create_engine(_scratch_url())
+    with Session(engine) as session:
+        session.execute(text("SELECT 1"))
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        pipeline = ETLPipeline(session)
+        connector = AmericanLegionPostsConnector(data_path=path)
+        started = time.perf_counter()
+        if mode == "streaming":
+            result = pipeline.run_streaming([connector], chunk_size=chunk_size)
+        else:
+            result = pipeline.run([connector])
+        seconds = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(baseline, peak, f"{seconds:.1f}", result.stats.created)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ETL peak memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5_000, 20_000, 40_000], help="Posts per run")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="run_streaming chunk size")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child[0], args.child[1], args.chunk_size)
+        return
+
+    print(f"{'posts':>8}  {'mode':>10}  {'file MB':>8}  {'peak RSS growth MB':>18}  {'seconds':>8}  {'created':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"posts_{size}.json")
+            _write_posts(path, size)
+            file_mb = os.path.getsize(path) / 1e6
+            for mode in ("run", "streaming"):
+                _prepare_database()
+                output = subprocess.run(
+                    [sys.executable, __file__, "--chunk-size", str(args.chunk_size), "--child", mode, path],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout.split()
+                baseline, peak, seconds, created = output[-4:]
+                growth_mb = (int(peak) - int(baseline)) / 1024  # ru_maxrss is in KB on Linux
+                print(f"{size:>8}  {mode:>10}  {file_mb:>8.1f}  {growth_mb:>18.1f}  {seconds:>8}  {created:>8}")
+
+
+if __name__ == "__main__":
+    main()
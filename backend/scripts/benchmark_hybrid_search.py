@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark hybrid search latency as the resources table grows.
+
+Inserts synthetic active resources (random titles and 384-dim embeddings) in
+steps, runs SearchService.hybrid_search repeatedly at each size and reports
+median/p95 latency. Because each ranker only contributes its top-K candidates
+and only the page is hydrated, latency should stay roughly flat from 10k to
+500k rows.
+
+Everything runs in one transaction that is rolled back at the end, so the
+database is left untouched. Requires PostgreSQL with pgvector and the
+ix_resources_embedding_hnsw index; filling 500k rows takes several minutes.
+
+Usage:
+    python scripts/benchmark_hybrid_search.py [--sizes 10000,100000,500000] [--queries 50]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, create_engine, text
+
+from app.config import settings
+from app.models import Organization
+from app.models.resource import EMBEDDING_DIMENSION
+from app.services.search import SearchService
+
+WORDS = [
+    "housing",
+    "employment",
+    "legal",
+    "training",
+    "food",
+    "benefits",
+    "counseling",
+    "rental",
+    "assistance",
+    "career",
+    "disability",
+    "claims",
+    "shelter",
+    "pantry",
+    "education",
+    "mental",
+    "health",
+    "transition",
+    "family",
+    "emergency",
+]
+
+QUERIES = ["housing assistance", "job training", "legal help", "food pantry", "disability claims"]
+
+INSERT_SQL = """
+    INSERT INTO resources (
+        id, organization_id, title, description, categories, subcategories, tags,
+        scope, states, languages, freshness_score, reliability_score, status,
+        created_at, updated_at, embedding
+    )
+    SELECT gen_random_uuid(), :org_id,
+           (ARRAY[{words}])[1 + (g.i % :n_words)] || ' ' || (ARRAY[{words}])[1 + ((g.i / 7) % :n_words)],
+           'Synthetic benchmark resource ' || g.i,
+           ARRAY['housing']::text[], ARRAY[]::text[], ARRAY[]::text[],
+           'NATIONAL', ARRAY[]::text[], ARRAY['en']::text[], 1.0, 0.5, 'ACTIVE',
+           now(), now(),
+           ARRAY(SELECT random() FROM generate_series(1, {dim}) WHERE g.i IS NOT NULL)::vector
+    FROM generate_series(:start, :stop - 1) AS g(i)
+"""
+
+
+def _grow_to(session: Session, org_id: str, current: int, target: int) -> None:
+    """Insert synthetic rows until the benchmark corpus has ``target`` rows."""
+    words = ",".join(f"'{w}'" for w in WORDS)
+    sql = text(INSERT_SQL.format(words=words, dim=EMBEDDING_DIMENSION))
+    step = 50_000
+    for start in range(current, target, step):
+        stop = min(start + step, target)
+        session.execute(sql, {"org_id": org_id, "n_words": len(WORDS), "start": start, "stop": stop})
+    session.execute(text("ANALYZE resources"))
+
+
+def _time_queries(service: SearchService, n_queries: int) -> list[float]:
+    """Run hybrid searches with random query vectors and return latencies in ms."""
+    latencies = []
+    for i in range(n_queries):
+        embedding = [random.random() for _ in range(EMBEDDING_DIMENSION)]
+        started = time.perf_counter()
+        service.hybrid_search(QUERIES[i % len(QUERIES)], embedding, limit=20)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark hybrid search latency vs. table size")
+    parser.add_argument("--sizes", default="10000,50000,100000,500000", help="Comma-separated corpus sizes")
+    parser.add_argument("--queries", type=int, default=50, help="Queries to time at each size")
+    args = parser.parse_args()
+
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+    engine = create_engine(settings.database_url, echo=False)
+
+    with Session(engine) as session:
+        org = Organization(name="Benchmark Organization")
+        session.add(org)
+        session.flush()
+
+        service = SearchService(session)
+        current = 0
+        print(f"{'rows':>10}  {'median ms':>10}  {'p95 ms':>10}")
+        try:
+            for size in sizes:
+                _grow_to(session, str(org.id), current, size)
+                current = size
+                _time_queries(service, 3)  # warm caches
+                latencies = sorted(_time_queries(service, args.queries))
+                p95 = latencies[int(len(latencies) * 0.95) - 1]
+                print(f"{size:>10}  {statistics.median(latencies):>10.1f}  {p95:>10.1f}")
+        finally:
+            session.rollback()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Benchmark nearby search: in-memory spatial index vs. Haversine SQL vs. PostGIS.
+
+Inserts synthetic resources with locations spread over the continental US
+(denser around a few metros), then times ResourceService.list_nearby_by_coords
+for random centers and radii with each distance backend:
+
+- haversine: bounding box + per-row Haversine in SQL (no PostGIS)
+- index: the in-process grid (app.services.spatial_index) finds the
+  resources within the radius, the facet bitmaps apply the category
+  filter, and Postgres only unnests the final ids
+- postgis: ST_DWithin on locations.geog (skipped when PostGIS is missing)
+
+Every query filters on one category. It also times the in-memory lookup
+on its own and checks that the index and Haversine backends return the
+same pages and totals (both apply the same radius).
+
+Everything runs in one transaction that is rolled back at the end, so the
+database is left untouched.
+
+Usage:
+    python scripts/benchmark_nearby_index.py [--resources 50000] [--queries 100]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, create_engine, text
+
+from app.config import settings
+from app.models import Organization
+from app.services import facet_index, spatial_index
+from app.services.filters import ResourceFilters
+from app.services.geo import GeoContext, ZipTable
+from app.services.resource import ResourceService, _indexed_distance_sql
+
+# (lat, lng) of metros that get a third of the locations
+METROS = [(40.71, -74.01), (34.05, -118.24), (41.88, -87.63), (29.76, -95.37), (33.45, -112.07), (38.90, -77.04)]
+RADII = [10, 25, 50, 100]
+CATEGORIES = ["housing"]
+
+INSERT_SQL = """
+    WITH points AS (
+        SELECT g.i,
+               CASE WHEN g.i % 3 = 0 THEN m.lat + (random() - 0.5) * 1.5 ELSE 25 + random() * 24 END AS lat,
+               CASE WHEN g.i % 3 = 0 THEN m.lng + (random() - 0.5) * 1.5 ELSE -124 + random() * 57 END AS lng
+        FROM generate_series(1, :n) AS g(i)
+        JOIN (SELECT * FROM unnest(CAST(:metro_lats AS float8[]), CAST(:metro_lngs AS float8[]))
+              WITH ORDINALITY AS m(lat, lng, k)) m ON m.k = 1 + g.i % :n_metros
+    ), locs AS (
+        INSERT INTO locations (id, organization_id, address, city, state, zip_code, latitude, longitude)
+        SELECT gen_random_uuid(), :org_id, 'Benchmark ' || i, 'City', 'XX', '00000', lat, lng FROM points
+        RETURNING id, address
+    )
+    INSERT INTO resources (
+        id, organization_id, location_id, title, description, categories, subcategories, tags,
+        scope, states, languages, freshness_score, reliability_score, status, created_at, updated_at
+    )
+    SELECT gen_random_uuid(), :org_id, locs.id, locs.address,
+           'Synthetic nearby benchmark resource',
+           CASE WHEN random() < 0.5 THEN ARRAY['housing'] ELSE ARRAY['employment'] END::text[],
+           ARRAY[]::text[], ARRAY[]::text[], 'LOCAL', ARRAY['XX']::text[], ARRAY['en']::text[],
+           1.0, 0.5, 'ACTIVE', now(), now()
+    FROM locs
+"""
+
+
+def _centers(n: int) -> list[tuple[float, float, int]]:
+    rng = random.Random(42)
+    centers = []
+    for i in range(n):
+        if i % 2:
+            lat, lng = rng.choice(METROS)
+            lat, lng = lat + rng.uniform(-0.3, 0.3), lng + rng.uniform(-0.3, 0.3)
+        else:
+            lat, lng = rng.uniform(26, 48), rng.uniform(-122, -70)
+        centers.append((lat, lng, RADII[i % len(RADII)]))
+    return centers
+
+
+def _time_backend(
+    service: ResourceService, centers: list, postgis: bool, use_index: bool
+) -> tuple[list[float], list[list]]:
+    """Time list_nearby_by_coords (local results only) and return latencies and result ids."""
+    context = GeoContext(postgis=postgis, zips=ZipTable())
+    latencies, pages = [], []
+    with (
+        patch("app.services.resource.get_geo_context", return_value=context),
+        patch.object(settings, "nearby_spatial_index", use_index),
+    ):
+        for lat, lng, radius in centers:
+            started = time.perf_counter()
+            result = service.list_nearby_by_coords(
+                lat, lng, radius_miles=radius, categories=CATEGORIES, scope="state", limit=20
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            pages.append([(r.resource.id, round(r.distance_miles, 6)) for r in result.resources] + [result.total])
+    return latencies, pages
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[max(int(len(ordered) * 0.95) - 1, 0)]
+    print(f"{label:>24}  {statistics.median(ordered):>10.3f}  {p95:>10.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the nearby spatial index")
+    parser.add_argument("--resources", type=int, default=50_000, help="Synthetic resources with locations")
+    parser.add_argument("--queries", type=int, default=100, help="Nearby queries per backend")
+    args = parser.parse_args()
+
+    engine = create_engine(settings.database_url, echo=False)
+    with Session(engine) as session:
+        has_postgis = session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")).first() is not None
+        if not has_postgis:
+            # The geog trigger needs PostGIS; it's irrelevant to the non-PostGIS backends
+            session.execute(text("ALTER TABLE locations DISABLE TRIGGER locations_geog_update"))
+
+        org = Organization(name="Benchmark Organization")
+        session.add(org)
+        session.flush()
+        try:
+            session.execute(
+                text(INSERT_SQL),
+                {
+                    "n": args.resources,
+                    "org_id": str(org.id),
+                    "metro_lats": [m[0] for m in METROS],
+                    "metro_lngs": [m[1] for m in METROS],
+                    "n_metros": len(METROS),
+                },
+            )
+            session.execute(text("ANALYZE locations"))
+            session.execute(text("ANALYZE resources"))
+
+            service = ResourceService(session)
+            centers = _centers(args.queries)
+
+            spatial_index._index = None
+            facet_index._index = None
+            with patch.object(settings, "nearby_spatial_index", True):
+                started = time.perf_counter()
+                index = spatial_index.get_spatial_index(session)
+                facets = facet_index.get_facet_index(session)
+                build_ms = (time.perf_counter() - started) * 1000
+            assert index is not None and facets is not None
+            print(f"{len(index)} indexed resources, spatial and facet indexes built in {build_ms:.0f} ms")
+
+            filters = ResourceFilters(categories=CATEGORIES, tag_match="text")
+            lookups = []
+            for lat, lng, radius in centers:
+                started = time.perf_counter()
+                _indexed_distance_sql(index, facets, lat, lng, radius, filters, {})
+                lookups.append((time.perf_counter() - started) * 1000)
+
+            _time_backend(service, centers[:5], False, False)  # warm caches
+            haversine, haversine_pages = _time_backend(service, centers, postgis=False, use_index=False)
+            indexed, indexed_pages = _time_backend(service, centers, postgis=False, use_index=True)
+
+            print(f"{'backend':>24}  {'median ms':>10}  {'p95 ms':>10}")
+            _report("index lookup only", lookups)
+            _report("haversine SQL", haversine)
+            _report("index + SQL unnest", indexed)
+            if has_postgis:
+                postgis, _ = _time_backend(service, centers, postgis=True, use_index=False)
+                _report("PostGIS ST_DWithin", postgis)
+            else:
+                print(f"{'PostGIS ST_DWithin':>24}  (PostGIS not installed)")
+            print(f"index pages match haversine pages: {indexed_pages == haversine_pages}")
+        finally:
+            session.rollback()
+            spatial_index._index = None
+            facet_index._index = None
+
+
+if __name__ == "__main__":
+    main()
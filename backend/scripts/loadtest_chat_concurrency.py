@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Load test: /api/v1/resources latency while chat requests wait on Claude.
+
+Starts the API in-process with uvicorn (one worker) against DATABASE_URL,
+replaces the Claude round trip with a fixed delay, and measures
+/api/v1/resources latency first on its own and then while --chat-concurrency
+chat requests are in flight. With --blocking the delay blocks the event loop
+the way the synchronous Anthropic client did, for comparison.
+
+Usage:
+    python scripts/loadtest_chat_concurrency.py [--duration 10] [--chat-concurrency 20]
+        [--claude-latency 2.0] [--probe-concurrency 4] [--blocking]
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import uvicorn
+
+from app.config import settings
+from llm.client import ClaudeResponse
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _fake_claude(latency: float, blocking: bool):
+    """Stand-in for ClaudeClient.acomplete with a fixed round-trip time."""
+
+    async def acomplete(self, prompt: str, **kwargs) -> ClaudeResponse:
+        if blocking:
+            time.sleep(latency)  # What a synchronous client call does to the event loop
+        else:
+            await asyncio.sleep(latency)
+        return ClaudeResponse(content="Load test response", model="fake", input_tokens=0, output_tokens=0)
+
+    return acomplete
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct), len(ordered) - 1)]
+
+
+async def _probe(client: httpx.AsyncClient, deadline: float, latencies: list[float]) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get("/api/v1/resources", params={"limit": 20})
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def _chat(client: httpx.AsyncClient, deadline: float, completed: list[int]) -> None:
+    while time.perf_counter() < deadline:
+        # Unique client_id per request so the per-client rate limit doesn't kick in
+        payload = {"message": "I need housing help", "client_id": str(uuid.uuid4())}
+        response = await client.post("/api/v1/chat", json=payload)
+        response.raise_for_status()
+        completed.append(1)
+
+
+async def _run_phase(base_url: str, args: argparse.Namespace, chat_concurrency: int) -> tuple[list[float], int]:
+    deadline = time.perf_counter() + args.duration
+    latencies: list[float] = []
+    completed: list[int] = []
+    limits = httpx.Limits(max_connections=chat_concurrency + args.probe_concurrency + 10)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+        tasks = [_probe(client, deadline, latencies) for _ in range(args.probe_concurrency)]
+        tasks += [_chat(client, deadline, completed) for _ in range(chat_concurrency)]
+        await asyncio.gather(*tasks)
+    return latencies, len(completed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure /api/v1/resources latency under chat load")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per phase")
+    parser.add_argument("--chat-concurrency", type=int, default=20, help="Concurrent chat requests")
+    parser.add_argument("--probe-concurrency", type=int, default=4, help="Concurrent /resources requests")
+    parser.add_argument("--claude-latency", type=float, default=2.0, help="Simulated Claude round trip (s)")
+    parser.add_argument("--blocking", action="store_true", help="Simulate a blocking (synchronous) Claude call")
+    args = parser.parse_args()
+
+    settings.anthropic_api_key = settings.anthropic_api_key or "load-test"
+    settings.debug = False  # No SQL echo
+    settings.scheduler_enabled = False
+    settings.query_embedding_cache_warm_count = 0
+
+    from app.main import app
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+
+    with patch("llm.client.ClaudeClient.acomplete", _fake_claude(args.claude_latency, args.blocking)):
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.05)
+
+        base_url = f"http://127.0.0.1:{port}"
+        mode = "blocking" if args.blocking else "async"
+        print(f"Claude latency {args.claude_latency}s ({mode}), {args.duration}s per phase")
+        print(f"{'phase':>22}  {'requests':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  {'chats':>6}")
+        for label, chats in (
+            ("resources only", 0),
+            (f"+ {args.chat_concurrency} concurrent chats", args.chat_concurrency),
+        ):
+            latencies, completed = asyncio.run(_run_phase(base_url, args, chats))
+            print(
+                f"{label:>22}  {len(latencies):>8}  {statistics.median(latencies):>8.1f}  "
+                f"{_percentile(latencies, 0.95):>8.1f}  {_percentile(latencies, 0.99):>8.1f}  {completed:>6}"
+            )
+
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
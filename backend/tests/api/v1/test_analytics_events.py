@@ -0,0 +1,51 @@
+"""Tests for recording analytics events."""
+
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.models import AnalyticsEvent
+from app.services import analytics_buffer
+from app.services.analytics_buffer import AnalyticsBuffer
+
+EVENT = {"event_type": "search", "event_name": "search", "search_query": "housing", "state": "TX"}
+
+
+class TestRecordEvent:
+    """POST /api/v1/analytics/events with and without the buffer."""
+
+    def test_buffered_event_is_queued(self, client: TestClient, session: Session):
+        """Test that a buffered event is accepted without a database write."""
+        buffer = AnalyticsBuffer(MagicMock(), max_events=10, batch_size=10, flush_interval_ms=1000)
+
+        with patch.object(analytics_buffer, "_buffer", buffer):
+            response = client.post("/api/v1/analytics/events", json=EVENT)
+
+        assert response.status_code == 202
+        assert response.json()["event_name"] == "search"
+        assert buffer.stats().pending == 1
+        assert session.exec(select(AnalyticsEvent)).all() == []
+
+    def test_full_buffer_returns_503(self, client: TestClient):
+        """Test that clients are told to back off when the buffer is full."""
+        buffer = AnalyticsBuffer(MagicMock(), max_events=1, batch_size=10, flush_interval_ms=1000)
+
+        with patch.object(analytics_buffer, "_buffer", buffer):
+            assert client.post("/api/v1/analytics/events", json=EVENT).status_code == 202
+            response = client.post("/api/v1/analytics/events", json=EVENT)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    def test_unbuffered_event_is_written(self, client: TestClient, session: Session):
+        """Test that without a buffer the event is committed and returned."""
+        with patch.object(analytics_buffer, "_buffer", None):
+            response = client.post("/api/v1/analytics/events", json=EVENT)
+
+        assert response.status_code == 202
+        body = response.json()
+        stored = session.exec(select(AnalyticsEvent)).one()
+        assert body["id"] == str(stored.id)
+        assert body["created_at"]
+        assert stored.search_query == "housing"
@@ -1,6 +1,6 @@
 """Tests for the AI chat endpoint."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -13,9 +13,11 @@ def reset_rate_limits():
     """Reset rate limiting state between tests."""
     chat_module._rate_limit_store.clear()
     chat_module._conversation_store.clear()
+    chat_module._claude_client = None
     yield
     chat_module._rate_limit_store.clear()
     chat_module._conversation_store.clear()
+    chat_module._claude_client = None
 
 
 def test_chat_requires_message(client: TestClient):
@@ -55,7 +57,7 @@ def test_chat_returns_response(mock_settings, mock_claude_class, client: TestCli
     mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.content = "I can help you find veteran resources."
-    mock_client.complete.return_value = mock_response
+    mock_client.acomplete = AsyncMock(return_value=mock_response)
     mock_claude_class.return_value = mock_client
 
     response = client.post("/api/v1/chat", json={"message": "I need housing help"})
@@ -77,7 +79,7 @@ def test_chat_maintains_conversation_id(mock_settings, mock_claude_class, client
     mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.content = "Response"
-    mock_client.complete.return_value = mock_response
+    mock_client.acomplete = AsyncMock(return_value=mock_response)
     mock_claude_class.return_value = mock_client
 
     # First message - no conversation_id
@@ -123,7 +125,7 @@ def test_chat_handles_claude_error(mock_settings, mock_claude_class, client: Tes
     mock_settings.anthropic_api_key = "test-key"
 
     mock_client = MagicMock()
-    mock_client.complete.side_effect = Exception("API error")
+    mock_client.acomplete = AsyncMock(side_effect=Exception("API error"))
     mock_claude_class.return_value = mock_client
 
     response = client.post("/api/v1/chat", json={"message": "Hello"})
@@ -187,7 +189,7 @@ def test_chat_search_failure_sets_flag(mock_settings, mock_search_class, mock_cl
     mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.content = "I can still help you."
-    mock_client.complete.return_value = mock_response
+    mock_client.acomplete = AsyncMock(return_value=mock_response)
     mock_claude_class.return_value = mock_client
 
     response = client.post("/api/v1/chat", json={"message": "I need housing help"})
@@ -217,7 +219,7 @@ def test_chat_empty_results_not_flagged_as_failure(
     mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.content = "No resources found."
-    mock_client.complete.return_value = mock_response
+    mock_client.acomplete = AsyncMock(return_value=mock_response)
     mock_claude_class.return_value = mock_client
 
     response = client.post("/api/v1/chat", json={"message": "xyz123 nonexistent query"})
@@ -226,3 +228,67 @@ def test_chat_empty_results_not_flagged_as_failure(
     data = response.json()
     # search_failed should be False for empty results (search worked, just no matches)
     assert data["search_failed"] is False
+
+
+@patch("app.api.v1.chat.ClaudeClient")
+@patch("app.api.v1.chat.settings")
+def test_chat_does_not_block_other_requests(mock_settings, mock_claude_class, session):
+    """Test that a chat waiting on Claude doesn't stall other requests on the worker."""
+    import asyncio
+
+    import httpx
+
+    from app.database import get_session
+    from app.main import app
+
+    mock_settings.anthropic_api_key = "test-key"
+    app.dependency_overrides[get_session] = lambda: session
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow_complete(**kwargs):
+            await release.wait()
+            response = MagicMock()
+            response.content = "Done"
+            return response
+
+        mock_claude_class.return_value.acomplete = slow_complete
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            chat_request = asyncio.create_task(ac.post("/api/v1/chat", json={"message": "housing"}))
+            await asyncio.sleep(0.05)
+
+            # Served while the chat is still waiting on Claude
+            listing = await asyncio.wait_for(ac.get("/api/v1/resources"), timeout=5)
+            assert listing.status_code == 200
+            assert not chat_request.done()
+
+            release.set()
+            chat_response = await asyncio.wait_for(chat_request, timeout=5)
+            assert chat_response.status_code == 200
+            assert chat_response.json()["response"] == "Done"
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        app.dependency_overrides.clear()
+
+
+@patch("app.api.v1.chat.ClaudeClient")
+@patch("app.api.v1.chat.settings")
+def test_chat_reuses_claude_client(mock_settings, mock_claude_class, client: TestClient):
+    """Test that chat requests share one Claude client instead of creating one each."""
+    mock_settings.anthropic_api_key = "test-key"
+    mock_client = mock_claude_class.return_value
+    mock_client.api_key = "test-key"
+    mock_response = MagicMock()
+    mock_response.content = "Happy to help."
+    mock_client.acomplete = AsyncMock(return_value=mock_response)
+
+    for _ in range(2):
+        assert client.post("/api/v1/chat", json={"message": "housing"}).status_code == 200
+
+    mock_claude_class.assert_called_once()
+    assert mock_client.acomplete.await_count == 2
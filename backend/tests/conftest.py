@@ -13,6 +13,7 @@ from sqlmodel.pool import StaticPool
 
 from app.database import get_session
 from app.main import app
+from app.services.embedding_cache import get_query_embedding_cache
 
 
 @compiles(ARRAY, "sqlite")
@@ -39,6 +40,13 @@ def compile_vector_sqlite(element, compiler, **kw):
     return "BLOB"
 
 
+@pytest.fixture(autouse=True)
+def _clear_query_embedding_cache():
+    """Keep cached query embeddings from leaking between tests."""
+    yield
+    get_query_embedding_cache().clear()
+
+
 @pytest.fixture(name="session")
 def session_fixture():
     """Create an in-memory SQLite session for testing."""
@@ -326,6 +326,30 @@ class TestAmericanLegionPostsConnector:
         assert len(resources) == 1
         assert resources[0].raw_data["post_number"] == "100"
 
+    def test_iter_candidates_streams_posts(self, tmp_path):
+        """Test that iter_candidates() lazily yields the posts run() returns."""
+        test_data = {"posts": [{"post_number": str(n), "state": "TX"} for n in range(1, 4)]}
+        test_file = tmp_path / "test.json"
+        test_file.write_text(json.dumps(test_data))
+
+        connector = AmericanLegionPostsConnector(data_path=test_file)
+        stream = connector.iter_candidates()
+
+        assert not isinstance(stream, list)
+        assert [r.raw_data["post_number"] for r in stream] == ["1", "2", "3"]
+        assert len(connector.run()) == 3
+
+    def test_iter_candidates_parses_incrementally(self, tmp_path):
+        """Test that posts are yielded before the rest of the file is parsed."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text('{"posts": [{"post_number": "1", "state": "TX"}, {"post_number": "2", "state": "TX"}, ')
+
+        connector = AmericanLegionPostsConnector(data_path=test_file)
+        stream = connector.iter_candidates()
+
+        assert next(stream).raw_data["post_number"] == "1"
+        assert next(stream).raw_data["post_number"] == "2"
+
     def test_run_nonexistent_file(self, tmp_path):
         """Test running with nonexistent file."""
         connector = AmericanLegionPostsConnector(data_path=tmp_path / "nonexistent.json")
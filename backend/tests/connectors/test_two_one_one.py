@@ -500,6 +500,15 @@ class TestTwoOneOneConnector:
         assert count1 == count2
         assert count1 == 4
 
+    def test_iter_candidates_streams_files(self, connector):
+        """Test iter_candidates() yields the same resources as run() without keeping them."""
+        streamed = list(connector.iter_candidates())
+
+        assert [r.title for r in streamed] == [
+            r.title for r in TwoOneOneConnector(data_dir=connector.data_dir, states=["CA", "TX"]).run()
+        ]
+        assert connector._resources == []
+
     def test_service_category_map_coverage(self):
         """Test SERVICE_CATEGORY_MAP has expected coverage."""
         map_dict = TwoOneOneConnector.SERVICE_CATEGORY_MAP
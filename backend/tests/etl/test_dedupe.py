@@ -1,5 +1,10 @@
 """Tests for ETL deduplicator."""
 
+import copy
+import random
+
+import pytest
+
 from etl.dedupe import Deduplicator, find_potential_duplicates
 from etl.models import NormalizedResource
 
@@ -391,3 +396,72 @@ class TestFindPotentialDuplicates:
 
         duplicates = find_potential_duplicates(new_resource, [])
         assert len(duplicates) == 0
+
+
+def _resource(title: str, org: str = "Test Org", **kwargs) -> NormalizedResource:
+    return NormalizedResource(
+        title=title,
+        description="Description",
+        source_url=f"https://example.com/{abs(hash((title, org)))}",
+        org_name=org,
+        **kwargs,
+    )
+
+
+class TestBlockingDeduplicator:
+    """Tests for token-set matching and blocking-key candidate generation."""
+
+    def test_org_name_variants_match_across_groups(self):
+        """Test that slightly different org names no longer split duplicates."""
+        resources = [
+            _resource("Emergency Food Pantry", org="Disabled American Veterans", source_tier=1),
+            _resource("Emergency Food Pantry", org="Disabled American Veterans (DAV)", source_tier=2),
+        ]
+
+        result, removed = Deduplicator().deduplicate(resources)
+
+        assert removed == 1
+        assert result[0].source_tier == 1
+
+    def test_reordered_and_plural_titles_match(self):
+        """Test that word order, case and plurals don't hide a duplicate."""
+        resources = [_resource("Legal Services for Veterans"), _resource("veteran legal service for")]
+
+        _, removed = Deduplicator().deduplicate(resources)
+
+        assert removed == 1
+
+    def test_different_numbers_not_duplicates(self):
+        """Test that numbered posts and chapters are kept apart."""
+        resources = [
+            _resource("Post 12 Food Pantry", org="VFW"),
+            _resource("Post 13 Food Pantry", org="VFW"),
+            _resource("Emergency Financial Assistance Program", org="VFW Post 1234"),
+            _resource("Emergency Financial Assistance Program", org="VFW Post 1235"),
+        ]
+
+        result, removed = Deduplicator().deduplicate(resources)
+
+        assert removed == 0
+        assert len(result) == 4
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95])
+    def test_blocking_finds_every_match_a_full_scan_finds(self, threshold):
+        """Test that blocking keys skip no pair the pairwise comparison would match."""
+        words = ["food", "bank", "pantry", "legal", "aid", "county", "housing", "help", "center", "post", "of", "dc"]
+        rng = random.Random(3)
+        resources = [
+            _resource(" ".join(rng.sample(words, rng.randint(1, 8))), org=rng.choice(["Org A", "Org B"]))
+            for _ in range(400)
+        ]
+        deduplicator = Deduplicator(title_threshold=threshold)
+
+        result, removed = deduplicator.deduplicate(copy.deepcopy(resources))
+
+        # Reference: compare each resource with every kept one, in the same order
+        keep: list[NormalizedResource] = []
+        for resource in sorted(resources, key=lambda r: (r.source_tier, -deduplicator._completeness_score(r))):
+            if not any(deduplicator._are_duplicates(resource, kept) for kept in keep):
+                keep.append(resource)
+        assert removed == len(resources) - len(keep)
+        assert sorted(r.title for r in result) == sorted(r.title for r in keep)
@@ -0,0 +1,214 @@
+"""Tests for database-aware duplicate detection.
+
+These tests use mocks and don't require PostgreSQL.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.models import Organization, Resource
+from etl.dedupe_index import DedupeIndex, Fingerprint, normalize_phone
+from etl.loader import Loader
+from etl.models import NormalizedResource
+
+
+def _fingerprint(title: str = "Housing Assistance", org: str = "Veterans Org", **kwargs) -> Fingerprint:
+    return Fingerprint.of(title=title, org_name=org, **kwargs)
+
+
+def _stored(resource: Resource, fingerprint: Fingerprint) -> tuple[MagicMock, Resource]:
+    """A (ResourceFingerprint, Resource) row as returned by the lookup query."""
+    row = MagicMock(
+        org_key=fingerprint.org_key,
+        title_key=fingerprint.title_key,
+        phone=fingerprint.phone,
+        address_key=fingerprint.address_key,
+        state=fingerprint.state,
+    )
+    return row, resource
+
+
+def _session(rows: list | None = None) -> MagicMock:
+    session = MagicMock()
+    session.exec.side_effect = lambda stmt: iter(rows or ())
+    return session
+
+
+class TestFingerprint:
+    """Tests for fingerprint normalization and matching."""
+
+    def test_normalizes_case_order_plurals_and_suffixes(self):
+        """Test that cosmetic differences give the same keys."""
+        a = _fingerprint("Veterans Housing Assistance", "Veterans Org, Inc.")
+        b = _fingerprint("housing assistance - veteran", "VETERANS ORG")
+
+        assert a.org_key == b.org_key
+        assert a.title_key == b.title_key
+        assert a.matches(b)
+
+    def test_normalize_phone(self):
+        """Test that phones are reduced to 10 digits."""
+        assert normalize_phone("1-(555) 123-4567") == "5551234567"
+        assert normalize_phone("555-1234") is None
+        assert normalize_phone(None) is None
+
+    def test_same_phone_matches_near_identical_title(self):
+        """Test that the same org and phone match a title with the same words give or take one."""
+        a = _fingerprint("Veterans Housing Assistance Program", phone="555-123-4567")
+        b = _fingerprint("Housing Assistance Program", phone="(555) 123-4567")
+
+        assert a.matches(b)
+        assert not _fingerprint("Veterans Housing Assistance Program").matches(
+            _fingerprint("Housing Assistance Program")
+        )
+
+    def test_same_phone_different_programs_do_not_match(self):
+        """Test that programs sharing their org's main number stay separate."""
+        a = _fingerprint("WWP - Project Odyssey", "Wounded Warrior Project", phone="888-997-2586")
+        b = _fingerprint("WWP - Warrior Care Network", "Wounded Warrior Project", phone="888-997-2586")
+
+        assert not a.matches(b)
+
+    def test_different_phone_does_not_match(self):
+        """Test that conflicting phones keep same-titled programs apart."""
+        a = _fingerprint(phone="555-123-4567")
+        b = _fingerprint(phone="555-765-4321")
+
+        assert not a.matches(b)
+
+    def test_different_address_or_state_does_not_match(self):
+        """Test that branches at different addresses or states stay separate."""
+        a = _fingerprint(address="1 Main St", city="Austin", state="TX")
+        b = _fingerprint(address="9 Elm St", city="Austin", state="TX")
+
+        assert not a.matches(b)
+        assert not _fingerprint(state="TX").matches(_fingerprint(state="CA"))
+        assert _fingerprint(state="TX").matches(_fingerprint())
+
+    def test_different_org_does_not_match(self):
+        """Test that the same title at another org is not a duplicate."""
+        assert not _fingerprint(org="Veterans Org").matches(_fingerprint(org="Other Org"))
+
+
+class TestDedupeIndex:
+    """Tests for DedupeIndex lookups and writes."""
+
+    def test_find_uses_one_query_for_the_batch(self):
+        """Test that a batch of fingerprints is resolved with a single query."""
+        resource = Resource(id=uuid4(), title="Housing Assistance", description="x")
+        session = _session([_stored(resource, _fingerprint())])
+        index = DedupeIndex(session)
+
+        found = index.find([_fingerprint(), _fingerprint(title="Employment"), _fingerprint(org="Other Org")])
+
+        assert found == [resource, None, None]
+        assert session.exec.call_count == 1
+
+    def test_find_skips_query_without_keys(self):
+        """Test that fingerprints without an org don't hit the database."""
+        session = _session()
+
+        assert DedupeIndex(session).find([_fingerprint(org="")]) == [None]
+        session.exec.assert_not_called()
+
+    def test_added_fingerprints_are_found_without_query(self):
+        """Test that resources added in this run match later records."""
+        index = DedupeIndex(_session())
+        resource = Resource(id=uuid4(), title="Housing Assistance", description="x")
+        index.add(resource, _fingerprint())
+
+        assert index.find_added(_fingerprint("assistance housing")) is resource
+        assert index.find_added(_fingerprint(title="Employment")) is None
+
+    def test_same_phone_programs_are_not_merged(self):
+        """Test that a second program with the org's shared phone isn't matched to the first."""
+        index = DedupeIndex(_session())
+        odyssey = Resource(id=uuid4(), title="WWP - Project Odyssey", description="x")
+        index.add(odyssey, _fingerprint("WWP - Project Odyssey", "Wounded Warrior Project", phone="888-997-2586"))
+        care_network = _fingerprint("WWP - Warrior Care Network", "Wounded Warrior Project", phone="888-997-2586")
+
+        assert index.find_added(care_network) is None
+        session = _session([_stored(odyssey, index._pending[odyssey.id][0])])
+        assert DedupeIndex(session).find([care_network]) == [None]
+
+    def test_add_replaces_previous_fingerprint(self):
+        """Test that re-adding a resource drops its old keys."""
+        index = DedupeIndex(_session())
+        resource = Resource(id=uuid4(), title="Housing Assistance", description="x")
+        index.add(resource, _fingerprint())
+        index.add(resource, _fingerprint(title="Rapid Rehousing"))
+
+        assert index.find_added(_fingerprint()) is None
+        assert index.find_added(_fingerprint(title="Rapid Rehousing")) is resource
+
+    def test_flush_upserts_pending_once(self):
+        """Test that flush writes pending fingerprints in one statement and clears them."""
+        session = _session()
+        index = DedupeIndex(session)
+        for i in range(3):
+            index.add(Resource(id=uuid4(), title=f"Program {i}", description="x"), _fingerprint(f"Program {i}"))
+
+        index.flush()
+        index.flush()
+
+        session.flush.assert_called_once()
+        session.execute.assert_called_once()
+        assert index.find_added(_fingerprint("Program 0")) is None
+
+    def test_backfill_covers_missing_and_stale_fingerprints(self):
+        """Test that backfill fingerprints resources without one or edited since theirs was written."""
+        org = Organization(id=uuid4(), name="Veterans Org")
+        resources = [
+            Resource(id=uuid4(), title=f"Program {i}", description="x", organization_id=org.id, organization=org)
+            for i in range(2)
+        ]
+        session = MagicMock()
+        session.exec.return_value.all.side_effect = [resources, []]
+
+        assert DedupeIndex(session).backfill() == 2
+
+        query = str(session.exec.call_args_list[0].args[0])
+        assert "resource_fingerprints.resource_id IS NULL" in query
+        assert "resources.updated_at > resource_fingerprints.updated_at" in query
+        # The next batch continues after the last resource
+        assert "resources.id >" in str(session.exec.call_args_list[1].args[0])
+        session.execute.assert_called_once()
+        session.commit.assert_called_once()
+
+    def test_refresh_failure_does_not_stop_the_import(self):
+        """Test that a failed refresh is rolled back and reported as nothing fingerprinted."""
+        session = MagicMock()
+        session.exec.side_effect = Exception("connection lost")
+
+        assert DedupeIndex(session).refresh() == 0
+        session.rollback.assert_called_once()
+
+
+class TestLoaderFingerprintMatch:
+    """Tests for Loader matching existing resources by fingerprint."""
+
+    def test_fingerprint_match_updates_existing_resource(self):
+        """Test that a record with a new URL but a known fingerprint updates the existing resource."""
+        existing = Resource(
+            id=uuid4(),
+            organization_id=uuid4(),
+            title="Housing Assistance",
+            description="Old description",
+            source_url="https://old.example.com/housing",
+        )
+        rows = [_stored(existing, _fingerprint())]
+        session = MagicMock()
+        # last source records, organizations, resources by URL: nothing; fingerprints: the existing resource
+        session.exec.side_effect = [iter(()), iter(()), iter(()), iter(rows)]
+        resource = NormalizedResource(
+            title="Housing Assistance",
+            description="New description",
+            source_url="https://new.example.com/housing",
+            org_name="Veterans Org",
+        )
+
+        results, errors = Loader(session).load_batch([resource])
+
+        assert errors == []
+        assert results[0].action == "updated"
+        assert results[0].resource_id == existing.id
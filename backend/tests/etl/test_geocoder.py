@@ -0,0 +1,233 @@
+"""Tests for the cached Census batch geocoder.
+
+The Census batch endpoint is replaced by a local HTTP server that answers
+in the same CSV format.
+"""
+
+import csv
+import io
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.models import GeocodedAddress
+from app.services.geo import GeoContext, ZipTable
+from etl.enrich import Enricher
+from etl.geocoder import CensusGeocoder, address_hash
+from etl.models import NormalizedResource
+
+# Street addresses the stand-in matches: street -> (lat, lon)
+MATCHES = {
+    "810 Vermont Avenue NW": (38.9006, -77.0344),
+    "1 Veterans Plaza Road": (30.2672, -97.7431),
+}
+
+
+class _CensusHandler(BaseHTTPRequestHandler):
+    """Answers batch requests like the Census geocoder, recording each one."""
+
+    batches: list[list[str]] = []
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        # The address file is the only multipart part that looks like CSV rows
+        rows = [row for row in csv.reader(io.StringIO(body)) if len(row) == 5]
+        self.batches.append([row[1] for row in rows])
+
+        out = io.StringIO()
+        writer = csv.writer(out)
+        for row_id, street, city, state, zip_code in rows:
+            if street in MATCHES:
+                lat, lon = MATCHES[street]
+                writer.writerow(
+                    [row_id, f"{street}, {city}, {state}, {zip_code}", "Match", "Exact", "", f"{lon},{lat}"]
+                )
+            else:
+                writer.writerow([row_id, f"{street}, {city}, {state}, {zip_code}", "No_Match"])
+        payload = out.getvalue().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def census_url() -> Iterator[str]:
+    """URL of a local Census batch stand-in."""
+    _CensusHandler.batches = []
+    server = HTTPServer(("127.0.0.1", 0), _CensusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/addressbatch"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _geo_context():
+    """Zip centroids for the fallback tests."""
+    context = GeoContext(postgis=False, zips=ZipTable([("62701", 39.80, -89.65, "IL")]))
+    with patch("etl.geocoder.get_geo_context", return_value=context):
+        yield
+
+
+def _resource(address: str, city: str = "Washington", state: str = "DC", zip_code: str = "20420"):
+    return NormalizedResource(
+        title="Test Resource",
+        description="Test description",
+        source_url=f"https://example.com/{address}",
+        org_name="Test Org",
+        address=address,
+        city=city,
+        state=state,
+        zip_code=zip_code,
+    )
+
+
+def _resources() -> list[NormalizedResource]:
+    return [
+        _resource("810 Vermont Avenue NW"),
+        _resource("1 Veterans Plaza Road", city="Austin", state="TX", zip_code="78701"),
+        _resource("500 Unknown Street", city="Springfield", state="IL", zip_code="62701"),
+        _resource("Citywide", city="Chicago", state="IL", zip_code="60601"),
+    ]
+
+
+class TestAddressHash:
+    """Tests for address cache keys."""
+
+    def test_normalizes_case_punctuation_and_zip4(self):
+        """Test that formatting differences share a cache entry."""
+        assert address_hash("810 Vermont Ave. NW", "Washington", "DC", "20420-0001") == address_hash(
+            "810 vermont ave nw", "WASHINGTON", "dc", "20420"
+        )
+
+    def test_different_addresses_differ(self):
+        """Test that different streets get different keys."""
+        assert address_hash("1 Main St", "Austin", "TX", "78701") != address_hash("2 Main St", "Austin", "TX", "78701")
+
+
+class TestCensusGeocoder:
+    """Tests for CensusGeocoder batching, caching and fallbacks."""
+
+    def test_batch_geocodes_with_fallbacks(self, session: Session, census_url: str):
+        """Test one Census request for street addresses and centroids for the rest."""
+        geocoder = CensusGeocoder(session, url=census_url, request_interval=0)
+
+        coordinates = geocoder.geocode_batch(
+            [(r.address, r.city, r.state, r.zip_code) for r in _resources()]  # type: ignore[misc]
+        )
+
+        assert coordinates[0] == MATCHES["810 Vermont Avenue NW"]
+        assert coordinates[1] == MATCHES["1 Veterans Plaza Road"]
+        assert coordinates[2] == (39.80, -89.65)  # No Census match: zip centroid
+        assert coordinates[3] == (41.8781, -87.6298)  # Citywide: never sent, city centroid
+        assert geocoder.requests == 1
+        assert _CensusHandler.batches == [["810 Vermont Avenue NW", "1 Veterans Plaza Road", "500 Unknown Street"]]
+
+    def test_results_cached_including_misses(self, session: Session, census_url: str):
+        """Test that matched and unmatched addresses are stored in the cache."""
+        CensusGeocoder(session, url=census_url, request_interval=0).geocode_batch(
+            [(r.address, r.city, r.state, r.zip_code) for r in _resources()]  # type: ignore[misc]
+        )
+
+        rows = {row.address_hash: row for row in session.exec(select(GeocodedAddress)).all()}
+        assert len(rows) == 3
+        unmatched = rows[address_hash("500 Unknown Street", "Springfield", "IL", "62701")]
+        assert unmatched.latitude is None
+
+    def test_refresh_of_unchanged_addresses_makes_no_requests(self, session: Session, census_url: str):
+        """Test that a second run over the same addresses is answered from the cache."""
+        first = Enricher(geocoder=CensusGeocoder(session, url=census_url, request_interval=0)).enrich_batch(
+            _resources()
+        )
+        geocoder = CensusGeocoder(session, url=census_url, request_interval=0)
+        second = Enricher(geocoder=geocoder).enrich_batch(_resources())
+
+        assert geocoder.requests == 0
+        assert len(_CensusHandler.batches) == 1
+        assert [(r.latitude, r.longitude) for r in second] == [(r.latitude, r.longitude) for r in first]
+
+    def test_expired_misses_are_retried(self, session: Session, census_url: str):
+        """Test that a cached "no match" is sent again once it is older than the miss TTL."""
+        addresses = [(r.address, r.city, r.state, r.zip_code) for r in _resources()]
+        CensusGeocoder(session, url=census_url, request_interval=0).geocode_batch(addresses)  # type: ignore[arg-type]
+        unmatched = session.get(GeocodedAddress, address_hash("500 Unknown Street", "Springfield", "IL", "62701"))
+        unmatched.created_at = datetime.now(UTC) - timedelta(days=31)
+        session.add(unmatched)
+        session.commit()
+
+        geocoder = CensusGeocoder(session, url=census_url, request_interval=0, miss_ttl_days=30)
+        geocoder.geocode_batch(addresses)  # type: ignore[arg-type]
+
+        assert geocoder.requests == 1
+        assert _CensusHandler.batches[-1] == ["500 Unknown Street"]
+        session.refresh(unmatched)
+        assert unmatched.created_at.replace(tzinfo=None) > datetime.now() - timedelta(days=1)
+
+    def test_cache_does_not_commit_the_pipeline_session(self, session: Session, census_url: str):
+        """Test that cache reads and writes leave the caller's transaction alone."""
+        geocoder = CensusGeocoder(session, url=census_url, request_interval=0)
+
+        with patch.object(session, "commit") as commit, patch.object(session, "rollback") as rollback:
+            geocoder.geocode_batch([(r.address, r.city, r.state, r.zip_code) for r in _resources()])  # type: ignore[misc]
+
+        commit.assert_not_called()
+        rollback.assert_not_called()
+
+    def test_requests_split_by_batch_size(self, session: Session, census_url: str):
+        """Test that cache misses are sent batch_size addresses at a time."""
+        geocoder = CensusGeocoder(session, url=census_url, batch_size=2, request_interval=0)
+
+        geocoder.geocode_batch([(f"{i} Main Street", "Austin", "TX", "78701") for i in range(100, 105)])
+
+        assert geocoder.requests == 3
+        assert [len(batch) for batch in _CensusHandler.batches] == [2, 2, 1]
+
+    def test_api_error_not_cached(self, session: Session):
+        """Test that failed requests fall back to centroids and are retried next run."""
+        geocoder = CensusGeocoder(session, url="http://127.0.0.1:9/addressbatch", request_interval=0)
+
+        lat, lng = geocoder.geocode("500 Unknown Street", "Springfield", "IL", "62701")
+
+        assert (lat, lng) == (39.80, -89.65)
+        assert session.exec(select(GeocodedAddress)).all() == []
+
+
+class TestEnricherBatchGeocoding:
+    """Tests for Enricher.enrich_batch with a batch geocoder."""
+
+    def test_one_geocode_batch_call(self):
+        """Test that enrich_batch geocodes all located resources in one call."""
+
+        class RecordingGeocoder:
+            def __init__(self):
+                self.batches: list[list[tuple[str, str, str, str]]] = []
+
+            def geocode(self, address: str, city: str, state: str, zip_code: str):
+                raise AssertionError("geocode_batch should be used")
+
+            def geocode_batch(self, addresses):
+                self.batches.append(list(addresses))
+                return [(1.0, 2.0)] * len(addresses)
+
+        geocoder = RecordingGeocoder()
+        no_address = NormalizedResource(
+            title="National", description="x", source_url="https://example.com/n", org_name="Test Org"
+        )
+
+        results = Enricher(geocoder=geocoder).enrich_batch([*_resources(), no_address])
+
+        assert len(geocoder.batches) == 1
+        assert len(geocoder.batches[0]) == 4
+        assert results[0].latitude == 1.0
+        assert results[-1].latitude is None
@@ -0,0 +1,223 @@
+"""Tests for chunked loading in Loader.load_batch.
+
+These tests use mocks and don't require PostgreSQL.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy.exc import OperationalError
+
+from app.models import Organization, Resource, Source
+from etl.loader import Loader
+from etl.models import NormalizedResource
+
+
+def _resource(i: int, org: str = "Test Org") -> NormalizedResource:
+    return NormalizedResource(
+        title=f"Resource {i}",
+        description=f"Description {i}",
+        source_url=f"https://example.com/{i}",
+        org_name=org,
+    )
+
+
+def _empty_session() -> MagicMock:
+    """Session where every lookup finds nothing."""
+    session = MagicMock()
+    session.exec.side_effect = lambda stmt: iter(())
+    return session
+
+
+class TestLoadBatchChunks:
+    """Tests for set-based chunk loading."""
+
+    def test_chunk_resolved_with_one_query_per_entity(self):
+        """Test that a chunk issues one org query and one resource query, not one per row."""
+        session = _empty_session()
+        resources = [_resource(i, org=f"Org {i % 3}") for i in range(10)]
+
+        results, errors = Loader(session).load_batch(resources)
+
+        assert [r.action for r in results] == ["created"] * 10
+        assert errors == []
+        # source_records + organizations + resources + fingerprints IN (...); no locations or sources
+        assert session.exec.call_count == 4
+        session.commit.assert_called_once()
+        # One flush before the fingerprint upsert, none per row
+        session.flush.assert_called_once()
+
+    def test_commits_once_per_chunk(self):
+        """Test that each chunk is committed separately."""
+        session = _empty_session()
+
+        results, _ = Loader(session).load_batch([_resource(i) for i in range(5)], chunk_size=2)
+
+        assert len(results) == 5
+        assert session.commit.call_count == 3
+
+    def test_organizations_shared_within_chunk(self):
+        """Test that rows with the same org (any case) share one new Organization."""
+        session = _empty_session()
+        resources = [_resource(0, org="Test Org"), _resource(1, org="TEST ORG"), _resource(2, org="Other Org")]
+
+        results, _ = Loader(session).load_batch(resources)
+
+        assert results[0].organization_id == results[1].organization_id
+        assert results[0].organization_id != results[2].organization_id
+
+    def test_duplicate_url_in_chunk_updates_created_resource(self):
+        """Test that a repeated source_url in a chunk is not created twice."""
+        session = _empty_session()
+
+        results, _ = Loader(session).load_batch([_resource(0), _resource(0)])
+
+        assert [r.action for r in results] == ["created", "skipped"]
+        assert results[0].resource_id == results[1].resource_id
+
+    def test_failed_chunk_falls_back_to_single_loads(self):
+        """Test that a failed chunk is rolled back and retried one resource at a time."""
+        session = _empty_session()
+        loader = Loader(session)
+        error = OperationalError("connection timeout", {}, Exception("timeout expired"))
+
+        def bulk_fails(chunk):
+            raise error
+
+        loader._load_chunk = bulk_fails  # type: ignore[method-assign]
+        session.exec.side_effect = error
+
+        results, errors = loader.load_batch([_resource(0), _resource(1)])
+
+        session.rollback.assert_called()
+        assert [r.action for r in results] == ["failed", "failed"]
+        assert all(r.retriable for r in results)
+        assert [e.source_url for e in errors] == ["https://example.com/0", "https://example.com/1"]
+
+
+def _sourced(i: int, raw: str = "v1") -> NormalizedResource:
+    resource = _resource(i)
+    resource.source_name = "Test Source"
+    resource.raw_data = {"id": i, "version": raw}
+    resource.fetched_at = datetime(2026, 2, 9, tzinfo=UTC)
+    return resource
+
+
+class TestUnchangedFastPath:
+    """Tests for skipping records whose raw data hash is unchanged."""
+
+    SOURCE_ID = uuid4()
+
+    def _loader(self, session: MagicMock, last_records: list[tuple]) -> Loader:
+        """Loader with a cached source, where the first query (source_records) returns last_records."""
+        loader = Loader(session)
+        loader._source_cache["Test Source"] = Source(id=self.SOURCE_ID, name="Test Source", url="https://example.com")
+        rows = [last_records]
+        session.exec.side_effect = lambda stmt: iter(rows.pop(0) if rows else ())
+        return loader
+
+    def test_unchanged_records_skip_lookups_and_writes(self):
+        """Test that unchanged records are answered from the hash query plus one UPDATE."""
+        session = MagicMock()
+        resources = [_sourced(i) for i in range(3)]
+        resource_ids = [uuid4() for _ in resources]
+        rows = zip(resources, resource_ids, strict=True)
+        loader = self._loader(session, [(r.source_url, rid, self.SOURCE_ID, Loader._raw_hash(r)) for r, rid in rows])
+
+        results, errors = loader.load_batch(resources)
+
+        assert [r.action for r in results] == ["skipped"] * 3
+        assert [r.resource_id for r in results] == resource_ids
+        assert errors == []
+        # Only the source_records lookup: no org, location, resource or fingerprint queries
+        assert session.exec.call_count == 1
+        session.execute.assert_called_once()
+        session.add.assert_not_called()
+
+    def test_changed_hash_takes_full_path(self):
+        """Test that a record with new raw data is diffed and loaded as before."""
+        session = MagicMock()
+        old = _sourced(0, raw="v1")
+        loader = self._loader(session, [(old.source_url, uuid4(), self.SOURCE_ID, Loader._raw_hash(old))])
+
+        results, _ = loader.load_batch([_sourced(0, raw="v2")])
+
+        assert [r.action for r in results] == ["created"]
+        # source_records + organizations + resources + fingerprints IN (...)
+        assert session.exec.call_count == 4
+
+    def test_disabled_diffs_every_record(self):
+        """Test that skip_unchanged=False never queries source records."""
+        session = _empty_session()
+        loader = Loader(session, skip_unchanged=False)
+        loader._source_cache["Test Source"] = Source(id=uuid4(), name="Test Source", url="https://example.com")
+
+        results, _ = loader.load_batch([_sourced(0)])
+
+        assert [r.action for r in results] == ["created"]
+        # organizations + resources + fingerprints IN (...)
+        assert session.exec.call_count == 3
+
+
+class TestUpdateSourceTier:
+    """Tests for merging a copy of a resource from another source."""
+
+    def _copies(self, existing_tier: int, incoming_tier: int) -> tuple[Resource, NormalizedResource, Source]:
+        org = Organization(id=uuid4(), name="Test Org")
+        owner = Source(id=uuid4(), name="Owner", url="https://owner.example.com", tier=existing_tier)
+        existing = Resource(
+            id=uuid4(),
+            title="Resource 0",
+            description="Official description",
+            organization_id=org.id,
+            source_id=owner.id,
+            source=owner,
+            organization=org,
+        )
+        incoming = Source(id=uuid4(), name="Incoming", url="https://incoming.example.com", tier=incoming_tier)
+        normalized = _resource(0)
+        normalized.description = "Scraped description"
+        normalized.phone = "555-123-4567"
+        return existing, normalized, incoming
+
+    def _update(self, existing_tier: int, incoming_tier: int) -> tuple[Resource, Source]:
+        """Merge a copy the way a streaming run does."""
+        existing, normalized, incoming = self._copies(existing_tier, incoming_tier)
+        loader = Loader(MagicMock())
+        loader.lower_tier_fills_empty_only = True
+        loader._update_resource(existing, normalized, existing.organization, None, incoming)
+        return existing, incoming
+
+    def test_lower_tier_copy_only_fills_empty_fields(self):
+        """Test that a lower-tier source doesn't overwrite a higher-tier source's fields."""
+        existing, incoming = self._update(existing_tier=1, incoming_tier=3)
+
+        assert existing.description == "Official description"
+        assert existing.phone == "555-123-4567"
+        assert existing.source_id != incoming.id
+
+    def test_higher_tier_copy_overwrites_fields(self):
+        """Test that a higher-tier source's fields replace a lower-tier source's."""
+        existing, incoming = self._update(existing_tier=3, incoming_tier=1)
+
+        assert existing.description == "Scraped description"
+        assert existing.source_id == incoming.id
+
+    def test_single_load_overwrites_from_any_tier(self):
+        """Test that load() outside a streaming run keeps last-writer-wins updates."""
+        existing, normalized, incoming = self._copies(existing_tier=1, incoming_tier=3)
+        normalized.source_name = incoming.name
+        loader = Loader(MagicMock())
+
+        with (
+            patch.object(loader, "_get_or_create_organization", return_value=existing.organization),
+            patch.object(loader, "_get_or_create_source", return_value=incoming),
+            patch.object(loader, "_find_existing_resource", return_value=existing),
+            patch.object(loader, "_commit"),
+        ):
+            result = loader.load(normalized)
+
+        assert result.action == "updated"
+        assert existing.description == "Scraped description"
+        assert existing.source_id != incoming.id
@@ -5,12 +5,14 @@ Tests that don't need the loader can still run with SQLite.
 """
 
 import json
+import threading
+import time
 
 import httpx
 import pytest
 
-from connectors.base import ResourceCandidate
-from etl.models import ETLResult
+from connectors.base import ResourceCandidate, SourceMetadata
+from etl.models import ETLResult, ETLStats, LoadResult
 from etl.pipeline import ETLPipeline, _categorize_exception, create_pipeline
 from tests.etl.conftest import MockConnector
 
@@ -279,6 +281,203 @@ class TestETLPipeline:
         assert db_resource.reliability_score == 1.0  # Tier 1 score
 
 
+class SlowConnector(MockConnector):
+    """Mock connector that takes a while and tracks how many run at once per host."""
+
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    finished: list[str] = []
+    lock = threading.Lock()
+
+    def __init__(self, name: str, host: str, seconds: float):
+        super().__init__(
+            [
+                ResourceCandidate(
+                    title=f"{name} Resource",
+                    description="Resource from a slow source",
+                    source_url=f"https://{host}/{name}",
+                    org_name=f"{name} Org",
+                )
+            ],
+            name=name,
+        )
+        self._metadata = SourceMetadata(name=name, url=f"https://{host}/api", tier=2, frequency="daily")
+        self.seconds = seconds
+
+    def run(self) -> list[ResourceCandidate]:
+        host = self._metadata.url
+        with self.lock:
+            self.running[host] = self.running.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.running[host])
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running[host] -= 1
+            self.finished.append(self._metadata.name)
+        return super().run()
+
+
+class TestConcurrentExtract:
+    """Tests for the concurrent extract stage."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_counts(self):
+        SlowConnector.running.clear()
+        SlowConnector.peak.clear()
+        SlowConnector.finished.clear()
+
+    def test_connectors_run_concurrently(self, etl_session):
+        """Test that slow connectors overlap instead of running back to back."""
+        connectors = [SlowConnector(f"Source {i}", f"host{i}.example.com", 0.3) for i in range(4)]
+
+        started = time.monotonic()
+        result = ETLPipeline(etl_session, max_workers=4).dry_run(connectors)
+
+        assert time.monotonic() - started < 1.0
+        assert result.stats.extracted == 4
+        assert set(result.stats.connector_seconds) == {f"Source {i}" for i in range(4)}
+        assert all(seconds >= 0.3 for seconds in result.stats.connector_seconds.values())
+        assert result.stats.extract_seconds < 1.0
+
+    def test_per_host_limit(self, etl_session):
+        """Test that connectors sharing a host respect the per-host limit."""
+        connectors = [SlowConnector(f"Source {i}", "shared.example.com", 0.1) for i in range(4)]
+
+        result = ETLPipeline(etl_session, max_workers=4, per_host=1).dry_run(connectors)
+
+        assert result.stats.extracted == 4
+        assert SlowConnector.peak["https://shared.example.com/api"] == 1
+
+    def test_busy_host_does_not_hold_every_worker(self, etl_session):
+        """Test that connectors waiting on a busy host leave workers free for other hosts."""
+        connectors = [SlowConnector(f"Source {i}", "shared.example.com", 0.2) for i in range(3)]
+        connectors.append(SlowConnector("Other Source", "other.example.com", 0.0))
+
+        result = ETLPipeline(etl_session, max_workers=2, per_host=1).dry_run(connectors)
+
+        assert result.stats.extracted == 4
+        assert SlowConnector.peak["https://shared.example.com/api"] == 1
+        assert SlowConnector.finished[0] == "Other Source"
+
+    def test_connector_timeout(self, etl_session):
+        """Test that a hung connector is reported without holding up the others."""
+        connectors = [
+            SlowConnector("Hung Source", "hung.example.com", 2.0),
+            SlowConnector("Fast Source", "fast.example.com", 0.0),
+        ]
+
+        started = time.monotonic()
+        result = ETLPipeline(etl_session, connector_timeout=0.2).dry_run(connectors)
+
+        assert time.monotonic() - started < 1.5
+        assert result.stats.extracted == 1
+        assert len(result.errors) == 1
+        assert result.errors[0].category == "transient"
+        assert "Hung Source" in result.errors[0].message
+
+    def test_results_kept_in_connector_order(self, etl_session):
+        """Test that normalized output doesn't depend on which connector finished first."""
+        connectors = [
+            SlowConnector("Slow Source", "slow.example.com", 0.2),
+            SlowConnector("Fast Source", "fast.example.com", 0.0),
+        ]
+        pipeline = ETLPipeline(etl_session)
+        errors: list = []
+
+        normalized = pipeline._extract(connectors, ETLStats(), errors)
+
+        assert [r.source_name for r in normalized] == ["Slow Source", "Fast Source"]
+
+
+class StreamingConnector(MockConnector):
+    """Mock connector that only streams (run() is not used by the streaming pipeline)."""
+
+    def __init__(self, name: str, count: int, hang_after: float | None = None):
+        super().__init__([], name=name)
+        self._metadata = SourceMetadata(name=name, url=f"https://{name.lower()}.example.com", tier=2, frequency="daily")
+        self.count = count
+        self.hang_after = hang_after
+
+    def run(self) -> list[ResourceCandidate]:
+        raise AssertionError("run() should not be called")
+
+    def iter_candidates(self):
+        for i in range(self.count):
+            yield ResourceCandidate(
+                title=f"{self._metadata.name} Resource {i}",
+                description="Streamed resource",
+                source_url=f"https://example.com/{self._metadata.name}/{i}",
+                org_name=f"{self._metadata.name} Org {i}",
+            )
+            if self.hang_after is not None and i == 0:
+                time.sleep(self.hang_after)
+
+
+def _recording_loader() -> tuple[list[int], object]:
+    """Loader stand-in that records chunk sizes and creates everything."""
+    sizes: list[int] = []
+
+    class RecordingLoader:
+        def load_batch(self, resources):
+            sizes.append(len(resources))
+            return [LoadResult(action="created") for _ in resources], []
+
+    return sizes, RecordingLoader()
+
+
+class TestRunStreaming:
+    """Tests for chunked, bounded-memory pipeline runs."""
+
+    def test_loads_in_fixed_size_chunks(self, etl_session):
+        """Test that resources flow through dedupe/enrich/load in chunks."""
+        pipeline = ETLPipeline(etl_session)
+        sizes, pipeline.loader = _recording_loader()
+
+        result = pipeline.run_streaming([StreamingConnector("Alpha", 7), StreamingConnector("Beta", 5)], chunk_size=4)
+
+        assert result.success is True
+        assert result.stats.extracted == 12
+        assert result.stats.created == 12
+        assert sum(sizes) == 12
+        assert max(sizes) <= 4
+        assert set(result.stats.connector_seconds) == {"Alpha", "Beta"}
+
+    def test_run_adapter_for_list_connectors(self, etl_session, sample_candidate):
+        """Test that connectors without iter_candidates() stream through run()."""
+        pipeline = ETLPipeline(etl_session)
+        sizes, pipeline.loader = _recording_loader()
+
+        result = pipeline.run_streaming([MockConnector([sample_candidate])], chunk_size=10)
+
+        assert result.stats.created == 1
+        assert sizes == [1]
+
+    def test_failing_connector_reported(self, etl_session, failing_connector):
+        """Test that a failing stream is categorized like in run()."""
+        pipeline = ETLPipeline(etl_session)
+        _, pipeline.loader = _recording_loader()
+
+        result = pipeline.run_streaming([failing_connector, StreamingConnector("Alpha", 3)], chunk_size=2)
+
+        assert result.success is False
+        assert result.stats.created == 3
+        assert [e.stage for e in result.errors] == ["extract"]
+
+    def test_stalled_connector_stopped(self, etl_session):
+        """Test that a connector without progress is stopped and the rest still load."""
+        pipeline = ETLPipeline(etl_session, connector_timeout=0.3)
+        _, pipeline.loader = _recording_loader()
+
+        started = time.monotonic()
+        result = pipeline.run_streaming(
+            [StreamingConnector("Stalled", 5, hang_after=3.0), StreamingConnector("Alpha", 3)], chunk_size=2
+        )
+
+        assert time.monotonic() - started < 2.5
+        assert result.stats.created == 3
+        assert len(result.errors) == 1
+        assert result.errors[0].category == "transient"
+
+
 class TestCreatePipeline:
     """Tests for the create_pipeline factory function."""
 
@@ -0,0 +1,58 @@
+"""Tests for the analytics partitions job."""
+
+from unittest.mock import MagicMock, patch
+
+from jobs.analytics_partitions import AnalyticsPartitionJob
+
+
+class TestAnalyticsPartitionJob:
+    """Tests for AnalyticsPartitionJob class."""
+
+    def test_job_properties(self):
+        """Test job name and description."""
+        job = AnalyticsPartitionJob()
+
+        assert job.name == "analytics_partitions"
+        assert "partitions" in job.description.lower()
+
+    def test_creates_and_drops(self):
+        """Upcoming partitions are created and expired ones dropped."""
+        job = AnalyticsPartitionJob()
+
+        with patch("jobs.analytics_partitions.AnalyticsPartitionService") as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.is_partitioned.return_value = True
+            service.ensure_partitions.return_value = ["analytics_events_y2026m06"]
+            service.expired_partitions.return_value = ["analytics_events_legacy"]
+            stats = job.execute(MagicMock())
+
+        service.drop_partitions.assert_called_once_with(["analytics_events_legacy"])
+        assert stats["created"] == ["analytics_events_y2026m06"]
+        assert stats["dropped"] == ["analytics_events_legacy"]
+
+    def test_dry_run_keeps_partitions(self):
+        """Dry run reports expired partitions without dropping them."""
+        job = AnalyticsPartitionJob()
+
+        with patch("jobs.analytics_partitions.AnalyticsPartitionService") as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.is_partitioned.return_value = True
+            service.ensure_partitions.return_value = []
+            service.expired_partitions.return_value = ["analytics_events_legacy"]
+            stats = job.execute(MagicMock(), dry_run=True)
+
+        service.drop_partitions.assert_not_called()
+        assert stats["dropped"] == []
+        assert stats["expired"] == ["analytics_events_legacy"]
+
+    def test_unpartitioned_table(self):
+        """Nothing is done before the migration has run."""
+        job = AnalyticsPartitionJob()
+
+        with patch("jobs.analytics_partitions.AnalyticsPartitionService") as mock_service_cls:
+            service = mock_service_cls.return_value
+            service.is_partitioned.return_value = False
+            stats = job.execute(MagicMock())
+
+        service.ensure_partitions.assert_not_called()
+        assert stats["partitioned"] is False
@@ -0,0 +1,76 @@
+"""Tests for the analytics rollup job."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, call, patch
+
+from app.services.analytics import PERIOD_DAY, PERIOD_HOUR
+from jobs.analytics_rollup import AnalyticsRollupJob
+
+NOW = datetime(2026, 3, 10, 3, 30, tzinfo=UTC)
+TODAY = datetime(2026, 3, 10, tzinfo=UTC)
+
+
+class TestAnalyticsRollupJob:
+    """Tests for AnalyticsRollupJob class."""
+
+    def test_job_properties(self):
+        """Test job name and description."""
+        job = AnalyticsRollupJob()
+
+        assert job.name == "analytics_rollup"
+        assert "analytics" in job.description.lower()
+
+    def test_rolls_up_missing_days_and_closed_hours(self):
+        """Buckets without a rollup are computed, and recently closed ones recomputed."""
+        job = AnalyticsRollupJob()
+        now = TODAY + timedelta(hours=9, minutes=30)
+
+        with patch("jobs.analytics_rollup.AnalyticsService") as mock_analytics_cls:
+            analytics = mock_analytics_cls.return_value
+            analytics.first_event_at.return_value = TODAY - timedelta(days=3, hours=-5)
+            analytics.rollup_dates.side_effect = [
+                {TODAY - timedelta(days=3)},  # day rows
+                {TODAY + timedelta(hours=n) for n in range(8)},  # hour rows 00:00-07:00
+            ]
+            analytics.delete_hour_rollups.return_value = 20
+            stats = job.execute(MagicMock(), now=now)
+
+        assert analytics.rollup.call_args_list == [
+            call(TODAY - timedelta(days=2), PERIOD_DAY),
+            call(TODAY - timedelta(days=1), PERIOD_DAY),
+            # 06:00 and 07:00 closed within ROLLUP_REFRESH; 08:00 is new; 09:00-10:00 hasn't closed
+            call(TODAY + timedelta(hours=6), PERIOD_HOUR),
+            call(TODAY + timedelta(hours=7), PERIOD_HOUR),
+            call(TODAY + timedelta(hours=8), PERIOD_HOUR),
+        ]
+        analytics.delete_hour_rollups.assert_called_once_with(before=TODAY)
+        assert stats == {"days_rolled_up": 2, "hours_rolled_up": 3, "hour_rollups_deleted": 20}
+
+    def test_recomputes_yesterday_after_midnight(self):
+        """Events written late for yesterday are picked up by its day row."""
+        job = AnalyticsRollupJob()
+        yesterday = TODAY - timedelta(days=1)
+
+        with patch("jobs.analytics_rollup.AnalyticsService") as mock_analytics_cls:
+            analytics = mock_analytics_cls.return_value
+            analytics.first_event_at.return_value = yesterday - timedelta(days=1)
+            analytics.rollup_dates.side_effect = [{yesterday - timedelta(days=1), yesterday}, set()]
+            analytics.delete_hour_rollups.return_value = 0
+            job.execute(MagicMock(), now=TODAY + timedelta(minutes=30))
+
+        assert analytics.rollup.call_args_list == [call(yesterday, PERIOD_DAY)]
+
+    def test_no_events(self):
+        """Without events there are no days to roll up; today's hours still get (empty) rows."""
+        job = AnalyticsRollupJob()
+
+        with patch("jobs.analytics_rollup.AnalyticsService") as mock_analytics_cls:
+            analytics = mock_analytics_cls.return_value
+            analytics.first_event_at.return_value = None
+            analytics.rollup_dates.return_value = set()
+            analytics.delete_hour_rollups.return_value = 0
+            stats = job.execute(MagicMock(), now=NOW)
+
+        assert {period for _, period in (c.args for c in analytics.rollup.call_args_list)} == {PERIOD_HOUR}
+        assert stats["days_rolled_up"] == 0
+        assert stats["hours_rolled_up"] == 3
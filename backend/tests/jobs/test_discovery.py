@@ -230,6 +230,26 @@ class TestDiscoveryJob:
         # 0.5 -> discarded
         assert result["discarded"] >= 1  # Low confidence discarded
 
+    def test_find_duplicates_batches_lookups(self):
+        """Test that duplicates are found by URL and fingerprint with one query each."""
+        job = DiscoveryJob()
+        session = MagicMock()
+        session.exec.return_value.all.return_value = ["https://known.example.com"]
+        dedupe_index = MagicMock()
+        dedupe_index.find.return_value = [MagicMock(), None]
+        candidates = [
+            {"name": "Known URL", "source_url": "https://known.example.com"},
+            {"name": "Housing Help", "organization": "Veterans Org"},
+            {"name": "New Program", "organization": "Veterans Org"},
+        ]
+
+        duplicates = job._find_duplicates(session, dedupe_index, candidates)
+
+        assert duplicates == [True, True, False]
+        session.exec.assert_called_once()
+        dedupe_index.find.assert_called_once()
+        assert len(dedupe_index.find.call_args.args[0]) == 2
+
 
 class TestDiscoveryStats:
     """Tests for DiscoveryStats dataclass."""
@@ -30,7 +30,8 @@ class TestFreshnessJob:
             # Mock count queries
             with patch.object(job, "_count_active_resources", return_value=10):
                 with patch.object(job, "_get_average_freshness", return_value=0.75):
-                    stats = job.execute(mock_session)
+                    with patch("jobs.freshness.StatsService") as mock_stats_cls:
+                        stats = job.execute(mock_session)
 
         assert stats["total_active"] == 10
         assert stats["updated"] == 5
@@ -39,6 +40,7 @@ class TestFreshnessJob:
         assert stats["stale_count"] == 2
 
         mock_trust.refresh_all_freshness_scores.assert_called_once()
+        mock_stats_cls.return_value.refresh.assert_called_once()
 
     def test_execute_with_no_resources(self):
         """Test execute when no resources exist."""
@@ -96,10 +96,12 @@ class TestRefreshJob:
                 mock_pipeline.dry_run.return_value = mock_result
                 mock_pipeline_cls.return_value = mock_pipeline
 
-                stats = job.execute(mock_session, dry_run=True)
+                with patch("jobs.refresh.StatsService") as mock_stats_cls:
+                    stats = job.execute(mock_session, dry_run=True)
 
         assert stats["success"] is True
         mock_pipeline.dry_run.assert_called_once()
+        mock_stats_cls.return_value.refresh.assert_not_called()
 
     def test_execute_full_run(self):
         """Test execute with full ETL run."""
@@ -136,13 +138,15 @@ class TestRefreshJob:
 
                 # Mock the geocoding method to return an int
                 with patch.object(job, "_geocode_from_zip_centroids", return_value=0):
-                    stats = job.execute(mock_session, dry_run=False)
+                    with patch("jobs.refresh.StatsService") as mock_stats_cls:
+                        stats = job.execute(mock_session, dry_run=False)
 
         assert stats["success"] is True
         assert stats["extracted"] == 10
         assert stats["created"] == 5
         assert stats["updated"] == 3
         mock_pipeline.run.assert_called_once()
+        mock_stats_cls.return_value.refresh.assert_called_once()
 
     def test_format_message_success(self):
         """Test formatting success message."""
@@ -0,0 +1,120 @@
+"""Tests for buffered analytics ingestion."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.models import AnalyticsEvent, AnalyticsEventType
+from app.services import analytics_buffer
+from app.services.analytics import AnalyticsService
+from app.services.analytics_buffer import MAX_BATCH_ATTEMPTS, AnalyticsBuffer
+
+
+def _event(name: str = "home") -> AnalyticsEvent:
+    return AnalyticsEvent(event_type=AnalyticsEventType.PAGE_VIEW, event_name=name)
+
+
+@pytest.fixture
+def session():
+    """Session the buffer writes with (patched in place of a real engine)."""
+    with patch("app.services.analytics_buffer.Session") as session_cls:
+        yield session_cls.return_value.__enter__.return_value
+
+
+class TestAnalyticsBuffer:
+    """Events are batched, bounded and never lost on a transient failure."""
+
+    def test_flush_writes_in_batches(self, session):
+        buffer = AnalyticsBuffer(MagicMock(), max_events=100, batch_size=2, flush_interval_ms=1000)
+        for i in range(5):
+            assert buffer.add(_event(f"page-{i}"))
+
+        assert buffer.flush() == 5
+
+        batches = [call.args[1] for call in session.execute.call_args_list]
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row["event_name"] for batch in batches for row in batch] == [f"page-{i}" for i in range(5)]
+        assert session.commit.call_count == 3
+        stats = buffer.stats()
+        assert (stats.accepted, stats.written, stats.pending) == (5, 5, 0)
+
+    def test_full_buffer_refuses_events(self, session):
+        buffer = AnalyticsBuffer(MagicMock(), max_events=2, batch_size=10, flush_interval_ms=1000)
+
+        assert buffer.add(_event())
+        assert buffer.add(_event())
+        assert not buffer.add(_event())
+
+        stats = buffer.stats()
+        assert (stats.accepted, stats.dropped, stats.pending) == (2, 1, 2)
+
+    def test_failed_write_is_requeued(self, session):
+        buffer = AnalyticsBuffer(MagicMock(), max_events=10, batch_size=10, flush_interval_ms=1000)
+        buffer.add(_event("first"))
+        buffer.add(_event("second"))
+        session.execute.side_effect = [Exception("db down"), None]
+
+        assert buffer.flush() == 0
+        assert buffer.stats().pending == 2
+
+        assert buffer.flush() == 2
+        assert [row["event_name"] for row in session.execute.call_args.args[1]] == ["first", "second"]
+        stats = buffer.stats()
+        assert (stats.failed_flushes, stats.dropped, stats.written) == (1, 0, 2)
+
+    def test_failing_row_is_dropped_after_retries(self, session):
+        buffer = AnalyticsBuffer(MagicMock(), max_events=10, batch_size=10, flush_interval_ms=1000)
+        for name in ("first", "bad", "last"):
+            buffer.add(_event(name))
+
+        def insert(stmt, rows):
+            if any(row["event_name"] == "bad" for row in rows):
+                raise Exception("no partition of relation found for row")
+
+        session.execute.side_effect = insert
+
+        for _ in range(MAX_BATCH_ATTEMPTS - 1):
+            assert buffer.flush() == 0
+            assert buffer.stats().pending == 3
+        assert buffer.flush() == 2
+
+        stats = buffer.stats()
+        assert (stats.written, stats.dropped, stats.pending) == (2, 1, 0)
+        assert stats.failed_flushes == MAX_BATCH_ATTEMPTS
+
+        # Later events are no longer held up
+        buffer.add(_event("next"))
+        assert buffer.flush() == 1
+        assert buffer.stats().written == 3
+
+    def test_stop_drains_pending_events(self, session):
+        buffer = AnalyticsBuffer(MagicMock(), max_events=100, batch_size=50, flush_interval_ms=60_000)
+        buffer.start()
+        buffer.add(_event())
+        buffer.add(_event())
+
+        buffer.stop()
+
+        assert buffer.stats().written == 2
+        assert buffer.stats().pending == 0
+
+
+class TestRecord:
+    """AnalyticsService.record uses the running buffer, else writes directly."""
+
+    def test_buffered_when_running(self):
+        buffer = MagicMock()
+        db = MagicMock()
+        with patch.object(analytics_buffer, "_buffer", buffer):
+            AnalyticsService(db).track_page_view("/search")
+
+        buffer.add.assert_called_once()
+        db.commit.assert_not_called()
+
+    def test_direct_without_buffer(self):
+        db = MagicMock()
+        with patch.object(analytics_buffer, "_buffer", None):
+            event = AnalyticsService(db).track_page_view("/search")
+
+        db.add.assert_called_once_with(event)
+        db.commit.assert_called_once()
@@ -0,0 +1,126 @@
+"""Tests for analytics_events partition management."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from app.services.analytics_partitions import AnalyticsPartitionService, add_months, month_start
+
+NOW = datetime(2026, 3, 17, 15, 0, tzinfo=UTC)
+
+
+def _bound(start: str | None, end: str | None) -> str:
+    start_sql = f"'{start} 00:00:00'" if start else "MINVALUE"
+    end_sql = f"'{end} 00:00:00'" if end else "MAXVALUE"
+    return f"FOR VALUES FROM ({start_sql}) TO ({end_sql})"
+
+
+def _session(partitions: list[tuple[str, str]]) -> MagicMock:
+    session = MagicMock()
+    session.execute.return_value.fetchall.return_value = partitions
+    return session
+
+
+def _ddl(session: MagicMock) -> list[str]:
+    return [str(c.args[0]) for c in session.execute.call_args_list if not c.args[0].text.lstrip().startswith("SELECT")]
+
+
+class TestMonths:
+    """Month arithmetic on naive UTC month starts."""
+
+    def test_month_start_is_naive_utc(self):
+        assert month_start(NOW) == datetime(2026, 3, 1)
+
+    def test_add_months_crosses_years(self):
+        assert add_months(datetime(2026, 11, 1), 3) == datetime(2027, 2, 1)
+        assert add_months(datetime(2026, 1, 1), -13) == datetime(2024, 12, 1)
+
+
+class TestAnalyticsPartitionService:
+    """Partitions are created ahead and dropped after the retention period."""
+
+    def test_ensure_skips_months_already_covered(self):
+        # The legacy partition covers everything before April
+        session = _session([("analytics_events_legacy", _bound(None, "2026-04-01"))])
+
+        created = AnalyticsPartitionService(session).ensure_partitions(months_ahead=2, now=NOW)
+
+        assert created == ["analytics_events_y2026m04", "analytics_events_y2026m05"]
+        ddl = _ddl(session)
+        assert ddl[0] == (
+            "CREATE TABLE analytics_events_y2026m04 PARTITION OF analytics_events "
+            "FOR VALUES FROM ('2026-04-01 00:00:00') TO ('2026-05-01 00:00:00')"
+        )
+        session.commit.assert_called_once()
+
+    def test_ensure_is_idempotent(self):
+        session = _session(
+            [
+                ("analytics_events_y2026m03", _bound("2026-03-01", "2026-04-01")),
+                ("analytics_events_y2026m04", _bound("2026-04-01", "2026-05-01")),
+            ]
+        )
+
+        assert AnalyticsPartitionService(session).ensure_partitions(months_ahead=1, now=NOW) == []
+        assert _ddl(session) == []
+
+    def test_ensure_with_empty_default_partition(self):
+        session = _session(
+            [
+                ("analytics_events_y2026m03", _bound("2026-03-01", "2026-04-01")),
+                ("analytics_events_default", "DEFAULT"),
+            ]
+        )
+        session.execute.return_value.scalar.return_value = 0
+
+        created = AnalyticsPartitionService(session).ensure_partitions(months_ahead=1, now=NOW)
+
+        assert created == ["analytics_events_y2026m04"]
+        assert [statement.split(" PARTITION OF")[0] for statement in _ddl(session)] == [
+            "CREATE TABLE analytics_events_y2026m04"
+        ]
+
+    def test_ensure_moves_rows_out_of_default_partition(self):
+        # The job was behind: April's events went to the DEFAULT partition
+        session = _session(
+            [
+                ("analytics_events_y2026m03", _bound("2026-03-01", "2026-04-01")),
+                ("analytics_events_default", "DEFAULT"),
+            ]
+        )
+        session.execute.return_value.scalar.return_value = 42
+
+        AnalyticsPartitionService(session).ensure_partitions(months_ahead=1, now=NOW)
+
+        in_range = "created_at >= '2026-04-01 00:00:00' AND created_at < '2026-05-01 00:00:00'"
+        assert _ddl(session) == [
+            "ALTER TABLE analytics_events DETACH PARTITION analytics_events_default",
+            "CREATE TABLE analytics_events_y2026m04 PARTITION OF analytics_events "
+            "FOR VALUES FROM ('2026-04-01 00:00:00') TO ('2026-05-01 00:00:00')",
+            f"INSERT INTO analytics_events_y2026m04 SELECT * FROM analytics_events_default WHERE {in_range}",
+            f"DELETE FROM analytics_events_default WHERE {in_range}",
+            "ALTER TABLE analytics_events ATTACH PARTITION analytics_events_default DEFAULT",
+        ]
+        session.commit.assert_called_once()
+
+    def test_expired_partitions(self):
+        session = _session(
+            [
+                ("analytics_events_y2025m02", _bound("2025-02-01", "2025-03-01")),
+                ("analytics_events_legacy", _bound(None, "2025-02-01")),
+                ("analytics_events_y2025m03", _bound("2025-03-01", "2025-04-01")),
+                ("analytics_events_default", "DEFAULT"),
+            ]
+        )
+
+        expired = AnalyticsPartitionService(session).expired_partitions(retention_months=12, now=NOW)
+
+        # Cutoff is March 2025: only partitions ending by then
+        assert expired == ["analytics_events_legacy", "analytics_events_y2025m02"]
+
+    def test_drop_partitions(self):
+        session = MagicMock()
+
+        AnalyticsPartitionService(session).drop_partitions(["analytics_events_y2025m02"])
+
+        assert str(session.execute.call_args.args[0]) == 'DROP TABLE "analytics_events_y2025m02"'
+        session.commit.assert_called_once()
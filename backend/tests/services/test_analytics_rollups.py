@@ -0,0 +1,110 @@
+"""Tests for dashboard statistics read from analytics rollups."""
+
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.models import AnalyticsDailyAggregate
+from app.services.analytics import PERIOD_DAY, PERIOD_HOUR, AnalyticsService, EventCounts
+
+
+def _rows(*results: list) -> list[MagicMock]:
+    """session.exec results, in query order."""
+    mocks = []
+    for rows in results:
+        result = MagicMock()
+        result.all.return_value = rows
+        mocks.append(result)
+    return mocks
+
+
+def _aggregate(date: datetime, period: str = PERIOD_DAY, **counts: Counter) -> AnalyticsDailyAggregate:
+    aggregate = AnalyticsDailyAggregate(date=date.replace(tzinfo=None), period=period)
+    EventCounts(**counts).apply_to(aggregate)
+    return aggregate
+
+
+class TestEventCounts:
+    """Rollup rows round-trip and merge by summing."""
+
+    def test_round_trip(self):
+        counts = EventCounts(
+            by_type=Counter({"search": 3, "page_view": 7}),
+            wizard_steps=Counter({"1": 2}),
+            searches=Counter({"housing": 3}),
+        )
+        aggregate = AnalyticsDailyAggregate(date=datetime(2026, 1, 5))
+
+        counts.apply_to(aggregate)
+
+        assert aggregate.total_searches == 3
+        assert aggregate.total_page_views == 7
+        decoded = EventCounts.from_aggregate(aggregate)
+        assert decoded.by_type["search"] == 3
+        assert decoded.searches == Counter({"housing": 3})
+        assert decoded.wizard_steps == Counter({"1": 2})
+
+    def test_merge_sums_top_maps(self):
+        first = EventCounts(searches=Counter({"housing": 5, "jobs": 1}))
+        second = EventCounts(searches=Counter({"jobs": 6, "legal": 2}))
+
+        merged = first.merge(second)
+
+        assert merged.searches == Counter({"jobs": 7, "housing": 5, "legal": 2})
+
+
+class TestWindowStats:
+    """Dashboard stats combine day rows, today's hour rows and the raw tail."""
+
+    def test_summary_and_popular_searches(self):
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        day = _aggregate(
+            today - timedelta(days=1),
+            by_type=Counter({"search": 10, "wizard_start": 4, "wizard_complete": 1}),
+            searches=Counter({"housing": 6, "jobs": 4}),
+        )
+        hour = _aggregate(today, PERIOD_HOUR, by_type=Counter({"search": 2}), searches=Counter({"jobs": 2}))
+        session = MagicMock()
+        session.exec.side_effect = _rows(
+            [day],  # day rollups
+            [hour],  # hour rollups
+            [("search", 1)],  # tail: by type
+            [],  # tail: wizard steps
+            [],  # tail: categories
+            [],  # tail: states
+            [("jobs", 1)],  # tail: searches
+            [],  # tail: resources
+        )
+        analytics = AnalyticsService(session)
+
+        summary = analytics.get_summary_stats(days=7)
+        searches = analytics.get_popular_searches(days=7)
+
+        assert summary["total_searches"] == 13
+        assert summary["wizard_starts"] == 4
+        assert searches == [{"query": "jobs", "count": 7}, {"query": "housing", "count": 6}]
+        # The window is read once per service
+        assert session.exec.call_count == 8
+
+    def test_tail_starts_after_last_rollup(self):
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        session = MagicMock()
+        session.exec.side_effect = _rows(
+            [_aggregate(today - timedelta(days=1))],
+            [_aggregate(today, PERIOD_HOUR), _aggregate(today + timedelta(hours=1), PERIOD_HOUR)],
+        )
+
+        rollups, tail_since = AnalyticsService(session)._rollup_window(days=30)
+
+        assert len(rollups) == 3
+        assert tail_since == today + timedelta(hours=2)
+
+    def test_no_rollups_reads_whole_window_raw(self):
+        today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        session = MagicMock()
+        session.exec.side_effect = _rows([], [])
+
+        rollups, tail_since = AnalyticsService(session)._rollup_window(days=30)
+
+        assert rollups == []
+        assert tail_since == today - timedelta(days=30)
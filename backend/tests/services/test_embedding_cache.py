@@ -0,0 +1,172 @@
+"""Tests for the semantic search query embedding cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import embedding_cache
+from app.services.embedding_cache import QueryEmbeddingCache, embed_query, normalize_query, warm_query_embedding_cache
+
+MODEL = "all-MiniLM-L6-v2"
+
+
+def _generator():
+    """Fake embedding function that records the texts it was asked to embed."""
+    calls: list[str] = []
+
+    def generate(text: str) -> list[float]:
+        calls.append(text)
+        return [float(len(text))]
+
+    return generate, calls
+
+
+class TestNormalizeQuery:
+    def test_case_and_whitespace(self):
+        assert normalize_query("  Housing   HELP\tnear me ") == "housing help near me"
+
+    def test_truncates_to_column_length(self):
+        assert len(normalize_query("a" * 500)) == 255
+
+
+class TestQueryEmbeddingCache:
+    def test_hit_after_miss(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60)
+        generate, calls = _generator()
+
+        first = cache.get_or_create(MODEL, "Housing Help", generate)
+        second = cache.get_or_create(MODEL, "housing  help", generate)
+
+        assert first == second
+        assert calls == ["housing help"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_keyed_by_model(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60)
+        generate, calls = _generator()
+
+        cache.get_or_create(MODEL, "jobs", generate)
+        cache.get_or_create("text-embedding-3-small", "jobs", generate)
+
+        assert len(calls) == 2
+
+    def test_evicts_least_recently_used(self):
+        cache = QueryEmbeddingCache(max_size=2, ttl_seconds=60)
+        generate, calls = _generator()
+
+        cache.get_or_create(MODEL, "a", generate)
+        cache.get_or_create(MODEL, "b", generate)
+        cache.get_or_create(MODEL, "a", generate)  # a is now most recent
+        cache.get_or_create(MODEL, "c", generate)  # evicts b
+
+        assert cache.get(MODEL, "a") is not None
+        assert cache.get(MODEL, "b") is None
+        assert cache.stats().evictions == 1
+
+    def test_entries_expire(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60)
+        generate, calls = _generator()
+
+        with patch("app.services.embedding_cache.time.monotonic", return_value=1000.0):
+            cache.get_or_create(MODEL, "legal aid", generate)
+        with patch("app.services.embedding_cache.time.monotonic", return_value=1061.0):
+            cache.get_or_create(MODEL, "legal aid", generate)
+
+        assert len(calls) == 2
+
+    def test_warm_embeds_misses_in_one_batch(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60)
+        cache.put(MODEL, "food", [1.0])
+        batches: list[list[str]] = []
+
+        def generate_batch(texts):
+            batches.append(texts)
+            return [[2.0] for _ in texts]
+
+        warmed = cache.warm(MODEL, ["Food", "Jobs", "jobs ", "", "Shelter"], generate_batch)
+
+        assert warmed == 2
+        assert batches == [["jobs", "shelter"]]
+        assert cache.get(MODEL, "shelter") == [2.0]
+
+    def test_shared_table_hit_skips_generation(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60, persist=True)
+        session = MagicMock()
+        session.exec.return_value.all.return_value = [("va benefits", [0.5, 0.5])]
+        generate, calls = _generator()
+
+        embedding = cache.get_or_create(MODEL, "VA benefits", generate, session)
+
+        assert embedding == [0.5, 0.5]
+        assert calls == []
+        assert cache.stats().shared_hits == 1
+        session.execute.assert_not_called()
+
+    def test_shared_table_miss_stores_embedding(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60, persist=True)
+        session = MagicMock()
+        session.exec.return_value.all.return_value = []
+        generate, calls = _generator()
+
+        with patch("app.services.embedding_cache.Session") as session_cls:
+            cache.get_or_create(MODEL, "childcare", generate, session)
+
+        assert calls == ["childcare"]
+        # Written through its own session, leaving the request session uncommitted
+        session_cls.assert_called_once_with(session.get_bind())
+        own_session = session_cls.return_value.__enter__.return_value
+        upsert = str(own_session.execute.call_args[0][0])
+        assert "INSERT INTO query_embeddings" in upsert
+        assert "ON CONFLICT" in upsert
+        own_session.commit.assert_called_once()
+        session.execute.assert_not_called()
+        session.commit.assert_not_called()
+
+    def test_shared_table_errors_fall_back_to_generation(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl_seconds=60, persist=True)
+        session = MagicMock()
+        session.exec.side_effect = RuntimeError("relation does not exist")
+        generate, calls = _generator()
+
+        with patch("app.services.embedding_cache.Session") as session_cls:
+            session_cls.return_value.__enter__.return_value.execute.side_effect = RuntimeError(
+                "relation does not exist"
+            )
+            assert cache.get_or_create(MODEL, "dental", generate, session) == [6.0]
+
+        assert calls == ["dental"]
+
+
+class TestProcessCache:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        monkeypatch.setattr(embedding_cache, "_cache", QueryEmbeddingCache(max_size=10, ttl_seconds=60))
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_embed_query_generates_once(self, mock_get_service):
+        mock_get_service.return_value.generate_embedding.return_value.embedding = [0.1] * 384
+
+        embed_query("PTSD support")
+        embed_query("ptsd support")
+
+        mock_get_service.return_value.generate_embedding.assert_called_once_with("ptsd support")
+
+    @patch("app.services.embedding.get_embedding_service")
+    @patch("app.services.analytics.AnalyticsService.get_popular_searches")
+    def test_warm_from_popular_searches(self, mock_popular, mock_get_service):
+        mock_popular.return_value = [{"query": "housing", "count": 50}, {"query": "jobs", "count": 30}]
+        mock_get_service.return_value.generate_batch_embeddings.return_value = [
+            MagicMock(embedding=[0.1]),
+            MagicMock(embedding=[0.2]),
+        ]
+
+        assert warm_query_embedding_cache(MagicMock(), limit=2) == 2
+        mock_popular.assert_called_once_with(days=30, limit=2)
+
+        embed_query("Jobs")
+        mock_get_service.return_value.generate_embedding.assert_not_called()
+
+    def test_warm_disabled(self):
+        assert warm_query_embedding_cache(MagicMock(), limit=0) == 0
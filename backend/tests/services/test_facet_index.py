@@ -0,0 +1,209 @@
+"""Tests for the in-process facet bitmap index."""
+
+import random
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.config import settings
+from app.models.resource import ResourceStatus
+from app.services import facet_index
+from app.services.facet_index import FacetIndex, facet_counts, get_facet_index, update_facet_index
+from app.services.filters import ResourceFilters
+from app.services.resource import ResourceService
+from app.services.search import SearchService
+
+CATEGORIES = ["housing", "employment", "legal", "mentalHealth"]
+STATES = ["VA", "MD", "TX", "CA", "FL"]
+TAGS = ["hud-vash", "ssvf", "food-pantry", "job-placement", "women"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    facet_index._index = None
+    yield
+    facet_index._index = None
+
+
+def _row(
+    status: str = "ACTIVE",
+    scope: str = "STATE",
+    categories: list[str] | None = None,
+    states: list[str] | None = None,
+    tags: list[str] | None = None,
+    subcategories: list[str] | None = None,
+) -> tuple:
+    return (uuid4(), status, scope, categories or [], states or [], tags or [], subcategories or [])
+
+
+def _random_rows(count: int, seed: int = 3) -> list[tuple]:
+    rng = random.Random(seed)
+    return [
+        _row(
+            status=rng.choice(["ACTIVE", "ACTIVE", "ACTIVE", "NEEDS_REVIEW", "INACTIVE"]),
+            scope=rng.choice(["NATIONAL", "STATE", "LOCAL"]),
+            categories=rng.sample(CATEGORIES, rng.randint(1, 2)),
+            states=rng.sample(STATES, rng.randint(0, 2)),
+            tags=rng.sample(TAGS, rng.randint(0, 2)),
+            subcategories=rng.sample(TAGS, rng.randint(0, 1)),
+        )
+        for _ in range(count)
+    ]
+
+
+def _matches(row: tuple, filters: ResourceFilters) -> bool:
+    """Brute-force ResourceFilters semantics (tag_match 'array' or 'tags')."""
+    _, status, scope, categories, states, tags, subcategories = row
+    if filters.active_only and status != "ACTIVE":
+        return False
+    if not filters.active_only and status == "INACTIVE":
+        return False
+    if filters.categories and not set(filters.categories) & set(categories):
+        return False
+    if filters.states and not (scope == "NATIONAL" and not states) and not set(filters.states) & set(states):
+        return False
+    if filters.scope == "non_national" and scope == "NATIONAL":
+        return False
+    if filters.scope in ("national", "state", "local") and scope != filters.scope.upper():
+        return False
+    for tag in filters.tags or []:
+        if tag not in tags and not (filters.tag_match == "array" and tag in subcategories):
+            return False
+    return True
+
+
+class TestFacetIndex:
+    """Bitmap filters and counts agree with a full scan."""
+
+    def test_match_agrees_with_full_scan(self):
+        rows = _random_rows(500)
+        index = FacetIndex(rows)
+        rng = random.Random(11)
+
+        for _ in range(50):
+            filters = ResourceFilters(
+                categories=rng.sample(CATEGORIES, rng.randint(0, 2)) or None,
+                states=rng.sample(STATES, rng.randint(0, 2)) or None,
+                scope=rng.choice([None, "national", "state", "local", "non_national"]),
+                tags=rng.sample(TAGS, rng.randint(0, 1)) or None,
+                active_only=rng.random() < 0.5,
+                tag_match=rng.choice(["array", "tags"]),
+            )
+            expected = {row[0] for row in rows if _matches(row, filters)}
+            assert index.match(filters) == index.bitmap(expected)
+
+    def test_category_counts_ignore_category_filter(self):
+        rows = _random_rows(300)
+        index = FacetIndex(rows)
+        filters = ResourceFilters(categories=["housing"], states=["VA"], active_only=True)
+
+        counts = facet_counts(index, filters)
+
+        without_categories = ResourceFilters(states=["VA"], active_only=True)
+        expected: dict[str, int] = {}
+        for row in rows:
+            if _matches(row, without_categories):
+                for category in row[3]:
+                    expected[category] = expected.get(category, 0) + 1
+        assert counts["categories"] == expected
+        assert list(counts["categories"].values()) == sorted(expected.values(), reverse=True)
+
+    def test_state_counts_include_nationwide(self):
+        index = FacetIndex([_row(scope="NATIONAL"), _row(states=["VA"]), _row(states=["TX"])])
+
+        counts = facet_counts(index, ResourceFilters())
+
+        # Picking a state also returns the nationwide resource
+        assert counts["states"] == {"TX": 2, "VA": 2}
+        assert counts["scope"] == {"state": 2, "national": 1}
+
+    def test_state_scope_is_state_only_and_listing_state_is_non_national(self):
+        index = FacetIndex(
+            [
+                _row(scope="STATE", categories=["housing"]),
+                _row(scope="LOCAL", categories=["legal"]),
+                _row(scope="NATIONAL", categories=["food"]),
+            ]
+        )
+
+        assert facet_counts(index, ResourceFilters(scope="state"))["categories"] == {"housing": 1}
+        with patch("app.services.resource.get_facet_index", return_value=index):
+            listing = ResourceService(MagicMock()).facet_counts(scope="state")
+        assert listing is not None
+        assert listing["categories"] == {"housing": 1, "legal": 1}
+
+    def test_search_matches_restrict_counts(self):
+        housing, legal = _row(categories=["housing"]), _row(categories=["legal"])
+        index = FacetIndex([housing, legal])
+
+        counts = facet_counts(index, ResourceFilters(active_only=True), matches=index.bitmap([legal[0]]))
+
+        assert counts["categories"] == {"legal": 1}
+
+    def test_search_matches_capped_and_flagged_approximate(self, monkeypatch):
+        rows = [_row(categories=["housing"]) for _ in range(3)]
+        index = FacetIndex(rows)
+        session = MagicMock()
+        session.exec.return_value = [row[0] for row in rows]
+        monkeypatch.setattr(settings, "facet_search_max_matches", 2)
+
+        with patch("app.services.search.get_facet_index", return_value=index):
+            counts, approximate = SearchService(session).facet_counts("housing")
+
+        assert approximate is True
+        assert counts["categories"] == {"housing": 2}
+        # One row past the cap is fetched to tell whether more matched
+        statement = session.exec.call_args[0][0]
+        assert "LIMIT" in str(statement)
+        assert 3 in statement.compile().params.values()
+
+    def test_text_tag_match_not_supported(self):
+        index = FacetIndex([_row(tags=["ssvf"])])
+
+        assert facet_counts(index, ResourceFilters(tags=["ssvf"], tag_match="text")) == {}
+
+    def test_upsert_replaces_and_removes(self):
+        first, second = _row(categories=["housing"]), _row(categories=["legal"])
+        index = FacetIndex([first, second])
+        assert facet_counts(index, ResourceFilters())["categories"] == {"housing": 1, "legal": 1}
+
+        changed = (first[0], "ACTIVE", "STATE", ["employment"], [], [], [])
+        index.upsert([changed], removed=[second[0]])
+
+        assert len(index) == 1
+        assert facet_counts(index, ResourceFilters())["categories"] == {"employment": 1}
+        assert index.match(ResourceFilters(status=ResourceStatus.ACTIVE)) == index.bitmap([first[0]])
+
+
+class TestGetFacetIndex:
+    """The process index is built on first use and rebuilt after its TTL."""
+
+    def test_built_once_then_rebuilt_after_ttl(self):
+        session = MagicMock()
+        session.execute.return_value.fetchall.return_value = [_row()]
+
+        index = get_facet_index(session)
+        assert index is not None and len(index) == 1
+        assert get_facet_index(session) is index
+        assert session.execute.call_count == 1
+
+        index.built_at -= settings.facet_index_ttl_seconds
+        assert get_facet_index(session) is not index
+
+    def test_update_rereads_committed_resources(self):
+        kept, deleted = _row(categories=["housing"]), _row(categories=["legal"])
+        facet_index._index = FacetIndex([kept, deleted])
+        session = MagicMock()
+        session.execute.return_value.fetchall.return_value = [(kept[0], "ACTIVE", "LOCAL", ["food"], [], [], [])]
+
+        update_facet_index(session, [kept[0], deleted[0]])
+
+        assert facet_counts(facet_index._index, ResourceFilters())["categories"] == {"food": 1}
+
+    def test_update_without_index_is_noop(self):
+        session = MagicMock()
+
+        update_facet_index(session, [uuid4()])
+
+        session.execute.assert_not_called()
@@ -0,0 +1,252 @@
+"""Tests for shared resource filters and paginated counting."""
+
+import re
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlmodel import select
+
+# Import all models to ensure SQLModel resolves relationships
+import app.models  # noqa: F401
+from app.models import Resource
+from app.models.resource import ResourceStatus
+from app.services.filters import (
+    TAG_TEXT_COLUMNS,
+    TOTAL_ESTIMATE_CAP,
+    ResourceFilters,
+    fetch_page,
+    reported_total,
+    tag_text_patterns,
+)
+
+
+def _compile(clauses) -> str:
+    return " AND ".join(
+        str(c.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": False})) for c in clauses
+    )
+
+
+class TestResourceFilters:
+    """The ORM and raw-SQL renderings describe the same predicates."""
+
+    def test_defaults_exclude_inactive_only(self):
+        params: dict = {}
+
+        assert ResourceFilters().sql(params) == " AND r.status != :f_inactive"
+        assert params == {"f_inactive": "INACTIVE"}
+        assert len(ResourceFilters().clauses()) == 1
+
+    def test_active_only(self):
+        params: dict = {}
+
+        assert "r.status = :f_active" in ResourceFilters(active_only=True).sql(params)
+        assert params["f_active"] == "ACTIVE"
+
+    def test_categories_or_states_with_nationwide(self):
+        params: dict = {}
+
+        sql = ResourceFilters(categories=["housing", "legal"], states=["TX", "VA"]).sql(params)
+
+        assert "(r.categories @> ARRAY[:f_cat_0]::text[] OR r.categories @> ARRAY[:f_cat_1]::text[])" in sql
+        assert "(r.scope = :f_national AND r.states = '{}'::text[])" in sql
+        assert "r.states @> ARRAY[:f_state_1]::text[]" in sql
+        assert params["f_national"] == "NATIONAL"
+        assert params["f_state_1"] == "VA"
+
+    @pytest.mark.parametrize(
+        ("scope", "expected_sql", "expected_value"),
+        [
+            ("non_national", "r.scope != :f_scope", "NATIONAL"),
+            ("national", "r.scope = :f_scope", "NATIONAL"),
+            ("state", "r.scope = :f_scope", "STATE"),
+            ("local", "r.scope = :f_scope", "LOCAL"),
+        ],
+    )
+    def test_scope(self, scope, expected_sql, expected_value):
+        params: dict = {}
+
+        assert expected_sql in ResourceFilters(scope=scope).sql(params)
+        assert params["f_scope"] == expected_value
+
+    def test_all_scope_adds_nothing(self):
+        assert "f_scope" not in ResourceFilters(scope="all").sql({})
+        assert len(ResourceFilters(scope="all").clauses()) == 1
+
+    @pytest.mark.parametrize(
+        ("tag_match", "fragments"),
+        [
+            ("tags", ["r.tags @>"]),
+            ("array", ["r.tags @>", "r.subcategories @>"]),
+            ("text", ["r.tags @>", "r.subcategories @>", "r.eligibility ILIKE", "r.description ILIKE"]),
+        ],
+    )
+    def test_tag_match_modes(self, tag_match, fragments):
+        filters = ResourceFilters(tags=["hud-vash", "ssvf"], tag_match=tag_match)
+        sql = filters.sql({})
+        orm_sql = _compile(filters.clauses())
+
+        for fragment in fragments:
+            # Once per tag: tags use AND logic
+            assert sql.count(fragment) >= 2
+        if tag_match != "text":
+            assert "ILIKE" not in sql
+            assert "ILIKE" not in orm_sql.upper()
+        else:
+            assert "subcategories" in orm_sql
+
+    def test_text_tags_match_spaced_variant(self):
+        params: dict = {}
+
+        ResourceFilters(tags=["hud-vash"], tag_match="text").sql(params)
+
+        assert params["f_tag_like_0"] == "%hud-vash%"
+        assert params["f_tag_like_spaced_0"] == "%hud vash%"
+
+    def test_values_are_parameterized(self):
+        payload = "'; DROP TABLE resources;--"
+        params: dict = {}
+
+        sql = ResourceFilters(categories=[payload], states=[payload], tags=[payload], tag_match="text").sql(params)
+
+        assert "DROP TABLE" not in sql
+        assert payload in params.values()
+
+    def test_status_filter(self):
+        params: dict = {}
+
+        sql = ResourceFilters(status=ResourceStatus.NEEDS_REVIEW).sql(params)
+
+        assert "r.status = :f_status" in sql
+        assert params["f_status"] == "NEEDS_REVIEW"
+
+    @pytest.mark.parametrize(("tag", "ilikes"), [("ssvf", 3), ("combat_veteran", 3), ("hud-vash", 6)])
+    def test_text_tags_skip_duplicate_spaced_pattern(self, tag, ilikes):
+        params: dict = {}
+
+        sql = ResourceFilters(tags=[tag], tag_match="text").sql(params)
+
+        assert sql.count("ILIKE") == ilikes
+        assert _compile(ResourceFilters(tags=[tag], tag_match="text").clauses()).upper().count("ILIKE") == ilikes
+        assert ("f_tag_like_spaced_0" in params) == (ilikes == 6)
+
+
+def _ilike(value: str | None, pattern: str) -> bool:
+    """Evaluate ``value ILIKE pattern`` the way Postgres does (% and _ wildcards)."""
+    if value is None:
+        return False
+    regex = "".join(".*" if c == "%" else "." if c == "_" else re.escape(c) for c in pattern)
+    return re.fullmatch(regex, value, re.IGNORECASE | re.DOTALL) is not None
+
+
+# Fixture corpus for the tag text predicate: dashes, spaces, underscores and case
+TAG_CORPUS = [
+    {"eligibility": "HUD-VASH voucher holders", "title": "Housing", "description": None},
+    {"eligibility": None, "title": "HUD VASH case management", "description": "Vouchers"},
+    {"eligibility": "Combat veterans only", "title": "PTSD group", "description": ""},
+    {"eligibility": "", "title": "Female veteran retreat", "description": "For female_veteran members"},
+    {"eligibility": "Any veteran", "title": "SSVF rapid rehousing", "description": "ssvf grantee"},
+    {"eligibility": "Any veteran", "title": "Food pantry", "description": "Weekly food-pantry distribution"},
+    {"eligibility": None, "title": "Legal aid", "description": None},
+]
+CORPUS_TAGS = ["hud-vash", "combat_veteran", "female_veteran", "ssvf", "food-pantry", "food pantry", "legal", "x"]
+
+
+class TestTagTextEquivalence:
+    """The deduplicated patterns select exactly what the original six ILIKEs did."""
+
+    @staticmethod
+    def _original(row: dict, tag: str) -> bool:
+        patterns = (f"%{tag}%", f"%{tag.replace('-', ' ')}%")
+        return any(_ilike(row[column], p) for column in ("eligibility", "title", "description") for p in patterns)
+
+    @staticmethod
+    def _current(row: dict, tag: str) -> bool:
+        return any(_ilike(row[column], p) for column in TAG_TEXT_COLUMNS for p in tag_text_patterns(tag))
+
+    @pytest.mark.parametrize("tag", CORPUS_TAGS)
+    def test_same_rows_match(self, tag):
+        original = [i for i, row in enumerate(TAG_CORPUS) if self._original(row, tag)]
+        current = [i for i, row in enumerate(TAG_CORPUS) if self._current(row, tag)]
+
+        assert current == original
+
+    def test_corpus_exercises_both_patterns(self):
+        # Sanity check: the spaced variant matters for some rows
+        assert [i for i, row in enumerate(TAG_CORPUS) if self._current(row, "hud-vash")] == [0, 1]
+
+
+class RecordingSession:
+    """Fake session that records compiled statements and replays canned results."""
+
+    def __init__(self, *results: list) -> None:
+        self.results = list(results)
+        self.statements: list[str] = []
+
+    def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        rows = self.results.pop(0)
+        result = MagicMock()
+        result.all.return_value = rows
+        result.scalar_one.return_value = rows
+        return result
+
+
+def _statement():
+    return select(Resource).where(Resource.status != ResourceStatus.INACTIVE)
+
+
+class TestFetchPage:
+    """Page and total come from as few statements as possible."""
+
+    def test_exact_total_from_window_in_one_statement(self):
+        page = [("a", 12), ("b", 12)]
+        session = RecordingSession(page)
+
+        rows, total = fetch_page(session, _statement(), [Resource.title], limit=2, offset=4)
+
+        assert rows == [("a",), ("b",)]
+        assert total == 12
+        assert len(session.statements) == 1
+        assert "count(*) OVER () AS total" in session.statements[0]
+        assert "LIMIT" in session.statements[0]
+
+    def test_exact_empty_first_page_needs_no_count(self):
+        session = RecordingSession([])
+
+        rows, total = fetch_page(session, _statement(), [Resource.title], limit=5, offset=0)
+
+        assert (rows, total) == ([], 0)
+        assert len(session.statements) == 1
+
+    def test_exact_past_the_end_counts_directly(self):
+        session = RecordingSession([], 12)
+
+        rows, total = fetch_page(session, _statement(), [Resource.title], limit=5, offset=50)
+
+        assert (rows, total) == ([], 12)
+        assert "count(*)" in session.statements[1]
+        assert "OVER" not in session.statements[1]
+
+    def test_none_skips_total(self):
+        session = RecordingSession([("a",), ("b",)])
+
+        rows, total = fetch_page(session, _statement(), [Resource.title], limit=2, offset=0, count="none")
+
+        assert rows == [("a",), ("b",)]
+        assert total is None
+        assert len(session.statements) == 1
+        assert "count" not in session.statements[0]
+
+    def test_estimate_count_stops_at_cap(self):
+        session = RecordingSession([("a",)], TOTAL_ESTIMATE_CAP + 1)
+
+        _, total = fetch_page(session, _statement(), [Resource.title], limit=1, offset=0, count="estimate")
+
+        assert "LIMIT" in session.statements[1]
+        assert reported_total(total, "estimate") == (TOTAL_ESTIMATE_CAP, True)
+
+    def test_small_estimate_is_exact(self):
+        assert reported_total(12, "estimate") == (12, False)
+        assert reported_total(5000, "exact") == (5000, False)
+        assert reported_total(None, "none") == (None, False)
@@ -0,0 +1,91 @@
+"""Tests for the process-level geo context."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import geo
+from app.services.geo import GeoContext, ZipCentroid, ZipTable, get_geo_context, refresh_geo_context
+
+ROWS = [
+    ("90210", 34.09, -118.41, "CA"),
+    ("02134", 42.35, -71.11, "MA"),
+    ("22201", 38.88, -77.09, None),
+    ("ABCDE", 1.0, 1.0, "XX"),  # Not a zip: skipped
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_context():
+    geo._context = None
+    yield
+    geo._context = None
+
+
+def _session(rows=ROWS, postgis=False) -> MagicMock:
+    session = MagicMock()
+    results = [MagicMock(fetchone=MagicMock(return_value=(1,) if postgis else None)), MagicMock()]
+    results[1].fetchall.return_value = rows
+    session.execute.side_effect = results
+    return session
+
+
+class TestZipTable:
+    """Packed zip lookups."""
+
+    def test_lookup(self):
+        table = ZipTable(ROWS)
+
+        assert len(table) == 3
+        assert table.get("90210") == ZipCentroid(34.09, -118.41, "CA")
+        assert table.get("02134") == ZipCentroid(42.35, -71.11, "MA")  # Leading zero kept
+        assert table.get("22201") == ZipCentroid(38.88, -77.09, None)
+
+    @pytest.mark.parametrize("zip_code", ["90211", "00000", "9021", "902100", "abcde", ""])
+    def test_unknown_or_invalid(self, zip_code):
+        assert ZipTable(ROWS).get(zip_code) is None
+
+
+class TestGeoContext:
+    """Loaded once per process, refreshed on demand."""
+
+    def test_loaded_once(self):
+        session = _session(postgis=True)
+
+        first = get_geo_context(session)
+        second = get_geo_context(session)
+
+        assert first is second
+        assert first.postgis is True
+        assert session.execute.call_count == 2  # pg_extension + zip_codes, once
+
+    def test_failed_load_is_retried(self):
+        session = MagicMock()
+        session.execute.side_effect = RuntimeError("no zip_codes table")
+
+        context = get_geo_context(session)
+
+        assert context.postgis is False
+        assert len(context.zips) == 0
+        assert geo._context is None
+        session.rollback.assert_called_once()
+
+    def test_refresh_replaces_table(self):
+        get_geo_context(_session(rows=ROWS[:1]))
+
+        refresh_geo_context(_session(rows=ROWS))
+
+        assert get_geo_context().zips.get("02134") is not None
+
+
+def test_zip_endpoint_reads_memory():
+    context = GeoContext(postgis=False, zips=ZipTable(ROWS))
+    with patch("app.api.v1.resources.get_geo_context", return_value=context):
+        client = TestClient(app)
+        found = client.get("/api/v1/resources/zip/90210")
+        missing = client.get("/api/v1/resources/zip/90211")
+
+    assert found.json() == {"zip_code": "90210", "state": "CA"}
+    assert missing.status_code == 404
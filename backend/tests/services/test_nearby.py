@@ -0,0 +1,139 @@
+"""Tests for the nearby engine's single page query and keyset cursors."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.database import get_session
+from app.main import app
+from app.services.geo import GeoContext, ZipTable
+from app.services.resource import ResourceService, _decode_nearby_cursor, _encode_nearby_cursor
+
+
+def _row(bucket: int, distance: float, title: str = "", total: int = 3):
+    return SimpleNamespace(resource_id=uuid4(), distance_miles=distance, bucket=bucket, title=title, total=total)
+
+
+class FakeSession:
+    """Records raw SQL and returns canned page rows; hydration finds nothing."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.statements: list[tuple[str, dict]] = []
+
+    def execute(self, stmt, params=None):
+        self.statements.append((str(stmt), params or {}))
+        result = MagicMock()
+        result.fetchall.return_value = self.rows
+        result.scalar.return_value = 0
+        return result
+
+    def exec(self, stmt):
+        return MagicMock(all=MagicMock(return_value=[]))
+
+
+@pytest.fixture(autouse=True)
+def _geo_context():
+    context = GeoContext(postgis=False, zips=ZipTable([("22201", 38.88, -77.09, "VA")]))
+    with patch("app.services.resource.get_geo_context", return_value=context):
+        yield
+
+
+class TestNearbyCursor:
+    """Cursors carry the full sort key."""
+
+    def test_round_trip(self):
+        row = _row(1, 0.0, "Legal Aid")
+
+        assert _decode_nearby_cursor(_encode_nearby_cursor(row)) == (1, 0.0, "Legal Aid", str(row.resource_id))
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm90IGpzb24=", "WzEsIDJd"])
+    def test_malformed_cursor_raises(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            _decode_nearby_cursor(cursor)
+
+
+class TestNearbyPage:
+    """Local and national rows come from one statement."""
+
+    def test_one_statement_for_page_and_total(self):
+        session = FakeSession([_row(0, 1.5), _row(1, 0.0, "A")])
+
+        result = ResourceService(session).list_nearby_by_coords(38.9, -77.1, limit=20)  # type: ignore[arg-type]
+
+        assert len(session.statements) == 1
+        sql, _ = session.statements[0]
+        assert "UNION ALL" in sql
+        assert "COUNT(*) OVER ()" in sql
+        assert result.total == 3
+        assert result.next_cursor is None  # Short page: nothing more
+
+    def test_full_page_returns_cursor_for_last_row(self):
+        rows = [_row(0, 1.5), _row(0, 2.5)]
+        session = FakeSession(rows)
+
+        result = ResourceService(session).list_nearby_by_coords(38.9, -77.1, limit=2)  # type: ignore[arg-type]
+
+        assert _decode_nearby_cursor(result.next_cursor)[:2] == (0, 2.5)
+
+    def test_cursor_continues_after_sort_key(self):
+        last = _row(0, 2.5)
+        session = FakeSession([])
+
+        result = ResourceService(session).list_nearby_by_coords(  # type: ignore[arg-type]
+            38.9, -77.1, limit=2, offset=40, cursor=_encode_nearby_cursor(last)
+        )
+
+        sql, params = session.statements[0]
+        assert "(bucket, distance_miles, title, resource_id) >" in sql
+        assert params["c_distance"] == 2.5
+        assert params["c_id"] == str(last.resource_id)
+        assert params["offset"] == 0  # Cursor replaces offset
+        # Empty page after a cursor: total is counted directly
+        assert len(session.statements) == 2
+        assert result.total == 0
+
+    def test_zip_resolved_without_database(self):
+        session = FakeSession([])
+
+        result = ResourceService(session).list_nearby("22201")  # type: ignore[arg-type]
+
+        assert (result.center_lat, result.center_lng, result.state) == (38.88, -77.09, "VA")
+        assert len(session.statements) == 1  # Only the page query
+        assert ResourceService(session).list_nearby("99999") is None  # type: ignore[arg-type]
+        assert len(session.statements) == 1
+
+    def test_national_resource_near_center_listed_once(self):
+        """A national resource with a location in the radius is only in the national bucket."""
+        session = FakeSession([])
+
+        ResourceService(session).list_nearby_by_coords(38.9, -77.1)  # type: ignore[arg-type]
+
+        sql, params = session.statements[0]
+        nearby_branch, national_branch = sql.split("UNION ALL")
+        assert "r.scope != :national_scope" in nearby_branch
+        assert "r.scope = :national_scope" in national_branch
+        assert params["national_scope"] == "NATIONAL"
+
+    def test_national_scope_skips_distance_branch(self):
+        session = FakeSession([])
+
+        ResourceService(session).list_nearby_by_coords(38.9, -77.1, scope="national")  # type: ignore[arg-type]
+
+        sql, params = session.statements[0]
+        assert "UNION ALL" not in sql
+        assert "center_lat" not in params
+
+
+def test_nearby_endpoint_rejects_bad_cursor():
+    app.dependency_overrides[get_session] = lambda: FakeSession([])
+    try:
+        response = TestClient(app).get("/api/v1/resources/nearby", params={"lat": 38.9, "lng": -77.1, "cursor": "x"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
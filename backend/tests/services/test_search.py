@@ -0,0 +1,339 @@
+"""Tests for SearchService result building."""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+# Import all models to ensure SQLModel resolves relationships
+import app.models  # noqa: F401
+from app.config import settings
+from app.models import Location, Organization, Program, Resource, Source
+from app.models.program import ProgramType
+from app.models.resource import ResourceScope
+from app.services import search as search_module
+from app.services.search import (
+    FILTERED_EF_SEARCH_MULTIPLIER,
+    HNSW_MAX_EF_SEARCH,
+    HYBRID_CANDIDATES_PER_RANKER,
+    EligibilityFilters,
+    ResultRelations,
+    SearchService,
+    ann_ef_search_for_tier,
+)
+
+
+class QueryCountingSession:
+    """Fake session that answers ``exec`` from in-memory rows and counts queries.
+
+    Statements selecting a model return every stored row of that model that
+    matches the ``IN (...)`` ids; ``get`` is tracked so tests can assert that
+    result building never falls back to per-row lookups.
+    """
+
+    def __init__(self, rows: dict[type, list], raw_rows: list | None = None, scalar=None) -> None:
+        self.rows = rows
+        self.raw_rows = raw_rows or []
+        self.scalar = scalar
+        self.exec_count = 0
+        self.executed: list[tuple[str, dict]] = []
+        self.get = MagicMock(side_effect=AssertionError("per-row session.get is not allowed"))
+
+    def execute(self, stmt, params=None):
+        self.executed.append((str(stmt), params or {}))
+        result = MagicMock()
+        result.fetchall.return_value = self.raw_rows
+        result.scalar.return_value = self.scalar
+        return result
+
+    def statement(self, marker: str) -> tuple[str, dict]:
+        """Return the single executed raw statement containing ``marker``."""
+        matches = [(sql, params) for sql, params in self.executed if marker in sql]
+        assert len(matches) == 1, f"expected one statement containing {marker!r}"
+        return matches[0]
+
+    def settings_applied(self) -> list[str]:
+        """Return the SET LOCAL statements executed so far."""
+        return [sql for sql, _ in self.executed if sql.startswith("SET LOCAL")]
+
+    def exec(self, stmt):
+        self.exec_count += 1
+        entity = stmt.column_descriptions[0]["entity"]
+        ids = set(stmt.whereclause.right.value)
+        result = MagicMock()
+        result.all.return_value = [row for row in self.rows.get(entity, []) if row.id in ids]
+        return result
+
+
+@pytest.fixture(autouse=True)
+def _pgvector_without_iterative_scan(monkeypatch):
+    """Pretend pgvector < 0.8 unless a test opts in, so no version query is issued."""
+    monkeypatch.setattr(search_module, "_iterative_scan_available", False)
+
+
+def _make_page(size: int) -> tuple[list[Resource], dict[type, list]]:
+    """Build a page of resources that each reference distinct related rows."""
+    resources: list[Resource] = []
+    rows: dict[type, list] = {Organization: [], Location: [], Source: [], Program: []}
+    for i in range(size):
+        org = Organization(id=uuid.uuid4(), name=f"Org {i}", website=f"https://org{i}.example")
+        location = Location(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            address=f"{i} Main St",
+            city="Austin",
+            state="TX",
+            zip_code="78701",
+            age_min=55,
+        )
+        source = Source(id=uuid.uuid4(), name=f"Source {i}", url="https://src.example", tier=1 + i % 4)
+        program = Program(id=uuid.uuid4(), organization_id=org.id, name=f"SSVF {i}", program_type=ProgramType.SSVF)
+        rows[Organization].append(org)
+        rows[Location].append(location)
+        rows[Source].append(source)
+        rows[Program].append(program)
+        resources.append(
+            Resource(
+                id=uuid.uuid4(),
+                organization_id=org.id,
+                location_id=location.id,
+                source_id=source.id,
+                program_id=program.id,
+                title=f"Housing help {i}",
+                description="Rental assistance for Veterans",
+                categories=["housing"],
+                states=["TX"],
+                scope=ResourceScope.LOCAL,
+            )
+        )
+    return resources, rows
+
+
+class TestHydrate:
+    """Tests for the batched hydration stage."""
+
+    def test_empty_page_issues_no_queries(self):
+        session = QueryCountingSession({})
+        relations = SearchService(session)._hydrate([])
+
+        assert relations == ResultRelations()
+        assert session.exec_count == 0
+
+    def test_one_query_per_related_table(self):
+        resources, rows = _make_page(20)
+        session = QueryCountingSession(rows)
+
+        relations = SearchService(session)._hydrate(resources)
+
+        assert session.exec_count == 4
+        assert len(relations.organizations) == 20
+        assert len(relations.locations) == 20
+        assert len(relations.sources) == 20
+        assert len(relations.programs) == 20
+
+    def test_skips_tables_with_no_references(self):
+        resources, rows = _make_page(5)
+        for resource in resources:
+            resource.location_id = None
+            resource.source_id = None
+            resource.program_id = None
+        session = QueryCountingSession(rows)
+
+        relations = SearchService(session)._hydrate(resources)
+
+        assert session.exec_count == 1
+        assert relations.locations == {}
+
+    def test_result_building_uses_no_extra_queries(self):
+        """A 20-row eligibility page needs 4 queries total, not 3-4 per row."""
+        resources, rows = _make_page(20)
+        session = QueryCountingSession(rows)
+        service = SearchService(session)
+        filters = EligibilityFilters(states=["TX"])
+
+        relations = service._hydrate(resources)
+        for resource in resources:
+            service._build_explanations(resource, "housing", "housing", "TX", relations=relations)
+            service._build_match_reasons(resource, filters, relations)
+            read = service._to_read_schema(resource, relations)
+
+            assert read.organization.name.startswith("Org ")
+            assert read.location is not None
+            assert read.trust.source_name is not None
+            assert read.program is not None
+
+        assert session.exec_count == 4
+        session.get.assert_not_called()
+
+    def test_orphaned_organization_falls_back(self):
+        resources, rows = _make_page(1)
+        rows[Organization] = []
+        session = QueryCountingSession(rows)
+        service = SearchService(session)
+
+        read = service._to_read_schema(resources[0], service._hydrate(resources))
+
+        assert read.organization.name == "Unknown Organization"
+
+    def test_state_explanation_uses_hydrated_location(self):
+        resources, rows = _make_page(1)
+        session = QueryCountingSession(rows)
+        service = SearchService(session)
+
+        explanations = service._build_explanations(
+            resources[0], "zzz", None, "TX", relations=service._hydrate(resources)
+        )
+
+        assert "Available in Austin, TX" in [e.reason for e in explanations]
+
+
+def _fused_row(resource: Resource, rrf_score: float, total: int, fts_score=0.1, distance=0.2) -> SimpleNamespace:
+    return SimpleNamespace(
+        resource_id=resource.id, fts_score=fts_score, distance=distance, rrf_score=rrf_score, total=total
+    )
+
+
+class TestHybridSearch:
+    """Tests for database-side Reciprocal Rank Fusion."""
+
+    def test_fuses_in_one_statement_and_hydrates_page(self):
+        resources, rows = _make_page(3)
+        rows[Resource] = resources
+        fused = [_fused_row(r, 0.03 - i * 0.001, total=42) for i, r in enumerate(reversed(resources))]
+        session = QueryCountingSession(rows, fused)
+
+        results, total = SearchService(session).hybrid_search("housing", [0.1] * 384, limit=3)
+
+        assert total == 42
+        assert [r.resource.id for r in results] == [r.id for r in reversed(resources)]
+        assert results[0].rank == 0.03
+        session.statement("WITH fts")
+        assert session.settings_applied() == [f"SET LOCAL hnsw.ef_search = {HYBRID_CANDIDATES_PER_RANKER}"]
+        # Page of resources + organizations, locations, sources, programs
+        assert session.exec_count == 5
+
+    def test_sql_limits_each_ranker_before_fusion(self):
+        session = QueryCountingSession({})
+
+        SearchService(session).hybrid_search("housing", [0.5] * 384, limit=20, offset=400)
+
+        sql, params = session.statement("WITH fts")
+        assert sql.count("LIMIT :candidates") == 2
+        assert "FULL OUTER JOIN" in sql
+        assert params["candidates"] == max(HYBRID_CANDIDATES_PER_RANKER, 420)
+        assert params["embedding"].startswith("[0.5,")
+
+    def test_filters_apply_to_both_rankers(self):
+        session = QueryCountingSession({})
+
+        SearchService(session).hybrid_search("legal", [0.1] * 384, category="legal", state="VA")
+
+        sql, params = session.statement("WITH fts")
+        assert sql.count("r.categories @> ARRAY[:f_cat_0]::text[]") == 2
+        assert sql.count("r.states @> ARRAY[:f_state_0]::text[]") == 2
+        assert sql.count("r.status = :f_active") == 2
+        assert params["f_cat_0"] == "legal"
+        assert params["f_state_0"] == "VA"
+
+    def test_no_candidates_returns_empty(self):
+        session = QueryCountingSession({})
+
+        results, total = SearchService(session).hybrid_search("nothing", [0.1] * 384)
+
+        assert results == []
+        assert total == 0
+        assert session.exec_count == 0
+
+    def test_semantic_only_candidate_has_no_fts_explanation(self):
+        resources, rows = _make_page(1)
+        rows[Resource] = resources
+        session = QueryCountingSession(rows, [_fused_row(resources[0], 0.008, total=1, fts_score=None)])
+
+        results, _ = SearchService(session).hybrid_search("housing", [0.1] * 384)
+
+        fields = [e.field for e in results[0].explanations]
+        assert "embedding" in fields
+        assert "title" not in fields
+
+
+class TestConfigureAnn:
+    """Tests for per-request HNSW parameters."""
+
+    def test_tiers_map_to_settings(self):
+        assert ann_ef_search_for_tier("fast") == settings.ann_ef_search_fast
+        assert ann_ef_search_for_tier("balanced") == settings.ann_ef_search_balanced
+        assert ann_ef_search_for_tier("accurate") == settings.ann_ef_search_accurate
+
+    def test_unknown_tier_raises(self):
+        with pytest.raises(ValueError, match="Unknown ANN tier"):
+            ann_ef_search_for_tier("exhaustive")
+
+    def test_ef_search_covers_requested_rows(self):
+        session = QueryCountingSession({})
+
+        SearchService(session)._configure_ann("fast", 300, filtered=False)
+
+        assert session.settings_applied() == ["SET LOCAL hnsw.ef_search = 300"]
+
+    def test_filtered_query_widens_candidates_without_iterative_scan(self):
+        session = QueryCountingSession({})
+
+        SearchService(session)._configure_ann("fast", 20, filtered=True)
+
+        expected = settings.ann_ef_search_fast * FILTERED_EF_SEARCH_MULTIPLIER
+        assert session.settings_applied() == [f"SET LOCAL hnsw.ef_search = {expected}"]
+
+    def test_filtered_query_uses_iterative_scan_when_available(self, monkeypatch):
+        monkeypatch.setattr(search_module, "_iterative_scan_available", True)
+        session = QueryCountingSession({})
+
+        SearchService(session)._configure_ann("balanced", 20, filtered=True)
+
+        assert session.settings_applied() == [
+            "SET LOCAL hnsw.iterative_scan = relaxed_order",
+            f"SET LOCAL hnsw.ef_search = {settings.ann_ef_search_balanced}",
+        ]
+
+    def test_ef_search_is_clamped_to_pgvector_limit(self):
+        session = QueryCountingSession({})
+
+        SearchService(session)._configure_ann("accurate", 5000, filtered=True)
+
+        assert session.settings_applied() == [f"SET LOCAL hnsw.ef_search = {HNSW_MAX_EF_SEARCH}"]
+
+
+class TestSemanticSearch:
+    """Tests for vector similarity search."""
+
+    def test_orders_by_distance_and_hydrates_page(self):
+        resources, rows = _make_page(3)
+        rows[Resource] = resources
+        ranked = [SimpleNamespace(resource_id=r.id, distance=0.1 * (i + 1)) for i, r in enumerate(resources)]
+        session = QueryCountingSession(rows, ranked, scalar=17)
+
+        results, total = SearchService(session).semantic_search([0.1] * 384, limit=3, ann_tier="accurate")
+
+        assert total == 17
+        assert [r.resource.id for r in results] == [r.id for r in resources]
+        assert results[0].rank == pytest.approx(0.9)
+        sql, params = session.statement("AS nearest")
+        assert "ORDER BY r.embedding <=> CAST(:embedding AS vector)" in sql
+        assert params["limit"] == 3
+        assert session.settings_applied() == [f"SET LOCAL hnsw.ef_search = {settings.ann_ef_search_accurate}"]
+        # Page of resources + organizations, locations, sources, programs
+        assert session.exec_count == 5
+
+    def test_filters_apply_to_count_and_page(self):
+        session = QueryCountingSession({}, scalar=0)
+
+        results, total = SearchService(session).semantic_search([0.1] * 384, category="food", state="OH")
+
+        assert results == []
+        assert total == 0
+        for marker in ("COUNT(*)", "AS nearest"):
+            sql, params = session.statement(marker)
+            assert "r.categories @> ARRAY[:f_cat_0]::text[]" in sql
+            assert "r.states @> ARRAY[:f_state_0]::text[]" in sql
+            assert params["f_cat_0"] == "food"
+            assert params["f_national"] == "NATIONAL"
@@ -0,0 +1,204 @@
+"""Tests for the in-process nearby spatial index."""
+
+import random
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.config import settings
+from app.services import spatial_index
+from app.services.facet_index import FacetIndex
+from app.services.filters import ResourceFilters
+from app.services.resource import _haversine_distance_sql, _indexed_distance_sql
+from app.services.spatial_index import SpatialIndex, bounding_box, get_spatial_index, haversine_miles
+from etl.loader import Loader
+from etl.models import NormalizedResource
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    spatial_index._index = None
+    yield
+    spatial_index._index = None
+
+
+def _brute_force(points: list, lat: float, lng: float, radius: float) -> set:
+    lat_min, lat_max, lng_min, lng_max = bounding_box(lat, lng, radius)
+    return {
+        (resource_id, round(haversine_miles(lat, lng, p_lat, p_lng), 9))
+        for resource_id, p_lat, p_lng in points
+        if lat_min <= p_lat <= lat_max and lng_min <= p_lng <= lng_max
+    }
+
+
+class TestSpatialIndex:
+    """Grid lookups match a full scan with the SQL fallback's box."""
+
+    def test_within_box_matches_full_scan(self):
+        rng = random.Random(7)
+        points = [(uuid4(), rng.uniform(25, 49), rng.uniform(-124, -67)) for _ in range(2000)]
+        index = SpatialIndex(points)
+
+        for _ in range(50):
+            lat, lng, radius = rng.uniform(26, 48), rng.uniform(-122, -70), rng.choice([5, 25, 100, 500])
+            found = {(resource_id, round(d, 9)) for resource_id, d in index.within_box(lat, lng, radius)}
+            assert found == _brute_force(points, lat, lng, radius)
+
+    def test_within_radius_drops_box_corners(self):
+        rng = random.Random(11)
+        points = [(uuid4(), rng.uniform(38, 40), rng.uniform(-78, -76)) for _ in range(500)]
+        index = SpatialIndex(points)
+
+        found = index.within_radius(38.9, -77.0, 25)
+        assert {resource_id for resource_id, _ in found} == {
+            resource_id for resource_id, lat, lng in points if haversine_miles(38.9, -77.0, lat, lng) <= 25
+        }
+        assert len(found) < len(index.within_box(38.9, -77.0, 25))
+
+    def test_distance_matches_known_value(self):
+        # Washington, DC to Baltimore, about 35 miles
+        assert haversine_miles(38.9072, -77.0369, 39.2904, -76.6122) == pytest.approx(35, abs=1)
+
+    def test_upsert_moves_and_removes(self):
+        resource_id = uuid4()
+        index = SpatialIndex([(resource_id, 38.9, -77.0)])
+
+        index.upsert(resource_id, 34.05, -118.24)
+        assert index.within_box(38.9, -77.0, 25) == []
+        assert [r for r, _ in index.within_box(34.05, -118.24, 25)] == [resource_id]
+
+        index.upsert(resource_id, None, None)
+        assert len(index) == 0
+        assert index.within_box(34.05, -118.24, 25) == []
+
+
+class TestGetSpatialIndex:
+    """The process index is opt-in and rebuilt after its TTL."""
+
+    def _session(self, rows: list) -> MagicMock:
+        session = MagicMock()
+        session.execute.return_value.fetchall.return_value = [
+            MagicMock(id=resource_id, latitude=lat, longitude=lng) for resource_id, lat, lng in rows
+        ]
+        return session
+
+    def test_disabled_returns_none(self):
+        session = self._session([])
+
+        with patch.object(settings, "nearby_spatial_index", False):
+            assert get_spatial_index(session) is None
+        session.execute.assert_not_called()
+
+    def test_built_once_then_rebuilt_after_ttl(self):
+        session = self._session([(uuid4(), 38.9, -77.0)])
+
+        with patch.object(settings, "nearby_spatial_index", True):
+            index = get_spatial_index(session)
+            assert index is not None and len(index) == 1
+            assert get_spatial_index(session) is index
+            assert session.execute.call_count == 1
+
+            index.built_at -= settings.nearby_spatial_index_ttl_seconds
+            assert get_spatial_index(session) is not index
+            assert session.execute.call_count == 2
+
+    def test_failed_build_keeps_previous_index(self):
+        session = self._session([])
+        previous = SpatialIndex()
+        previous.built_at -= settings.nearby_spatial_index_ttl_seconds
+        spatial_index._index = previous
+        session.execute.side_effect = Exception("connection lost")
+
+        with patch.object(settings, "nearby_spatial_index", True):
+            assert get_spatial_index(session) is previous
+        session.rollback.assert_called_once()
+
+
+class TestIndexedDistanceSql:
+    """Radius and filters are applied in memory; only the final ids reach Postgres."""
+
+    CENTER = (38.9, -77.0)
+
+    def _indexes(self, resources: dict) -> tuple[SpatialIndex, FacetIndex]:
+        """Indexes over {resource_id: ((lat, lng), status, scope, categories, tags)}."""
+        spatial = SpatialIndex((resource_id, lat, lng) for resource_id, ((lat, lng), *_) in resources.items())
+        facets = FacetIndex(
+            (resource_id, status, scope, categories, [], tags, [])
+            for resource_id, (_, status, scope, categories, tags) in resources.items()
+        )
+        return spatial, facets
+
+    def test_passes_only_matching_resources_in_radius(self):
+        kept, outside, corner, other_category, inactive, national = (uuid4() for _ in range(6))
+        _, lat_max, _, lng_max = bounding_box(*self.CENTER, 25)
+        spatial, facets = self._indexes(
+            {
+                kept: (self.CENTER, "ACTIVE", "STATE", ["housing"], []),
+                outside: ((34.05, -118.24), "ACTIVE", "STATE", ["housing"], []),
+                corner: ((lat_max - 0.01, lng_max - 0.01), "ACTIVE", "STATE", ["housing"], []),
+                other_category: (self.CENTER, "ACTIVE", "STATE", ["legal"], []),
+                inactive: (self.CENTER, "INACTIVE", "STATE", ["housing"], []),
+                national: (self.CENTER, "ACTIVE", "NATIONAL", ["housing"], []),
+            }
+        )
+
+        params: dict = {}
+        sql = _indexed_distance_sql(
+            spatial, facets, *self.CENTER, 25, ResourceFilters(categories=["housing"], tag_match="text"), params
+        )
+
+        assert "unnest(CAST(:near_ids AS uuid[])" in sql
+        assert "resources r" not in sql
+        assert params == {"near_ids": [kept], "near_distances": [0.0]}
+
+    def test_text_tags_filtered_in_sql(self):
+        """Filters the bitmaps can't answer are applied to the radius matches in SQL."""
+        tagged = uuid4()
+        spatial, facets = self._indexes(
+            {
+                tagged: (self.CENTER, "ACTIVE", "STATE", [], ["ssvf"]),
+                uuid4(): ((34.05, -118.24), "ACTIVE", "STATE", [], ["ssvf"]),
+            }
+        )
+
+        for facet_index_built in (facets, None):
+            params: dict = {}
+            filters = ResourceFilters(tags=["ssvf"], tag_match="text")
+            sql = _indexed_distance_sql(spatial, facet_index_built, *self.CENTER, 25, filters, params)
+
+            assert "WHERE r.id = near.resource_id AND r.scope != :national_scope" in sql
+            assert "r.tags @> ARRAY[:f_tag_0]" in sql
+            assert params["near_ids"] == [tagged]
+            assert params["national_scope"] == "NATIONAL"
+
+
+def test_sql_fallback_applies_the_radius():
+    """The SQL fallback cuts the box to the radius like SpatialIndex.within_radius."""
+    sql, params = _haversine_distance_sql(38.9, -77.0, 25)
+
+    assert "<= :radius_miles" in sql
+    assert params["radius_miles"] == 25
+
+
+def test_loader_commit_updates_index():
+    index = SpatialIndex()
+    spatial_index._index = index
+    session = MagicMock()
+    session.exec.side_effect = lambda stmt: iter(())
+    resource = NormalizedResource(
+        title="Housing Help",
+        description="Rental assistance",
+        source_url="https://example.com/housing",
+        org_name="Test Org",
+        address="1 Main St",
+        city="Arlington",
+        state="VA",
+        zip_code="22201",
+        latitude=38.88,
+        longitude=-77.09,
+    )
+
+    results, _ = Loader(session).load_batch([resource])
+
+    assert [r for r, _ in index.within_box(38.88, -77.09, 5)] == [results[0].resource_id]
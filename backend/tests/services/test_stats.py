@@ -0,0 +1,66 @@
+"""Tests for StatsService (resource stats snapshot)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.models import ResourceStatsSnapshot
+from app.services.stats import REFRESH_SQL, SNAPSHOT_ID, StatsService
+
+
+class TestStatsService:
+    """Tests for computing and reading the snapshot."""
+
+    def test_refresh_is_one_statement(self):
+        """Test that refresh aggregates and upserts in a single statement, then commits."""
+        session = MagicMock()
+        snapshot = ResourceStatsSnapshot(total_resources=3)
+        session.get.return_value = snapshot
+
+        result = StatsService(session).refresh()
+
+        assert result is snapshot
+        session.execute.assert_called_once()
+        params = session.execute.call_args.args[1]
+        assert params["snapshot_id"] == SNAPSHOT_ID
+        assert params["active_status"] == "ACTIVE"
+        session.commit.assert_called_once()
+
+    def test_refresh_sql_aggregates_categories_in_sql(self):
+        """Test that categories are counted with unnest ... GROUP BY, not in Python."""
+        assert "unnest(r.categories)" in REFRESH_SQL
+        assert "GROUP BY category" in REFRESH_SQL
+        assert "ON CONFLICT (id) DO UPDATE" in REFRESH_SQL
+
+    def test_get_snapshot_reads_existing_row(self):
+        """Test that an existing snapshot is served without recomputing."""
+        session = MagicMock()
+        session.get.return_value = ResourceStatsSnapshot(total_resources=10)
+
+        snapshot = StatsService(session).get_snapshot()
+
+        assert snapshot.total_resources == 10
+        session.execute.assert_not_called()
+
+    def test_get_snapshot_computes_when_missing(self):
+        """Test that the first request computes the snapshot."""
+        session = MagicMock()
+        computed = ResourceStatsSnapshot(total_resources=5)
+        session.get.side_effect = [None, computed]
+
+        snapshot = StatsService(session).get_snapshot()
+
+        assert snapshot is computed
+        session.execute.assert_called_once()
+
+    def test_categories_decoded(self):
+        """Test that category counts are decoded from the stored JSON."""
+        snapshot = ResourceStatsSnapshot(resources_by_category='{"housing": 4, "legal": 1}')
+
+        assert StatsService.categories(snapshot) == {"housing": 4, "legal": 1}
+
+    def test_age_seconds_treats_naive_as_utc(self):
+        """Test snapshot age with a naive computed_at as read back from the database."""
+        now = datetime(2026, 2, 10, 12, 0, tzinfo=UTC)
+        snapshot = ResourceStatsSnapshot(computed_at=(now - timedelta(minutes=5)).replace(tzinfo=None))
+
+        assert StatsService.age_seconds(snapshot, now) == 300.0
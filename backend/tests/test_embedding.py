@@ -1,5 +1,6 @@
 """Tests for embedding service and semantic search."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -167,6 +168,145 @@ class TestGetEmbeddingService:
                 service = get_embedding_service()
                 assert isinstance(service, OpenAIEmbeddingService)
 
+    def test_sidecar_when_socket_configured(self):
+        """Test that factory returns SidecarEmbeddingService when a sidecar socket is set."""
+        from app.services.embedding import SidecarEmbeddingService, get_embedding_service
+
+        with (
+            patch("app.config.settings.use_local_embeddings", True),
+            patch("app.config.settings.embedding_sidecar_socket", "/tmp/embeddings.sock"),
+        ):
+            service = get_embedding_service()
+            assert isinstance(service, SidecarEmbeddingService)
+            assert service.socket_path == "/tmp/embeddings.sock"
+
+
+class TestSidecarEmbeddingService:
+    """Tests for the SidecarEmbeddingService client."""
+
+    @staticmethod
+    def _mock_transport(requests):
+        import httpx
+
+        def handler(request):
+            texts = json.loads(request.content)["texts"]
+            requests.append(texts)
+            return httpx.Response(200, json={"embeddings": [[float(len(t))] for t in texts], "model": "m"})
+
+        return httpx.MockTransport(handler)
+
+    def test_batch_embeddings_are_chunked(self):
+        from app.services.embedding import LOCAL_MODEL_NAME, SidecarEmbeddingService
+
+        requests = []
+        with patch("httpx.HTTPTransport", return_value=self._mock_transport(requests)) as mock_transport:
+            service = SidecarEmbeddingService(socket_path="/tmp/embeddings.sock")
+            results = service.generate_batch_embeddings(["a", "bb", "ccc"], batch_size=2)
+
+        mock_transport.assert_called_with(uds="/tmp/embeddings.sock")
+        assert requests == [["a", "bb"], ["ccc"]]
+        assert [r.embedding for r in results] == [[1.0], [2.0], [3.0]]
+        assert results[0].model == LOCAL_MODEL_NAME
+
+    def test_error_status_raises(self):
+        import httpx
+
+        from app.services.embedding import SidecarEmbeddingService
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+        with patch("httpx.HTTPTransport", return_value=transport):
+            service = SidecarEmbeddingService(socket_path="/tmp/embeddings.sock")
+            with pytest.raises(ValueError, match="sidecar error: 500"):
+                service.generate_embedding("test")
+
+    def test_requires_socket(self):
+        from app.services.embedding import SidecarEmbeddingService
+
+        with patch("app.config.settings.embedding_sidecar_socket", ""):
+            with pytest.raises(ValueError, match="EMBEDDING_SIDECAR_SOCKET"):
+                SidecarEmbeddingService()
+
+
+class TestEmbeddingSidecarApp:
+    """Tests for the embedding sidecar app."""
+
+    def test_embed(self):
+        from fastapi.testclient import TestClient
+
+        from app.embedding_sidecar import app as sidecar_app
+        from app.services.embedding import EmbeddingResult, LocalEmbeddingService
+
+        with (
+            patch.object(LocalEmbeddingService, "load_model") as mock_load,
+            patch.object(
+                LocalEmbeddingService,
+                "generate_batch_embeddings",
+                return_value=[EmbeddingResult(embedding=[0.1, 0.2], model="m", tokens_used=0)],
+            ),
+            TestClient(sidecar_app) as sidecar,
+        ):
+            response = sidecar.post("/embed", json={"texts": ["housing"]})
+
+        assert mock_load.called
+        assert response.status_code == 200
+        assert response.json()["embeddings"] == [[0.1, 0.2]]
+
+    def test_rejects_empty_batch(self):
+        from fastapi.testclient import TestClient
+
+        from app.embedding_sidecar import app as sidecar_app
+
+        response = TestClient(sidecar_app).post("/embed", json={"texts": []})
+        assert response.status_code == 422
+
+
+class TestPreloadEmbeddingModel:
+    """Tests for background model loading at startup."""
+
+    def test_loading_flag_set_until_model_loads(self):
+        import threading
+
+        from app.services.embedding import LocalEmbeddingService, embedding_model_loading, preload_embedding_model
+
+        release = threading.Event()
+        ready = MagicMock()
+        with (
+            patch("app.config.settings.use_local_embeddings", True),
+            patch("app.config.settings.embedding_sidecar_socket", ""),
+            patch.object(LocalEmbeddingService, "is_loaded", return_value=False),
+            patch.object(LocalEmbeddingService, "load_model", side_effect=lambda: release.wait(5)),
+        ):
+            thread = preload_embedding_model(on_ready=ready)
+            assert embedding_model_loading()
+            release.set()
+            thread.join(5)
+
+        assert not embedding_model_loading()
+        ready.assert_called_once()
+
+    def test_failed_load_clears_flag(self):
+        from app.services.embedding import LocalEmbeddingService, embedding_model_loading, preload_embedding_model
+
+        with (
+            patch("app.config.settings.use_local_embeddings", True),
+            patch("app.config.settings.embedding_sidecar_socket", ""),
+            patch.object(LocalEmbeddingService, "is_loaded", return_value=False),
+            patch.object(LocalEmbeddingService, "load_model", side_effect=ImportError("no model")),
+        ):
+            preload_embedding_model().join(5)
+
+        assert not embedding_model_loading()
+
+    @pytest.mark.parametrize(("use_local", "socket"), [(False, ""), (True, "/tmp/embeddings.sock")])
+    def test_nothing_to_load(self, use_local, socket):
+        from app.services.embedding import preload_embedding_model
+
+        with (
+            patch("app.config.settings.use_local_embeddings", use_local),
+            patch("app.config.settings.embedding_sidecar_socket", socket),
+        ):
+            assert preload_embedding_model() is None
+
 
 class TestSemanticSearchEndpoint:
     """Tests for the semantic search API endpoint."""
@@ -204,6 +344,20 @@ class TestSemanticSearchEndpoint:
         # Error message is sanitized for security - doesn't expose internal details
         assert "Failed to process search query" in response.json()["detail"]
 
+    @patch("app.api.v1.search.embedding_model_loading", return_value=True)
+    @patch("app.services.search.SearchService.search")
+    @patch("app.services.embedding.get_embedding_service")
+    def test_keyword_fallback_while_model_loads(self, mock_get_service, mock_search, _loading, client):
+        """Test that requests during model preload get keyword results instead of waiting."""
+        mock_search.return_value = ([], 0)
+
+        response = client.post("/api/v1/search/semantic?q=housing+assistance&state=TX")
+
+        assert response.status_code == 200
+        assert response.json()["search_mode"] == "keyword"
+        assert mock_search.call_args.kwargs["states"] == ["TX"]
+        mock_get_service.assert_not_called()
+
 
 class TestEmbeddingsJob:
     """Tests for the embeddings background job."""
@@ -229,3 +383,249 @@ class TestEmbeddingsJob:
         # Should complete without error (empty DB = 0 resources to process)
         assert result.stats.get("processed", 0) >= 0
         assert result.stats.get("error") is None
+
+
+class FakeChunkSession:
+    """Session stand-in that serves resource chunks and records bulk updates."""
+
+    def __init__(self, rows):
+        self.rows = sorted(rows, key=lambda row: row.id)
+        self.chunk_params = []
+        self.updates = []
+        self.commits = 0
+
+    def execute(self, statement, params=None):
+        result = MagicMock()
+        if str(statement).lstrip().startswith("SELECT"):
+            self.chunk_params.append(params)
+            after = [row for row in self.rows if row.id > params["after_id"]]
+            result.all.return_value = after[: params["limit"]]
+        else:
+            self.updates.append((str(statement), params))
+        return result
+
+    def commit(self):
+        self.commits += 1
+
+
+def _resource_row(i, **fields):
+    from types import SimpleNamespace
+    from uuid import UUID
+
+    row = {
+        "id": UUID(int=i + 1),
+        "title": f"Resource {i}",
+        "description": "Help for veterans",
+        "summary": None,
+        "eligibility": None,
+        "categories": ["housing"],
+        "tags": [],
+        "missing_embedding": True,
+        "embedding_text_hash": None,
+        "embedding_model": None,
+    }
+    return SimpleNamespace(**{**row, **fields})
+
+
+def _embedded_row(i, model="all-MiniLM-L6-v2", **fields):
+    """Row whose stored vector matches its current text."""
+    from app.services.embedding import embedding_text_hash, prepare_resource_text
+
+    row = _resource_row(i, missing_embedding=False, embedding_model=model, **fields)
+    row.embedding_text_hash = embedding_text_hash(prepare_resource_text(row))
+    return row
+
+
+class TestEmbeddingsJobChunks:
+    """Tests for chunked encoding and bulk writes in the embeddings job."""
+
+    @staticmethod
+    def _batch_service():
+        from app.services.embedding import EmbeddingResult
+
+        service = MagicMock()
+        service.generate_batch_embeddings.side_effect = lambda texts: [
+            EmbeddingResult(embedding=[0.5] * 384, model="test", tokens_used=2) for _ in texts
+        ]
+        return service
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_one_batch_call_and_update_per_chunk(self, mock_get_service):
+        from jobs.embeddings import EmbeddingsJob
+
+        service = self._batch_service()
+        mock_get_service.return_value = service
+        session = FakeChunkSession([_resource_row(i) for i in range(5)])
+
+        stats = EmbeddingsJob().execute(session, batch_size=2)
+
+        assert stats["processed"] == 5
+        assert stats["failed"] == 0
+        assert stats["chunks"] == 3
+        assert stats["tokens_used"] == 10
+        assert stats["resources_per_second"] > 0
+        assert [len(call.args[0]) for call in service.generate_batch_embeddings.call_args_list] == [2, 2, 1]
+        service.generate_embedding.assert_not_called()
+        assert len(session.updates) == 3
+        assert session.commits == 3
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_keyset_pagination_by_id(self, mock_get_service):
+        from jobs.embeddings import MIN_UUID, EmbeddingsJob
+
+        mock_get_service.return_value = self._batch_service()
+        rows = [_resource_row(i) for i in range(4)]
+        session = FakeChunkSession(rows)
+
+        EmbeddingsJob().execute(session, batch_size=2)
+
+        assert [p["after_id"] for p in session.chunk_params] == [MIN_UUID, rows[1].id, rows[3].id]
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_bulk_update_binds_ids_and_vectors(self, mock_get_service):
+        from jobs.embeddings import EmbeddingsJob
+
+        mock_get_service.return_value = self._batch_service()
+        rows = [_resource_row(i) for i in range(2)]
+        session = FakeChunkSession(rows)
+
+        EmbeddingsJob().execute(session, batch_size=10)
+
+        from app.services.embedding import embedding_text_hash, get_embedding_model_name, prepare_resource_text
+
+        sql, params = session.updates[0]
+        assert "UPDATE resources" in sql
+        assert "FROM (VALUES" in sql
+        assert params["id_0"] == rows[0].id
+        assert params["embedding_1"] == [0.5] * 384
+        assert params["hash_0"] == embedding_text_hash(prepare_resource_text(rows[0]))
+        assert params["model"] == get_embedding_model_name()
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_max_resources_limits_chunks(self, mock_get_service):
+        from jobs.embeddings import EmbeddingsJob
+
+        mock_get_service.return_value = self._batch_service()
+        session = FakeChunkSession([_resource_row(i) for i in range(10)])
+
+        stats = EmbeddingsJob().execute(session, batch_size=4, max_resources=6)
+
+        assert stats["processed"] == 6
+        assert [
+            len(call.args[0]) for call in mock_get_service.return_value.generate_batch_embeddings.call_args_list
+        ] == [
+            4,
+            2,
+        ]
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_batch_failure_falls_back_to_single_encoding(self, mock_get_service):
+        from app.services.embedding import EmbeddingResult
+        from jobs.embeddings import EmbeddingsJob
+
+        service = MagicMock()
+        service.generate_batch_embeddings.side_effect = ValueError("bad input")
+        service.generate_embedding.side_effect = [
+            EmbeddingResult(embedding=[0.1] * 384, model="test", tokens_used=0),
+            ValueError("bad input"),
+            EmbeddingResult(embedding=[0.1] * 384, model="test", tokens_used=0),
+        ]
+        mock_get_service.return_value = service
+        rows = [_resource_row(i) for i in range(3)]
+        session = FakeChunkSession(rows)
+
+        stats = EmbeddingsJob().execute(session, batch_size=10)
+
+        assert stats["processed"] == 2
+        assert stats["failed"] == 1
+        _, params = session.updates[0]
+        assert {params["id_0"], params["id_1"]} == {rows[0].id, rows[2].id}
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_nothing_to_embed_skips_model_load(self, mock_get_service):
+        from jobs.embeddings import EmbeddingsJob
+
+        stats = EmbeddingsJob().execute(FakeChunkSession([]))
+
+        assert stats["total"] == 0
+        mock_get_service.assert_not_called()
+
+
+class TestIncrementalReembedding:
+    """Tests for hash- and model-driven re-embedding."""
+
+    @pytest.fixture(autouse=True)
+    def local_model(self):
+        with patch("app.config.settings.use_local_embeddings", True):
+            yield
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_unchanged_resources_are_skipped(self, mock_get_service):
+        from jobs.embeddings import EmbeddingsJob
+
+        mock_get_service.return_value = TestEmbeddingsJobChunks._batch_service()
+        session = FakeChunkSession([_embedded_row(i) for i in range(3)])
+
+        stats = EmbeddingsJob().execute(session)
+
+        assert stats["total"] == 0
+        assert stats["skipped"] == 3
+        assert session.updates == []
+        mock_get_service.assert_not_called()
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_edited_text_is_reembedded(self, mock_get_service):
+        from jobs.embeddings import REASON_TEXT_CHANGED, EmbeddingsJob
+
+        mock_get_service.return_value = TestEmbeddingsJobChunks._batch_service()
+        edited = _embedded_row(1)
+        edited.eligibility = "Post-9/11 veterans"
+        session = FakeChunkSession([_embedded_row(0), edited, _resource_row(2)])
+
+        stats = EmbeddingsJob().execute(session)
+
+        assert stats["processed"] == 2
+        assert stats["skipped"] == 1
+        assert stats[REASON_TEXT_CHANGED] == 1
+        assert stats["missing"] == 1
+        _, params = session.updates[0]
+        assert {params["id_0"], params["id_1"]} == {edited.id, _resource_row(2).id}
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_model_change_rolls_out_within_limit(self, mock_get_service):
+        from jobs.embeddings import REASON_MODEL_CHANGED, EmbeddingsJob
+
+        mock_get_service.return_value = TestEmbeddingsJobChunks._batch_service()
+        rows = [_embedded_row(i, model="old-model") for i in range(5)] + [_resource_row(5)]
+        session = FakeChunkSession(rows)
+
+        stats = EmbeddingsJob().execute(session, batch_size=2, rolling_limit=2)
+
+        # New resources are never held back by the rolling limit
+        assert stats[REASON_MODEL_CHANGED] == 2
+        assert stats["missing"] == 1
+        assert stats["skipped"] == 3
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_untracked_vectors_count_as_model_changed(self, mock_get_service):
+        from jobs.embeddings import REASON_MODEL_CHANGED, EmbeddingsJob
+
+        mock_get_service.return_value = TestEmbeddingsJobChunks._batch_service()
+        legacy = _resource_row(0, missing_embedding=False)
+        session = FakeChunkSession([legacy])
+
+        stats = EmbeddingsJob().execute(session)
+
+        assert stats[REASON_MODEL_CHANGED] == 1
+
+    @patch("app.services.embedding.get_embedding_service")
+    def test_reembed_ignores_hashes(self, mock_get_service):
+        from jobs.embeddings import REASON_REEMBED, EmbeddingsJob
+
+        mock_get_service.return_value = TestEmbeddingsJobChunks._batch_service()
+        session = FakeChunkSession([_embedded_row(i) for i in range(3)])
+
+        stats = EmbeddingsJob().execute(session, reembed=True)
+
+        assert stats[REASON_REEMBED] == 3
+        assert stats["skipped"] == 0
@@ -367,7 +367,7 @@ function SearchResults() {
   const hasGeolocation = filters.lat !== undefined && filters.lng !== undefined;
   const nearbyQuery = useInfiniteQuery({
     queryKey: ['nearby', filters.zip, filters.lat, filters.lng, filters.radius, filters.categories, filters.scope, filters.tags],
-    queryFn: async ({ pageParam = 0 }) => {
+    queryFn: async ({ pageParam }) => {
       // Support both zip code and lat/lng geolocation
       const params: Parameters<typeof api.resources.nearby>[0] = {
         radius: filters.radius || 100,
@@ -375,7 +375,7 @@ function SearchResults() {
         scope: filters.scope !== 'all' ? filters.scope : undefined,
         tags: filters.tags && filters.tags.length > 0 ? filters.tags.join(',') : undefined,
         limit: NEARBY_PAGE_SIZE,
-        offset: pageParam,
+        cursor: pageParam,
       };
       // Use lat/lng if available, otherwise use zip
       if (hasGeolocation) {
@@ -386,14 +386,9 @@ function SearchResults() {
       }
       return api.resources.nearby(params);
     },
-    initialPageParam: 0,
-    getNextPageParam: (lastPage, _allPages, lastPageParam) => {
-      // If we got fewer results than page size, we've reached the end
-      if (lastPage.resources.length < NEARBY_PAGE_SIZE) {
-        return undefined;
-      }
-      return lastPageParam + NEARBY_PAGE_SIZE;
-    },
+    initialPageParam: undefined as string | undefined,
+    // Keyset pagination: the API returns no cursor on the last page
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
     enabled: (!!filters.zip || hasGeolocation) && !query,
     // Don't use placeholderData - it causes stale results when filters change
     // Better to show loading state briefly than wrong filtered results
@@ -110,6 +110,7 @@ export interface ResourceNearbyResult {
 export interface ResourceNearbyList {
   resources: ResourceNearbyResult[];
   total: number;
+  next_cursor?: string | null;  // pass as cursor for the next page; null on the last page
   zip_code: string | null;  // null when using lat/lng geolocation
   state: string | null;  // 2-letter state code for the zip
   radius_miles: number;
@@ -692,6 +693,7 @@ export const api = {
       tags?: string;
       limit?: number;
       offset?: number;
+      cursor?: string;
     }): Promise<ResourceNearbyList> => {
       const searchParams = new URLSearchParams();
       // Support both zip code and lat/lng modes
@@ -707,6 +709,7 @@ export const api = {
       if (params.tags) searchParams.set('tags', params.tags);
       if (params.limit) searchParams.set('limit', String(params.limit));
       if (params.offset) searchParams.set('offset', String(params.offset));
+      if (params.cursor) searchParams.set('cursor', params.cursor);
 
       return fetchAPI(`/api/v1/resources/nearby?${searchParams.toString()}`);
     },